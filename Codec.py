@@ -0,0 +1,385 @@
+"""
+The ggpack data is encoded by XOR'ing it with a keystream made from the two key tables in Keys.
+That keystream only depends on the length of the data, not on the data itself, so instead of decoding byte by byte,
+we generate the keystream in bulk and XOR whole buffers at once, using the fastest backend that's available
+"""
+import contextlib, importlib.util, mmap, os, struct, zlib
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import Keys, Utils
+from CustomExceptions import DecodeError
+
+# Used to stop multiple MonkeyPack processes from writing to the keystream cache file at the same time
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
+	import msvcrt
+
+
+def decodeReference(encodedGameData: bytes) -> bytes:
+	"""The original byte-by-byte decoder. It's slow, but it's the reference the faster backends should produce identical output to"""
+	# From https://github.com/bgbennyboy/Dinky-Explorer/blob/master/ThimbleweedLibrary/BundleReader_ggpack.cs#L627
+	encodedGameDataLength = len(encodedGameData)
+	decodedByteArray = bytearray(encodedGameDataLength)
+	decodeSum = ((len(encodedGameData)) + Keys.MAGIC_VALUE) & 0xFFFF
+	for index in range(encodedGameDataLength):
+		key1decodeByte = Keys.KEY_1[(decodeSum + Keys.MAGIC_VALUE) & 0xFF]
+		key2decodeByte = Keys.KEY_2[decodeSum]
+		decodedByteArray[index] = (encodedGameData[index] ^ key1decodeByte ^ key2decodeByte)
+		decodeSum = (decodeSum + Keys.KEY_1[decodeSum & 0xFF]) & 0xFFFF
+	return bytes(decodedByteArray)
+
+def getStartState(dataLength: int) -> int:
+	"""The keystream state a piece of data starts at only depends on the length of that data"""
+	return (dataLength + Keys.MAGIC_VALUE) & 0xFFFF
+
+def walkKeystream(startState: int, length: int) -> Tuple[bytes, int]:
+	"""
+	Generate the keystream from the provided start state. The state can only have 65,536 values, so the walk always ends up in a loop (in practice after about a thousand steps).
+	We stop once we've generated enough bytes or once the walk loops back onto itself, whichever comes first
+	:param startState: The state to start walking from, see getStartState
+	:param length: How many keystream bytes are needed
+	:return: A tuple with the generated keystream segment, and the index in that segment where the loop starts. That index is -1 if the walk stopped before the loop was found
+	"""
+	key1 = Keys.KEY_1
+	key2 = Keys.KEY_2
+	magicValue = Keys.MAGIC_VALUE
+	segment = bytearray()
+	stateIndexes: Dict[int, int] = {}
+	decodeSum = startState
+	while len(segment) < length:
+		if decodeSum in stateIndexes:
+			return bytes(segment), stateIndexes[decodeSum]
+		stateIndexes[decodeSum] = len(segment)
+		segment.append(key1[(decodeSum + magicValue) & 0xFF] ^ key2[decodeSum])
+		decodeSum = (decodeSum + key1[decodeSum & 0xFF]) & 0xFFFF
+	return bytes(segment), -1
+
+def expandKeystream(segment: bytes, cycleStart: int, offset: int, length: int) -> bytes:
+	"""
+	Get the keystream bytes from 'offset' up to 'offset + length' out of a segment created by walkKeystream, repeating the looping part of the segment as often as needed
+	:param segment: The keystream segment, as returned by walkKeystream
+	:param cycleStart: The index where the loop in the segment starts, as returned by walkKeystream
+	:param offset: Where in the keystream to start
+	:param length: How many keystream bytes to return
+	:return: The requested part of the keystream
+	"""
+	end = offset + length
+	if end <= len(segment):
+		return segment[offset:end]
+	if cycleStart < 0:
+		raise DecodeError(f"Keystream segment of {len(segment):,} bytes doesn't contain a loop, so it can't be expanded to {end:,} bytes")
+	parts: List[bytes] = []
+	if offset < cycleStart:
+		parts.append(segment[offset:cycleStart])
+		offset = cycleStart
+	cycle = segment[cycleStart:]
+	cycleOffset = (offset - cycleStart) % len(cycle)
+	# Rotate the loop so it starts where we need it to, then just repeat it
+	rotatedCycle = cycle[cycleOffset:] + cycle[:cycleOffset]
+	fullRepeats, remainder = divmod(end - offset, len(cycle))
+	parts.append(rotatedCycle * fullRepeats)
+	parts.append(rotatedCycle[:remainder])
+	return b''.join(parts)
+
+
+class KeystreamCache:
+	"""
+	Every piece of data with the same length uses the same keystream, so this stores the generated keystream segments per start state, so they don't need to be generated again.
+	Segments are kept in memory up to a maximum size, after which the least recently used segments get dropped.
+	Optionally, the segments can also be stored in a file, so they can be reused between runs
+	"""
+
+	# The header changed when the records got a checksum, so cache files from before that get recreated
+	DISK_CACHE_HEADER = b'MPK2'
+	_RECORD_CHECKSUM = struct.Struct('<I')  # CRC32 of the rest of the record
+	_RECORD_FIELDS = struct.Struct('<HHI')  # Start state, loop start index, and segment length
+	# Windows locks a byte range instead of the whole file. Lock a byte far past the end of the file, so the lock doesn't get in the way of reading the records
+	_WINDOWS_LOCK_OFFSET = 0x7FFFFFFE
+
+	def __init__(self, maxMemoryBytes: int = 16 * 1024 * 1024, diskCachePath: str = None):
+		self.maxMemoryBytes = maxMemoryBytes
+		self._segments: 'OrderedDict[int, Tuple[bytes, int]]' = OrderedDict()
+		self._memoryBytesUsed = 0
+		self.diskCachePath = diskCachePath
+		self._diskFileDescriptor: Optional[int] = None
+		self._diskMap: Optional[mmap.mmap] = None
+		self._diskIndex: Dict[int, Tuple[int, int, int]] = {}
+		if diskCachePath:
+			self._openDiskCache()
+
+	def getSegment(self, startState: int) -> Tuple[bytes, int]:
+		"""Get the full keystream segment for the provided start state, up to and including the loop it ends in, generating it if it isn't stored yet. Returns the same tuple as walkKeystream"""
+		cachedSegment = self._segments.get(startState)
+		if cachedSegment:
+			self._segments.move_to_end(startState)
+			return cachedSegment
+		cachedSegment = self._readFromDisk(startState)
+		if not cachedSegment:
+			# There are only 65,536 possible states, so a walk of one step more than that is guaranteed to find the loop
+			cachedSegment = walkKeystream(startState, 0x10001)
+			self._writeToDisk(startState, cachedSegment)
+		self._storeInMemory(startState, cachedSegment)
+		return cachedSegment
+
+	def clear(self):
+		"""Drop all the segments stored in memory. The disk cache, if any, is left alone"""
+		self._segments.clear()
+		self._memoryBytesUsed = 0
+
+	def close(self):
+		self.clear()
+		self._closeDiskCache()
+
+	def _closeDiskCache(self):
+		if self._diskMap:
+			self._diskMap.close()
+			self._diskMap = None
+		if self._diskFileDescriptor is not None:
+			os.close(self._diskFileDescriptor)
+			self._diskFileDescriptor = None
+		self._diskIndex.clear()
+
+	def _storeInMemory(self, startState: int, segmentAndCycleStart: Tuple[bytes, int]):
+		self._segments[startState] = segmentAndCycleStart
+		self._memoryBytesUsed += len(segmentAndCycleStart[0])
+		while self._memoryBytesUsed > self.maxMemoryBytes and len(self._segments) > 1:
+			evictedSegment, evictedCycleStart = self._segments.popitem(last=False)[1]
+			self._memoryBytesUsed -= len(evictedSegment)
+
+	def _getDiskCacheHeader(self) -> bytes:
+		# Store a hash of the keys, so a cache file made with different keys doesn't get used
+		return KeystreamCache.DISK_CACHE_HEADER + Utils.calculateMd5Hash(Keys.KEY_1 + Keys.KEY_2).encode('ascii')
+
+	@staticmethod
+	def _getRecordChecksum(recordFields: bytes, segment: bytes) -> int:
+		return zlib.crc32(segment, zlib.crc32(recordFields))
+
+	@contextlib.contextmanager
+	def _lockDiskCache(self) -> Iterator[None]:
+		"""
+		Lock the disk cache file while reading its records or appending to it, so no other process can append a record at the same time.
+		The lock belongs to this process, so worker processes forked from this one don't share it but wait for it like any other process
+		"""
+		if fcntl:
+			fcntl.lockf(self._diskFileDescriptor, fcntl.LOCK_EX)
+		else:
+			os.lseek(self._diskFileDescriptor, KeystreamCache._WINDOWS_LOCK_OFFSET, os.SEEK_SET)
+			msvcrt.locking(self._diskFileDescriptor, msvcrt.LK_LOCK, 1)
+		try:
+			yield
+		finally:
+			if fcntl:
+				fcntl.lockf(self._diskFileDescriptor, fcntl.LOCK_UN)
+			else:
+				os.lseek(self._diskFileDescriptor, KeystreamCache._WINDOWS_LOCK_OFFSET, os.SEEK_SET)
+				msvcrt.locking(self._diskFileDescriptor, msvcrt.LK_UNLCK, 1)
+
+	def _openDiskCache(self):
+		# With O_APPEND, each write goes to the end of the file, even if another process appended something since, or a forked worker process moved the shared file position
+		self._diskFileDescriptor = os.open(self.diskCachePath, os.O_RDWR | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0))
+		expectedHeader = self._getDiskCacheHeader()
+		try:
+			with self._lockDiskCache():
+				self._mapDiskCache()
+				if not self._diskMap or self._diskMap[:len(expectedHeader)] != expectedHeader:
+					if self._diskMap:
+						print(f"Keystream cache file '{self.diskCachePath}' is invalid or outdated, recreating it")
+					self._truncateDiskCache(0)
+					self._appendToDisk(expectedHeader)
+					self._mapDiskCache()
+				recordOffset = self._indexDiskCache(len(expectedHeader))
+				if recordOffset < len(self._diskMap):
+					# Records are only appended while holding the lock, so whatever comes after the last valid record was left by a run that got interrupted, and no other process uses it
+					print(f"Keystream cache file '{self.diskCachePath}' ends with an incomplete or damaged record, removing it")
+					self._truncateDiskCache(recordOffset)
+					self._mapDiskCache()
+		except OSError as e:
+			self._disableDiskCache(e)
+
+	def _disableDiskCache(self, error: OSError):
+		# The disk cache only saves time, so if it can't be used, keep going with just the segments in memory
+		print(f"Unable to use keystream cache file '{self.diskCachePath}', not storing generated keys: {error}")
+		self._closeDiskCache()
+
+	def _indexDiskCache(self, recordOffset: int) -> int:
+		"""Store where each record starting at the provided offset is in the disk cache file, until the first record that's incomplete or damaged. Returns the offset after the last valid record"""
+		checksumSize = KeystreamCache._RECORD_CHECKSUM.size
+		recordHeaderSize = checksumSize + KeystreamCache._RECORD_FIELDS.size
+		diskMapSize = len(self._diskMap)
+		while recordOffset + recordHeaderSize <= diskMapSize:
+			startState, cycleStart, segmentLength = KeystreamCache._RECORD_FIELDS.unpack_from(self._diskMap, recordOffset + checksumSize)
+			segmentOffset = recordOffset + recordHeaderSize
+			if segmentOffset + segmentLength > diskMapSize or cycleStart >= segmentLength:
+				break
+			recordChecksum = KeystreamCache._RECORD_CHECKSUM.unpack_from(self._diskMap, recordOffset)[0]
+			if recordChecksum != self._getRecordChecksum(self._diskMap[recordOffset + checksumSize:segmentOffset], self._diskMap[segmentOffset:segmentOffset + segmentLength]):
+				break
+			self._diskIndex[startState] = (segmentOffset, segmentLength, cycleStart)
+			recordOffset = segmentOffset + segmentLength
+		return recordOffset
+
+	def _mapDiskCache(self):
+		if self._diskMap:
+			self._diskMap.close()
+			self._diskMap = None
+		if os.fstat(self._diskFileDescriptor).st_size > 0:
+			self._diskMap = mmap.mmap(self._diskFileDescriptor, 0, access=mmap.ACCESS_READ)
+
+	def _truncateDiskCache(self, size: int):
+		# The file can't be made smaller while it's mapped
+		if self._diskMap:
+			self._diskMap.close()
+			self._diskMap = None
+		os.ftruncate(self._diskFileDescriptor, size)
+
+	def _appendToDisk(self, data: bytes):
+		dataToWrite = memoryview(data)
+		while dataToWrite:
+			dataToWrite = dataToWrite[os.write(self._diskFileDescriptor, dataToWrite):]
+
+	def _readFromDisk(self, startState: int) -> Optional[Tuple[bytes, int]]:
+		if startState not in self._diskIndex:
+			return None
+		segmentOffset, segmentLength, cycleStart = self._diskIndex[startState]
+		if not self._diskMap or segmentOffset + segmentLength > len(self._diskMap):
+			# This segment was written after the file was mapped, so map it again to include it
+			try:
+				self._mapDiskCache()
+			except OSError as e:
+				self._disableDiskCache(e)
+				return None
+		return bytes(self._diskMap[segmentOffset:segmentOffset + segmentLength]), cycleStart
+
+	def _writeToDisk(self, startState: int, segmentAndCycleStart: Tuple[bytes, int]):
+		if self._diskFileDescriptor is None:
+			return
+		segment, cycleStart = segmentAndCycleStart
+		recordFields = KeystreamCache._RECORD_FIELDS.pack(startState, cycleStart, len(segment))
+		record = KeystreamCache._RECORD_CHECKSUM.pack(self._getRecordChecksum(recordFields, segment)) + recordFields + segment
+		try:
+			with self._lockDiskCache():
+				recordOffset = os.fstat(self._diskFileDescriptor).st_size
+				# If this fails halfway, the partial record gets cut off the next time the cache file is opened
+				self._appendToDisk(record)
+		except OSError as e:
+			self._disableDiskCache(e)
+			return
+		self._diskIndex[startState] = (recordOffset + len(record) - len(segment), len(segment), cycleStart)
+
+_keystreamCache = KeystreamCache()
+
+def getKeystreamCache() -> KeystreamCache:
+	return _keystreamCache
+
+def setKeystreamCache(keystreamCache: KeystreamCache):
+	"""Replace the keystream cache used by the codec, for instance with one that's also stored on disk"""
+	global _keystreamCache
+	_keystreamCache = keystreamCache
+
+def getKeystream(dataLength: int, offset: int = 0, length: int = None) -> bytes:
+	"""Get the keystream needed to decode or encode data of length 'dataLength'. If 'offset' and 'length' are provided, only that part of the keystream gets returned"""
+	if length is None:
+		length = dataLength - offset
+	segment, cycleStart = _keystreamCache.getSegment(getStartState(dataLength))
+	return expandKeystream(segment, cycleStart, offset, length)
+
+
+def _xorPython(data: bytes, keystream: bytes) -> bytes:
+	# Python's big integers XOR in C, which is a lot faster than looping over each byte
+	return (int.from_bytes(data, 'little') ^ int.from_bytes(keystream, 'little')).to_bytes(len(data), 'little')
+
+def _xorNumpy(data: bytes, keystream: bytes) -> bytes:
+	# numpy takes a while to import, so it's only imported the first time something gets XOR'd instead of every time MonkeyPack starts
+	import numpy
+	return (numpy.frombuffer(data, dtype=numpy.uint8) ^ numpy.frombuffer(keystream, dtype=numpy.uint8)).tobytes()
+
+# The available XOR backends, fastest first
+_XOR_BACKENDS: Dict[str, Callable[[bytes, bytes], bytes]] = {}
+if importlib.util.find_spec('numpy') is not None:
+	_XOR_BACKENDS['numpy'] = _xorNumpy
+_XOR_BACKENDS['python'] = _xorPython
+REFERENCE_BACKEND = 'reference'
+
+_backendName: str = next(iter(_XOR_BACKENDS))
+
+def getAvailableBackends() -> List[str]:
+	"""Get the names of the codec backends that can be used, fastest first"""
+	return list(_XOR_BACKENDS) + [REFERENCE_BACKEND]
+
+def getBackend() -> str:
+	return _backendName
+
+def setBackend(backendName: str):
+	"""Set which backend to use for decoding and encoding. By default, the fastest available backend is used"""
+	global _backendName
+	if backendName not in getAvailableBackends():
+		raise ValueError(f"Unknown codec backend '{backendName}', available backends are: {', '.join(getAvailableBackends())}")
+	_backendName = backendName
+
+def xorWithKeystream(data: bytes, keystream: bytes) -> bytes:
+	"""XOR the provided data with the provided keystream, which should be the same length, using the fastest available backend"""
+	if _backendName == REFERENCE_BACKEND:
+		return bytes(dataByte ^ keyByte for dataByte, keyByte in zip(data, keystream))
+	return _XOR_BACKENDS[_backendName](data, keystream)
+
+def decode(encodedGameData: bytes) -> bytes:
+	"""Decodes the provided encoded game data into something parseable, or turns decoded data back into encoded data"""
+	if _backendName == REFERENCE_BACKEND:
+		return decodeReference(encodedGameData)
+	if len(encodedGameData) == 0:
+		return b''
+	return xorWithKeystream(encodedGameData, getKeystream(len(encodedGameData)))
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+class StreamCodec:
+	"""
+	Decodes or encodes a piece of data in chunks, so the whole piece never needs to be in memory at once.
+	The keystream depends on the total length of the data, so that needs to be known up front. This object keeps track of where in the keystream the next chunk starts
+	"""
+
+	def __init__(self, dataLength: int):
+		self.dataLength = dataLength
+		self.position = 0
+		self._segment, self._cycleStart = _keystreamCache.getSegment(getStartState(dataLength))
+
+	def process(self, chunk: bytes) -> bytes:
+		"""Decode or encode the next chunk of the data"""
+		chunkLength = len(chunk)
+		if self.position + chunkLength > self.dataLength:
+			raise DecodeError(f"Chunk of {chunkLength:,} bytes at position {self.position:,} goes past the end of the data, which is {self.dataLength:,} bytes")
+		keystream = expandKeystream(self._segment, self._cycleStart, self.position, chunkLength)
+		self.position += chunkLength
+		return xorWithKeystream(chunk, keystream)
+
+def iterCodedChunks(sourceData: memoryview, shouldCode: bool = True, chunkSize: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+	"""Decode or encode the provided buffer, like a slice of a memory-mapped file, one chunk at a time. Each decoded chunk gets yielded, so only one chunk at a time gets copied"""
+	sourceData = memoryview(sourceData)
+	streamCodec = StreamCodec(len(sourceData)) if shouldCode else None
+	for chunkStart in range(0, len(sourceData), chunkSize):
+		chunk = sourceData[chunkStart:chunkStart + chunkSize]
+		yield streamCodec.process(chunk) if streamCodec else bytes(chunk)
+
+class CodedReader:
+	"""
+	A read-only file-like object over the provided buffer, like a slice of a memory-mapped file, that decodes or encodes the data while it gets read.
+	Useful to pass packed files to code that reads from a file, like tarfile, without decoding the whole file first
+	"""
+
+	def __init__(self, sourceData: memoryview, shouldCode: bool = True):
+		self._sourceData = memoryview(sourceData)
+		self._streamCodec = StreamCodec(len(self._sourceData)) if shouldCode and len(self._sourceData) > 0 else None
+		self.position = 0
+
+	def read(self, size: int = -1) -> bytes:
+		if size is None or size < 0:
+			size = len(self._sourceData) - self.position
+		chunk = self._sourceData[self.position:self.position + size]
+		self.position += len(chunk)
+		if not chunk:
+			return b''
+		return self._streamCodec.process(chunk) if self._streamCodec else bytes(chunk)
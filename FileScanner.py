@@ -0,0 +1,83 @@
+"""
+Finds the files to pack inside the provided files and folders. Folders are walked recursively with os.scandir, which gets the file type from the directory listing itself,
+so the only extra call per file is the one that gets its size. Walking can optionally be spread over multiple threads, which helps on network drives, where each listing takes a while
+"""
+import fnmatch, functools, os, re
+from typing import Dict, List, Pattern, Tuple
+
+
+@functools.lru_cache(maxsize=32)
+def _compileFilenameFilters(filenameFilters: Tuple[str, ...]) -> Pattern:
+	# Combine all the filters into one regex, so checking a filename is a single match instead of one fnmatch call per filter
+	return re.compile('|'.join(f'(?:{fnmatch.translate(os.path.normcase(filenameFilter))})' for filenameFilter in filenameFilters))
+
+def doesFilenameMatchFilters(filename: str, filenameFilterList: List[str]) -> bool:
+	"""Check whether the provided filename matches any of the provided filters, which use '?' and '*' like fnmatch does. Like fnmatch, this ignores case on systems where filenames ignore case"""
+	return _compileFilenameFilters(tuple(filenameFilterList)).match(os.path.normcase(filename)) is not None
+
+def _scanFolder(folderPath: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+	"""Get the path and size of each file directly inside the provided folder, and the paths of the folders directly inside it. Links to folders aren't followed, so a link to a parent folder can't make this loop"""
+	files: List[Tuple[str, int]] = []
+	subfolderPaths: List[str] = []
+	with os.scandir(folderPath) as directoryEntries:
+		for directoryEntry in directoryEntries:
+			if directoryEntry.is_dir(follow_symlinks=False):
+				subfolderPaths.append(directoryEntry.path)
+			elif directoryEntry.is_file():
+				files.append((directoryEntry.path, directoryEntry.stat().st_size))
+	return files, subfolderPaths
+
+def walkFolder(folderPath: str, jobCount: int = 1) -> List[Tuple[str, int]]:
+	"""Get the path and size of each file inside the provided folder and all its subfolders. If 'jobCount' is more than 1, that many folders get scanned at the same time"""
+	files: List[Tuple[str, int]] = []
+	if jobCount <= 1:
+		folderPathsToScan = [folderPath]
+		while folderPathsToScan:
+			folderFiles, subfolderPaths = _scanFolder(folderPathsToScan.pop())
+			files.extend(folderFiles)
+			folderPathsToScan.extend(subfolderPaths)
+		return files
+	from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+	with ThreadPoolExecutor(max_workers=jobCount) as executor:
+		pendingScans = {executor.submit(_scanFolder, folderPath)}
+		while pendingScans:
+			finishedScans, pendingScans = wait(pendingScans, return_when=FIRST_COMPLETED)
+			for finishedScan in finishedScans:
+				folderFiles, subfolderPaths = finishedScan.result()
+				files.extend(folderFiles)
+				pendingScans.update(executor.submit(_scanFolder, subfolderPath) for subfolderPath in subfolderPaths)
+	return files
+
+def scanFilesToPack(pathsToPack: List[str], filenameFilterList: List[str] = None, jobCount: int = 1) -> List[Dict]:
+	"""
+	Turn the provided list of files and folders to pack into a list of the files to pack. Folders are replaced by all the files inside them and their subfolders
+	:param pathsToPack: The files and folders to pack
+	:param filenameFilterList: If provided, only files whose name inside the ggpack matches one of these filters get packed
+	:param jobCount: How many folders to scan at the same time
+	:return: A dictionary for each file to pack, with the 'filename' it should get inside the ggpack, the 'path' to read it from, and its 'size'.
+		Files from a folder keep their path relative to that folder in their filename, with '/' between the folder names. The list is sorted by filename, and each filename is only in it once.
+		ggpack files are left out
+	"""
+	filesByName: Dict[str, Dict] = {}
+	def addFile(filename: str, filePath: str, fileSize: int):
+		if 'ggpack' in os.path.splitext(filename)[1].lower():
+			print(f"Skipping packing of ggpack file '{filePath}'")
+			return
+		if filenameFilterList and not doesFilenameMatchFilters(filename, filenameFilterList):
+			return
+		if filename in filesByName and os.path.abspath(filesByName[filename]['path']) != os.path.abspath(filePath):
+			print(f"WARNING: Both '{filesByName[filename]['path']}' and '{filePath}' would be packed as '{filename}', only packing '{filePath}'")
+		filesByName[filename] = {"filename": filename, "path": filePath, "size": fileSize}
+
+	for pathToPack in pathsToPack:
+		if os.path.isdir(pathToPack):
+			# The file paths start with the folder path, so the relative path is everything after that
+			folderPrefixLength = len(os.path.join(pathToPack, ''))
+			for filePath, fileSize in walkFolder(pathToPack, jobCount):
+				addFile(filePath[folderPrefixLength:].replace(os.sep, '/'), filePath, fileSize)
+		elif os.path.isfile(pathToPack):
+			addFile(os.path.basename(pathToPack), pathToPack, os.path.getsize(pathToPack))
+		else:
+			raise FileNotFoundError(f"Asked to pack file '{pathToPack}' but that file doesn't exist")
+	# Sorted filenames keep the files from the same folder together, in the order a directory listing would show them
+	return [filesByName[filename] for filename in sorted(filesByName)]
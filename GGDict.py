@@ -1,6 +1,7 @@
+import struct
+from collections.abc import Mapping, Sequence
 from enum import Enum
-from io import BytesIO
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import Utils
 from CustomExceptions import DecodeError, GGDictError
@@ -12,6 +13,15 @@ class _ValueType(Enum):
 	STRING = b'\x04'
 	INTEGER = b'\x05'
 
+# The value types as numbers, since that's what indexing into bytes returns
+_DICT_TYPE = _ValueType.DICT.value[0]
+_ARRAY_TYPE = _ValueType.ARRAY.value[0]
+_STRING_TYPE = _ValueType.STRING.value[0]
+_INTEGER_TYPE = _ValueType.INTEGER.value[0]
+
+_INT_STRUCT = struct.Struct('<i')
+_SHORT_STRUCT = struct.Struct('<h')
+
 class GGDict:
 	"""
 	Thimbleweed Park, Delores, and Return To Monkey Island store some data in a specialised format called a GGDict
@@ -32,82 +42,126 @@ class GGDict:
 		:param useShortStringIndex: Whether to use 2 bytes or 4 bytes to read string indexes. Thimbleweed Park and Delores use 4 bytes ('False'), Return To Monkey Island uses 2 bytes ('True')
 		:return: The parsed structure, usually a dictionary
 		"""
-		# Verify the header to see if the source data is parsable
-		if sourceData[0:4] != GGDict.DECODED_HEADER or sourceData[4:8] != GGDict.VERSION_HEADER:
-			raise DecodeError(f"Invalid header. Should be '{Utils.getPrintableBytes(GGDict.DECODED_HEADER)} {Utils.getPrintableBytes(GGDict.VERSION_HEADER)}, but is {Utils.getPrintableBytes(sourceData[0:8])}")
+		if not isinstance(sourceData, bytes):
+			sourceData = bytes(sourceData)
 		sourceDataLength = len(sourceData)
-		# Get the start offset of the file index entries
-		offsetsListStart = Utils.parseInt(sourceData, 8) + 1
-		if offsetsListStart >= sourceDataLength:
-			raise DecodeError(f"String offsets supposedly start at offset {offsetsListStart:,} but there are only {sourceDataLength:,} bytes available")
-		elif offsetsListStart < 12:
-			raise DecodeError(f"Invalid index start offset of {offsetsListStart:,}, too small")
+		offsetsListStart = GGDict._getStringOffsetsStart(sourceData)
 		# Iterate over the offsets and retrieve the string at each location
 		stringList: List[str] = []
-		for currentOffsetsListOffset in range(offsetsListStart, sourceDataLength, 4):
-			stringOffset = Utils.parseInt(sourceData, currentOffsetsListOffset)
+		unpackInt = _INT_STRUCT.unpack_from
+		for currentOffsetsListOffset in range(offsetsListStart, sourceDataLength - 3, 4):
+			stringOffset = unpackInt(sourceData, currentOffsetsListOffset)[0]
 			if stringOffset <= -1:
 				# '-1' signals the end of the offsets list, so we can stop
 				break
-			stringList.append(Utils.readString(sourceData, stringOffset))
+			try:
+				stringList.append(sourceData[stringOffset:sourceData.find(b'\x00', stringOffset)].decode('utf-8'))
+			except UnicodeDecodeError:
+				# Let the util method show what went wrong
+				stringList.append(Utils.readString(sourceData, stringOffset))
 		# The section after the offsetsListStart explains how the strings are organised
-		sourceDataAsIo = BytesIO(sourceData)
-		sourceDataAsIo.seek(12)
-		return GGDict._readValue(sourceDataAsIo, stringList, useShortStringIndex)
+		return GGDict._parseValues(sourceData, 12, stringList, useShortStringIndex)
 
 	@staticmethod
-	def _readValue(sourceData: BytesIO, stringList: List[str], useShortStringIndex: bool):
-		valueType = sourceData.read(1)
-		if valueType == _ValueType.DICT.value:
-			return GGDict._readDictionary(sourceData, stringList, useShortStringIndex)
-		elif valueType == _ValueType.ARRAY.value:
-			return GGDict._readArray(sourceData, stringList, useShortStringIndex)
-		elif valueType == _ValueType.STRING.value:
-			return GGDict._readString(sourceData, stringList, useShortStringIndex)
-		elif valueType == _ValueType.INTEGER.value:
-			return GGDict._readInteger(sourceData, stringList, useShortStringIndex)
-		else:
-			raise GGDictError(f"Encountered unknown value type {valueType}")
+	def view(sourceData: bytes, useShortStringIndex: bool):
+		"""
+		Like fromGgDict, but instead of parsing everything up front, this returns read-only proxies that only parse the parts that are accessed.
+		Dictionaries are returned as a GGDictMapping and arrays as a GGDictSequence. Strings only get decoded when they're needed, and parts of the structure that are never accessed are skipped over without parsing them.
+		Call 'toPython()' on a returned proxy to fully convert it to Python dictionaries and lists
+		:param sourceData: The data to view as a GGDict
+		:param useShortStringIndex: Whether to use 2 bytes or 4 bytes to read string indexes. Thimbleweed Park and Delores use 4 bytes ('False'), Return To Monkey Island uses 2 bytes ('True')
+		:return: The root value, usually a GGDictMapping
+		"""
+		if not isinstance(sourceData, bytes):
+			sourceData = bytes(sourceData)
+		viewData = _GGDictViewData(sourceData, GGDict._getStringOffsetsStart(sourceData), useShortStringIndex)
+		return viewData.readValue(12)
 
 	@staticmethod
-	def _readDictionary(sourceData: BytesIO, stringList: List[str], useShortStringIndex: bool) -> Dict[str, Any]:
-		result = {}
-		itemCount = Utils.readInt(sourceData)
-		for itemIndex in range(itemCount):
-			keyName = GGDict._readString(sourceData, stringList, useShortStringIndex)
-			value = GGDict._readValue(sourceData, stringList, useShortStringIndex)
-			if keyName in result:
-				print(f"Duplicate key '{keyName}', old value is {result[keyName]}, overwriting with {value}")
-			result[keyName] = value
-		GGDict._verifyBlockIsClosed(sourceData, _ValueType.DICT)
-		return result
+	def _getStringOffsetsStart(sourceData: bytes) -> int:
+		"""Verify the header to see if the source data is parsable, and if so, return the offset where the list of string offsets starts"""
+		if sourceData[0:4] != GGDict.DECODED_HEADER or sourceData[4:8] != GGDict.VERSION_HEADER:
+			raise DecodeError(f"Invalid header. Should be '{Utils.getPrintableBytes(GGDict.DECODED_HEADER)} {Utils.getPrintableBytes(GGDict.VERSION_HEADER)}, but is {Utils.getPrintableBytes(sourceData[0:8])}")
+		sourceDataLength = len(sourceData)
+		# Get the start offset of the file index entries
+		offsetsListStart = _INT_STRUCT.unpack_from(sourceData, 8)[0] + 1
+		if offsetsListStart >= sourceDataLength:
+			raise DecodeError(f"String offsets supposedly start at offset {offsetsListStart:,} but there are only {sourceDataLength:,} bytes available")
+		elif offsetsListStart < 12:
+			raise DecodeError(f"Invalid index start offset of {offsetsListStart:,}, too small")
+		return offsetsListStart
 
 	@staticmethod
-	def _readArray(sourceData: BytesIO, stringList: List[str], useShortStringIndex: bool) -> List[Any]:
-		itemCount = Utils.readInt(sourceData)
-		result = []
-		for itemIndex in range(itemCount):
-			result.append(GGDict._readValue(sourceData, stringList, useShortStringIndex))
-		# An array also ends with the array marker
-		GGDict._verifyBlockIsClosed(sourceData, _ValueType.ARRAY)
-		return result
+	def _parseValues(sourceData: bytes, startOffset: int, stringList: List[str], useShortStringIndex: bool):
+		"""
+		Parse the value that starts at the provided offset, and everything inside it.
+		This walks through the data by offset and uses a dispatch table per value type, since this gets called for every single value in big file indexes.
+		Each reader gets the offset just after the value type byte, and returns the read value and the offset after that value
+		"""
+		stringIndexStruct = _SHORT_STRUCT if useShortStringIndex else _INT_STRUCT
+		unpackStringIndex = stringIndexStruct.unpack_from
+		stringIndexSize = stringIndexStruct.size
+		unpackInt = _INT_STRUCT.unpack_from
+		stringCount = len(stringList)
+		sourceDataLength = len(sourceData)
 
-	@staticmethod
-	def _readString(sourceData: BytesIO, stringList: List[str], useShortStringIndex: bool) -> str:
-		stringIndex = Utils.readShort(sourceData) if useShortStringIndex else Utils.readInt(sourceData)
-		if stringIndex < 0 or stringIndex >= len(stringList):
-			raise GGDictError(f"Invalid string index {stringIndex}, string list contains {len(stringList):,} strings. StringList is {stringList}")
-		return stringList[stringIndex]
+		def readString(offset: int) -> Tuple[str, int]:
+			stringIndex = unpackStringIndex(sourceData, offset)[0]
+			if stringIndex < 0 or stringIndex >= stringCount:
+				raise GGDictError(f"Invalid string index {stringIndex}, string list contains {stringCount:,} strings. StringList is {stringList}")
+			return stringList[stringIndex], offset + stringIndexSize
 
-	@staticmethod
-	def _readInteger(sourceData: BytesIO, stringList: List[str], useShortStringIndex: bool) -> int:
-		return int(GGDict._readString(sourceData, stringList, useShortStringIndex), 10)
+		def readInteger(offset: int) -> Tuple[int, int]:
+			integerString, offset = readString(offset)
+			return int(integerString, 10), offset
 
-	@staticmethod
-	def _verifyBlockIsClosed(sourceData, valueTypeToClose: _ValueType):
-		closeByte = sourceData.read(1)
-		if closeByte != valueTypeToClose.value:
-			raise GGDictError(f"ValueType wasn't closed properly. Expected {valueTypeToClose.value} but was {closeByte} (At position {sourceData.tell():,})")
+		def readDictionary(offset: int) -> Tuple[Dict[str, Any], int]:
+			result = {}
+			itemCount = unpackInt(sourceData, offset)[0]
+			offset += 4
+			for itemIndex in range(itemCount):
+				# Keys are always strings without a value type, so read them directly instead of going through readString
+				keyIndex = unpackStringIndex(sourceData, offset)[0]
+				if keyIndex < 0 or keyIndex >= stringCount:
+					raise GGDictError(f"Invalid string index {keyIndex}, string list contains {stringCount:,} strings. StringList is {stringList}")
+				keyName = stringList[keyIndex]
+				value, offset = readValue(offset + stringIndexSize)
+				if keyName in result:
+					print(f"Duplicate key '{keyName}', old value is {result[keyName]}, overwriting with {value}")
+				result[keyName] = value
+			return result, verifyBlockIsClosed(offset, _ValueType.DICT)
+
+		def readArray(offset: int) -> Tuple[List[Any], int]:
+			itemCount = unpackInt(sourceData, offset)[0]
+			offset += 4
+			result = []
+			for itemIndex in range(itemCount):
+				value, offset = readValue(offset)
+				result.append(value)
+			# An array also ends with the array marker
+			return result, verifyBlockIsClosed(offset, _ValueType.ARRAY)
+
+		def readValue(offset: int) -> Tuple[Any, int]:
+			if offset >= sourceDataLength:
+				raise GGDictError(f"Expected a value at position {offset:,}, but the data is only {sourceDataLength:,} bytes")
+			valueReader = valueReaders.get(sourceData[offset])
+			if not valueReader:
+				raise GGDictError(f"Encountered unknown value type {sourceData[offset:offset + 1]}")
+			return valueReader(offset + 1)
+
+		def verifyBlockIsClosed(offset: int, valueTypeToClose: _ValueType) -> int:
+			closeByte = sourceData[offset:offset + 1]
+			if closeByte != valueTypeToClose.value:
+				raise GGDictError(f"ValueType wasn't closed properly. Expected {valueTypeToClose.value} but was {closeByte} (At position {offset + 1:,})")
+			return offset + 1
+
+		valueReaders = {
+			_DICT_TYPE: readDictionary,
+			_ARRAY_TYPE: readArray,
+			_STRING_TYPE: readString,
+			_INTEGER_TYPE: readInteger
+		}
+		return readValue(startOffset)[0]
 
 	@staticmethod
 	def toGgDict(valueToConvert, useShortStringIndex: bool) -> bytes:
@@ -118,76 +172,254 @@ class GGDict:
 		:return: The GGDict structure
 		"""
 		# Create the dict structure itself first. Later we'll add the offsets and the stringlist, but we need this size to be able to calculate offsets
-		stringList: List[str] = []
+		# The string table maps each string to its index. Dictionaries keep insertion order, so iterating over it gives the strings in index order
+		stringIndexes: Dict[str, int] = {}
 		ggdictOutput = bytearray()
-		GGDict._writeValue(ggdictOutput, stringList, useShortStringIndex, valueToConvert)
+		GGDict._writeValue(ggdictOutput, stringIndexes, _SHORT_STRUCT if useShortStringIndex else _INT_STRUCT, valueToConvert)
 		# Now we can create the string offsets and strings (The +4 is for the int indicating the offset where the string offsets list starts)
 		stringIndexOffset = len(GGDict.DECODED_HEADER) + len(GGDict.VERSION_HEADER) + 4 + len(ggdictOutput)
-		output = bytearray()
-		output.extend(GGDict.DECODED_HEADER)
-		output.extend(GGDict.VERSION_HEADER)
-		output.extend(Utils.toWritableInt(stringIndexOffset))
-		output.extend(ggdictOutput)
-		# Now we can start writing the string list
-		stringListOutput = bytearray()
-		stringListOffsets: List[int] = []
-		for s in stringList:
-			stringListOffsets.append(len(stringListOutput))
-			stringListOutput.extend(bytes(s, encoding='utf-8'))
-			stringListOutput.extend(b'\x00')  # Strings are 0-terminated
 		# The string offsets should be from the start of the ggdict, so add the ints (4 bytes) we're going to write for each string offset, plus the block closing and opening indicators
-		baseStringOffset = stringIndexOffset + len(stringList) * 4 + len(GGDict.FILE_INDEX_END) + len(GGDict.STRING_OFFSETS_START) + len(GGDict.STRINGS_START)
-		output.extend(GGDict.STRING_OFFSETS_START)
-		for stringListOffset in stringListOffsets:
-			output.extend(Utils.toWritableInt(baseStringOffset + stringListOffset))
-		output.extend(GGDict.FILE_INDEX_END)
-		output.extend(GGDict.STRINGS_START)
-		output.extend(stringListOutput)
-		return bytes(output)
+		baseStringOffset = stringIndexOffset + len(stringIndexes) * 4 + len(GGDict.FILE_INDEX_END) + len(GGDict.STRING_OFFSETS_START) + len(GGDict.STRINGS_START)
+		encodedStrings: List[bytes] = []
+		stringListOffsets: List[int] = []
+		for s in stringIndexes:
+			stringListOffsets.append(baseStringOffset)
+			encodedString = bytes(s, encoding='utf-8') + b'\x00'  # Strings are 0-terminated
+			encodedStrings.append(encodedString)
+			baseStringOffset += len(encodedString)
+		# All the parts are known now, so join them together in one go
+		return b''.join((
+			GGDict.DECODED_HEADER,
+			GGDict.VERSION_HEADER,
+			_INT_STRUCT.pack(stringIndexOffset),
+			ggdictOutput,
+			GGDict.STRING_OFFSETS_START,
+			struct.pack(f'<{len(stringListOffsets)}i', *stringListOffsets),
+			GGDict.FILE_INDEX_END,
+			GGDict.STRINGS_START,
+			b''.join(encodedStrings)
+		))
 
 	@staticmethod
-	def _writeValue(output: bytearray, stringList: List[str], useShortStringIndex: bool, value: Any):
+	def _writeValue(output: bytearray, stringIndexes: Dict[str, int], stringIndexStruct: struct.Struct, value: Any):
 		if isinstance(value, dict):
-			GGDict._writeDictionary(output, stringList, useShortStringIndex, value)
+			GGDict._writeDictionary(output, stringIndexes, stringIndexStruct, value)
 		elif isinstance(value, list):
-			GGDict._writeArray(output, stringList, useShortStringIndex, value)
+			GGDict._writeArray(output, stringIndexes, stringIndexStruct, value)
 		elif isinstance(value, str):
-			GGDict._writeString(output, stringList, useShortStringIndex, value)
+			GGDict._writeString(output, stringIndexes, stringIndexStruct, value)
 		elif isinstance(value, int):
-			GGDict._writeInteger(output, stringList, useShortStringIndex, value)
+			GGDict._writeInteger(output, stringIndexes, stringIndexStruct, value)
 		else:
 			raise GGDictError(f"Writing value type '{type(value)}' hasn't been implemented yet ({value=})")
 
 	@staticmethod
-	def _writeDictionary(output: bytearray, stringList: List[str], useShortStringIndex: bool, d: Dict[str, Any]):
-		output.extend(_ValueType.DICT.value)
-		output.extend(Utils.toWritableInt(len(d)))
+	def _writeDictionary(output: bytearray, stringIndexes: Dict[str, int], stringIndexStruct: struct.Struct, d: Dict[str, Any]):
+		output += _ValueType.DICT.value
+		output += _INT_STRUCT.pack(len(d))
 		for key in d:
-			GGDict._writeString(output, stringList, useShortStringIndex, key, False)
-			GGDict._writeValue(output, stringList, useShortStringIndex, d[key])
+			GGDict._writeString(output, stringIndexes, stringIndexStruct, key, False)
+			GGDict._writeValue(output, stringIndexes, stringIndexStruct, d[key])
 		# Close off the dict
-		output.extend(_ValueType.DICT.value)
+		output += _ValueType.DICT.value
 
 	@staticmethod
-	def _writeArray(output: bytearray, stringList: List[str], useShortStringIndex: bool, l: List[Any]):
-		output.extend(_ValueType.ARRAY.value)
-		output.extend(Utils.toWritableInt(len(l)))
+	def _writeArray(output: bytearray, stringIndexes: Dict[str, int], stringIndexStruct: struct.Struct, l: List[Any]):
+		output += _ValueType.ARRAY.value
+		output += _INT_STRUCT.pack(len(l))
 		for value in l:
-			GGDict._writeValue(output, stringList, useShortStringIndex, value)
-		output.extend(_ValueType.ARRAY.value)
+			GGDict._writeValue(output, stringIndexes, stringIndexStruct, value)
+		output += _ValueType.ARRAY.value
 
 	@staticmethod
-	def _writeString(output: bytearray, stringList: List[str], useShortStringIndex: bool, s: str, addValueType: bool = True):
+	def _writeString(output: bytearray, stringIndexes: Dict[str, int], stringIndexStruct: struct.Struct, s: str, addValueType: bool = True):
 		if addValueType:
-			output.extend(_ValueType.STRING.value)
-		if s not in stringList:
-			stringList.append(s)
-			keyIndex = len(stringList) - 1
-		else:
-			keyIndex = stringList.index(s)
-		output.extend(Utils.toWritableShort(keyIndex) if useShortStringIndex else Utils.toWritableInt(keyIndex))
+			output += _ValueType.STRING.value
+		keyIndex = stringIndexes.get(s)
+		if keyIndex is None:
+			keyIndex = len(stringIndexes)
+			stringIndexes[s] = keyIndex
+		output += stringIndexStruct.pack(keyIndex)
 
 	@staticmethod
-	def _writeInteger(output: bytearray, stringList: List[str], useShortStringIndex: bool, i: int):
-		output.extend(_ValueType.INTEGER.value)
-		GGDict._writeString(output, stringList, useShortStringIndex, str(i), False)
+	def _writeInteger(output: bytearray, stringIndexes: Dict[str, int], stringIndexStruct: struct.Struct, i: int):
+		output += _ValueType.INTEGER.value
+		GGDict._writeString(output, stringIndexes, stringIndexStruct, str(i), False)
+
+
+class _GGDictViewData:
+	"""The data shared by all the proxies of a GGDict view. Keeps track of the decoded strings and the parsed containers, so nothing gets parsed twice"""
+
+	def __init__(self, sourceData: bytes, offsetsListStart: int, useShortStringIndex: bool):
+		self.sourceData = sourceData
+		self.offsetsListStart = offsetsListStart
+		self.useShortStringIndex = useShortStringIndex
+		stringIndexStruct = _SHORT_STRUCT if useShortStringIndex else _INT_STRUCT
+		self.unpackStringIndex = stringIndexStruct.unpack_from
+		self.stringIndexSize = stringIndexStruct.size
+		# The string offsets list ends with a '-1'. Strings are UTF-8, which never contains 0xFF bytes, and string offsets are positive, so the first aligned 0xFFFFFFFF is the end
+		offsetsListEnd = sourceData.find(GGDict.FILE_INDEX_END, offsetsListStart)
+		while offsetsListEnd != -1 and (offsetsListEnd - offsetsListStart) % 4 != 0:
+			offsetsListEnd = sourceData.find(GGDict.FILE_INDEX_END, offsetsListEnd + 1)
+		if offsetsListEnd == -1:
+			offsetsListEnd = len(sourceData) - (len(sourceData) - offsetsListStart) % 4
+		self.strings = _LazyStringList(sourceData, offsetsListStart, (offsetsListEnd - offsetsListStart) // 4)
+		# The start and end offsets of each container that's been skipped over, and each container proxy that's been created, both keyed on the container start offset
+		self.containerEnds: Dict[int, int] = {}
+		self.containers: Dict[int, Union['GGDictMapping', 'GGDictSequence']] = {}
+
+	def readString(self, offset: int) -> str:
+		"""Read the string whose index is stored at the provided offset"""
+		stringIndex = self.unpackStringIndex(self.sourceData, offset)[0]
+		if stringIndex < 0 or stringIndex >= len(self.strings):
+			raise GGDictError(f"Invalid string index {stringIndex}, string list contains {len(self.strings):,} strings")
+		return self.strings[stringIndex]
+
+	def readValue(self, offset: int):
+		"""Read the value whose value type is at the provided offset. Containers are returned as proxies, and are only parsed once they're accessed"""
+		if offset >= len(self.sourceData):
+			raise GGDictError(f"Expected a value at position {offset:,}, but the data is only {len(self.sourceData):,} bytes")
+		valueType = self.sourceData[offset]
+		if valueType == _STRING_TYPE:
+			return self.readString(offset + 1)
+		elif valueType == _INTEGER_TYPE:
+			return int(self.readString(offset + 1), 10)
+		elif valueType == _DICT_TYPE or valueType == _ARRAY_TYPE:
+			if offset not in self.containers:
+				self.containers[offset] = GGDictMapping(self, offset) if valueType == _DICT_TYPE else GGDictSequence(self, offset)
+			return self.containers[offset]
+		raise GGDictError(f"Encountered unknown value type {self.sourceData[offset:offset + 1]}")
+
+	def skipValue(self, offset: int) -> int:
+		"""Find where the value whose value type is at the provided offset ends, without decoding any strings. Returns the offset just after the value"""
+		sourceData = self.sourceData
+		valueType = sourceData[offset]
+		scalarValueSize = 1 + self.stringIndexSize
+		if valueType == _STRING_TYPE or valueType == _INTEGER_TYPE:
+			return offset + scalarValueSize
+		if offset in self.containerEnds:
+			return self.containerEnds[offset]
+		if valueType != _DICT_TYPE and valueType != _ARRAY_TYPE:
+			raise GGDictError(f"Encountered unknown value type {sourceData[offset:offset + 1]}")
+		# Dictionary items start with a key, array items don't
+		keySize = self.stringIndexSize if valueType == _DICT_TYPE else 0
+		itemCount = _INT_STRUCT.unpack_from(sourceData, offset + 1)[0]
+		currentOffset = offset + 5
+		for itemIndex in range(itemCount):
+			currentOffset += keySize
+			# Most values are strings or integers, skip those here instead of with a method call for each one
+			itemValueType = sourceData[currentOffset]
+			if itemValueType == _STRING_TYPE or itemValueType == _INTEGER_TYPE:
+				currentOffset += scalarValueSize
+			else:
+				currentOffset = self.skipValue(currentOffset)
+		return self.closeContainer(offset, currentOffset, _ValueType.DICT if valueType == _DICT_TYPE else _ValueType.ARRAY)
+
+	def closeContainer(self, startOffset: int, closeOffset: int, valueTypeToClose: _ValueType) -> int:
+		"""Verify the container starting at 'startOffset' is closed at 'closeOffset', store its span, and return the offset after it"""
+		closeByte = self.sourceData[closeOffset:closeOffset + 1]
+		if closeByte != valueTypeToClose.value:
+			raise GGDictError(f"ValueType wasn't closed properly. Expected {valueTypeToClose.value} but was {closeByte} (At position {closeOffset + 1:,})")
+		self.containerEnds[startOffset] = closeOffset + 1
+		return closeOffset + 1
+
+
+class _LazyStringList(Sequence):
+	"""The string list of a GGDict, where each string only gets decoded the first time it's needed"""
+
+	def __init__(self, sourceData: bytes, offsetsListStart: int, stringCount: int):
+		self._sourceData = sourceData
+		self._offsetsListStart = offsetsListStart
+		self._strings: List[str] = [None] * stringCount
+
+	def __len__(self) -> int:
+		return len(self._strings)
+
+	def __getitem__(self, stringIndex: int) -> str:
+		string = self._strings[stringIndex]
+		if string is None:
+			stringOffset = _INT_STRUCT.unpack_from(self._sourceData, self._offsetsListStart + stringIndex * 4)[0]
+			string = Utils.readString(self._sourceData, stringOffset)
+			self._strings[stringIndex] = string
+		return string
+
+
+class GGDictMapping(Mapping):
+	"""A read-only view of a dictionary inside a GGDict, see GGDict.view. The keys and the location of each value are only read when this is first accessed"""
+
+	def __init__(self, viewData: _GGDictViewData, startOffset: int):
+		self._viewData = viewData
+		self.startOffset = startOffset
+		self._valueOffsets: Dict[str, int] = None
+
+	@property
+	def endOffset(self) -> int:
+		"""The offset just after the end of this dictionary in the GGDict data"""
+		return self._viewData.skipValue(self.startOffset)
+
+	def _getValueOffsets(self) -> Dict[str, int]:
+		if self._valueOffsets is None:
+			viewData = self._viewData
+			valueOffsets = {}
+			itemCount = _INT_STRUCT.unpack_from(viewData.sourceData, self.startOffset + 1)[0]
+			currentOffset = self.startOffset + 5
+			for itemIndex in range(itemCount):
+				keyName = viewData.readString(currentOffset)
+				currentOffset += viewData.stringIndexSize
+				valueOffsets[keyName] = currentOffset
+				currentOffset = viewData.skipValue(currentOffset)
+			viewData.closeContainer(self.startOffset, currentOffset, _ValueType.DICT)
+			self._valueOffsets = valueOffsets
+		return self._valueOffsets
+
+	def __getitem__(self, key: str):
+		return self._viewData.readValue(self._getValueOffsets()[key])
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self._getValueOffsets())
+
+	def __len__(self) -> int:
+		return len(self._getValueOffsets())
+
+	def toPython(self) -> Dict[str, Any]:
+		"""Fully parse this dictionary and everything inside it into normal Python dictionaries and lists"""
+		return GGDict._parseValues(self._viewData.sourceData, self.startOffset, self._viewData.strings, self._viewData.useShortStringIndex)
+
+
+class GGDictSequence(Sequence):
+	"""A read-only view of an array inside a GGDict, see GGDict.view. The location of each value is only read when this is first accessed"""
+
+	def __init__(self, viewData: _GGDictViewData, startOffset: int):
+		self._viewData = viewData
+		self.startOffset = startOffset
+		self._valueOffsets: List[int] = None
+
+	@property
+	def endOffset(self) -> int:
+		"""The offset just after the end of this array in the GGDict data"""
+		return self._viewData.skipValue(self.startOffset)
+
+	def _getValueOffsets(self) -> List[int]:
+		if self._valueOffsets is None:
+			viewData = self._viewData
+			valueOffsets = []
+			itemCount = _INT_STRUCT.unpack_from(viewData.sourceData, self.startOffset + 1)[0]
+			currentOffset = self.startOffset + 5
+			for itemIndex in range(itemCount):
+				valueOffsets.append(currentOffset)
+				currentOffset = viewData.skipValue(currentOffset)
+			viewData.closeContainer(self.startOffset, currentOffset, _ValueType.ARRAY)
+			self._valueOffsets = valueOffsets
+		return self._valueOffsets
+
+	def __getitem__(self, index: Union[int, slice]):
+		if isinstance(index, slice):
+			return [self._viewData.readValue(valueOffset) for valueOffset in self._getValueOffsets()[index]]
+		return self._viewData.readValue(self._getValueOffsets()[index])
+
+	def __len__(self) -> int:
+		return len(self._getValueOffsets())
+
+	def toPython(self) -> List[Any]:
+		"""Fully parse this array and everything inside it into normal Python lists and dictionaries"""
+		return GGDict._parseValues(self._viewData.sourceData, self.startOffset, self._viewData.strings, self._viewData.useShortStringIndex)
@@ -0,0 +1,204 @@
+import mmap, os
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+
+import Codec, Stats, Utils
+from CustomExceptions import DecodeError
+from GGDict import GGDict
+if TYPE_CHECKING:
+	# Only imported for the type hints, the index cache is created by whoever enables it, so sqlite doesn't need to be loaded when it's not used
+	from IndexCache import IndexCache
+
+# If set, parsed file indexes are stored in and loaded from this cache, see setIndexCache
+_indexCache: Optional['IndexCache'] = None
+
+def getIndexCache() -> Optional['IndexCache']:
+	return _indexCache
+
+def setIndexCache(indexCache: Optional['IndexCache']):
+	"""Set the cache to store parsed file indexes in, so they don't need to be parsed again if the ggpack didn't change. Set to None to disable the cache"""
+	global _indexCache
+	_indexCache = indexCache
+
+# Worker processes keep their ggpack files open, so they don't need to be opened again for each task, see getSharedGGPack
+_sharedGGPacks: Dict[str, 'GGPack'] = {}
+
+def getSharedGGPack(gameFilePath: str) -> 'GGPack':
+	"""Get a GGPack for the provided path that stays open for the rest of this process. Meant for worker processes that handle many tasks for the same ggpack"""
+	if gameFilePath not in _sharedGGPacks:
+		_sharedGGPacks[gameFilePath] = GGPack(gameFilePath)
+	return _sharedGGPacks[gameFilePath]
+
+
+class GGPack:
+	"""
+	Reads a ggpack file. The file is opened and memory-mapped once, and the file index and the packed files inside are provided as memoryview slices of that map,
+	so nothing gets read or copied until it's actually needed.
+	Packed files can also be read by name, for instance 'GGPack.open(path)["Text_en.tsv"]' returns the decoded contents of 'Text_en.tsv'
+	"""
+
+	def __init__(self, gameFilePath: str):
+		self.gameFilePath = gameFilePath
+		self._gameFile = open(gameFilePath, 'rb')
+		try:
+			self.fileSize = os.fstat(self._gameFile.fileno()).st_size
+			if self.fileSize < 12:
+				raise DecodeError(f"File '{gameFilePath}' is too small to be a ggpack file")
+			self._gameFileMap = mmap.mmap(self._gameFile.fileno(), 0, access=mmap.ACCESS_READ)
+		except Exception:
+			self._gameFile.close()
+			raise
+		self._gameFileView = memoryview(self._gameFileMap)
+		self.fileIndexOffset = Utils.parseInt(self._gameFileMap, 0)
+		self.fileIndexSize = Utils.parseInt(self._gameFileMap, 4)
+		self._fileIndex: Dict = None
+		self._fileEntriesByName: Dict[str, Dict] = None
+
+	@classmethod
+	def open(cls, gameFilePath: str) -> 'GGPack':
+		return cls(gameFilePath)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, excType, excValue, traceback):
+		self.close()
+
+	def close(self):
+		"""Close the ggpack file. Any memoryviews gotten from this object can't be used anymore after this"""
+		if self._gameFileView is not None:
+			self._gameFileView.release()
+			self._gameFileView = None
+			try:
+				self._gameFileMap.close()
+			except BufferError:
+				# Some slices are still in use. The map gets closed automatically once those are gone
+				pass
+			self._gameFile.close()
+
+	def getEncodedFileIndex(self) -> memoryview:
+		"""Get the still-encoded file index, which describes which files are in this ggpack and where"""
+		if self.fileIndexSize < 1:
+			raise DecodeError(f"Invalid data size of {self.fileIndexSize}")
+		if self.fileIndexOffset + self.fileIndexSize > self.fileSize:
+			raise DecodeError(f"Found an offset of {self.fileIndexOffset:,} and a data size of {self.fileIndexSize:,}, totalling {self.fileIndexOffset + self.fileIndexSize:,}, but the file is only {self.fileSize:,} bytes on disk")
+		return self._gameFileView[self.fileIndexOffset:self.fileIndexOffset + self.fileIndexSize]
+
+	def getFileIndex(self) -> Dict:
+		"""Get the decoded and parsed file index. It's only parsed the first time this is called, or loaded from the index cache if that's set"""
+		archiveName = os.path.basename(self.gameFilePath)
+		if self._fileIndex is None and _indexCache:
+			with Stats.measure(Stats.INDEX_CACHE_LOAD, archiveName=archiveName):
+				self._fileIndex = _indexCache.get(self.gameFilePath, self.fileIndexOffset, self.fileIndexSize)
+		if self._fileIndex is None:
+			with Stats.measure(Stats.INDEX_READ, self.fileIndexSize, archiveName):
+				encodedFileIndex = bytes(self.getEncodedFileIndex())
+			with Stats.measure(Stats.INDEX_DECODE, self.fileIndexSize, archiveName):
+				decodedFileIndex = Codec.decode(encodedFileIndex)
+			with Stats.measure(Stats.INDEX_PARSE, self.fileIndexSize, archiveName):
+				self._fileIndex = GGDict.fromGgDict(decodedFileIndex, True)
+			if _indexCache:
+				_indexCache.store(self.gameFilePath, self.fileIndexOffset, self.fileIndexSize, self._fileIndex)
+		return self._fileIndex
+
+	def getEncodedData(self, startOffset: int, size: int) -> memoryview:
+		"""Get the still-encoded data at the provided location, without copying it"""
+		if size is None or size < 0:
+			raise DecodeError(f"Missing or invalid size parameter for entry at start offset {startOffset}")
+		if startOffset < 0 or startOffset + size > self.fileSize:
+			raise DecodeError(f"Entry at offset {startOffset:,} with a size of {size:,} bytes goes past the end of '{self.gameFilePath}', which is {self.fileSize:,} bytes")
+		return self._gameFileView[startOffset:startOffset + size]
+
+	def getEncodedFileEntry(self, fileEntry: Dict) -> memoryview:
+		"""Get the still-encoded data for the provided file index entry, without copying it"""
+		return self.getEncodedData(fileEntry['offset'], fileEntry['size'])
+
+	def decodeFileEntry(self, fileEntry: Dict) -> bytes:
+		"""Get the decoded data for the provided file index entry"""
+		encodedData = self.getEncodedFileEntry(fileEntry)
+		if not GGPack.isEncoded(fileEntry['filename']):
+			return bytes(encodedData)
+		return Codec.decode(encodedData)
+
+	def getFileEntry(self, filename: str) -> Dict:
+		"""Get the file index entry for the provided filename. Raises a KeyError if there's no file with that name in this ggpack"""
+		fileEntriesByName = self._getFileEntriesByName()
+		if filename not in fileEntriesByName:
+			raise KeyError(f"There's no file called '{filename}' in '{self.gameFilePath}'")
+		return fileEntriesByName[filename]
+
+	def _getFileEntriesByName(self) -> Dict[str, Dict]:
+		# Build the filename lookup table only once, so finding a file by name doesn't need to go through the whole file index each time
+		if self._fileEntriesByName is None:
+			self._fileEntriesByName = {fileEntry['filename']: fileEntry for fileEntry in self.iterEntries()}
+		return self._fileEntriesByName
+
+	def iterEntries(self) -> Iterator[Dict]:
+		"""Iterate over the file index entries, in the order they're stored in the file index. Entries that are missing a filename, offset, or size are skipped"""
+		for fileEntry in self.getFileIndex()['files']:
+			if 'filename' in fileEntry and 'offset' in fileEntry and 'size' in fileEntry:
+				yield fileEntry
+
+	def getFilenames(self) -> List[str]:
+		return list(self._getFileEntriesByName())
+
+	def read(self, filename: str, stream: bool = False, chunkSize: int = Codec.DEFAULT_CHUNK_SIZE) -> Union[bytes, Iterator[bytes]]:
+		"""
+		Get the decoded contents of a file inside this ggpack
+		:param filename: The name of the file to read
+		:param stream: If False, the whole decoded file gets returned at once. If True, an iterator is returned that decodes and yields the file one chunk at a time, so big files don't have to be fully in memory
+		:param chunkSize: When streaming, how big each chunk should be
+		:return: The decoded file contents, or an iterator over chunks of them
+		"""
+		fileEntry = self.getFileEntry(filename)
+		if stream:
+			return Codec.iterCodedChunks(self.getEncodedFileEntry(fileEntry), GGPack.isEncoded(fileEntry['filename']), chunkSize)
+		return self.decodeFileEntry(fileEntry)
+
+	def __getitem__(self, filename: str) -> bytes:
+		return self.read(filename)
+
+	def __contains__(self, filename: str) -> bool:
+		return filename in self._getFileEntriesByName()
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self.getFilenames())
+
+	def __len__(self) -> int:
+		return len(self._getFileEntriesByName())
+
+	def findExtentProblems(self) -> List[str]:
+		"""
+		Check whether the location of each file in the file index makes sense: inside the ggpack, not overlapping the header or the file index, and not partially overlapping another file.
+		Multiple files pointing to exactly the same location is fine, that's how duplicate files are stored
+		:return: A list of the problems found, empty if there aren't any
+		"""
+		problems: List[str] = []
+		fileIndexEnd = self.fileIndexOffset + self.fileIndexSize
+		if self.fileIndexOffset < 8 or fileIndexEnd > self.fileSize:
+			problems.append(f"The file index at offset {self.fileIndexOffset:,} with a size of {self.fileIndexSize:,} bytes isn't inside the ggpack, which is {self.fileSize:,} bytes")
+		filenamesByExtent: Dict[Tuple[int, int], List[str]] = {}
+		for fileEntry in self.getFileIndex()['files']:
+			if 'filename' not in fileEntry or 'offset' not in fileEntry or 'size' not in fileEntry:
+				problems.append(f"Invalid file entry '{fileEntry}', missing key 'filename', 'offset', or 'size'")
+				continue
+			fileStart = fileEntry['offset']
+			fileEnd = fileStart + fileEntry['size']
+			if fileStart < 8 or fileEntry['size'] < 0 or fileEnd > self.fileSize:
+				problems.append(f"File '{fileEntry['filename']}' at offset {fileStart:,} with a size of {fileEntry['size']:,} bytes isn't inside the ggpack, which is {self.fileSize:,} bytes")
+			elif fileStart < fileIndexEnd and fileEnd > self.fileIndexOffset:
+				problems.append(f"File '{fileEntry['filename']}' at offset {fileStart:,} with a size of {fileEntry['size']:,} bytes overlaps the file index")
+			else:
+				filenamesByExtent.setdefault((fileStart, fileEnd), []).append(fileEntry['filename'])
+		# Sort by start offset, then each file should start after the previous one ended
+		previousExtent = None
+		for extent in sorted(filenamesByExtent):
+			if previousExtent and extent[0] < previousExtent[1]:
+				problems.append(f"Files {filenamesByExtent[previousExtent]} at offsets {previousExtent[0]:,} to {previousExtent[1]:,} and files {filenamesByExtent[extent]} at offsets {extent[0]:,} to {extent[1]:,} overlap")
+			if not previousExtent or extent[1] > previousExtent[1]:
+				previousExtent = extent
+		return problems
+
+	@staticmethod
+	def isEncoded(filename: str) -> bool:
+		"""Most files inside a ggpack are encoded, but .bank files, which contain music and sounds, are stored as-is"""
+		return '.bank' not in filename
@@ -0,0 +1,156 @@
+import os, re
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import Codec
+from GGPack import GGPack
+
+# The game loads 'Weird.ggpack' files with a number from 1 to 9, optionally followed by a letter from a to f (see getAvailableFilename in main)
+GGPACK_FILENAME_REGEX = re.compile(r'^Weird\.ggpack([1-9])([a-f]?)$')
+
+
+def getGGPackPriority(gameFilePath: str) -> Optional[Tuple[int, str]]:
+	"""Get the load order of the provided ggpack file, files with a higher priority override files with the same name in ggpacks with a lower priority. Returns None if it isn't a game ggpack file"""
+	filenameMatch = GGPACK_FILENAME_REGEX.match(os.path.basename(gameFilePath))
+	if not filenameMatch:
+		return None
+	# Sort on the number first, and within the same number, the letterless file comes before the lettered ones
+	return int(filenameMatch.group(1)), filenameMatch.group(2)
+
+def findGGPackFiles(gameFolderPath: str) -> List[str]:
+	"""Find all the game ggpack files in the provided folder, sorted from lowest to highest priority"""
+	gameFilePaths = [directoryEntry.path for directoryEntry in os.scandir(gameFolderPath) if directoryEntry.is_file() and getGGPackPriority(directoryEntry.name)]
+	gameFilePaths.sort(key=getGGPackPriority)
+	return gameFilePaths
+
+
+class GGPackSet:
+	"""
+	All the ggpack files in a game folder, seen as one archive the way the game sees them: if multiple ggpacks contain a file with the same name, the one in the ggpack with the highest priority wins.
+	The file index of each ggpack is only parsed once. Call refresh to pick up ggpack files that were changed, added, or removed since, only those get parsed again
+	"""
+
+	def __init__(self, gameFolderPath: str):
+		if not os.path.isdir(gameFolderPath):
+			raise FileNotFoundError(f"Asked to open the game folder '{gameFolderPath}', but that folder doesn't exist")
+		self.gameFolderPath = gameFolderPath
+		# The opened ggpacks, sorted from lowest to highest priority, and the size and modification time they had when they were opened
+		self._ggpacks: List[GGPack] = []
+		self._ggpackKeys: Dict[str, Tuple[int, int]] = {}
+		# For each filename, the ggpack that wins, and the file entry in that ggpack
+		self._effectiveEntries: Dict[str, Tuple[GGPack, Dict]] = {}
+		self.refresh()
+
+	@classmethod
+	def open(cls, gameFolderPath: str) -> 'GGPackSet':
+		return cls(gameFolderPath)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, excType, excValue, traceback):
+		self.close()
+
+	def close(self):
+		for ggpack in self._ggpacks:
+			ggpack.close()
+		self._ggpacks = []
+		self._ggpackKeys.clear()
+		self._effectiveEntries.clear()
+
+	def getGGPacks(self) -> List[GGPack]:
+		"""Get the opened ggpacks, sorted from lowest to highest priority"""
+		return list(self._ggpacks)
+
+	def refresh(self) -> List[str]:
+		"""
+		Check whether any ggpack files in the game folder were changed, added, or removed since they were opened, and update the effective file index for only those ggpacks.
+		ggpack files that can't be read are skipped with a warning, and tried again once they change
+		:return: The paths of the ggpack files that were changed, added, or removed
+		"""
+		currentGameFilePaths = findGGPackFiles(self.gameFolderPath)
+		currentKeys: Dict[str, Tuple[int, int]] = {}
+		for gameFilePath in currentGameFilePaths:
+			fileStats = os.stat(gameFilePath)
+			currentKeys[gameFilePath] = (fileStats.st_size, fileStats.st_mtime_ns)
+		changedGameFilePaths = [gameFilePath for gameFilePath in self._ggpackKeys if currentKeys.get(gameFilePath) != self._ggpackKeys[gameFilePath]]
+		changedGameFilePaths.extend(gameFilePath for gameFilePath in currentKeys if gameFilePath not in self._ggpackKeys)
+		if not changedGameFilePaths:
+			return changedGameFilePaths
+		# Open all the changed ggpacks before changing anything, so if that fails, this set still has the ggpacks it had before
+		newGGPacksByPath: Dict[str, GGPack] = {}
+		try:
+			for gameFilePath in changedGameFilePaths:
+				if gameFilePath in currentKeys:
+					newGGPack = GGPackSet._openGGPack(gameFilePath)
+					if newGGPack:
+						newGGPacksByPath[gameFilePath] = newGGPack
+		except BaseException:
+			for newGGPack in newGGPacksByPath.values():
+				newGGPack.close()
+			raise
+		# Only the filenames in the changed ggpacks, from before and after the change, can have a different winner now
+		affectedFilenames: Set[str] = set()
+		ggpacksByPath = {ggpack.gameFilePath: ggpack for ggpack in self._ggpacks}
+		oldGGPacks = [ggpacksByPath.pop(gameFilePath) for gameFilePath in changedGameFilePaths if gameFilePath in ggpacksByPath]
+		for ggpack in oldGGPacks + list(newGGPacksByPath.values()):
+			affectedFilenames.update(ggpack.getFilenames())
+		ggpacksByPath.update(newGGPacksByPath)
+		self._ggpacks = [ggpacksByPath[gameFilePath] for gameFilePath in currentGameFilePaths if gameFilePath in ggpacksByPath]
+		# Skipped ggpacks are stored too, so they're only tried again once they change
+		self._ggpackKeys = currentKeys
+		for filename in affectedFilenames:
+			self._effectiveEntries.pop(filename, None)
+			for ggpack in reversed(self._ggpacks):
+				if filename in ggpack:
+					self._effectiveEntries[filename] = (ggpack, ggpack.getFileEntry(filename))
+					break
+		for oldGGPack in oldGGPacks:
+			oldGGPack.close()
+		return changedGameFilePaths
+
+	@staticmethod
+	def _openGGPack(gameFilePath: str) -> Optional[GGPack]:
+		"""Open the provided ggpack and parse its file index. Returns None if that fails, so one damaged ggpack doesn't make the files in the other ggpacks unavailable"""
+		try:
+			ggpack = GGPack(gameFilePath)
+		except Exception as e:
+			print(f"WARNING: Skipping ggpack file '{gameFilePath}' because it can't be opened: {e}")
+			return None
+		try:
+			ggpack.getFilenames()
+		except Exception as e:
+			print(f"WARNING: Skipping ggpack file '{gameFilePath}' because its file index can't be read: {e}")
+			ggpack.close()
+			return None
+		return ggpack
+
+	def getFileEntry(self, filename: str) -> Tuple[GGPack, Dict]:
+		"""Get the ggpack that the game would load the provided file from, and the file entry in that ggpack. Raises a KeyError if none of the ggpacks contain a file with that name"""
+		if filename not in self._effectiveEntries:
+			raise KeyError(f"There's no file called '{filename}' in any of the ggpack files in '{self.gameFolderPath}'")
+		return self._effectiveEntries[filename]
+
+	def iterEntries(self) -> Iterator[Tuple[GGPack, Dict]]:
+		"""Iterate over the ggpack and file entry of each file the game would load, sorted by filename"""
+		for filename in sorted(self._effectiveEntries):
+			yield self._effectiveEntries[filename]
+
+	def getFilenames(self) -> List[str]:
+		return sorted(self._effectiveEntries)
+
+	def read(self, filename: str, stream: bool = False, chunkSize: int = Codec.DEFAULT_CHUNK_SIZE) -> Union[bytes, Iterator[bytes]]:
+		"""Get the decoded contents of the version of a file that the game would load. See GGPack.read for the parameters"""
+		ggpack, fileEntry = self.getFileEntry(filename)
+		return ggpack.read(fileEntry['filename'], stream, chunkSize)
+
+	def __getitem__(self, filename: str) -> bytes:
+		return self.read(filename)
+
+	def __contains__(self, filename: str) -> bool:
+		return filename in self._effectiveEntries
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self.getFilenames())
+
+	def __len__(self) -> int:
+		return len(self._effectiveEntries)
@@ -0,0 +1,58 @@
+import json, os, sqlite3
+from typing import Dict, Optional, Tuple
+
+
+class IndexCache:
+	"""
+	Decoding and parsing the file index of a big ggpack takes a while, and is needed for every action on that ggpack.
+	This stores parsed file indexes in an SQLite database, so they only need to be parsed again when the ggpack changes.
+	Each stored index is keyed on the ggpack's path, size, modification time, and file index location, if any of those change the index gets parsed and stored again
+	"""
+
+	def __init__(self, databasePath: str):
+		self.databasePath = databasePath
+		self._connection: Optional[sqlite3.Connection] = None
+		try:
+			self._connection = sqlite3.connect(databasePath)
+			with self._connection:
+				self._connection.execute("CREATE TABLE IF NOT EXISTS fileIndexes (path TEXT PRIMARY KEY, fileSize INTEGER, modifiedTime INTEGER, fileIndexOffset INTEGER, fileIndexSize INTEGER, fileIndex TEXT)")
+		except sqlite3.Error as e:
+			# The cache only saves time, so if the database can't be used, for instance because it's damaged, every file index just gets parsed like without the cache
+			print(f"WARNING: Unable to use the index cache '{databasePath}', not caching file indexes: {e}")
+			self.close()
+
+	def close(self):
+		if self._connection:
+			self._connection.close()
+			self._connection = None
+
+	@staticmethod
+	def _getKey(gameFilePath: str, fileIndexOffset: int, fileIndexSize: int) -> Tuple[str, int, int, int, int]:
+		fileStats = os.stat(gameFilePath)
+		return os.path.abspath(gameFilePath), fileStats.st_size, fileStats.st_mtime_ns, fileIndexOffset, fileIndexSize
+
+	def get(self, gameFilePath: str, fileIndexOffset: int, fileIndexSize: int) -> Optional[Dict]:
+		"""Get the stored file index for the provided ggpack, or None if it isn't stored or if the ggpack changed since it was stored"""
+		if not self._connection:
+			return None
+		path, fileSize, modifiedTime, fileIndexOffset, fileIndexSize = IndexCache._getKey(gameFilePath, fileIndexOffset, fileIndexSize)
+		try:
+			row = self._connection.execute("SELECT fileIndex FROM fileIndexes WHERE path = ? AND fileSize = ? AND modifiedTime = ? AND fileIndexOffset = ? AND fileIndexSize = ?",
+										   (path, fileSize, modifiedTime, fileIndexOffset, fileIndexSize)).fetchone()
+			return json.loads(row[0]) if row else None
+		except (sqlite3.Error, ValueError) as e:
+			# Treat it like the index isn't stored, so it gets parsed from the ggpack instead
+			print(f"WARNING: Unable to load the file index of '{gameFilePath}' from the index cache '{self.databasePath}': {e}")
+			return None
+
+	def store(self, gameFilePath: str, fileIndexOffset: int, fileIndexSize: int, fileIndex: Dict):
+		"""Store the parsed file index of the provided ggpack, replacing any older stored index for that ggpack"""
+		if not self._connection:
+			return
+		try:
+			with self._connection:
+				self._connection.execute("INSERT OR REPLACE INTO fileIndexes VALUES (?, ?, ?, ?, ?, ?)",
+										 IndexCache._getKey(gameFilePath, fileIndexOffset, fileIndexSize) + (json.dumps(fileIndex, separators=(',', ':')),))
+		except sqlite3.Error as e:
+			# Not being able to store the index isn't a problem, it just needs to get parsed again next time
+			print(f"WARNING: Unable to store the file index of '{gameFilePath}' in the index cache '{self.databasePath}': {e}")
@@ -1,7 +1,32 @@
 # Contains the decoding keys for Return To Monkey Island
+# The two key tables are stored as binary files in the 'resources' folder, and only get loaded the first time they're used,
+# so starting MonkeyPack doesn't need to load them when they're not needed, for instance for 'help' or for a 'list' with a cached file index
+import os, sys
 
 MAGIC_VALUE = 0x78
 
-KEY_1: bytes = b'\xD5\x7D\xFB\x4D\x51\xF5\x5E\xF4\xAA\x0B\x8A\x7E\x00\x8D\xCB\x66\x3A\x85\xA0\x30\x8B\x2D\xF3\xE8\xF0\x62\xBF\x26\x73\xE7\x61\x41\xCB\x03\x6C\xC9\xEF\x4D\xCE\xF2\x94\x61\xAB\xEC\xD1\x54\xCD\x3E\x0E\xE0\xA3\xE3\x45\x10\xFE\x1D\xA2\xF6\x96\x5B\x10\x10\xC1\xCC\x8F\x20\x15\x05\xD2\xA2\xC4\xB8\x31\x2D\xCC\xC1\x6B\x88\x97\x52\xFD\x07\x4A\xCF\xB8\x1B\x82\xDD\x65\x8F\x35\x81\x8B\x84\x0D\x5A\xCB\x7F\x89\xED\xD3\x29\x80\x6C\xC5\x5C\x44\x34\x46\x87\x8C\x89\xEE\xCE\xFF\xBE\x36\x86\x94\xF1\xF3\xD3\xE8\xD2\xCA\x16\x84\xF4\x39\x36\xF3\x48\x9D\x45\xBC\x2C\xF1\x00\x40\x96\x73\x12\xF4\x0B\xEE\x48\x42\x26\x07\x4A\x4B\x0E\xFB\x1B\x54\x9D\xB7\xE8\x76\xEE\xCB\x61\x88\xB0\xFB\xFB\xCC\xDD\xD5\x9B\x52\xA5\x4D\x1A\xDB\x36\xFD\x04\x87\x6E\x06\xC8\x62\xD0\x61\x2D\x97\x09\xFE\xF8\x24\xE8\x8F\x61\xBC\xC4\x68\x78\x53\x87\xA6\x88\x10\xF7\x45\xC0\x27\x13\x0E\x76\x35\x34\x35\x52\x37\x8E\x4D\xED\x53\xB4\xD2\xA8\x58\x70\xCB\xB5\x45\x4D\xC7\xAA\xBB\xE0\x68\x27\xDB\x26\x7E\x3C\x5C\xDC\x3A\x03\xAF\x68\x24\x54\x9A\x69\x61\xC8\x5A\x8D\x20\xAC\xD3\x9C'
+# The filename and the expected size of each key table
+_KEY_RESOURCES = {
+	'KEY_1': ('key1.bin', 0x100),
+	'KEY_2': ('key2.bin', 0x10000)
+}
 
-KEY_2: bytes = b'\xF7\xEC\x7E\xB6\xE3\x42\x5C\x36\x55\x5E\xA2\x97\xC0\x1E\xBE\x2C\x07\xFB\xDC\x96\x8D\x0F\x97\xCA\x43\xA3\xB3\x0C\x46\x38\x60\xDF\x09\x13\x15\xC4\x04\xFD\xC6\x7C\x3D\x29\x9F\x64\xEE\xF9\xC1\x33\x37\x64\x33\x35\xB5\x7A\x9C\x64\x49\x79\x17\x61\x19\x7B\x76\x9E\xCA\x21\x56\xBE\x4D\x0D\xE2\x41\x0D\xD0\x24\x29\xD4\xC5\xB6\xE8\x6E\x02\x3B\x3A\xEF\x47\x85\xEE\x1D\x8C\x63\x3F\x45\xAF\x6D\x58\xF6\x2A\xA5\xF0\x40\xFD\xD6\xF0\xB8\x40\x03\x48\x63\xBC\x79\x55\x78\x77\xD4\x44\x68\xA0\x0D\xDF\xCE\x9B\x19\x2A\x46\x67\x96\xFA\xE5\x93\x76\xF9\x89\x0B\xB1\xBB\x4C\x5F\x7C\x5F\xBE\xCF\xE3\xEA\xAF\xB5\x20\x70\x56\xA9\xEA\x00\x5C\x24\x11\x06\xCA\xDC\x0D\x99\xBD\xF8\x87\x66\xD9\x10\x44\x8C\x92\xE7\x28\x36\x84\xED\x2A\x49\x7B\x48\x66\x63\x28\x8B\x13\x20\xE2\x50\x34\xD2\xE7\x7E\x09\x1F\x76\xAE\xD1\xA8\x02\x5F\xEE\xB2\xD3\x8E\xDC\x47\xD7\xC0\xFF\x46\x53\x60\xE9\x60\x85\x11\xA7\x73\x42\x2D\x06\x40\xEC\xE0\x1E\x60\x63\x24\xB0\xFB\x56\x28\x04\xAF\xBC\x9A\x5C\xE3\x1F\xB2\xCF\x4F\x66\xC0\xBB\x31\x2E\xAB\x38\xA1\x6E\x68\x5D\x84\x43\xFF\x62\xC0\xD9\x40\x54\x8C\x1C\xD9\xFE\x26\x11\xB7\x6D\x70\xB5\xC6\x83\x91\x82\x92\x4D\xB1\xAD\x7D\xDD\xEA\x3D\xD0\x8B\xBF\x40\x96\x9C\x20\x00\x5D\xD1\x4E\x75\x41\xF6\x98\x79\xDF\xBE\x82\x77\x2A\x04\xF8\x6D\xD8\xCF\x5F\x53\x57\x3A\x53\x28\x5C\x0B\x28\x0A\x6A\x0C\xC9\x97\xC9\x6E\xB7\x26\x33\xF8\xC7\x28\xB4\x91\xD0\x89\xC9\x20\xB7\x62\x74\x18\xD3\x34\x89\xB9\x69\x7E\xFA\xE5\x7E\x58\x05\x26\x72\xF5\x65\xE8\x1A\x39\xA4\x57\x2B\x43\xC2\x4B\x19\x7E\x89\x12\x79\xC4\x08\x37\x48\x37\x23\xBE\x8A\x13\x5C\x34\x10\xB8\x1D\xC2\x3F\xDE\x9E\x43\x87\x6C\xE8\x51\x4B\xBC\xB2\x75\xEB\x02\x66\x10\xE1\xB3\xC8\x46\x78\x90\xBF\x9A\x0B\x65\x4B\xE3\x33\xBD\x1C\x0D\xC5\x0C\x7B\x97\x37\x14\x6A\x1D\xF1\x0C\x41\x2B\x02\xB0\x56\xAE\x56\x08\x82\xA2\x24\x7B\x54\x2A\x97\x64\x8D\xE1\xF4\xC3\xF0\x57\xF0\xE0\xB3\xD5\x4C\xD1\x46\x4D\xB0\x95\xB5\xA9\xF7\x00\xB2\x2F\x77\xF7\xCB\x08\xE2\xE8\x71\x02\xC6\xC2\x58\xED\x5E\x15\xD3\x50\x2B\x21\x63\x15\x59\xCE\xB3\xA2\xBD\xA2\x4B\xF8\x76\xB1\x23\x1C\x47\x71\xAA\x9C\x89\x04\xDA\xDC\x64\x3B\x26\x47\xBE\x41\x23\x34\xE7\xE8\x7B\x70\xC2\x5B\x4F\xA0\x84\x27\x22\x67\x1E\x0C\x23\x40\x83\x49\xA8\xEB\xC1\x43\x62\xE6\x06\xA3\xFF\x6F\xA3\x6A\xA2\x69\xD8\x84\x11\x42\x98\x7E\xF8\x5C\x09\xAA\xA3\x79\x5D\x5F\x0B\xDB\xA7\xF1\x64\x6E\xEF\xC3\xFC\x2C\x11\x9D\x49\x4C\x24\x80\x00\x69\xD7\x71\xFF\x29\x5F\x7A\x6C\x4D\x32\x59\xA5\xCC\xB2\x40\x81\x81\xEB\x94\x32\x7C\xD2\xD7\x26\x3D\x29\x95\xA5\x5D\x2B\xE7\x6E\x3C\xB8\xFB\xD0\x7F\xC9\x8C\xB4\x16\xE0\x01\x24\xA7\xF7\xC7\xAA\x3C\x85\x1C\x2A\x61\x02\xF4\x2B\xAF\x5E\x3A\xAE\x6C\x0F\xD7\x7D\x36\x57\x1C\xC1\x4E\x2B\x56\xFC\x58\x63\xCB\x3A\x1C\xE1\xA0\x2E\xC2\x96\xEC\xF4\xDF\x69\x21\x1A\x3B\x1E\xBC\x7D\x20\x30\x73\x94\x4E\x9D\xDD\x54\xAC\x98\x98\x02\xC1\x90\xD8\xB6\xB7\x5F\xB0\x8C\x6A\x1F\xF8\x4A\x3E\x48\xB4\x1B\x31\x8B\xA4\xB9\xA1\x36\x78\xA1\xE7\x4A\xC9\x0F\x0D\xC0\xF3\xED\x9E\x98\x83\xBC\x00\x34\x0A\x2B\x62\xC0\xBB\xDA\x67\xED\x8B\x6A\x0C\x87\x5D\xCC\x2F\x96\xCD\xD8\xCB\xB6\x89\x4E\x39\x6B\xC6\x4B\xCB\x89\x12\x31\x8D\xC0\x17\x5B\x6D\xA3\x8A\x2D\x21\xA5\x8B\xA1\x50\x1E\xDB\x37\x27\x7E\x72\x81\xD4\x7C\x98\x0F\xAB\xA9\x11\x99\xF9\xAB\x79\x53\x04\x8A\x1A\x95\x5E\xC7\x9F\x55\x12\xC5\x6E\xE4\x41\xC0\x86\xC7\xD0\x78\x19\xE2\x96\x33\xA9\x78\xED\xD9\xFA\x78\x01\xAF\xA0\x67\x88\x90\x0E\x8A\x0B\x1B\xB0\x90\xAA\xBB\x04\xFA\x8A\x9D\xF5\xD5\x0B\x0A\xA7\xD4\x97\x82\x1E\xCE\x47\x8B\x56\x7D\x76\x61\x49\x16\xE9\x13\x34\x81\x4E\x6B\x1F\x69\x8D\x7A\x2D\x4D\x46\xD3\x53\x73\xE9\xA8\xB8\x05\x57\x6C\x82\x4F\xC0\x76\x55\xC2\x4B\x49\x3F\xAC\x40\x1A\x2D\x7D\xAD\xBC\x98\x8B\xE7\xB7\x7C\x70\xE6\xCA\x6D\xE1\x00\xEB\x5A\x04\x1A\x34\x6A\x65\xD4\x76\x54\x19\xEB\x17\xE0\x41\x0C\x8F\x85\x94\x87\x05\x3B\x97\x3C\xF2\x3B\x5E\x40\x3C\x01\xDF\xEF\xC7\x3F\x86\xB9\x6A\x26\x90\x09\xC9\xCB\xCC\xF6\x56\x81\x5F\xF9\x04\x10\x34\x10\xD4\x91\xC3\xEC\x96\x67\xF5\x42\xB8\xC4\x04\x6E\x98\x16\x79\x9A\xBB\x60\x07\x43\xAF\x46\x57\xAA\x59\x9A\xCA\xC2\x92\x09\x03\xCA\x17\x4E\xFE\x06\x1E\xA0\xEE\xCF\x03\x7E\x36\x92\x08\x52\x2A\x98\xF0\xF5\x1F\x8A\x16\xC0\xC5\xF1\x1A\x32\x03\xF2\x20\xB1\x6B\x17\x2F\xE2\xD9\xE7\xCA\xCB\x92\xC0\x6F\xBF\x3B\x6E\x5B\xA9\xE8\xC0\x47\xD1\x8F\x14\xAF\xE2\xC7\x54\xD1\x82\x90\xEF\x62\x78\x01\x21\xE7\x0F\x66\xC5\x06\x97\x76\x88\x08\x7F\x59\xE8\x0C\xFA\x37\xDD\x26\x87\xBA\x34\x50\xF8\xFD\xB2\xB1\x89\x6B\xBA\xE9\x3A\xC8\xE2\x99\x40\x59\x95\x6D\xAC\x0B\xEA\x92\xDC\x2E\x37\xBF\x64\x11\xC4\xC9\x8D\x60\xAC\x63\x99\x51\x44\x03\x38\x7B\x50\x47\x8B\xCB\x2A\x37\xC7\x69\x29\xC7\xEB\x37\xB3\x88\x22\x1F\x17\x2F\x11\x7B\xE6\xAB\x05\x93\x11\xA0\xB3\x39\x0C\x29\x74\x39\xEA\xAE\x02\x1F\x75\xFA\x0F\x95\x33\x23\xF0\x5D\x1D\xBB\x15\x7A\xED\x23\x8D\xB5\xAA\x17\xFA\xD4\x65\x50\x7C\xB1\x7B\x60\xDA\xC7\xB9\xC2\x1D\x41\xFF\x0D\x0E\x17\x05\x75\x23\x61\xCB\xE1\x63\xE2\x8B\xEB\xD3\xC2\x1B\x38\x46\xE8\x16\xE7\xE7\x99\xA9\x72\x2D\xD5\x92\x60\x3C\x99\x53\x6A\x8F\x05\xEB\xE8\x2B\x20\x04\xA7\xB8\x9C\x6D\x0D\x1E\x19\x30\x41\xF7\x5F\xB0\x05\x45\xA0\x1E\xD4\xBA\x94\x08\x4E\xD7\x0B\x74\x9A\x8A\xC9\x90\xF4\x9F\x4D\xC5\xA3\xDC\x4A\xD2\x99\xE5\x4B\xA8\xFC\x3F\x76\x5F\x9E\x7B\x0F\x9D\x42\xC5\x01\x41\x73\x35\xA6\xD0\x64\x7A\xEA\xA2\x0A\xA9\xF2\x0D\x92\x11\x61\x1A\xD9\x60\x9F\xD0\xA1\xA1\xEB\x94\x3A\xB5\xCB\xBC\x85\x55\xF1\x24\x80\xB7\x2E\x37\x63\xE1\xCC\x20\x73\xAF\x59\x0E\x97\x32\xB9\xBF\x36\x19\x86\xD8\x8F\x62\xDA\x3A\x05\xF0\xAF\xA6\xDA\xED\x3E\x71\x6E\x4E\x9F\x2D\x13\xAB\x34\x3D\x81\x17\x2A\x78\xF0\x1F\x7B\x66\xCA\xF0\xF3\xEE\xDE\x12\x80\x9B\xB1\xFE\x20\xD8\xFC\x7B\xF9\x27\xDA\xE3\xBD\x83\xA9\x59\xA0\x34\x7C\x33\xDE\xE1\xC2\x93\xDD\x60\x33\xAA\x4B\x13\x0C\x2A\x4B\x44\x1B\x59\x2F\x37\xCE\xED\x1C\x32\x59\x1C\x73\xBE\x77\x07\x5A\x7D\xFF\xC5\x74\xDD\xF3\xC5\x83\x3A\xCD\x69\xBF\x82\x99\x4D\x36\xC0\x07\x90\x59\x2A\x8D\x64\x13\x1A\xF0\x25\x79\x3C\x7A\x35\x45\x23\x67\x37\x3A\xBB\x6F\x9A\xED\xF1\x6C\x5E\x18\xE1\x03\xCB\xFE\x4F\xFC\x1B\x68\xA3\xBD\xD7\xF0\x9F\x8A\x40\xC9\x5E\xCA\x86\xE0\x93\x2C\xAF\x41\xF3\xE7\xB6\xB0\xF8\xEA\x47\x41\x31\x50\x34\xE0\x21\x7F\xBB\x5E\xB7\x4D\x6A\x68\xFF\x89\xBC\xD8\xB6\x7B\x25\x9C\x26\x3C\x18\x84\x7D\x01\x58\xD0\xAF\x47\x57\xCF\xFE\xDE\xF7\xE9\x26\xDA\xEA\x5D\x8D\xD3\x2E\x80\xC5\x88\xC8\x4D\xC1\xB4\x81\x38\x18\x0D\x40\x54\x0E\x5D\xB8\x64\x7A\x0C\x14\x44\x9B\x8E\x60\xC7\x37\xB5\x74\x41\x23\xE4\x6E\xA0\xDE\x19\x9D\x07\xBA\xAB\xC8\x32\x52\xB9\xE2\x52\xCD\xF6\xB1\x33\x52\x5E\x6A\x83\x3A\x3D\xA8\x16\xE3\x4F\x52\x73\x8B\x17\x13\x63\x8B\x85\xFA\x82\x78\x1A\x1D\x3B\x04\xDF\x30\x95\xD4\x38\x94\x51\x31\x5E\x70\xE6\xCB\xA3\x73\x6B\x5B\xAE\x88\x9A\x4B\x75\xFA\x9E\x52\xCE\xD9\xF7\x5D\x87\xBF\xDF\xDF\x93\xDA\xFD\x90\x86\x22\x55\xB8\xFE\xC1\x90\x2C\x6B\x7F\x12\xE0\x13\x26\xAD\x8D\x1C\xAF\xFD\xF1\x3D\x59\xCD\x04\x59\xD9\x01\xA2\x73\xD1\x6A\xFA\xCC\xC6\x1B\x17\xD2\x3B\x31\xAE\x30\x28\x2B\x68\x09\x14\xED\xAE\xA9\x54\x54\x08\x33\x45\x8E\xCF\x1A\x42\x79\xBD\x2F\xB2\xCF\x00\xB5\xD0\xCC\x9F\x63\x82\x5E\xBC\x8C\xE7\x7E\x7C\x16\x16\x98\x06\x97\xCE\xF8\x2E\xA8\xA9\x0F\x57\x92\x4B\x3B\xA0\x22\xAE\x41\x8F\xCA\xA0\x00\x49\x49\xA5\x5A\xB4\xFB\x00\x97\xC9\x67\xFE\x52\xB4\x0B\xE4\x97\x01\x5D\x37\xD7\x45\xA0\xF2\x37\x1D\xC0\xAB\xE4\x76\xAE\x5A\x4F\xBD\x7E\xE7\xD9\x73\xD9\x89\xE9\xD4\xD8\x3B\x90\x06\xBB\xDD\x45\xC9\xA0\xD0\x07\xCC\x47\xF7\x41\x3F\xDC\xF3\xAE\x1E\x56\x92\xC5\x49\x18\x06\xB1\x63\x5D\x5F\x2A\x34\x8B\x09\x86\xB4\x80\x8D\x1F\x48\xC2\xF4\x59\x10\x56\xE1\x7D\xD0\xEC\x1C\x44\xF6\xBE\x17\xEE\xCB\xAF\x4D\xFA\x7F\x63\x0F\x6B\xF4\x42\x9B\x8F\xF0\xCA\x31\xB4\x66\xD9\x39\x7E\x6F\x62\x32\x13\xA6\x30\x27\x93\x0B\xE0\x5E\xC4\x2E\x8B\xFB\x2B\x29\x9D\xFB\xF4\xDD\x9E\xB1\x3A\xCD\x79\xD0\x7A\xD2\x41\xAB\xDF\x94\x4B\x86\xD5\x05\x79\x27\x5A\x59\x17\x12\x23\x12\xD4\x88\x08\x1C\x01\xA7\xD2\x19\x18\x6A\x2D\xFB\xA6\x6E\x9A\xCE\x51\x4E\x9D\xB0\x66\x43\xC9\xE7\xED\x79\x98\xFD\xB0\x91\x13\x24\xEB\x4C\xB3\x21\xFC\xE5\x10\x77\x65\x61\x03\x72\x04\x2F\x76\x95\x0B\xDC\xE0\x0A\x6E\x1A\xC7\x14\x11\xAF\x39\xD0\xF1\xAC\x4E\xE5\x1C\x18\x3F\xB3\x3C\xFF\x4D\xC4\x3B\xA3\xEB\x72\x3A\x54\x85\x3B\xA9\x33\xDD\xA1\x7F\xBF\x56\x5D\xA6\xD2\xC1\xE6\x7E\x86\xB2\x88\xEE\x6C\x15\xCA\x54\x8B\xBB\x0F\xD5\xDE\xEC\xCA\x24\x9C\x20\x13\x59\x84\xDD\x11\x6D\xCB\x65\xF9\xFF\xCE\x63\xC0\x54\xA9\x52\xD4\x2F\xF3\x4F\xBC\xCF\xFA\xDA\xA2\xA3\x59\x3F\x97\x2F\xBC\xAC\xD2\xC9\x6E\x5A\x21\x64\xBE\xC8\x7E\xDC\x90\xA9\x98\xD1\x3E\x1F\x13\x2F\x7D\xBA\xEC\x91\x64\x8B\x3B\x97\x2C\x48\x7E\x83\x86\xB5\x0B\xA1\x91\x64\x2B\xD6\x53\xB5\x97\x60\x70\x81\x15\x91\xBC\x5F\x77\x34\xD5\x28\x1A\xC4\x2E\x0D\x91\xCB\xEF\x40\x5A\xF9\xD0\x95\xAE\x54\x53\xED\x89\x92\xCC\xDB\xA2\x67\xB1\x45\x29\x4F\x1E\x96\xDC\x61\x56\x62\xEB\xE7\x8E\x45\x91\xCB\xD5\x5A\x43\xDD\xB8\x0F\xEE\x16\xA4\x96\x80\x88\xD0\x8B\x0B\x01\xCE\x75\x24\x2F\xEE\x0F\x2B\xD0\xB7\x90\xDC\xF2\xA0\x72\x14\xA7\xFE\x7E\xBD\x78\x55\xE6\xAF\x95\x63\xCA\xB2\x80\x0D\xD9\x16\xF5\x5C\x36\x74\x07\x5C\xD8\x4A\xD9\xA3\xA2\x44\x3E\xA9\x2C\x02\x2A\x63\x48\x5C\x2A\x52\xE3\x6D\xF1\x59\xF2\x12\x2F\x51\x53\xF9\xDA\xCC\x38\xF2\x28\x93\xF8\x67\x8F\xD1\xAA\xDA\x0C\xE9\xC5\x84\xB1\x19\xFB\xB1\x85\x93\x44\x4E\x80\x1F\x78\x5F\x58\x53\x46\x94\xBC\xA4\x29\x2A\xDA\x8E\x44\xA6\xB0\x30\x0F\xFE\x71\x67\xA3\xF4\x83\x1D\x08\xB0\xE2\x89\xCA\xBD\x93\xE2\xA4\xA5\x98\x8B\x22\x3C\x0E\x0B\x2D\x23\xBE\x1D\xDA\x96\xB9\x52\xD1\xFF\x03\x33\xA8\x12\xCE\x47\xD5\xDF\xE5\x54\xC4\xAC\x51\x93\x4B\xBA\xA0\x56\xAE\xB7\x1B\x6D\xAB\x49\xA0\x56\x61\x0D\xFE\x9E\xF8\x91\xAD\x75\x7F\xDD\x7A\x68\x04\xCC\x48\xAE\x87\xB2\x40\xBB\x7F\xD1\xD4\x8D\xF3\xE9\xBA\x85\x6A\x4A\x19\xB4\x37\xB2\xE6\x34\x40\xBD\x5E\x6F\x7C\x80\xAA\x94\x6A\x59\x4A\x3E\xF7\x62\xAA\x2D\x98\x8F\xC5\xA5\x65\x81\xBF\x8D\x18\xBF\xA0\x0B\xD7\xF7\xBA\x06\xC3\x55\x9D\x34\x3A\xDD\x24\x79\x9B\x51\xB5\x67\x9E\x0B\xA6\x5B\xC7\x1C\x38\x70\x4D\x3A\x91\x4E\x87\xBC\x6C\x77\x51\x75\xE0\x73\x11\xF6\xEB\xAA\xDE\xC5\x11\x58\xF5\x25\x9F\xC1\x8D\xAE\xF3\xD8\xB8\xED\x09\xAE\x01\x7F\x1F\x95\x71\xF8\xA2\x00\x04\xAC\x34\x4D\x01\xA2\x24\x25\xE1\x18\xB9\xA1\x4A\x2E\xB5\x2F\xA2\x72\xD9\x19\x42\x2B\x9A\x6E\xF0\x3B\x8B\x2B\x62\x3D\xA6\x95\x1B\x49\x80\x3B\xDF\x25\x10\x6D\x1F\x22\x53\x7A\xAD\xFE\x43\x11\xCE\xFA\x89\x82\x96\x9A\xA3\x2F\xDC\x1A\xAE\xC4\x52\x13\xEE\x3D\xD5\x44\xDE\x5C\x1D\x6C\xEA\x15\xB3\x87\x63\x82\xD6\xD6\x7E\xD8\x87\xA9\x60\xFA\x68\x69\x2D\x79\x1A\xF2\x2A\x7C\x0F\xCE\xE2\xC4\x08\xEA\xDF\x80\x23\x64\x72\x87\x8A\x79\x23\x6C\x5A\xD0\x60\x5E\xCC\x91\x56\x29\x08\xAC\xAA\x74\xFD\x79\x71\x44\x7B\x5C\x06\xDC\xD3\xC1\xFE\x8A\xA2\x0A\x99\x5F\x34\x43\xBC\xEA\x59\xB1\x91\xD7\xD1\xCA\xB6\xBC\x31\x37\x8F\x2E\x36\x83\x82\xAA\xEB\x5D\x23\x73\xF2\x3F\xAF\x75\xEB\xA0\x47\x86\xA0\x57\xA5\xEB\xCD\xE4\xA9\x25\x8E\x14\x65\x79\xC0\x4A\x76\xE5\x5C\x0F\x05\x70\x15\x9C\x9C\xA3\xB9\x4C\x1C\x18\x1B\x8B\x94\x92\xFD\x53\x92\xB3\xE0\xAC\x56\xC2\x77\x05\xA4\xA5\x60\x22\xB2\x54\xA0\xE2\x67\x24\xCC\x3F\x42\x28\xBF\x81\xFA\x40\x48\x3E\xD0\xDC\xD6\x94\xD7\xDB\x80\x58\x15\xE0\x65\xC2\x47\x2D\x02\x9C\x4F\x18\x6C\x87\x27\x4B\xF2\x11\x77\x5F\x27\x2D\xCC\xD4\x75\x18\xE8\x1C\x66\x74\xB9\x8E\xA2\x38\x59\x23\x4D\x4C\x3B\x9A\xBB\x4F\x24\xB7\x9D\xD1\x3D\xA3\x57\x98\xA5\x53\x85\x92\x07\x04\xA3\x99\x55\x46\x2C\xDB\xAB\x3B\xBD\x85\xC5\x28\x30\x0F\xD0\xC7\x62\x5A\xF1\x30\x7F\x01\xC9\x92\x96\x03\x81\x1C\xC4\xB3\x96\x07\xA1\x7C\x01\x14\x9D\xBE\x9C\xFA\x56\x2E\xEB\x34\x81\x00\x28\xD0\xE1\x9D\xF0\xD6\xE9\x5D\xCB\x22\x84\xD2\xEE\x24\x86\x30\x66\xAB\xA7\xC2\x75\x0B\x28\xF5\x48\xBB\x64\xF1\x07\x94\x7C\x5E\x5F\x71\xD1\xA1\x78\x9F\xAE\xCC\x9B\x26\x56\x8E\x16\xBD\x23\xE5\x90\x59\x0C\x30\x55\xB6\xE6\xFE\x42\xC4\xA1\xBC\xDB\xA7\x85\xB9\x87\xA1\x96\xE5\x81\x9F\xA1\x44\xCB\xED\xA0\x90\x6D\x8C\x4E\xD4\xD0\x1A\x73\xD5\x8A\x55\x1F\x11\xC8\x96\x80\xAD\x30\xC7\xA4\xF6\x6D\x35\x5C\x37\x9A\x41\x85\x8D\x9D\x6F\x6F\x49\x9D\xB0\x75\x10\xCC\x1F\x5C\xBC\xBD\xC8\xBA\x9D\xC3\x16\x54\x64\x28\xB7\x05\x2B\x58\x91\x15\x61\xEB\xA4\x08\x30\x24\x55\x39\x37\x0D\xB2\x49\xF8\x25\x93\xC8\x2A\x8B\x3F\x9F\x08\xBA\xD7\x87\xBF\xBF\x33\xC5\xFF\xE2\x87\x03\x13\x17\x2B\xAB\x8C\xC2\xB7\xBF\xDC\x65\x20\xA2\x6D\xAD\x85\x09\x2E\xE6\x0B\x0D\xB4\x77\x2F\x86\x70\xE0\xAD\x30\xA1\x92\x74\x5B\xB6\x39\x10\xD6\x48\xD4\x40\xA3\xB5\x80\xE3\xAC\x33\xD0\x17\x32\xCE\x1E\x9F\xF5\xF4\x35\xEC\xB1\xF6\xFA\x8C\x93\x8C\xC2\x52\xB1\xAC\xC3\x8B\x11\x08\xD8\x41\x29\x99\x25\x74\xEF\xDA\x90\x84\x94\xB6\xAD\xD6\x31\x5D\x18\xD8\x4F\xFF\xAE\xFC\x0C\xFD\x76\x5B\x3B\x3A\x51\x44\x41\x24\x3F\xBA\xDC\x08\xA8\x56\xC9\xC7\xBA\xD8\x1F\xB1\x93\x6A\x3A\x27\x63\x4F\xAF\x3A\x4E\xFF\x2A\xDB\xF2\xCC\x3B\xE7\x2F\x6F\xA9\x56\x9B\xF6\x3E\xF2\xE8\xEA\xDB\x99\x69\x0E\x33\x82\x7D\xE4\xB8\xDE\xCF\x60\x3F\x52\xEA\x99\x68\xC5\xB4\x53\x0D\x0C\x43\x0A\xF5\x88\x0E\x96\x89\xAB\x27\x59\xB3\xD1\x43\xD1\x13\x23\x35\x92\x1F\xC5\xBA\xAF\xA1\x13\xAD\xCB\x92\x7C\x9F\x49\x86\x76\xD1\x8F\xF4\xFE\x36\x24\x2A\xFA\x94\x95\xDE\xF7\x70\xE7\x80\xA1\x83\x04\xCC\x0D\x8E\xAB\x7D\x65\x31\x45\x03\xB4\x9F\x57\x5D\x5A\xEA\xFD\x21\x81\x76\x4F\x39\x4E\xAE\xC9\xEE\xDC\x73\x3F\x83\x77\xD9\x07\x6D\x36\x1C\x4A\x41\xB3\x6A\x69\x1D\xBF\xA2\x7B\xEF\x2C\x0E\x38\x87\xBC\x35\x4C\xE8\xA2\xAE\x9A\x6B\xEE\xE2\x57\x78\xA7\x63\xC0\x38\x8C\x4D\x32\x5B\xBB\x7A\x41\xE6\xE5\x1E\x2A\x7D\x61\xFC\x49\xC9\xC0\x55\xE9\x3A\x6E\x99\x28\x24\x1B\xBA\x84\xC3\x05\x5E\xB6\x7A\x38\x44\x5A\x11\x41\xE5\x6D\x3C\x48\xCD\xA6\x25\xBD\x89\x65\x40\xFF\xC3\x69\x03\x1B\xC5\x02\x2D\xBE\xB1\xFA\xBA\xC2\x4A\x5F\x0B\xC1\xCE\x27\xD6\x99\x3A\x1E\xF0\xDF\x82\x9B\xFF\xF1\xF5\x77\xE0\x4D\x7A\x5E\x9F\xE5\x94\x01\x46\x56\xE9\xFC\xF5\x08\xA6\x4B\x54\xD4\x3E\xCF\xE2\xE8\xB2\x91\xEE\x4E\x16\x10\xD6\x94\x29\xE5\xA0\x47\x4F\xA3\x86\x0B\xB3\xD3\xD2\x27\x2D\x2B\xE6\x83\x6D\xB8\xF5\xCC\x5E\x1F\xBA\xB7\xC9\xEF\x9F\xEE\x7C\x04\xC5\x9E\xE6\xA6\x66\x8E\x42\xFD\x7C\xB6\xA4\x87\xBD\xD7\xB0\xC4\x60\x40\xEB\x18\x86\x64\x9B\x58\x54\xE1\x44\x36\x0F\xDE\x4C\xF7\x17\x03\x52\x75\xAA\xDA\x66\x8E\x76\x8B\x5F\xEB\xE9\x3B\x97\x09\x94\x1F\x66\x09\x74\x60\xFA\xDD\x3C\xDE\xBD\x11\xD7\xA2\xA1\x4D\x25\xCE\x2D\x28\x34\x2B\x4A\x91\x4A\x7F\x5E\xC7\xA6\xF6\x6C\x71\x7F\x7F\x97\xD2\xA0\x35\xB7\x7B\x5C\x37\xB4\x11\x19\x6D\xB8\x58\x57\x03\x48\x93\x5E\x15\x8D\x5E\x8F\xAA\x13\xFF\xEF\x6C\xA5\x26\x37\xF9\x9E\x1D\x08\xB0\x7B\x7B\x38\xFA\x9B\xB0\x26\xF5\x16\x58\xB1\x12\xFB\xBE\xA1\x16\xE8\x39\x6A\x9B\xE7\x99\x93\xA4\x33\x8F\xB4\xB6\x1A\x54\xB9\x82\x22\x70\x3D\x5C\x0A\xF4\x7B\xA7\xE0\x31\x1E\x54\x86\xD5\x71\xC5\xB1\xF0\x42\x54\xEC\xFF\x4F\x2B\x3F\x1B\xD2\x98\x3F\x73\xB1\xB6\x58\xF8\x4E\x6B\x86\x8D\xF8\x7C\x51\xB0\xD6\x24\x97\x80\x9C\x66\xA8\x97\x86\x17\xBE\x49\xEF\xB3\x20\x43\xD7\x6D\xAF\x65\x10\x77\x37\xB3\xDC\xB4\xF1\x71\x71\xAA\x22\x0B\x8A\x29\x3A\x73\x4E\x59\xA8\x53\x02\x59\x74\x00\x03\xE0\xC4\xC2\xAF\x61\xD1\xE6\x3D\xDC\xFD\x5D\x35\x49\x13\xBD\xE3\xBF\xC9\x46\x0D\xBC\x9C\xE4\x62\xB4\xCC\x79\xA3\xE8\xAA\x0E\xD1\x6F\xE0\x95\xFB\xCF\xB3\xE2\xEE\xEA\x6D\xC1\x99\x47\xC2\xEC\x45\xA2\x69\xFC\x04\x73\xED\xBA\xB5\xF7\x8E\xDB\x6E\x1C\x80\x64\x34\x70\x95\xC8\x0F\x55\xF5\x9F\x7C\x85\x77\x6D\xCE\x17\x3F\xAA\x61\xAE\xF5\xB1\xAB\xE6\x60\x2A\x87\x63\x4E\x0F\x70\x9E\xA9\x71\xA6\xDC\xDB\x9A\xD7\x8B\xAB\x3C\x6F\xB0\xC5\xEE\xE0\x3D\x14\x78\x94\x28\xD7\x99\x56\x15\xF1\xBF\x89\x3D\xCF\xA7\xED\x38\xC4\x68\xEC\x9E\x20\x9F\x23\xF0\x92\xC6\xF1\xE0\xB0\xEE\xCA\x8C\x4B\x43\x81\x99\x72\x23\x28\x36\x69\xFC\x94\xCF\x17\x51\x3D\x24\xD9\x91\xB8\x64\x7E\x77\xD6\x42\x34\xE7\x5C\x56\x28\x9F\x66\x33\x69\xCE\x85\x40\xA0\x42\x29\xDD\x0B\xE1\x2F\x94\x74\x70\xEC\xD1\xDA\x13\xAD\xFF\xCE\xFA\x2B\x96\xCE\x3A\x77\x2B\xE1\xF7\x44\x6A\x16\x15\x6B\xD5\x0C\x03\xDB\xB6\x77\x97\x7F\x0F\x66\x46\x49\x1F\x16\x59\xDE\x56\x6B\x06\xE0\x1D\xAA\x18\x63\x7F\x70\xD6\x5F\xC3\x70\x7C\x8E\x9B\x45\x77\x20\x49\x31\x22\x82\x38\xE3\x46\xCC\x85\xFE\x1B\x2C\xA9\x8D\x97\xB6\x4F\x0C\xF8\x8A\x65\x04\x1F\x41\xB1\x8B\x1D\x12\xAD\x67\x8E\xCF\x94\x19\x6C\x6C\x5E\x66\xB0\x54\x78\x6F\x7E\xE1\x97\x5B\x23\xFB\xFE\x24\x14\x7B\x51\xAA\x2A\x40\x01\x8D\x36\xCE\xFB\x0A\x7F\x37\x82\xE2\xF2\xE3\xF0\x53\xB2\x48\x80\xBE\xAB\x05\xB6\x2B\x9F\x12\xB7\xBF\xB8\x5E\x27\x24\xA0\xAD\xF2\x33\xC1\x59\xD8\xA0\x84\x5A\xD3\x38\x2F\x04\x6A\x56\x1C\xB9\x11\x49\x52\x18\x46\x6E\x6D\xF9\x2F\xF5\x60\x5E\x57\xFF\x5E\x96\x63\x54\x02\xC7\xEF\x7C\x3F\x0A\xAB\x4F\xBB\x18\x76\xDD\x36\x81\x45\xE1\x17\xB0\x26\xD2\x39\x0D\x6A\x24\x18\xE0\x0B\xD3\xA9\x1E\x2E\xEB\x53\x0B\x85\xEF\x94\x17\xAE\xBD\x8A\x33\x64\x5D\x79\x5D\xD8\x57\xA0\xD2\x3C\xA5\xC9\xBB\xD5\xD6\x08\x2F\x10\xED\x72\x5E\xCF\xC8\x83\x48\x61\xB3\xCE\xC8\xB6\x2A\x34\x74\x81\xC3\x19\x05\xA8\xDB\xFC\x62\x01\xAF\x9E\xB8\xA1\xC5\x66\x79\xEF\x3D\xB0\xB0\x8E\xBC\xCE\xB9\x79\x5A\xD9\x67\xAF\x88\x8C\x99\xA1\x6A\x38\x66\xCA\xB8\xFB\x4F\xFB\x11\x95\x4B\x9B\xC0\x23\x4E\x5E\x74\x1B\x49\xAD\x17\xAE\x67\x17\x91\x64\xB2\xD7\x09\xAE\x73\x4F\x86\xF3\xA6\xE3\x8D\x97\xC1\x48\xFC\xA2\x7C\xB5\xD1\x87\x69\x7A\x94\x26\x40\x44\xDB\x06\xEB\x4C\xFA\xA1\x7E\xF7\xC2\x39\xDE\x9B\x78\xA7\x8E\x44\xD4\xFA\x33\xDD\x61\xE4\x49\x9F\xB0\x31\xB5\x0B\xAF\xBE\x4E\xA8\x31\xAE\x31\x2E\x7F\x51\xAA\x43\x5D\x4B\xEF\x4D\x71\x3E\x6E\x0C\x06\xF0\xA1\xEF\x94\x0D\xF4\x41\x71\xF3\x94\x6D\xDF\x66\xD8\x7B\x48\x01\xC9\x25\x1D\x3E\xED\x59\x7D\xF4\x3F\x10\xF6\xA8\x77\x81\x7A\xDB\x9A\xF9\x77\xB7\x49\x3B\x1F\x54\x52\xC4\x12\x2D\xDD\x6E\x75\xC5\x5B\x6C\x7A\x19\x2C\x02\x90\x5B\xE6\x16\x96\xFF\x24\xDB\xBE\x00\x26\xE7\xCB\xEC\x54\xFA\x60\x09\x14\xF3\x9B\x77\x8E\x07\x43\xC7\xDA\xF1\x40\x3B\x94\x44\x8A\x88\xB9\xE6\xB6\xFC\x72\x1B\x01\xC7\x98\x56\x5F\xFA\xA2\x85\x71\x61\xC9\x79\x00\x92\xB4\x42\x27\xDD\xA4\x09\xEA\x5A\xD3\x31\x16\x83\x82\xEC\x9E\x92\xFC\xD1\x3E\xC8\x9C\xF1\x3C\xD0\xAB\x65\x52\x91\x24\x33\xDE\x41\x6E\x00\xF5\x8C\x7E\x47\xFC\xF2\x0C\x7D\x2C\x31\x98\x5D\x47\xAB\x5D\x01\x56\xA5\x95\x3F\xF4\x82\x9A\x1B\x6D\x08\x8A\x5F\x53\x2D\x05\x73\xBA\xB9\x1D\x54\xF5\x6D\xE7\x1F\x7F\x09\xB7\xCA\xD4\xC3\x0F\x99\xAA\x29\x83\x47\x61\xD1\x0E\xA3\xF7\xD8\x50\x3B\x65\x4F\x7B\x29\x4C\x08\xA3\x2B\xC1\x4C\x8D\x98\x75\xFD\xB8\xAB\x74\x1C\xFD\x3A\xC4\x69\xBF\x7C\x86\x06\x09\x7B\x35\x7C\xBE\xF2\xA6\xD6\xFF\x72\xA1\x08\x23\x90\xFB\x71\x4A\xFD\xD9\x12\xB0\xE2\xFA\x6A\x08\x60\x85\x03\x1D\x28\xC1\xCA\x32\x60\x9A\xCA\x03\x3A\x20\xC3\x2A\x32\xEB\x05\x78\x48\x4E\xEB\xF7\x37\x90\xA3\x41\x8A\xE1\xBA\x1B\xB3\x69\x3F\x6F\x77\xF2\xFF\x0E\x37\x5F\x27\x69\xC6\xFC\x7B\x6F\xAE\x9A\x09\xFC\xEC\x26\x25\x3F\x1B\x71\xE5\x48\xE9\x19\x90\x06\x0E\xE9\x89\x32\xE8\xD7\x50\x7A\x86\x00\xCC\x1E\x2E\xC4\xEB\xA4\x38\x5A\xED\x03\x75\x14\x3B\x64\x92\x72\xFB\xC2\x57\x0A\x2F\x25\xE9\xAB\x5C\x1A\x1C\x4E\xB6\x1A\x95\x99\x89\x12\xB5\x68\x5D\x64\x55\x8C\x2E\xD8\x2F\x65\x4C\x49\xBF\xEF\x44\x2D\x72\xD5\xF5\xA5\xDD\x5C\xE8\x8A\x5E\x2E\x45\x25\xB9\x30\x5D\x33\x9E\xFC\xD3\xE6\x50\xA8\x2F\x19\x2B\x16\x45\x15\x11\x33\xEE\xB6\xBB\xB4\xD1\x75\x23\xB5\x29\x31\x70\x1F\x20\xC2\xB6\x04\x1F\xCF\x04\xF9\x6D\xB2\xC5\x8C\x90\x44\x21\x1F\x37\xFA\x13\x47\x18\xC2\x07\xCE\xED\x2E\xB8\x4B\xCD\x6A\x94\xCD\x49\x8D\x1C\xA4\x6D\x2F\x1B\xAE\xB5\xC1\xA5\xFC\x49\xF9\x85\xE2\xB5\x14\x85\x52\x3D\xDC\x59\x7C\xDA\x87\x63\x6A\x61\x5E\x57\x26\x5E\xD5\x1C\xCC\x71\x62\x45\x97\x99\x4C\xEF\xC2\xBD\xB8\x88\x49\xB0\x79\x60\xC3\xEB\x3E\x68\xF7\x17\x64\x16\x34\x96\x94\x1C\x5F\x15\x92\xCC\xF2\x2E\x70\x02\x73\x5F\x47\xBC\x3D\x86\x66\x55\xDE\x27\x14\xE4\x39\x13\x9A\x33\xBE\xF8\x9A\x08\x7C\x23\xF8\x7F\x4A\xA9\x1C\xCE\x8E\x1F\x7C\x42\xDB\x1B\xDE\xB2\x63\x8B\x79\x27\x11\x92\xB6\x89\x8C\x88\x39\x04\x38\xB8\x54\x04\x40\xCD\x28\xF0\x4C\x25\xB5\x12\xFF\x7F\xB7\x66\x9B\x01\xAB\x75\x60\xB6\xB5\xFC\x44\x51\x4C\xA3\x19\xDA\x76\x37\xE9\xA8\x5B\x0E\x8D\x48\x69\xE3\x8A\xBE\x1F\x93\xB4\x83\x19\x24\x41\x22\x7E\x36\x45\x60\x08\x0D\xA0\x61\x9E\xAC\x52\x8C\x62\xFC\x9F\x15\x8C\xE9\x74\xF4\x48\xD5\x00\xF8\xEF\x1B\xC0\x61\xEA\xCE\x37\x77\x6F\xC5\xC0\xBA\x20\x88\xF7\x66\x83\x07\x57\xAF\x13\x75\xA3\xFA\x46\xBC\x0D\x4B\x8E\x4C\xC0\x4D\xCB\x6C\xFF\x56\x15\x17\x9D\x6F\xCF\x18\xBE\x1F\x61\x3B\x83\xBB\x9F\xB6\x50\x9A\x88\x7C\xFA\xC3\x3E\xA6\x89\x14\xD1\x5E\x34\xCD\xFB\x4F\x72\xE5\x82\x5E\x44\xDC\x4F\xB5\x3E\x75\xA3\x11\xD3\x03\xE9\xCE\xCB\xE9\x3E\xA4\x82\x30\xB8\x54\xBB\x35\x82\x30\xA9\x8E\x23\x64\xB7\xCE\xC6\xE5\xDD\x68\xA3\xA9\xC3\xD3\x35\x3D\xF2\x3B\xB4\xAF\xCB\xCD\x6E\x01\x4D\x2A\xBC\xB3\x8B\x5B\x71\x76\x0A\x8F\x2C\x4E\x74\xB8\xFC\x46\x85\x62\x21\x35\xA1\xB5\x76\xA1\x7B\xDA\x91\xDA\x73\x48\x6A\xCA\x45\x1D\xF3\xEC\x9A\xC6\x1F\x62\x13\xA5\x96\x0B\x05\x5A\xCE\x57\xE2\x7A\x36\x86\x44\x76\x8A\x6F\x3F\x4F\x41\xB5\x2C\x9D\x72\xFB\x28\x68\x13\xC6\x31\x74\xAA\xFB\x99\x44\x6D\x7E\x51\x52\x27\xBC\x7D\x35\x88\xAB\x59\x9D\x05\x2F\xC3\x5D\x18\x99\xE1\x96\xE3\xE3\xD8\x77\x01\x82\x2C\x30\x5A\x6A\xCB\x1A\xB2\xFF\xAA\x3D\x0D\x8D\x6E\x9A\xD6\x29\x8F\xD7\x22\x35\xB4\x49\xC0\xB5\x98\xC6\xA6\xC9\x3E\x92\xFF\x93\x99\x19\x94\xBE\x98\x20\xA4\xC9\x55\x1B\xC4\x98\xFF\x88\x3C\x34\xCB\xFC\x41\x33\x83\x73\x2D\xCE\x04\xF0\x31\xE2\x31\x04\x07\x98\x56\xB8\xBB\x1C\xB7\xEC\xF0\xEB\x45\x6D\x42\x47\xEF\xE7\x7C\x85\xEA\xCF\x83\xC7\x58\xA0\x87\xFC\x5E\x20\x19\xB5\xF2\x9B\x13\xCB\xD9\x14\x96\xF6\xA1\x21\xAE\xD3\x77\x4B\x7D\xD4\x73\x94\x01\x8E\xB0\x34\x5D\xDD\x59\x39\x73\xB6\x00\xD9\xAF\x91\xD1\xBC\x3E\x2B\x37\xD8\x80\xC6\x17\x69\x57\x2A\xEB\x3C\xBE\x5B\x7D\xE5\xA7\x61\x67\x41\x45\x29\x50\xBE\xA0\xC7\xDD\x0E\xC2\x46\xF9\x33\xD0\x67\x32\x42\x59\xB4\x9D\xCC\x4D\xBF\xFB\x1F\x2A\xD9\x03\xF1\xAF\x9E\x51\x84\x40\xED\xA5\x4C\xC8\xBF\x87\xA4\xBB\x91\x74\xDE\x3B\xEE\xDE\x70\x7E\x59\xB4\xF1\xA6\x26\x34\x5B\x50\xCE\x7C\x8E\x8D\xE4\xEA\xB2\x6D\x9B\xF6\x93\xCA\x63\x28\xC8\xE6\xB1\x8E\xA9\x9F\x88\xC8\x56\x7E\xC7\x0F\x5E\x71\xD2\x44\xA6\x99\xB5\xED\xA1\xE7\x45\x16\x3F\xB8\x6F\x8F\xAD\x8A\x62\x44\xE2\xC5\xAE\xCD\x87\xB6\xA7\x89\xC8\xF6\x13\xF6\x72\x37\xC6\x26\x3A\xDA\x31\x50\x1F\xFA\x99\x91\x25\xD8\xC2\x44\x9C\x4A\xE6\x07\x8F\xC2\xD6\xC4\xF7\x90\xA7\x4C\x0A\x62\xD8\x8A\x9E\xAF\x99\xD3\xDE\x6A\x3E\xA2\x96\xA4\xB1\x9F\x23\xE3\x9C\xED\xF8\x7F\x20\xC5\x84\x87\x75\xC1\x01\x3A\x1B\x5E\xD5\x0F\x00\x1B\x37\xA6\x2D\x46\xC8\x76\x75\xF5\xE2\xCF\x20\x59\xD2\x28\x10\x69\xCD\x0A\x72\xC7\x63\x64\x16\x27\xF2\x96\x16\xE3\x3C\x65\x21\x8D\x32\xF0\xB7\x6F\x78\x91\x94\xC2\xCC\x45\x4B\x47\xE7\xCF\x10\xD3\x74\x57\x19\x1D\x3D\xA6\xA9\x9B\x98\xEE\x18\x5A\x30\xC7\xB1\x68\xFB\x50\x3A\x80\x01\x14\xF6\x0F\xBD\x8A\xF7\x3F\x26\x28\xC1\x87\x08\x0D\x7B\x16\x6D\xC8\x56\x58\xDD\xBF\x48\xB1\xE9\xCD\x5F\x04\xCC\xD1\xA8\x93\x83\x94\xDC\x0C\x29\x74\x0E\xED\xC2\x35\x01\xF1\x42\xCF\xBD\xDF\x84\x39\x13\x31\xED\x16\xDD\x54\xA6\x71\x84\x8F\xBA\xDC\xE4\xDD\x7E\x53\xDA\x24\x17\xFB\x1C\x71\x89\x85\x0D\x6A\xBA\x84\xBD\x04\xC1\x35\x88\xA2\x41\x38\x64\x77\x42\x78\x29\xD4\x9A\xB6\x07\x59\x02\xCC\xBC\x7B\x3D\x61\xD0\xAA\x61\x14\x13\x2F\x47\x73\xBF\x63\xD3\x51\x84\x5A\x86\x78\x0B\xA6\xCF\x29\x42\x7A\x2B\xF2\xCD\x4B\x5F\xE9\x8A\xFB\xD4\xD0\xB9\xAD\x4F\xCD\xAA\xD4\xD5\xC6\xDC\x88\x8E\x70\x7D\xA2\x24\x23\x61\x3D\xE3\x69\xFA\x01\xB0\x2F\x50\xEE\xA0\x79\xCA\xEA\xA8\x36\x10\x73\x98\x4C\xEC\x37\x21\xAF\x0F\x3B\x22\xDB\x07\x2E\x19\x95\xB5\xC9\x76\xD6\x02\x90\x73\x51\x5B\x24\x13\xCD\x22\x66\xF1\x16\x5B\x69\x7D\xF4\x7E\x52\xC5\xDE\xB4\x42\xA9\xFA\x97\xAF\xB1\xCC\x78\x49\x3A\x0F\x6D\x18\xF6\xB0\x4F\xA3\xB6\xC2\xAE\xA3\xA2\xBD\xE9\x73\xFB\x26\xBE\x69\x34\xA6\xF2\xCA\x88\x0C\xDC\x56\x32\x95\x0A\xF4\xC4\xE8\xEA\x55\x25\xD8\x2E\xFC\x19\x94\xFE\xD3\xCD\xF3\xD7\xD3\x45\xFA\xA4\xE5\x27\xAB\xD3\xF4\x24\xFD\x76\x62\x6E\xFE\xE9\x58\x0C\xF6\xED\x0E\x1E\x88\x87\x4D\x8F\x5E\x56\xC8\x8C\xA0\x24\x85\x5C\x07\x6F\xC9\x2B\x6A\xA0\xD3\x38\x47\x0E\xE8\xC4\x6A\x96\xD9\xBB\xAC\x3D\x66\xF8\xD4\x63\x14\x2C\x51\x7D\x3E\xE3\x15\xCE\xDF\xDB\x35\xB9\xC5\x85\xA4\x1A\x55\x6D\x34\x6B\x68\xF1\xA3\xF8\x15\x32\xE2\x07\xDD\x5C\x08\xEE\xF6\xC9\x8E\xDB\xD2\x6D\xEC\x56\xA1\x26\x13\xA1\x65\x0A\x3F\xA8\x31\x38\x9E\x30\x7C\xA3\xAA\x66\x94\x69\xCA\x2E\xA2\xE7\x88\x22\x97\x24\xCC\xD4\xEC\x9C\x14\xF2\x29\x58\x63\x23\xD8\xD0\xD9\x88\xF0\x05\x97\x9C\xA2\x5D\x24\xB3\xF9\xF0\xB8\x57\x18\x6D\x59\xFA\x72\x3F\x66\x90\x31\x2C\xEA\xA4\x39\xE6\x78\xAF\xEF\x1C\xF0\x1D\x4F\x95\x41\xA1\x34\xDD\x91\x8F\x28\x15\x1C\x5C\x72\xF6\x19\xDC\x30\xD8\x82\xB4\xC2\x1D\xED\x8D\x3D\x5E\x3A\xF5\x21\xE0\xC2\xDB\x7F\xD5\xDB\x0F\x5E\x52\x00\x19\x46\x24\xAA\xC7\xEE\x1D\x38\x00\x21\x0A\x98\xF9\xED\xEE\x98\x4E\xD3\xA2\xD4\x05\xC0\xB6\x66\xBF\x65\x80\x97\xAA\x51\x5E\xB0\xFC\xA5\x16\xE2\x14\x4C\x2B\x0D\xC4\x7B\xFE\x0F\x58\x41\x03\x7E\x31\x5B\xC9\xF8\x02\x20\xA5\x1A\x08\x40\xF8\xC6\xF7\x1D\x13\x5B\x8C\x0C\x03\xF9\x2E\x0D\xEB\x20\xAB\xAA\x0D\x8B\xD7\xD7\x45\x7C\x47\x03\x30\xC4\xB8\xF6\xBD\xE6\x22\x71\xA6\x52\x9D\xB5\x9E\xF8\x78\x06\x04\x9E\xAF\x93\xF4\x79\xA9\xD1\xD4\x69\xDB\x8A\x7B\x3E\x5B\x3D\x5D\x80\x41\xBB\x66\x28\xA7\xDB\x5B\x8E\x48\xC5\x45\xAA\x52\xF8\xAC\xF5\x37\x80\x11\x81\x50\x57\xFB\x23\x66\xA0\x99\x86\x8C\x35\xE9\xA9\x23\x9D\x43\xE7\x47\xC0\x23\x61\xD7\xA6\xE7\x57\x04\x9B\x02\xA9\x1C\x07\xB5\x3A\x46\x44\x10\xB2\x4F\xEB\x87\x58\xF3\xBA\x10\x75\x63\x08\x29\x54\x3E\x22\x84\xB8\x95\x3D\x35\xD2\x27\x6C\xD8\x47\xEF\x84\x4F\x00\x22\x37\x53\xC1\xC9\x2E\x86\x7E\x34\x55\xD5\xFB\x33\x05\x1D\x2B\xBB\xA3\x54\xB7\xCD\x1A\x04\xE9\x84\x18\xB3\xF6\x8E\xF5\x4F\xA7\x88\x02\x35\x4A\xB0\xDC\x0B\x9E\x9C\x09\x37\xE1\x2B\xF3\xCA\x92\x2C\x46\x00\x08\x50\x2E\x87\xF8\x38\x5F\xFB\xAE\x42\xDF\xF6\x01\xC8\x2A\x8E\xF7\x3E\x04\xAD\xC0\xBE\xC0\x87\x66\x72\xAE\xD5\x1E\x6F\xDC\xEE\x7B\xE8\xCB\xD5\xFC\x10\x4D\x63\x5D\x81\x12\x2E\x94\x60\x49\x2B\x28\xCF\xE2\x80\x70\x5F\x2D\xE7\x02\x57\xB9\xC6\x33\xDA\xDA\x22\x01\x94\x4D\xB3\x8E\x24\x65\xEA\xF5\xDB\x8A\x62\x8F\x5F\x02\x88\xD0\xF7\xFC\x8D\xE8\xF4\xFB\x89\x24\x8D\x20\x84\x0D\x12\x7E\x85\x4E\xD1\xA2\xB3\x31\x62\x8C\x35\x1B\x2C\xEC\x1E\x7E\xDB\x32\x0E\xA1\x1E\xA8\x7A\x8E\x6A\x03\xEE\x59\xD0\x71\xE8\x20\xCE\x98\x1D\x05\x8A\x03\xC0\xD1\xB5\x64\x68\x03\x50\x6B\x92\x4D\xDE\x2E\xC9\x72\xBF\x05\x82\x5A\x83\x9B\xFE\xF5\x47\xE8\x7A\xC3\x83\x14\x73\xCB\xCE\x24\x58\x49\x37\xCF\xB5\x09\x70\x13\xC0\x26\x38\xE5\x67\x31\x6C\xBE\x8E\x2E\x96\x6E\xE7\x14\x52\x99\x04\x9C\x70\xB6\x34\x90\x16\x6E\x3D\x8F\x58\x99\x94\x5C\xF0\xBF\x76\x99\x0A\x1F\x5B\xB7\x35\xD9\x8B\x5E\x73\x2C\xCE\x15\x57\x54\x69\xF6\x8E\x0D\x5F\xC0\x39\xBC\x0F\xD3\x20\x99\x87\x36\x4B\x81\xB0\xC5\xAA\xA9\xAE\xE8\xF8\x5F\x21\x14\x23\x0F\x5C\xB1\x40\xAB\x11\xFE\x98\x39\x62\xAD\xD3\x87\x18\x66\x23\x76\x8E\xD6\x5C\x6D\xCB\xFD\x0D\x63\xA5\x35\x9E\x9F\x54\xD9\x88\xBF\xC1\x21\xD0\xDF\x61\x60\x88\x78\xE9\x23\xA8\xBA\x0F\x5B\x90\xB8\xA9\x51\xEC\x33\xBB\x69\x72\x90\xD5\x29\x82\x52\xD6\xC1\x7B\x0A\xC5\x52\x18\xB5\x67\xE6\xB7\xFA\x2D\x1F\x5C\x4E\xA9\x19\x3E\x51\x29\xCA\x15\x83\x86\x22\xEF\xDC\x50\xC5\xCE\x16\xE3\x92\x5C\xE2\x34\x8E\x93\x7A\xEA\x2F\xC1\xAF\x68\xA7\x2B\x84\x12\x68\x50\x8D\x6A\xF2\xD8\x2B\x3E\xF1\x33\xFB\xEC\x67\x2D\x5C\x14\xF7\xFE\x36\x46\x54\xF7\xF8\xD0\x76\xAE\xE5\xBF\x96\x54\x93\xB1\x88\x91\xCB\xA4\xFE\x15\x1F\xDA\xBD\x4D\xA3\x68\x71\xAF\x1C\x80\xBD\xA5\x21\xD8\x60\xD6\x85\xFD\xBC\xC6\x02\xE6\xC3\xB6\xD2\xC4\xA8\x97\x49\x89\xE9\x08\x01\x66\x46\x93\xA7\xE1\xA1\x92\x60\xC5\x53\x71\x6B\xF6\xE1\x0E\xBF\x67\x7B\x09\x97\x35\xFF\xF5\xC0\x51\x06\x44\x9C\x0A\x6C\xBC\xE0\x30\x7A\xD6\x42\xF5\x1B\x1A\x5C\x06\x22\xDE\xB4\x01\xDE\xFC\xED\x2D\x12\xF8\xD9\x14\x47\xCB\x0D\x2A\x9F\xB5\xE4\x24\xE4\x0C\xC1\xF3\x5A\x81\xA3\x90\x6F\x72\x98\x6E\xC7\x2A\xF3\xBA\x05\xEE\xB6\xC6\x8F\x56\xC4\x8F\x10\x25\xA1\xEE\xDB\x89\x89\x07\xD0\x1B\x75\xD3\x41\xC4\x35\x04\xBF\x64\x94\x99\x52\x4B\xF4\x2C\xDA\x8E\x7D\xED\xE5\xE0\xB3\x42\x7E\x66\x35\x33\x86\x72\x6E\x35\xCD\x69\xFE\x6B\x85\x32\xB4\x0E\x7E\x77\x4D\xFE\xDC\xE2\x78\xFC\xDF\x04\xE2\x12\xB1\xFE\x78\x2B\x12\x8E\x35\x77\xF6\x99\x9E\x4A\x25\x9C\x80\xCA\x07\xF7\x7B\xB2\x0C\x2C\x80\x2B\x12\xE8\x37\x29\xD8\xB6\xE7\xCD\x1C\xBE\x84\x88\xD7\xEE\x54\x29\x45\x23\xE5\x58\x4C\x07\x42\x5E\x9D\xFA\x40\x9D\x51\x45\xC1\x99\x7B\x01\x1E\x8C\x22\x30\xC2\x20\x54\x2B\xB4\xA4\x41\x5E\x31\x5B\x74\x2B\xDA\x37\x8B\xD7\x49\xC1\xD0\x60\xFB\xF6\x38\x06\xDF\xC8\x98\x1D\xDE\xE5\x4B\xEE\x06\x08\xA8\xC8\x58\xE2\xC6\x09\x67\xB4\xC9\x68\x32\xC7\x0D\xFC\x5D\x77\x0D\xC9\xC4\xB4\x35\xAF\xB6\xB1\xDA\x29\x27\x44\x26\xD5\x7B\x33\x2C\x55\xA6\x27\x27\x56\xDE\xEF\x3A\x89\x3C\x0E\xE2\x00\xFD\x89\x5C\x05\x79\x2C\x93\xE6\x94\x10\xB9\xAE\xF3\x20\xB8\x72\x38\x35\x5C\x6B\x77\x6B\x87\x64\x0E\x43\x87\xBE\x2C\x3C\x87\x75\x31\x64\xD1\x14\x15\x13\x96\xCD\x15\x24\xD6\xE8\x79\x00\x6E\x39\x14\x13\xE0\xE9\x36\x4F\x7D\xC0\xEF\x5F\x38\x86\x76\x3C\x81\xBA\xD0\xB3\x42\xD2\x26\x59\x36\x92\xAD\x9E\x07\xEB\xF7\xBD\x7A\x8A\xD9\x6A\xD6\x9F\xF2\x2E\x16\x8A\xC0\x06\x40\xB3\xC6\x0D\x69\xE3\x35\x4D\x21\xF4\x84\x48\x78\x67\xBF\xC1\x0C\xED\x43\xB3\xE6\xA3\x03\x85\xE6\x2D\xB5\xEF\x5B\x0D\x93\x7B\x97\x20\x18\x78\x7C\x54\xEE\x20\xFF\x10\x8A\x8E\x9C\x38\x4C\xA7\xB7\xD1\xF3\xDF\xE7\xDA\xF0\xF1\xAF\xF7\xED\x53\x6B\xF0\x77\x1F\xC9\x83\x72\x61\xF0\x6B\xC3\x06\xA8\x5D\x9B\x4A\xC8\x1A\x64\x2E\xAC\xD2\x2B\x62\x87\x9C\x19\x27\x08\x38\x4E\xEB\xED\xB4\x92\xDE\x3A\x74\x36\x76\x0C\x40\xEA\x18\xCC\x52\x0A\x4D\x46\xE3\xB5\xC0\x90\xCE\xBD\x43\x02\x56\xA9\x4B\xBD\x07\x8A\x59\x32\xEE\x38\x89\xE8\x4D\xA6\xB0\xAC\x92\x9D\xAE\x3A\x9B\xD8\x3C\xFD\x09\x79\x78\x89\xA9\x4D\x08\xF8\x8A\x16\xC9\x71\xDF\x53\xC9\x0D\x26\xC0\x5F\xA9\xFA\x80\xE6\xC1\xA4\x1E\xEE\x5D\xAE\x19\x65\xF3\x05\xC9\x8F\xBA\xE1\x98\x63\x6E\x6D\xFF\xE9\x61\x76\x2C\xA9\x6A\xB6\xB8\xB3\x9F\xF0\xC8\x28\xAC\xFA\xD9\x5E\x41\xBF\x91\xFA\x67\xB5\xAD\xEC\x41\x03\xFF\x5C\x1E\xE7\xF0\x53\x3C\xDE\x06\x0E\x3E\x62\x23\x0D\xCC\x7A\xF7\x21\xDE\xD5\x9E\x42\xF7\x13\x36\xF9\xB2\x8C\x11\xCB\x36\x00\x77\xA7\x9F\xAE\x58\xC6\x16\x8E\x08\xF4\x98\x76\x4E\x7A\xEC\xE0\xF9\x3A\x88\x99\x37\x8A\xBB\x76\x1B\x33\x89\x1D\x78\xF1\xAB\x93\x16\x17\x09\xDF\x18\x83\x79\xF6\x40\x5D\x1B\xA1\xC9\xB2\x27\x35\x5A\xA1\xFA\x93\xE5\x40\xC2\x3B\x68\xE1\xD2\xFE\xF7\xE5\xBD\xB1\x30\x6B\x22\x17\x65\xA4\x72\xD2\xFC\x30\xF4\x15\x66\x91\x3A\xD8\x09\x14\xAB\x6F\xE7\x95\x8C\x59\xCB\xFA\xFF\xBD\x85\xA3\x4B\x64\x6D\xC6\x05\x05\x2E\xC3\x0D\x72\x4D\x5A\x9B\xA1\x98\xFE\x88\x3B\xF9\x4D\xF3\x2C\x10\xAF\x1D\xC5\x74\x85\xF2\x91\x9F\x9E\xB3\x9E\xAC\x39\x2A\x41\x0A\x12\xCB\x23\x45\xA5\xB6\x24\x33\x74\xB9\xB7\x49\x89\x03\x9A\x7B\x89\x3D\x41\xDC\xC1\x78\x4A\xA8\xD5\x65\xF5\xC9\xE1\x9C\x92\xF6\x21\xDD\x6B\xDC\x88\xB9\xFF\x73\x44\x37\x71\x0B\xCD\x8A\xFA\x23\xB9\xE0\x33\x65\x4D\x7F\x8D\xCF\xD1\x25\xEC\xCA\x9F\xBA\xF0\x00\x21\xB4\x72\x38\xF8\x15\x35\xF4\x2B\xBE\xE4\xBE\x8F\x97\x75\x4D\x3D\x8C\xB7\x32\x9B\xE7\x69\x44\x26\xDF\x47\xD0\xD5\xDC\x4C\xC7\x39\x42\x96\x2A\xE9\xBC\x7C\xEA\x92\xBB\x68\x94\x7A\x5C\x8D\x66\x5C\xB5\xAC\x4D\xCB\x11\xD3\xE9\x98\x17\x9A\x91\xA0\x2D\x03\xE3\xF5\x38\x6B\x03\x9A\x15\xC4\x2A\x58\x6C\x36\x3A\x8F\xD9\x55\x9D\x6C\x9F\x82\x2A\x9F\xC9\x8F\x8F\xE5\x48\x06\x83\x43\x2C\x44\xB4\x73\xF9\xEF\xB2\x1C\xFD\x32\xEB\xCA\x56\xB1\x7B\x54\xBC\xCB\x65\xE9\x38\x20\xA8\x5E\x84\xC2\xFD\xD4\x63\x3D\x60\xAE\x76\xF7\x8B\x7C\xCE\x16\x7F\x99\xD1\x8C\xB6\x59\x80\xC6\xE0\x66\x2B\xD4\x1D\x29\xFD\xB1\x8D\xAB\x15\xA6\xA9\x37\x46\xE7\xB4\xD9\xD0\x85\x24\x9A\x69\x5B\xAA\x0D\x67\x80\x94\x53\x9C\x84\xCB\x22\xF6\xAB\xEA\xA0\x56\xB4\x36\x1D\x18\x63\xA7\xD6\x0F\x57\xD6\x95\x5D\xDC\x96\xA5\x8F\x4A\x4A\x0E\x77\x52\xD6\x40\xFA\xF5\x95\x1B\x42\x3A\x3D\x2F\x3E\x1B\x56\x72\x2D\x64\x9E\x06\x1F\x3E\xA5\xCB\x40\x93\xD0\x08\x4D\xAD\x7E\x44\x96\xDD\xE5\x32\xF8\x0E\xDE\xE2\x6D\xE9\x2B\x28\x4C\x12\x45\xFF\x98\x69\x39\x2C\x5C\x04\x29\xED\x42\xB7\xBC\x55\x48\x3D\x21\xDE\x17\x3A\xEE\xE4\xA7\xC0\x97\xC9\x2B\x10\xA4\xA9\xE9\xE2\x6A\x48\xF4\xB0\x95\xF2\xA3\x1B\xE6\x3A\x22\x26\x50\x89\x93\xBC\xF3\xE0\xE6\x00\xF7\x56\x53\xF4\xF7\x43\x21\xE3\x54\x5A\x1D\x72\xB4\x98\x67\xF7\x54\x58\x1F\x96\x5D\x8E\x8C\x3B\x4F\xDA\xF0\x2B\x95\xD5\x56\xE4\x1C\x0D\x67\x35\x0C\xB3\xAB\x7F\xBC\x3B\xB5\x50\x8F\x13\xBF\x72\x85\x19\x03\x15\x92\x30\x77\x8E\x17\x36\x28\xC9\xF8\xEB\xF9\xC3\xBF\x7D\xB0\xFF\xF1\x0D\x62\x9A\x61\x72\x9E\x80\xAE\x45\x67\x98\xE7\x77\x3F\x88\xB3\x30\x5C\x44\x5D\x81\x44\x6C\x12\x12\xAF\xB9\x27\xA0\x1A\x00\xCA\x5B\xB1\xD7\x59\x2D\x48\xAD\x7D\x1D\x61\x9F\x95\x3B\x9C\x71\x5F\x86\xD6\xD6\xE5\x99\x2C\x84\x4F\xA4\xA8\xCF\x25\x3A\xE0\x76\xF0\xEE\xD6\xFB\xD4\xCE\x81\x29\x40\x44\xAD\x40\xC5\xD7\x11\x5E\x40\x67\xE7\x0F\x12\x65\x5D\x65\xDD\x54\x22\x5D\xA1\x60\x01\xBB\x41\xC7\xC8\x04\x96\x94\xC7\x82\x59\xF6\xFE\x21\xCB\x76\xC3\x77\x0D\x05\x4E\xC9\x4D\x0E\xCE\xD6\x28\x27\xBD\x83\x8E\xCB\x85\xDE\x47\x11\x9D\x5C\x88\x1D\xC9\x15\xFA\xB4\x58\xA4\xF4\xBA\x73\x06\xB3\xBF\xA4\xD8\xA9\xF9\x98\x39\x12\x6F\xD3\x0F\x2F\x0F\xDE\x94\x78\x73\x70\xB2\x3C\x26\xF9\x5B\xB8\xA2\x0B\xEA\xBA\xE8\x87\x43\xCA\xF5\xCB\x63\x18\x45\xDB\xC3\xD4\x0A\x8A\x82\xC8\xBA\xB0\x0E\x3B\x06\xBC\xE5\x8D\xA3\xA4\x00\xA3\x77\x28\x0E\x6F\xEA\xCF\xE3\xF5\x9B\x37\xC6\xCD\xD4\x02\x69\xFB\x7D\x50\x52\x95\x32\x3F\x6B\x71\x47\x72\xAD\xA5\x61\xD5\x3C\xD4\xFC\x14\xFF\x1B\x80\x10\x65\xDD\x29\x22\xAF\xB4\xB9\xE9\xBC\x4C\xDA\xAB\x2D\x37\x7D\x92\x52\x60\x84\x0B\x14\x81\x03\x2A\x19\xB8\x67\xF8\xA9\xAB\x22\x26\x83\x52\xF4\xB7\x04\xC6\xD6\xC6\xB9\xCF\x77\x44\x2E\x42\x6E\x54\xE5\x6C\xE7\x52\x74\xE6\xC7\xA0\x5F\x18\xE8\xF2\x58\x88\x86\xF3\xAB\x2F\xD7\x69\x68\x57\xA9\x42\xE6\x85\xA0\xDD\x40\x47\x1F\xE6\x11\x9F\xB9\x89\xB2\x08\xB2\xBC\xE8\xAA\x15\x36\x82\x5F\xE9\x1E\xDC\x92\x9A\xEF\x54\x63\xA1\xE7\x17\x94\xF3\x33\x5E\xFD\xC1\x58\x2E\xFD\xF4\x20\xE9\x5B\x72\x12\xD1\x78\x53\xC5\x71\xA3\x43\x85\x9E\xA8\x0B\x43\xA6\x0D\x83\x76\xE7\x87\x53\x82\xA7\x45\xAD\xAA\x2B\xB2\x88\x48\x79\xED\xE9\x85\xC4\x6B\x67\x72\x40\x71\x0D\x4D\x5E\xBB\xAF\x86\x53\xD9\x7B\xE8\xAC\x43\x71\x59\x88\xC4\xEE\xA1\xA4\x27\x50\x80\x96\x72\x37\x3C\xC9\xFD\xE6\x9C\xE7\xAD\xA2\x6C\xF4\x99\x12\xE0\xBF\x0A\x29\xB8\x6B\x6F\xF1\xD7\x27\xBA\xF5\x3F\x01\xB3\xC5\x82\xAD\x90\x8C\xDE\x5B\x2F\x54\x76\xD6\xAB\xCF\x7B\xAF\x28\x03\xEE\xAC\xEB\xED\x02\xB8\x3D\x09\x2D\x39\xE1\x09\xC2\x32\x33\xA9\x2E\x65\x89\x17\x37\xC1\xBD\x6D\x6C\xAB\x3B\x08\x06\x49\xDD\x88\xA8\x2B\x7E\x7E\x7E\xAF\x02\xF2\x2C\x11\x81\x67\xE5\x95\x80\x73\x00\x3D\x29\x10\xE6\x13\xED\xB2\xE6\x86\x66\xA9\x8A\xFB\x89\x5F\x58\xF0\xE7\x42\x9A\x62\x16\x48\xC7\xA1\x93\x91\x88\xC2\x72\x5A\x3B\x61\x81\x67\x4E\x04\xBB\xB8\x62\x80\x97\x56\xE8\x1B\x9A\x65\xA2\x76\xA8\x0C\xD1\x80\xBB\x0C\x7B\xB2\x66\x44\xE3\x8B\x8F\x19\xF2\xD0\xF5\xE3\xE1\xA7\x27\xA8\x26\x45\x07\xA5\x47\xCB\xC6\xD7\x0E\x8F\x21\xD1\x1C\xFE\x20\x82\xAB\xBF\xBB\x7A\x5A\x53\x64\x9F\xE5\x8C\x7A\xEA\xF4\xC2\x9A\x35\x93\xA4\x65\x0A\x6E\x39\xFF\x37\xB8\xDA\xA3\x0C\xA9\x63\x99\x76\x12\x17\x28\xB6\x48\x31\xA0\xE1\x74\x4A\x91\x64\x0D\xEC\xBC\x46\x92\x06\x2F\xC6\x42\xBF\x23\xA0\x78\x74\xC3\x67\x2A\x37\x00\xAF\xA5\xFC\x1F\xF4\xDD\x3B\x19\xAA\x19\x3E\x14\x6E\xE3\x93\xAD\x3F\xB2\xEB\x67\x49\x02\x99\x98\x1D\xA7\x98\x37\x54\x40\x56\x26\x7A\xAF\x8B\x7A\xCF\x5D\xC2\xD2\xB6\x37\x93\x24\x32\x90\xFC\xA6\xFB\x48\xA3\xD9\x46\xE9\xD9\x86\x72\x7C\x35\x60\x03\xA6\x8C\x69\xEB\x35\xF3\x15\xFB\x1A\xC7\x03\x25\x57\x49\x74\x74\xC0\xC5\x8C\x96\xBB\x7F\x41\x6E\xC9\xA4\x54\x63\xFC\x1C\xBE\x3D\xDB\xFB\xE3\xB7\x4F\x9F\x0B\x10\xA1\x35\x29\xEB\xB6\x12\x34\x74\xF6\xAA\xA6\x40\xC9\xF1\xE5\xBE\x16\x93\xCC\xBE\xE6\x0A\x8E\xF5\xF9\x59\x3A\xCF\x50\x80\xC0\x8C\x15\x52\xED\xD1\xCA\xC7\x82\x63\xC5\x0D\x41\x9F\x0D\x5B\x42\x0B\xEE\xF7\xFF\xF5\x3D\x9B\x03\xBC\x45\xA8\x9E\xA2\xA0\x27\x28\x67\xDE\x01\xBB\x8F\x22\x88\xF1\xAB\xB7\xAA\x5A\x96\xC6\x61\x21\xDB\xF1\x91\xB5\x36\x07\x30\x32\xE7\x2F\xFB\xB1\xB4\xBB\x7C\x38\x87\xA8\x07\x1C\x09\xDC\x8B\x34\x44\x67\x21\x51\x08\x36\xD0\xF9\x75\x59\x7A\xBB\x44\xD2\xF5\x8C\x7C\x3E\xD1\x8A\x38\xEF\x5B\x91\x84\x0C\xE9\x37\x0A\x85\x9E\xFE\xEA\x5E\x84\xB5\x76\x2B\xC9\xFB\x10\x37\x3F\x7D\x0C\x56\x69\xB0\x93\xB4\xF7\x9B\x4C\xA2\x2D\xDA\x31\xCE\x5E\xD1\xFF\x58\x62\x69\x8C\xCD\x3E\x0A\x55\x98\x94\x1F\x4D\x7E\xBD\x18\x30\xD9\x9F\xCA\xE2\xC4\x65\x7A\xB3\xEA\x3F\x41\x04\xA5\x53\x31\xE5\x50\x5F\x08\x78\xD1\x60\xE9\xDC\x14\xBD\x28\x91\xC6\xDD\x0E\x3C\xF2\x9C\x85\x02\xF4\xE9\x71\x6A\x1D\x70\x68\x30\x2C\x55\xDC\xC6\x16\x0D\x5A\xAC\x89\xDD\x4B\x37\xBE\x4D\xA7\x6B\xB6\x06\x56\x16\x89\xEB\xAA\x9E\xBF\x88\x09\x11\x68\xC6\xB3\x43\x57\x04\x0E\xF0\x07\x0C\xF8\x12\x57\x43\xA9\x30\x2B\xCB\x4F\x80\x40\xF9\xE7\xD3\x74\x35\xB0\x5D\xCC\xB8\x0A\xE5\xD1\x23\x87\x5C\x07\xC3\x66\xA8\x71\x7B\xE2\xB0\x03\xEF\x3E\x67\x8D\x3B\x55\x1F\x7D\x6D\x7F\x7F\x31\x7D\xCD\x8C\x85\xB9\xC2\x8E\x8D\x1B\xC2\xB5\x5F\xB4\x5F\x62\x39\xCF\x3B\xB6\x28\xAB\xFB\x9A\x12\x6A\x26\xC2\xFB\x9F\x79\x2E\x2D\xBD\xE0\xEE\x5A\x88\x27\xBE\x53\xEC\xDD\x5A\xA2\xDD\x30\x1C\x5C\x85\x94\xB6\xCB\x9E\xEB\x8B\xA5\x79\xFE\xCB\x45\x73\x0A\x26\xD6\xD4\x58\x9D\x72\x55\x51\x32\xBE\x04\x9E\x11\x47\x76\x04\xB3\x32\x74\xE6\x50\x07\x9C\x4D\x7F\x94\xE5\x44\x0A\x78\x32\x0C\x4D\x25\x5E\x82\xC0\x55\xCF\xAB\xBF\xFC\xED\x6E\xAE\xDA\x8D\x9B\x9D\xF8\xEB\x7B\xF5\x9B\x8D\x60\xA3\x16\xB2\x85\x29\xE9\x20\xFD\x6D\x55\xB0\x59\x1A\x14\x21\x00\xD9\x61\x39\x94\x9F\xF8\x68\xDC\xCD\xD6\x54\xF2\xA7\x18\xEF\x6A\xE1\x9D\x97\x15\xF2\x7E\x33\x61\xC9\xD5\xA5\x97\xB3\x97\x36\xE5\x70\xB0\x74\x05\x2D\x0D\xBA\xDD\x40\x76\x4E\x06\xDB\x8D\x2A\xA9\xA6\x61\x2E\x44\x86\xB5\xEA\xFA\xCF\x8D\x9E\xCC\xA7\xA6\xC0\xCD\x0A\x22\xF6\xCE\xEC\x29\x07\xD7\x94\x01\x98\xFC\x2C\x47\x05\x03\x3F\xEA\x0F\x66\x21\x29\x3E\x04\xF7\x9B\xF9\x3E\xA3\x31\x05\x33\xD6\xFD\xE7\x76\x73\xA8\x9E\x6E\xA7\x3D\xDF\xB8\x3E\x1D\x60\x87\x9B\x42\x4D\xB2\x46\xEB\xE5\xC4\xEF\x33\x13\xA4\xBF\x2A\x73\x1A\xF6\x69\x08\xBB\xF2\xB8\x36\xEB\x65\xD2\x45\xC1\xC1\x0E\xFB\xE9\x9F\x5D\xFD\x44\xF5\xA7\xE0\xD5\x89\xB9\x2A\x7A\x84\xF4\xBB\x27\x19\x76\x4D\x48\x1B\x26\xAB\x45\x22\x49\xD1\x19\x65\xD2\x00\x87\xFF\x0F\x87\x4D\x8B\x0D\xCC\x92\x04\x1F\xA6\x91\x82\xBF\xE3\xE7\x43\x61\xB6\xA5\x02\xC5\x53\xC3\xED\xC9\xBC\x45\x8A\x1A\x74\xB9\x2D\x49\x24\x49\xDC\xC4\xBC\xC9\x2C\x36\x9A\x61\xC4\x0C\xA0\x96\xA6\xD2\x3A\x58\xA7\xB2\x4B\x7E\x4A\x18\xC0\xF1\x3F\x6D\x6C\xA4\x93\xDC\xE6\x3C\x0C\xD5\x8F\xC1\x3D\xA3\xC6\x27\x1C\x83\xAB\x1B\x97\xCB\x4E\xD4\x9E\x11\xAC\x5A\x83\xFE\xEA\xB6\x62\x6A\xC2\x77\x14\x33\x88\x12\xA0\x05\x69\x90\x6D\xBA\x3B\xA6\x63\x61\x87\x59\xB6\x6D\x0A\x25\x8F\xD0\x90\xAC\xFB\xCB\xF7\xA2\x63\x8C\x1B\x45\xA6\x3E\x9B\x22\x0E\xAF\x23\x3B\x1C\x9F\x00\x34\x43\xBC\xE6\x97\xEF\x9F\xE4\x2D\x31\x60\xDB\x66\x0B\x6A\x3E\x97\x8A\xEB\x5E\x5D\x85\xAF\x2A\x8C\x4D\x1A\xE5\x8B\x0F\xEF\x7C\xAE\x3B\xDD\x8A\xAE\xAE\x73\x6B\x34\x25\xFD\x8E\x41\x1A\xB4\x1A\x6D\xD2\x38\xF9\x03\x9B\x34\xE4\x1A\x8B\x23\x5E\xC7\x8C\x22\x28\xF5\x58\xE2\x02\xB1\xFD\xB0\x36\xF8\x8A\xA2\x76\x64\xEB\xD0\x49\xB8\xB3\xB3\x55\x38\x64\x56\xE6\x99\x61\xA9\x95\x8F\x79\xE9\xC8\xA4\x54\xAD\x52\x1F\xD0\xD7\xB3\x56\xA4\xB6\x40\xDF\x04\x45\x5A\x03\x3B\x7C\x3A\x51\x34\xC4\xA6\x8B\xF4\x58\xAB\xCA\xC6\x20\x25\x43\x30\xCB\xAB\xB2\x7C\xF9\xD2\x40\xDF\xCC\x61\xBF\xA5\x0A\xA4\x00\x88\x05\xA7\x03\xB9\x09\xE2\xFA\x83\x0F\xE1\xD0\x63\x60\x56\x5F\x48\xE2\xA4\xD0\x6F\xA4\x52\xD1\x8D\xEA\xB3\x3B\xFE\x95\x22\xF1\xDD\xC1\x34\xF2\xAB\x6A\x80\x7C\xFD\xDB\x33\x24\x33\x1A\x80\xBF\xC2\x86\x60\x2E\xA4\x0A\x9B\x15\xFE\x88\x3D\x70\xAA\x95\x8F\xDB\xC6\xE9\xBE\x2B\x32\x12\x77\x37\xA4\x44\x93\x65\x4B\xC3\xE1\x37\x60\xB3\xA2\xE8\xE3\xCA\x5F\x4C\xCA\x85\xD4\x1B\x2A\x88\xAE\x34\xB3\xC8\xF9\xEC\x5C\x77\x8A\x61\x73\xF7\x10\x35\x20\xEF\xF7\xCB\x0C\x60\xF6\x10\x46\x5A\xAE\xAA\x47\x29\x17\x5C\xC9\xC0\xBE\xCA\x14\x3E\xCB\x86\x7B\xFC\x04\xB7\xED\x99\x9B\xA5\x47\xD8\x42\x60\x4E\x21\x0B\x94\xB0\xD6\xD0\x17\x78\xE4\x75\xD6\xDE\x3B\xBA\xF7\x4D\x02\xB2\x09\xA3\x12\xFE\x0E\x33\x01\xF9\xDF\x63\x89\x01\x9C\x2D\x16\x77\x8F\x0C\xC5\x35\x59\x61\x80\x2E\x91\xDB\x8B\xEA\xAE\x7A\x67\x7C\xF2\xF6\xAA\x24\x88\x30\xF3\xA9\xC4\x10\x43\x68\xCD\x00\x18\xFA\x74\x22\x17\x3B\x01\x15\x2E\x55\x3E\x8F\x94\xFA\x95\x23\x4D\xAD\xBA\x19\x0C\xEE\x00\x6A\x43\xA4\x4C\x8B\x71\x97\x47\x3C\x2B\xA0\xDE\x34\xEA\x03\x94\x49\x67\xBE\x26\x7D\x26\xE6\x28\x2C\xD4\x99\x46\x42\x5F\xC2\xBE\x5A\x9A\xC7\x49\x30\x0E\x7A\xE0\x4A\x0B\x4D\x8F\x48\x7B\xFE\xF7\xD6\x40\x93\x7F\x61\x28\xC3\x9A\x22\x9D\x15\x3C\x20\xE1\x81\xDB\xCC\x7C\x2F\x19\x36\xA5\xFD\x32\x7D\x17\x30\x4F\x4C\x01\x9E\x91\x2B\xFA\xE7\x4D\x87\xFC\x98\x4B\xCD\x5C\x84\x63\x86\x70\x56\xA8\x96\xA4\xF6\x13\x05\x8F\x9F\x9E\xA9\xA9\x6E\x4C\x44\x0C\x22\xC3\x07\x4D\x96\x85\xCE\x21\x55\x26\xDF\x9E\xD2\x50\x81\xD4\x05\xB3\x0A\x75\x05\x31\x70\x3D\x39\x32\xB4\x16\x92\xDC\x2C\x8A\x89\x3D\xB5\x69\x12\x7F\xB1\x07\xD2\xC5\x04\x50\x7B\x4A\xC0\x0B\xDA\x00\x28\x44\xE6\x80\xC1\x60\xBB\xDB\xF3\xD8\x67\xDC\x97\x35\xBD\x34\x30\x6A\xDC\x2B\xB7\x07\x0A\xFC\xFF\xC5\x7E\x7F\xF6\xD1\x4B\x7E\x66\xB8\xFB\x6E\x67\xD1\xCF\x69\xF9\xD4\xFC\x48\xBC\x97\xB5\x66\x37\x84\x70\xDF\x8C\x1F\x67\x06\xA4\x77\xF1\x26\x1F\xD4\x7F\x95\x19\xBA\xB0\xC0\xD0\xF7\x19\xEC\x67\x52\x69\x4B\xD2\x5A\xE0\xB8\x38\xAD\x49\xC2\x30\xB1\xF9\x4F\xB6\xD6\x09\x1B\x3B\x00\xD7\xF1\x5C\xBA\x91\x5D\x78\xEB\x82\x02\xBF\xAC\x60\xD6\xAE\xE6\xDC\x16\x33\x6A\x2A\x61\x7A\xBB\x1C\x0F\x18\x41\x81\x20\xD9\x0F\xAD\x9D\xCA\x3B\x59\x41\x0B\x6A\x34\x16\x01\xDD\xDA\x73\xC5\xE6\x55\x9B\x90\xA4\xB7\x6C\x60\x8A\x10\x7B\xA6\x05\x29\x4D\x37\xA0\x08\xAD\xD2\x09\xE0\x37\xFC\x6A\xE6\xEA\x10\xD6\xB1\xEA\x16\x5D\x90\x6C\x80\x98\x03\xCC\xD0\xB8\xBC\x3D\x4A\x7C\xCF\x06\xCA\xCE\x99\xC3\xDA\xB3\x86\x56\x12\xF9\x92\xCA\x79\xE1\x60\x9F\x4F\x0A\x86\x38\xC0\x73\x08\x05\x04\x7D\x84\xCC\xF1\xEC\xF5\xDA\x5A\x7D\x9F\x67\x3A\xCB\x92\xDA\x21\xA9\xA0\xAC\xD4\x78\x7A\xE3\x84\x15\x15\x72\xDC\xA8\xB2\x80\xB8\x92\xA3\x2C\x3B\x64\x20\x4D\x4B\x80\xA4\x82\x4B\x33\xEA\x53\xE1\x36\xD2\x92\xAB\x72\x6D\x72\x39\x45\x97\x02\x3C\x2C\xA5\x74\x99\x70\xA0\xE8\x68\xE1\xF2\xEF\x30\xD0\x96\xFA\x5E\x03\xB6\xB3\x24\x6C\xF6\x7E\x58\xEC\x66\x25\x2B\x8A\xF2\x31\x50\x8F\x26\xBE\x51\x46\x7A\x01\x4C\x73\x58\x6B\x79\xB4\x0B\x23\xAD\x70\x12\xF3\x6D\xD7\xBC\x2B\xDE\xB2\xF3\xC4\xB6\xBD\x3F\x23\x8C\x60\xB4\x57\x4B\x47\xB5\xBD\x9F\x51\xB4\xE8\xBA\xC4\x46\x8A\x0A\x9D\xAE\xB7\xDB\x3A\x40\x69\x79\xC0\x58\x64\x6E\xDF\xF9\x6E\xF5\x82\x1E\xCF\x96\xEB\x8F\x2B\xBA\xF0\x06\xAF\x52\x40\x2B\x77\x38\x19\x9D\xA3\xF8\xB3\x6B\x6E\x0D\xAC\x5F\xD9\xF6\x0E\xB5\xAD\x17\xE1\xA2\x8F\x79\x78\x9A\x8C\x78\x32\xAC\x94\x36\xC7\x9B\x1A\x4E\xB3\x94\x1B\xB3\x84\xB0\x6B\x64\xE3\x5D\x46\xEA\x55\x9C\xFA\x4C\xF6\x09\xC0\xE0\xC8\xD5\x51\x30\xFE\x3D\x34\x63\xC1\xC3\xCE\x00\x3E\x18\xE0\x1D\xAE\xC6\x8E\x20\x4F\xE2\x55\xC8\x7E\x70\x75\x64\x9F\xD0\xDB\x36\xB2\x21\xF7\x56\x90\xE8\x11\xF4\xA5\xD3\xA9\x5E\x49\x2C\x87\xD1\xCC\x04\x40\x12\x24\x40\x6F\xAA\x8C\xDA\x18\xD2\x41\x00\x4C\xBC\x6B\xA5\x2B\x24\xB6\x0D\x94\x99\xC1\xB5\xF5\x2E\x34\xAC\xEA\x7D\xC0\x7E\x26\x87\x18\x45\x7C\x17\xA9\xFC\xC1\x7A\xEB\xC5\x21\xBD\xD1\xE9\x73\x6F\x15\x97\x45\x9F\xDC\x31\x18\xE1\x51\x6D\x0C\x0B\xA7\x3C\xAD\xFC\x13\x8B\xAE\x71\x94\xD0\x06\xC7\x36\xE0\x7B\xC8\x64\x1A\x12\x3A\x36\xAE\x89\x56\x1F\xC8\x78\xBF\x68\xAC\x32\xAA\x70\x32\xBB\xF1\x4B\xC9\x9D\x9E\xD2\x28\x47\x42\x0D\xB0\x21\x49\x40\x07\x45\x06\x12\x54\x12\xC7\xA0\x5E\x99\x72\x7E\x1F\x97\xB4\x8A\xAD\x72\x4B\xDF\x51\x48\xF7\xE2\x2D\x40\x9B\x7C\xCF\x10\x26\x5F\xD1\x24\xF0\x46\x52\x2D\x3C\x37\x59\xEB\x06\xA6\x67\x7A\x99\x1B\x20\x99\x25\x85\xF9\x18\xF4\xC0\xB9\xE2\x5E\x07\xFF\x76\x65\xE4\x2C\x75\xDD\x2D\xA1\xF3\xA0\xB3\x83\x63\x8E\xC4\x03\x02\x0B\xDC\x3D\x5A\x92\xB3\xF8\x33\x85\xAE\x96\x51\x7F\x2F\xE9\xAD\xE7\x93\x72\x37\x30\x19\xD9\xD1\x86\xFA\xCD\xE6\x5C\xDE\x6D\xAE\x44\x64\x27\x4F\x5C\x55\xD0\xAB\x02\xB0\xBF\x9E\xE3\xCE\xD8\x64\x96\xB4\x66\x11\x91\xC8\x3C\x8A\x83\x33\x26\xC7\x67\xB6\xB1\xBD\x13\x2B\x06\xD4\xFA\x0B\xD5\x7F\x1E\x78\xE3\x9A\xBF\x62\xE7\xAB\x11\x39\x57\x68\x5D\x31\x19\x79\x78\x7D\x85\xF5\xA0\xFB\x62\x85\x76\x41\x1B\x57\x03\x15\x8A\x2C\x24\x38\x01\xD4\x7B\x50\xEE\x1E\x50\xD2\xE8\x46\x6E\x77\x8B\x39\xC8\x84\xD1\xAC\xAD\xFE\x0C\x65\xA4\xB7\x86\x7B\xC2\xD6\x02\x8C\x6F\x11\x7A\x2C\xAF\x4D\x10\xBF\xBA\x69\x42\xC2\xE4\x80\x6B\xCC\x6A\xF6\xBA\xCB\x94\x09\x9E\x86\xB9\x0F\x5D\x74\x64\x51\x18\x5A\xB6\xB3\x32\x5E\xEA\xA4\xE7\x56\xB4\xF6\xF9\xD8\x6E\x0D\x6B\x27\xE1\x2A\xE4\x95\x44\xD5\x59\x66\x56\x21\x6F\x9E\x25\xEF\xBD\x70\x9B\xCF\x53\xED\x0E\xB7\x27\xE9\x12\x3A\x61\x0A\x67\x47\xD0\x15\x6C\x05\xC2\x25\xD7\x56\x7B\x9B\x07\x7E\xD0\x36\x38\xC7\x73\x52\x1E\x62\x3E\x3D\xEE\x57\x14\x7E\xAD\x28\xE2\x23\x08\x3A\x07\xFF\x3B\xAF\xFB\xB3\xAB\x01\x45\x85\x11\x61\x24\x31\x7B\xFA\xD9\x1B\xE1\xB2\x07\x2D\xF8\x7E\x61\x05\x7F\xC3\x6F\xA8\x4E\xB6\xE3\xDF\x2F\x5E\x05\xD1\xCE\x73\xB1\x46\x9B\xC0\x41\xD0\xF7\xA6\x3A\x84\x1E\x75\xAE\x35\x56\xFA\x5B\x67\x60\xCF\x3E\xAD\x00\xF9\x45\xCC\xA9\xA7\x71\x91\xBC\x18\xD5\x5F\x0E\xB8\xBF\x5B\x66\x25\xCE\x03\x84\x2C\x3B\x99\xEB\x7B\x63\x2F\x24\xA1\x8F\xFB\x00\x44\xF8\x5E\x54\x00\xF5\x35\x30\x73\x85\x1A\xDD\xE4\x51\x74\xBF\xF9\xB3\xE0\xC9\xE8\xBA\x66\x97\x92\xA8\xAE\x0F\x2B\xF5\xEA\x32\xD5\x9B\x6C\xF1\xA1\x7B\x62\x89\x94\x2B\x82\x40\xA7\xE1\x44\x84\xE2\xAE\x8D\xF9\x6A\xDB\x8B\x09\x55\x48\xEB\x00\x85\x88\x39\x68\x5A\xDA\xA9\xE0\x4B\x65\x35\x97\xD5\xAB\x8F\xAD\xF3\x4D\x3D\x1C\x0F\x9B\xC6\xA8\xDA\xE9\xC6\xCE\x1E\xF8\x1D\xE6\x89\x1F\xA7\xB0\xB7\x7F\x65\x04\xAC\xFB\x39\x9B\x1F\xBD\x8A\xDD\xCA\xB0\x8C\x40\xA1\xE7\xEF\x5E\xCE\x7D\x3A\xA0\x57\x28\xC1\x14\x06\xBB\x21\x92\xFD\xB7\x35\x2E\x4F\x2C\xDC\x57\x55\x7A\x8D\x0F\x6D\x12\x49\x43\xB4\xCE\x4A\x28\x80\x30\xE1\x46\x87\x27\xD7\x53\xE9\x29\x47\x9E\x1E\x8E\x21\xFA\xC2\x41\xD2\xDC\xFF\xB4\xC4\x43\x5A\xB3\x5F\x35\xE0\x56\x4D\xFA\x86\x0D\xAA\xD0\x12\x11\x27\x81\xAC\x05\x81\x2D\xE1\x98\xE2\x3C\x72\xAC\x57\x30\x07\x21\xC0\xF3\x7F\x2C\xC9\x53\xD8\x00\x0D\x66\x30\x15\xCC\xE1\xCE\xFD\x4D\xC1\x92\x5F\x78\xC2\x7B\x53\x15\xE7\xFD\x50\x81\x9D\xD9\x34\x8C\x9E\x7C\xBD\xA7\xB2\x25\x3A\x05\xC1\x1A\x47\x43\x81\x10\x6B\x88\xF1\xE1\x89\xA2\x59\x66\x71\xFF\xD4\x2B\xDC\x99\x8A\x49\xC8\x4B\x46\xE9\x80\xFA\xDF\x77\x9D\x1F\x03\xE8\x9B\xA9\xB3\x11\xB6\xBC\x51\x6E\xBB\x9B\x7E\x14\x87\xB2\x0C\xBF\x3A\x91\x8E\x99\x01\x61\x72\x58\x7F\xC8\xA8\xE1\x6B\x36\x47\xC7\x00\x17\xF3\x1C\x0B\x5D\x1C\x9D\xC5\x4F\x90\x10\x35\x14\x38\x33\x36\xFF\xC7\xE7\x4A\x4E\xF0\xF8\xF4\x99\x7C\xED\x14\xB9\x2D\x5B\x64\x51\x09\xF5\x28\x85\xD9\x7E\x1F\xEF\x46\x0C\xA9\x6B\x8A\x3F\x32\xD3\x52\x45\x66\xAA\x76\xAA\x49\x80\x43\x67\x41\xF8\x5D\x37\xAA\xA0\x74\x7C\x94\xA9\x9C\x75\xB8\x6C\xB2\xA1\xF0\xDB\x72\xD4\x24\xDD\xE6\x0A\x7C\xD2\xEC\xC9\x26\xBE\xB8\x5A\xE7\x58\x15\xCD\xEE\x2D\x2D\x6D\x8E\xDF\x1B\xB8\x26\x2B\x07\x92\x38\xD9\xBD\x3E\x1F\xF7\x1C\x88\xD1\xAD\x5D\x76\xAD\xAD\x8F\xE4\x3B\xB7\x40\x2F\xD0\x9A\x24\xEE\xA4\x2E\xBF\x82\x61\xFE\x2D\xC8\xAE\xDF\x42\x49\x79\x83\x2F\x3E\x92\x74\x8D\x6C\xD5\x02\xA3\xC4\x76\xB7\xC5\xEC\xB4\x94\x84\x50\xE0\xC1\xB8\xA9\xD8\x8A\x20\x70\x8B\xAD\xD6\x40\x44\x65\x8B\xE4\x09\x6B\xCD\xCD\x89\x1B\x1F\xBC\xAD\xDF\x08\x67\x43\x93\x26\x04\xD5\x0B\x74\x91\x2C\x90\x2A\x9C\xE1\x8B\x0E\xB1\xE0\x54\xAC\x0F\xB3\x3B\x7C\xB8\xD5\x43\xA0\x2C\x8D\x13\x06\xAC\x38\xCE\xFE\x37\x25\xA4\x10\xD2\xFA\xEC\x9A\x23\x53\xF9\x81\x64\xC7\x7F\x93\x95\x5C\xAE\x30\xE7\xB9\xE9\x14\x5C\x62\x27\x42\xCE\x7C\x1B\x50\x0C\x1A\x9C\x4B\x61\x33\x45\x6D\xD4\xD2\xBD\x62\x92\x7B\x61\xBA\x00\x06\x12\x57\xE5\x55\x8E\x29\x6F\x2D\x95\x20\x33\x06\xFA\xDF\x34\xFF\x67\x6A\x6E\xAC\x31\xE8\x08\x5E\x20\x4E\x11\xCC\x0D\x49\x33\xB7\x84\xD2\x32\x72\x95\x9D\x79\x31\xA6\x35\x1A\x08\xF5\x24\x3E\x3C\x00\xC9\x1C\x40\xD3\x8C\xCE\xB5\xC0\x25\x1A\x63\xCE\xC6\x68\x41\x16\xCC\xFD\xA1\xAF\x45\xC8\x75\xFA\x00\x14\x2E\xD5\x3A\xC0\x6E\x78\x24\x28\xC5\xEA\x1B\x9A\xB7\x1F\x31\x06\xA6\x55\x56\xA0\x71\xDE\x38\xE1\x09\xB7\x27\x16\x99\x83\x35\xAE\xB6\x79\x2B\x61\x0C\x8E\xB5\xCD\x40\x11\x5F\x83\x38\x44\x25\x44\x22\xF4\xD5\x45\xE8\x33\x34\x64\x7A\x1A\x66\x6C\x5A\xD5\x3E\x7B\xCB\x61\x45\xD8\x8A\x74\xB9\xA7\x58\x3E\xDB\x41\x2F\x46\xD4\x17\x0B\xD4\xCE\x71\xA2\x98\x8C\x5B\xEB\xF8\x57\x0B\xE6\x8B\x26\x28\xE5\x63\x2B\xEF\x2C\xC0\x6D\xC3\xF0\x49\x67\x82\xB8\x53\x0E\xED\x97\xB3\xB0\x8F\xDD\xF7\x38\x2A\x7C\x4F\x7E\x4F\x35\xAC\x47\xF6\x7A\x07\xED\x5D\xE6\xCF\xD2\xD9\xCD\x56\x59\xE7\x8C\xAA\xCF\x70\x1B\x86\xD7\x5F\xA0\x4D\x3D\x9E\x9B\x64\x9A\x1F\xFF\xB4\x54\xA3\xC8\xB6\x49\xA4\x9F\x62\xC0\x9A\x56\x59\xB5\xD4\xD8\x81\x5E\x3C\x28\x89\x0B\xD8\x7D\x15\x68\x3C\x86\x48\x43\x2C\x5A\x81\x5A\x71\x8F\xB2\xA0\x56\xB7\xDF\x3B\xF7\xCB\xF6\xCC\x97\xBB\x83\x13\x4F\x81\xF8\xE1\xA7\x1C\xDE\x32\xDD\x72\xC1\xB6\x3B\xA5\x35\x7E\x2E\x50\x4E\x50\x0A\x73\xBF\x59\x08\xAF\x15\x3F\x06\x4C\x65\x2D\x0D\x85\x56\x89\xB8\xA0\x8C\x6D\x2E\x2D\x68\x96\xDC\x61\xDD\x0B\x26\x34\xF6\xBC\x34\xE2\xC0\xFB\x6B\xCA\x55\x6B\x92\x3C\x50\xBF\x46\x88\x1D\x44\x99\x98\xE9\x8A\x59\x1A\x78\xA4\x7E\xEA\xE3\xCD\xF3\x17\xDB\xDD\x76\xB7\xBC\x0D\x23\x77\x34\xD5\xAC\xB4\x0E\x43\xA8\xB1\xEE\xA8\x0F\xD4\x07\xA2\x91\x26\x9C\x6C\x95\x4E\xA3\x7E\xD5\x92\x07\xE2\x22\x79\xDB\xAA\x6D\x80\xAB\xBE\xFA\xDC\xC7\xCC\x37\xB7\x8C\x03\xE3\x74\x54\x45\x99\x48\x47\x98\x23\x17\x23\x5D\x8B\x98\x73\xDB\xDC\xEB\xB7\x2D\x0A\x26\xB0\x32\xCD\x9F\xFB\xA4\x6B\xAB\x80\x8D\xA5\x32\x72\x8F\x40\x03\x07\xF6\x57\xDA\xC6\x9E\xD4\xDF\x30\x59\xE0\x6A\x02\x57\x59\x0E\xF5\xCD\x80\xBD\x91\x39\x2C\x38\xAD\x6B\x16\x29\xB0\x88\x97\xD9\xFB\x75\xDC\xD6\x2D\x07\xE1\xD6\xB3\x21\xF3\xFE\xCD\x72\x23\x33\xFB\x91\x45\xD6\x95\xF5\x72\xD5\x89\x4E\xC4\xC3\xBB\x5A\xA7\x6F\xB6\xFD\x59\xE4\xAF\xD7\xA9\x25\x34\xCE\x9E\xAB\x2A\x03\xC1\x1B\x38\x3B\xD5\x6B\xD6\x7D\xF4\xBA\xC1\xFC\x65\x7B\xF7\xA2\xF6\x2B\xF4\xD7\x46\x8C\xC5\x41\x36\x62\xB6\x15\xC6\x0B\x23\xC0\x39\x4A\xEE\xCB\xFB\x3C\x6B\xCF\x58\x5B\x02\x60\xB2\xD6\x95\xBF\x05\xBE\xE9\x79\x9C\xB9\x9D\x5A\x45\xE7\x0B\xD6\x7D\x0F\x22\x7C\xA1\x19\x26\xAD\x33\xB0\x39\x0C\xAF\x38\x71\x20\x0F\x54\xB5\xBD\x7D\x29\x66\xA0\x7C\xE3\x06\x13\xA8\x0E\x78\xC5\xF9\x3D\x99\x6A\x07\x51\xF4\xE6\xBD\xAB\xF2\x1D\x4D\xD0\x1C\x3C\xC8\x7F\xCF\x50\x03\xF4\xEF\x73\xC1\x6D\x10\x40\x46\x3B\xCE\x41\x21\x34\x8F\xCD\x2F\x9C\xFB\xDE\x5B\xE2\x2C\x03\x4E\x92\x7E\x52\x65\xF3\x86\x29\xDF\x23\x6B\x53\x92\x2C\xFF\x22\x6D\xF9\xE5\x9F\x0C\x5F\xBE\x63\x0A\xC1\x62\x6F\x3A\x41\xDA\x94\xF5\xA1\x5A\xCF\x39\xD0\xE1\x10\xF6\x92\x67\x25\x8A\x1A\x99\x75\xC6\x63\x54\xBD\x6C\xC6\xF3\xAA\x6A\x71\xC5\x4B\xAF\xE4\x80\x52\x19\xAE\x3B\xD2\x39\xFA\x5B\x84\x9C\xC7\x38\x56\x29\x2D\x1D\x1F\x3D\x80\x70\x56\x26\x33\xB7\x1E\x37\xFD\xA3\x4F\x06\x2E\xBC\xDC\x86\xA2\xA3\x17\x78\xBE\xB9\x9F\xC2\x5F\x2E\x2F\x00\x6D\x29\x86\x66\xFC\x8D\xF0\x60\x83\x64\x4D\x2F\xE1\x70\xD8\xFD\x0D\x5D\xE8\x23\x9B\x43\xB9\xF8\x45\x77\xA0\x14\x7F\xCA\x07\xFA\x2C\xA2\x5B\x8F\x3B\x45\x4A\x28\x30\xC5\x8C\x96\xDE\x2C\x4D\x97\x04\x16\xA2\x87\x3D\xDC\x19\x8A\x0C\x82\x91\x5D\x62\x94\x2D\x15\x4C\x07\x1E\x04\x1F\x84\x3B\x97\x6E\x7F\xCC\x04\xD1\xF0\xA0\xB3\xCD\xC7\xA6\x4C\xC2\x36\xFB\x13\x26\x84\xD3\x46\xAD\xB5\xD6\x66\x10\x4B\x59\x3A\x99\x82\x07\x6C\xE7\x3C\x74\xAB\xF0\x79\x11\xD3\xF8\xBD\x99\x20\xB2\xB6\x43\x65\xFB\x8F\xF3\xDD\xE5\x5A\x13\xB9\xAC\x5B\x44\xBB\xEF\xC8\x98\x7D\xA7\x0F\xE7\x9B\xDB\xE3\x88\x02\xD9\xD3\xD9\x46\xF5\xA8\x4E\xF6\xE6\x43\xD9\xE0\xA2\x17\x4D\x73\xFE\x5C\x28\x6C\xD0\xE6\x49\xCE\xFB\x82\x37\x45\x93\xDB\xF8\x7F\x51\x75\xDB\x7C\x5A\x71\x99\xDE\x70\xA3\x45\x58\x96\x3F\xD6\x7C\xF6\xFA\x78\xE7\xC6\x19\xAF\xC1\xD0\x2F\x05\x1D\x90\xBD\xB2\xB5\x3B\x47\x09\xE3\x7A\xBE\xB6\x3D\x48\x4B\x84\xBF\xD8\x1D\xCC\x3F\x99\x77\xD6\xEC\x0F\xAD\x73\x92\x59\x86\xE4\xF5\xF4\x2D\xD0\xEA\x25\xFA\x97\x7A\x7D\x8E\x26\x5F\x91\xA8\x55\x7C\xBA\x4B\xCB\x8E\xBA\xA7\x6C\x16\x61\x19\xD7\x73\x05\x7B\xBC\xA8\x2D\x43\xF5\x6F\x08\x7D\xF6\x1D\xC3\x6B\xAA\x51\x6F\x31\x01\x48\x00\xA4\x8F\x8E\x91\x90\xF0\xCB\x32\xB2\x69\x87\x68\xE8\x7B\xA5\x7C\x04\x03\x51\x0D\x07\x7D\xD4\x98\x0B\x66\x6A\x07\x84\x2F\x0D\x68\x52\x81\x7D\xF5\x73\x53\xAE\x3C\x93\x36\x3A\x78\x67\x3A\xE5\x73\x7A\x1A\x57\xC1\xF5\xC1\x11\xF7\x68\x6B\x36\x12\xE2\xBF\x93\xD8\xE3\x22\x59\xE7\x34\xB7\xAF\x35\x1E\x51\x07\x9D\x8E\xD6\x76\xC8\xA8\x3C\x03\xD7\x09\x48\xB9\x7F\x28\xEC\x97\x0C\x8E\x86\xA8\x23\x26\x2A\x19\xBE\x95\xF5\xAF\x2F\xF3\xE9\x22\x46\x17\xE5\x40\x9C\xF1\x89\x30\x61\xBB\x5A\x3E\x25\x91\x14\xA7\x28\xB3\xF7\x74\x83\xA6\xE3\x3A\x7D\x94\xDB\x0F\x65\xAD\x0F\xF4\x33\xE4\xFA\xC5\x5D\xFC\xC8\xE4\x4D\xCF\x44\x65\x10\x28\xA8\xA0\xD6\xBF\xFD\xA4\x18\x70\x66\xD6\xFF\x23\xAF\x83\x42\x38\x8C\xF8\x72\x5D\xA3\x3B\x34\x6A\x31\x0A\xC0\x3F\x41\x30\x94\x25\xE5\x3B\x33\x87\x80\x7F\xAF\x2F\x69\x5F\xF7\x69\x2D\x12\xB3\xCB\x1F\x0E\xD3\x19\x7C\xD5\xF7\x94\xCC\xB4\x0A\xEF\x04\x26\x62\x71\x44\xDE\x41\x85\x90\x1E\x42\xF4\x00\x55\xC6\xE3\x3D\x33\xED\x3B\xC3\x30\x76\xE3\x04\x37\x00\x9E\x68\xA1\xEC\x7A\x7E\x47\xB2\xB3\x0A\x96\xC9\x98\xAE\xEA\xBE\x54\xFB\x01\xF3\x09\xB6\xC7\x49\xB7\x92\xD1\xC0\x19\xA8\x3B\xDD\xD6\x1F\xA8\x6F\xA8\xA1\x20\x49\x3B\xCA\x0A\x96\x62\x12\xCB\x20\x12\x70\x8F\xAD\xB7\xC8\x2A\x10\x21\x5E\x26\x0C\x47\x20\x8E\xC6\x35\x46\x04\xB1\x2A\x27\x72\xED\xDA\xEF\xDF\xFA\x12\xC4\x29\xBB\xB0\x6B\x9F\xD3\xE4\xD8\x8B\x37\x14\x68\xC4\x85\x80\xD9\xD5\x41\x8B\xC3\x72\x64\xEF\x06\xEB\x9C\xF4\x7D\x62\x3F\xE9\xD7\xE5\xA1\xCB\xB7\xF8\x96\x03\xDE\x5C\xB8\x00\x2E\x6F\x08\xE0\x30\x0F\x0B\x5C\xB1\xD4\xC3\xD5\xC8\xCC\xE3\x28\xF1\x2A\xC3\x39\x98\xB1\x9D\x82\x2B\x93\x1C\x09\xB0\xB2\x45\xB9\x21\x25\x2E\x45\x1B\xE4\x69\xC5\x09\xBE\x3A\xE4\x18\xD6\x08\x2E\x37\x24\x12\xD9\xF1\x33\x1D\xBF\x7D\x1A\x60\x8B\xC5\x82\x14\xFB\xE7\xFA\x68\xB4\x15\x30\xA3\x12\x4A\x82\x83\x8A\x82\x87\xFB\x4E\xCD\xC6\x2A\xC6\x19\x62\xAB\x43\x99\x33\x66\xAE\xBC\x0C\xBE\x23\xFC\x80\x3F\xE4\xA9\xB1\x1D\x02\x8D\xE2\x91\x16\x3C\x29\x64\xDB\xB3\x2D\xF4\x85\xED\xE5\xAB\x46\x01\xBB\x07\xE4\x0E\x4A\x0E\xA5\x91\xE1\xAF\xD5\xF9\x3B\xA3\xB1\xCF\x63\x93\x0B\x77\x30\x3D\x5C\xB6\x3F\x79\x81\xE3\x06\xE7\x18\x30\x38\x28\x7D\xF1\xF1\x73\x85\x3B\x6C\xCB\x2B\x14\x29\xA7\xB8\x2B\xD5\xD7\x20\x5F\x24\x18\x07\xC6\x2E\x97\xD6\x09\xC9\x33\x37\xF6\x8E\x30\x6C\x33\x34\x74\xE1\x23\x5F\xDA\xF9\x71\x7C\x1C\xB9\x07\x52\x95\x4A\x29\x9F\xCC\x99\xD9\x11\x5D\xD8\x7C\x61\xE3\x98\x2A\x72\xC5\xC4\x6D\x45\x12\xC8\x0C\xB7\x5C\x89\x4E\xEA\xF5\x3A\x28\x22\x22\x21\x1C\x91\xF5\xA6\xFA\x68\x2C\xB0\xCA\x36\x9C\xEC\x57\x33\x7A\x3F\x40\xD3\x60\x4E\xAC\x02\x5B\x49\xE6\x7F\x1E\x8C\xE1\x72\xD3\xE8\x95\xEF\x9D\x2C\x7E\x3A\xEA\xE8\xA6\xD9\x2E\x1E\x98\xC3\xAC\x42\xDE\x79\xD7\xDC\x81\xD5\x09\xFA\xCD\x35\x5B\x8B\xB3\xC0\xB1\xE6\x42\xD8\xF2\x33\xF0\xDD\xFA\x55\x78\xC2\xC4\x54\x2C\xE0\x13\xCE\xC6\xA7\xBD\x72\xA0\x67\xE0\xCB\xE8\x68\xDE\x07\x27\xC7\x2D\x39\x1D\x16\xF5\x74\x53\x92\xB8\x6B\x64\x7A\x91\x5D\x52\x20\xEC\xD9\xC0\x00\x6C\x09\x27\xB9\xAF\x56\xD0\x9D\x9E\xC3\xCC\x5E\xCB\xB6\x4D\x3B\xBF\x91\x8E\x57\x64\xB3\x88\x37\xC7\xC0\xCD\xEC\x3F\x56\x8B\x46\x6A\x94\x28\xEE\x59\x68\x00\x31\x80\x9F\x76\x68\x54\x6B\xD4\x7B\xFE\x79\x62\xE9\x84\xDF\x95\xF0\x4A\x2C\x3E\xDD\xBD\x25\x91\xBB\xED\xD0\x7C\x89\x64\x80\xC3\x04\xF5\xBA\x54\xF2\xD9\x8E\xF9\x41\xF9\x8C\x87\x14\x4F\x08\x12\x0C\x17\x90\xB4\x99\xD7\x78\xDC\x7F\xAB\x97\x3E\x00\x4E\xA5\xC9\x43\x71\x73\xBA\x31\x6D\x0B\x7D\x78\x32\x0D\x88\x06\x61\x28\x9E\xCE\xE3\x9A\x0F\x52\x0C\x2B\xAB\x09\xA1\x8A\x34\x78\x32\x7C\xE0\xF6\x84\x74\x22\x6C\x8F\xEF\x7A\xBF\xB7\x2A\x71\xAB\x5A\x14\x59\x3A\x8B\x57\x11\xD9\x51\x24\x0A\xDB\x79\x99\xF2\x3F\x41\x2D\x4E\x84\x3B\x77\x8F\x13\x66\xF8\x5B\x56\x76\xD7\x6C\x6F\x44\xD6\x91\x3D\xE6\xD8\x55\xBD\xBF\x43\xC2\xC3\x3A\x47\x1A\x1E\xEC\x74\xED\x43\x6B\x7C\xB9\xD8\x83\xDB\x85\x6F\x42\x3F\xC0\x0F\xE6\x46\x7B\x32\x63\xB0\x1C\xE6\x7F\x9B\xAC\x0E\xD7\x21\x55\x42\xD6\x50\x00\x34\xBE\x57\x75\x29\xFA\x2D\x6F\x7F\x11\x1F\x88\xB0\x81\xCA\xC2\xD3\x46\xC9\x7D\x29\x47\x50\x2D\xA6\xE2\x1A\xC5\x1D\xA6\x73\x4C\x87\x5E\x15\xA3\xDA\x62\x7C\xCF\x77\x1A\xE7\x3C\x14\x45\xD9\x7F\x1A\xEB\xFD\x93\x7E\xFD\x52\x5F\x0D\xB9\x22\x8C\xAF\x3B\xB0\xFC\xCD\x2A\xFD\x73\x98\x57\xC9\xA6\x96\xD2\x74\xC6\x93\x55\xD7\x59\x0E\x2E\x18\x5A\xF6\xC4\xB0\xFD\xB4\xBF\x0E\xB1\xA8\x5F\x05\xD5\xB1\x55\xC2\xA2\x8A\x10\x4D\xE6\x72\x4F\x80\x6C\x29\x71\x74\x46\x31\xA7\xB4\x89\x7F\x66\xEC\x08\xA9\xD2\x53\xB0\x41\xA6\x8A\x85\x74\x3E\xB9\x4F\xEB\x95\xA3\x3C\x04\xE3\x19\x39\x40\x26\xB1\x68\x17\x94\x80\x18\x83\xFE\xB8\xF8\x9F\x54\x98\xE5\xB4\x76\x26\x07\x1F\x30\xA9\x25\x38\x20\xB4\xD5\xBE\xA1\x31\x30\x28\x2B\x42\xEC\xB7\x03\x27\x19\x66\x2E\xB7\x5F\x90\xDA\x55\x66\xE4\xDB\xB0\x05\x93\x7C\x45\xC3\x44\x3B\x3A\xE4\x69\x0D\x59\x75\xBF\x95\x0B\x6F\x56\xD3\x3B\xF6\xD5\xC0\xBD\xD5\x27\xE7\x78\xDE\x5A\x48\x01\x0B\xFE\xAB\x40\x86\x15\xA7\xD7\x5F\x77\x25\xE6\x8D\x03\x7C\x55\x92\x33\x8D\x85\xAD\xF1\x46\xCF\x48\xE8\xFB\xC7\x0D\x6E\x97\xE6\x06\x3E\x15\xA8\x76\xCF\xDD\x69\x0B\xF0\x2D\x38\x89\x58\xD3\xF3\xF4\x73\xB8\x9C\x8F\x8C\xA8\x53\xB5\x45\xFF\x36\xC7\x99\x15\x78\x10\xC3\x7B\x83\x4E\x43\xE1\x6A\xB0\xCD\x5B\x75\xDC\x73\x03\x4C\x20\xB6\x15\x1B\x61\x71\x8E\x7A\xD1\x61\x2F\x1D\x21\xA5\x94\x6A\x03\x01\x6F\x50\xB8\x65\xE9\xEA\x7D\x2A\xD3\xCD\x1E\xF9\x6E\x9D\x49\x0F\x18\x38\x95\xA2\xAE\x38\x43\x45\xDC\x91\xE2\x5C\x0F\x8F\x70\xAF\x31\x56\x2E\xD6\x2B\x1A\xA1\xDF\x16\x9B\x54\xCB\x92\x67\xD9\xE7\xC8\x96\x37\xE2\xC6\x03\xA8\xF6\xD2\x99\x79\xAD\x24\xF2\xEB\x4A\xFB\x56\xE3\x55\xF2\x78\x96\x24\xD0\x51\xC4\xAB\x38\xFB\xED\x4E\x5D\x06\x6E\x5E\x80\x04\x0E\x81\x59\x5D\x02\x1A\xB6\xF4\xA1\xC0\xE4\x85\xBB\xA8\x6F\x83\x11\xEF\x1D\xD3\xF3\x2C\x2D\x1A\x18\xB1\x66\xDA\xD9\x0B\x4A\xFC\xC6\x91\x8D\xFC\x3C\x1B\x31\x81\x34\x21\x98\x6A\x61\x84\x63\x21\xB2\x09\xE2\xA0\xD7\x47\xBD\xD9\x27\xC8\xE1\x25\x3A\xB2\x52\x47\xAB\x96\xCB\x7E\x2C\xF2\x9C\x3A\x48\xE3\xEB\x0C\x40\x7D\x1C\x75\x01\xB9\x7A\x83\x0F\x80\x7C\x8A\x17\x7F\xCD\x66\xBE\x52\x3F\xA1\x94\x97\x1B\xD3\x0A\x57\x57\x3E\xA3\x0B\x0A\x90\xBF\x72\x6D\x9C\x63\xC1\x48\xF8\xCD\x61\x0F\x04\x43\x3B\x70\xBB\x5C\x9F\x68\xF8\xC5\xFB\x16\x93\xA1\xBE\xAB\x03\x10\x1C\x74\xDE\x44\xC0\x6F\xF6\x1D\x10\x7A\xC1\x28\xA8\xA9\xEB\xAB\x3F\x06\x00\x7C\xB5\x11\x47\xE4\x8B\x6B\xFF\xF5\x55\xDD\x5A\xCD\x15\x30\x01\x5F\x12\x1F\xF5\x49\xA3\x09\x25\xA8\xD4\x06\xAE\x33\xBF\x80\x6E\x5A\x90\x2F\x78\x36\x02\x70\x70\x69\x63\x45\x1A\xBB\x49\x0A\xB8\xB7\xDA\xC3\xBB\x56\x5B\x62\x7B\x7C\xF7\xDB\xAD\xA9\xC8\xBE\xCA\x27\xAF\xC9\x2B\x8E\xC9\x63\xEC\x46\xE9\xA2\x8E\x7E\xAD\x28\x66\x11\xC1\xC1\xB8\x04\xD3\x66\x2B\x2E\x41\x5F\x55\x4B\x9B\x68\x17\x89\x0C\x01\xA3\xBB\x4B\xBA\x7F\xEB\x7C\x1C\x8B\x43\x01\x4A\x82\x34\x8A\x2E\x3F\x4C\xF5\x34\x10\xFA\x50\x1A\xCC\x4E\x33\xF4\xFA\x37\x42\xC2\x42\xBC\x64\xAA\xFF\x66\x99\xF3\x70\x2B\xB9\xB1\x29\x71\x2A\xD0\x32\xD9\xAA\x75\x8B\x56\x49\xEC\x33\x32\xC3\x2F\xE7\xDA\x83\x02\x5B\x12\xC2\x4A\x01\x0D\x5F\xD4\xE4\x97\xDD\xFA\x21\x6B\x8A\xFE\x63\x11\x3C\xC7\x11\x55\xA5\x21\x10\xA2\xED\xF8\xD9\x2A\xB9\x2F\xA4\x7D\x06\xF9\x77\xD9\x67\x2C\x2E\x51\x96\xE3\xB5\x3C\x8E\xB7\x9E\xB8\x54\xEA\x89\x38\x29\xAA\x49\xE8\x66\x29\xDE\xC2\x33\x7D\x4C\x99\xD9\x38\xF6\x8F\x2B\x03\x1C\xED\x90\x5F\x12\xA2\xDE\xFC\xF0\x35\x6B\x56\xBE\x45\x5E\xD1\x9A\xE5\x72\x6E\xCE\x6D\xAC\x9E\x3B\x91\xC8\xEA\x49\xA8\x84\x6C\x18\xF2\x0F\x52\x5B\x1E\x04\x60\xA6\x4C\x8B\x47\x66\x23\x56\x82\x45\x9A\xF3\x1B\x82\x7A\xE8\x88\xCD\xA0\x62\xCA\x00\x7D\x44\x8B\x4D\xCF\x10\xBB\xD8\x4A\x26\x2E\x63\x6A\x9B\x54\xB1\x34\x67\x65\x71\x62\xCF\x19\xDA\x83\x46\x8E\xA6\xB8\xA4\xAA\xA6\xAA\xDA\x43\xE7\x17\xE6\xB9\x78\xE3\x87\x1D\xC3\xE4\x6F\xD0\x19\x38\xBC\x4C\x06\x49\x9E\xCA\xAA\x7D\x9C\xF8\xBD\x10\x94\x86\x62\x50\x7F\xB7\x41\xB8\xE5\x7E\xA2\x07\x87\xED\x06\x62\xDB\x4F\xCB\x61\x64\x58\x5A\xEB\xB9\xB5\x7D\x0C\x33\xDB\x28\xDE\x33\x2D\x55\xB0\xD0\x6F\x42\x35\xD8\x07\x1B\x24\x6E\xF0\xA8\x84\x58\x3D\x4D\x67\x98\xAC\x53\x16\xCF\x0E\x71\xB3\x5C\x1B\xE3\x7F\xEB\xB6\x06\xE6\xC3\x1E\xE3\xD9\x66\x97\x9D\xB8\xAB\x35\x2B\xFC\x35\x28\x61\xF6\xAF\xD1\x77\xE7\xD3\x5A\xDF\xD5\x9F\x6D\xFC\xA3\x5D\x88\x41\x17\x77\x60\xD3\x00\xB0\xAF\x52\xED\xA4\x62\x5E\xD4\xC9\x82\x84\x00\xDD\x96\x22\xE7\x87\x8D\x80\x3D\x93\x3E\x25\x94\x50\xB3\x57\xFE\xEB\xE9\x91\xE7\xCD\x2B\x6B\x8B\x75\xC1\x0D\xAD\x9B\xCE\x7C\x6D\x7E\x3F\x93\xD0\xCD\x0B\x7B\xD9\x5E\x06\xAF\x22\x9B\x03\x8D\x64\x1F\x7D\x63\x19\x26\xDF\x08\x5C\xBF\x76\x44\xCE\x52\xF3\x01\x6E\x19\x33\xFA\xEF\x69\xD4\x56\xFF\x66\x47\x15\x97\x0F\xFD\x2C\xD9\x86\xDC\x40\x25\xC5\x8A\x1F\xAD\xA8\x66\x84\xE6\x4C\x98\x2B\x24\x76\x61\x70\x2B\x16\x17\xF6\x6E\x16\xD6\xAF\x2E\x05\xE6\x04\xB6\x88\xFC\xC7\x37\x1F\xE7\x51\x86\x9A\x25\xFC\x72\x29\x9A\xA3\x81\xD4\x45\x5B\xA1\x61\x37\xBC\x5D\x1A\x45\x8E\x48\x61\xDB\x91\x30\xE6\x41\xEA\xBB\x1A\x92\x49\x5C\xE0\x6E\x5D\xAB\x94\xF8\xA9\xD6\x08\xDC\xAD\x4B\x6C\xF8\xC5\xEF\x35\xF3\xE2\x13\x4F\x9A\xA1\xB0\xB4\xA6\x5A\x9E\xA5\x65\xE8\xA5\xE0\xA2\x8C\xC6\x8B\x1F\xCE\xC5\xE5\x02\x02\x71\x20\xE9\xC2\xD4\xD1\x9B\x0B\x75\x14\x31\x03\x33\x4F\x08\xB3\xCF\x97\x09\xCE\x99\x54\x93\x15\x7B\x6B\x2E\x92\x13\x33\x46\xE6\x69\x7F\x22\xC2\x5B\xF7\x64\x7D\xED\x39\x16\xEE\xFF\x6C\xEE\x1C\x40\x66\x0D\x6D\x62\xA3\xD6\x18\x7F\x79\x87\xF1\xEF\x50\xF9\x3D\x1C\xFB\x59\x88\xD3\x11\x36\x69\xFE\xE3\x3C\x28\x68\x02\x17\xE3\x72\x1C\x55\xEC\xD1\xF8\x80\xA2\x57\xD5\xFA\x72\xD2\xA8\x7C\x49\xF5\xA7\x98\x36\x7E\x01\x83\xAA\x36\x0D\xF4\x5A\x05\x17\xEB\xE8\x72\xA3\xD4\x60\x88\x57\x91\xA1\x76\x06\xE8\x74\x84\x3A\x40\xF5\xC3\xC9\x24\x55\x88\x4F\xFF\xB8\x53\x7B\x0F\x0E\x63\x7F\x10\x50\x09\x15\xB1\xD0\x65\xD0\x19\x81\xB5\xF1\x2F\x65\x57\xF0\x50\xED\xE9\x51\x37\x11\xD8\xD4\x15\x1B\xB2\x61\xB1\x5B\xFC\x3F\xC5\xF8\x6A\x31\x13\x03\x10\x9D\x44\xC2\x2E\x1C\xCD\x2A\xCB\x94\xED\xB3\x1E\xDE\x60\xC1\x17\xD5\xE2\x4D\xE0\x10\x70\x92\x6B\xF2\xA3\x27\x2C\xF6\x53\x1C\x67\x9E\xB7\xDA\x59\x67\x78\xD8\xBA\x71\xB2\xE5\xBB\x6D\x4B\x8F\x54\x1D\xC3\x71\x8E\x53\x18\xC5\x1B\x47\x08\xF1\x70\x09\x2E\xE2\xDD\xA6\x3B\x23\xB9\x1A\xAC\xC3\x8A\xFF\x1F\xCA\x7A\x25\x8B\xA5\xDE\x55\x95\xD0\x2F\x3D\x07\xA6\x33\x29\xA2\x11\x01\x23\x6A\x47\xB3\x30\x1F\x29\xF3\x78\xC3\xE3\x53\xC8\x65\x80\xBB\xF2\x99\xDF\x8D\xB0\x3C\x4D\xFC\x02\xCF\xCB\x0C\x81\x9A\x3A\xEF\x32\xD1\x5B\x60\x80\x64\x51\x6D\x72\x23\x47\xA1\x9C\xDF\x97\x5B\x71\x44\x8C\x2D\xA0\xA7\x7C\x23\x40\xA3\xD3\x59\xA3\x46\x15\x61\x99\xA5\x95\xCE\xBD\x1D\x1D\x04\x2C\x9F\x1E\x28\x5B\xD3\x81\x2A\xFF\x89\x0C\x87\x8E\x36\x64\xE9\x13\xF5\x34\xBC\x29\x04\x49\xA4\x2F\x17\xFF\x38\xD8\xFA\x25\x07\xAD\x79\x3E\x0A\xB7\x1D\xA9\x55\x3F\xB4\xCE\xA9\xE8\xF5\xC9\x5F\x12\xD5\xD1\xD9\x7F\xE2\x52\xE2\x01\xCE\xA7\xE3\x29\x8C\x73\x8B\x77\xDB\x75\xC5\x69\xEC\x69\x2A\x9E\x1A\x31\x6B\xF2\x82\x52\x7B\x9A\xF2\xD2\xAD\x3C\xC9\x13\x95\x51\xA0\x00\xF6\x34\xE2\x97\xB8\x8E\x30\xA0\xDA\xF0\x17\x7E\x57\x21\x6E\xC8\xB5\xE5\x5C\xBF\xB0\x9F\x85\xC2\x79\x26\x1D\x72\x61\xE6\x52\xD9\xB7\x7C\x78\xD0\x66\xE1\x65\x68\xFE\x63\x66\xA7\x36\x08\x40\x3D\x8F\xFC\xB0\x6E\xE0\xD8\x8B\xC6\xF7\xEB\x82\x51\x37\xE9\xEC\xB4\xD8\xF4\xAE\xFA\x06\x1D\xD0\x71\xA7\xA0\xF7\xF4\x0F\x6A\x59\xF2\x1E\x0E\x7F\x60\x07\xA0\xEA\xCB\xB9\x45\x83\x28\xC6\x78\x0E\x99\xAB\x55\xE9\x75\x30\x22\x32\xCA\x80\x5D\x69\x09\x73\x09\xDB\xEE\x26\xA6\x4B\x3C\x4D\x09\x6A\x9D\x8E\x16\xB9\xD3\xB2\xD4\xC1\x65\x05\xE9\x7F\x7D\x4E\xA2\x3F\x41\x07\xC6\xE5\x6D\xBA\xD6\x8E\x91\xD1\x46\xFC\x7B\x55\xF0\xD8\xF6\x77\x03\x59\xA3\x67\x06\x6B\x4F\xE1\x6C\xFE\x8E\x5D\x34\x9D\x4C\xF8\x06\x38\xA7\x61\xA0\x2B\x56\x7F\x5F\xE7\xC7\x88\xAD\xB2\xA3\x75\x8E\x31\x24\x1C\x96\x9E\xCD\x27\xD6\x90\x68\xF3\x22\x65\x0C\xBA\x28\xCF\x47\x30\x08\x01\x2A\x4B\x07\x1E\x8C\xEE\x2C\x73\x7E\x44\x5C\x99\x0D\x30\x77\xBC\xC8\x7D\x52\xB1\x5D\x35\x98\xB4\xF1\xC9\xBE\xBB\x0F\xC9\x70\xA8\xD3\x83\x36\x73\x68\x2C\xDC\x0F\x15\x2B\xD1\x55\x6A\x33\xF1\x04\xD8\xE2\x09\x0B\xFB\x45\x37\x9B\x88\x83\xE1\x5C\xA9\x4F\xF4\xF3\x1D\x3A\x91\xB8\xDB\x75\xCA\xFE\xDD\x46\x52\xD9\xFF\xC8\x9E\xF7\xBC\xCC\x40\x41\x8F\x02\xD1\xD2\x32\xF5\x2D\x49\x3C\xCD\xD5\xC5\x44\x1F\x98\xC8\x71\xB7\xB9\x88\xAB\xFC\x06\x6C\x50\xAA\x80\xBB\x73\xC7\x7C\xF2\x50\xD7\x42\x7A\x0C\x0B\xB6\x96\x2D\x3D\xBC\xEB\xAE\x2A\x03\xD4\x94\xED\xFE\x2E\x18\xC9\x4C\x08\xEC\xA4\x0B\x6B\x0B\xC4\xAD\xBE\x78\xFB\xE7\x70\xC5\x1C\x6D\xDD\xE7\x9E\x1A\xAA\x9D\xF6\x3F\xC9\xEF\x35\x28\x6C\x0A\x70\x52\x54\xFA\xFA\x5E\x7E\x4F\x5A\x04\x40\x42\x94\xAE\xC9\x95\xC7\x43\xEA\xAE\x08\xC8\x51\x2A\x0B\x0B\x74\x08\x67\x1E\xE1\x51\xA1\xE5\xDD\xFD\x09\x6A\x95\x6F\xE4\x8D\x08\x0F\x98\xD5\xA2\x09\x1E\x6D\x87\x1C\x46\x2F\x2C\xF0\x2E\xFE\xB6\x57\xFA\x69\x33\x92\xD9\x67\x5E\xBE\xDA\x1D\x8D\xD2\x3C\x42\x5D\x16\x22\x97\x08\xEA\x0B\x9F\xA6\x71\xDB\x01\x02\x0D\x57\xAB\xFC\x6B\x51\x71\x44\x56\x92\xED\x46\xB4\xB1\x38\xCD\x37\x1D\x29\xF8\x34\x34\x69\x66\xBB\x02\x04\x83\xBA\x34\x3D\x5C\xA6\x1D\x4F\x08\x65\x70\xEF\x2B\xED\xD3\x7F\x0C\x02\x21\x58\xB8\xD3\x51\xB3\x15\x24\xF9\x9A\xD9\x6E\x05\x9E\xDC\xB0\x09\xAA\xDA\x61\xB0\x83\x4A\x7A\xA5\x30\x0A\x9C\x4F\xE7\xB0\x3C\x83\x17\x68\x7E\x1A\xA2\x49\xB2\x94\xFA\x9D\x93\x35\xD3\x97\xB6\xB4\x63\xED\x15\x6B\x02\x97\x62\x06\xCF\x4C\x30\xC5\x5B\x25\x42\xD1\xDB\x79\x4B\xA7\xE7\xE3\xB5\x18\x24\xBB\x3A\xBA\x76\xEA\xA1\x3A\xFC\xBE\x17\xCF\x92\xC1\xA0\xDC\x01\x2A\xCC\x7E\x03\xA6\x1E\xB9\x15\x45\x70\x13\x58\x54\x66\x71\x52\xE3\x09\x1D\x51\x31\xD1\x9F\x72\xFC\xC2\xF8\x3E\x1F\x8C\xFA\x9F\xC8\xD9\x57\x99\x26\xD5\xDA\x50\xC7\x02\xA6\x94\x80\x20\x70\x9E\x7B\xD8\x2D\x2D\xD0\x74\x39\x86\x8C\xFA\x64\xA0\x48\x34\xD2\xE5\x4E\x2C\x1E\x53\x66\x19\x0E\x40\x27\xA8\x57\x09\xEA\x73\x61\xD9\xE2\xEE\x4D\x9A\x7C\xEF\xF4\x48\xC6\xDF\x6E\x50\x70\xEB\xC6\x2A\x64\xBE\x65\x4F\x0A\x26\xA1\x4D\x55\x37\xC6\x06\x53\x3F\x97\x0B\x0E\x07\x63\x26\xB2\x75\x83\xB5\xB5\x3D\xA6\x59\x70\xAB\xC4\xA5\x97\x74\x4B\x15\xDE\x8E\x56\xE6\x70\x1D\xAB\x32\xEF\xC1\x32\x5C\xD3\x12\xF9\x28\x87\x4F\xA0\x7A\x36\xE4\x8F\x00\x55\xB5\xBC\x89\xCB\xEA\x0D\x0D\x75\x50\xC6\x8E\x6D\x3F\xD6\x16\x57\xF4\xD4\x13\x32\xFB\xB3\x76\xEF\xC1\x2E\x17\x9A\xE5\x82\x46\x78\xFA\x52\x57\x59\x46\xBB\x0E\xBF\xA3\xE9\x85\x91\x0C\xCA\xEB\x37\x38\x10\x6B\x10\x71\xE0\x3A\x38\x20\xCA\x66\x2F\xC3\xF8\xD4\x3C\xD5\x18\xE2\xD9\x8A\x3C\x46\x8E\x90\x45\x36\xDD\x1B\xF9\x49\x98\x87\x80\x1F\x90\x75\x43\xB0\x8F\x16\x95\x8F\xE7\xDC\x07\x9F\x98\x58\xAD\xA3\xA4\xBC\x31\xD4\x59\x14\xCD\xAA\x5A\x86\xA2\x50\xF4\x15\x17\x45\x22\xF0\x6D\x87\x52\x8E\x07\x7D\xFE\x18\xA9\xD3\xC6\x8D\x39\x37\xF2\xDF\x49\xC0\x8A\x73\x1B\x5D\xC5\x35\xAC\x91\x87\x13\xE0\xCD\x31\xFD\x98\xF1\xD1\x4E\x16\x50\x4B\xED\xAC\xFA\x7E\xE9\x6E\xFA\xB7\x53\xDF\x76\xFD\x92\x98\x0B\xBF\x53\x34\xE1\xD3\xC5\x9A\xC8\xCD\xCD\x8D\x30\x79\x5E\x03\x2A\x47\xBC\xEE\x79\x93\x78\x23\xF0\x52\xFA\x9D\xAD\xBD\x00\xF7\x0B\xCC\xBD\xF4\x8B\x73\x62\xF8\xDC\xE1\xB5\x26\x2B\x67\x68\xDF\xED\x1A\x6A\x30\x57\x4B\x06\xC7\x4E\x12\xBB\x6C\x61\x0D\x35\xC5\xF0\x2E\x1D\x4A\x47\x31\x7C\xA9\x9A\x6F\x4B\xD8\x9A\x35\x01\x43\x3F\x8C\x6A\x54\x6D\x22\x99\x25\xCE\x9A\x2F\xE9\xE3\x81\x3F\x7D\xA6\x88\xB4\xB3\x61\x98\xC2\x63\x7E\xEF\x08\xE0\xFB\x7C\x24\x8A\x18\x80\xE9\xF4\xBC\x84\x7A\x3D\xD5\xD4\x59\x37\x30\xF3\x48\x50\x4E\xFE\xF6\xB5\x69\xC2\x29\x1C\x6E\x69\x6E\x17\xB7\x7D\x17\x5C\xB5\x74\xA2\x66\x9D\x2B\xD2\x2C\x52\x01\xF5\x2D\x41\xE0\x42\x49\x95\x6A\x9D\x32\x7F\x76\x24\x35\x0D\xAE\xE6\x32\x55\x34\x6D\xC0\x83\xD9\xED\xA5\x8F\x77\xEF\x49\xC2\x87\x33\xAD\x32\xDB\xC1\x67\x56\xB9\xDA\xBB\x2E\x07\x1B\x5C\xD6\x30\xCB\x4E\x5E\xF1\xEA\xCE\x57\x8E\x1F\xD2\x1D\x53\xA5\xED\xD7\xD3\x8B\x58\x28\x96\xBC\xF7\x20\x0A\x08\xFC\x97\x7B\xC6\x19\xC5\x17\x7C\x18\xF8\x64\x90\x2A\xF6\x4E\xD7\x89\x52\x7C\xAF\xA8\xF5\xA8\x22\x7A\xB0\x71\x1E\x16\x6F\xCD\x63\xA3\x89\x3F\xA8\x90\xBA\xCA\x13\x0A\x32\x38\x1F\x9A\x4B\x31\xA6\xFA\xFB\x42\xCD\x51\xEB\xF2\x11\xCE\x3C\x65\x8A\xF1\xFA\x49\xF4\x69\x7F\x9F\x23\x95\x83\x95\x4B\xF5\xD0\xEE\xE2\x8F\x30\x73\x34\x0B\x6E\x40\x3F\xBD\xD2\xD1\xC3\x2C\x70\x70\x7E\xEE\xEF\xFB\x70\x41\x48\xC1\x9B\x25\xD3\xC1\x73\x1B\x89\x98\x31\xC9\x9B\x0A\x84\x80\xE8\x28\x24\xB3\xE4\x28\xE1\xC1\xD2\xE8\x46\x6E\x8C\x59\x0E\x24\x91\xC6\x10\x89\x21\x59\x7F\xAE\xC6\xBE\x7D\xF4\x04\xDB\xAB\xB9\xF2\xEB\x29\xEA\xF6\xE5\x50\x86\x79\x53\x70\xD9\x7B\x8C\xE7\xA7\xB5\x55\xFE\x95\x4A\x62\x98\xC1\x46\x4F\x05\x0F\x30\x9E\xD9\x7D\xD1\xA1\x1B\x1D\xAF\x22\xC5\x6C\xBA\xC0\x03\x3C\xFD\xFC\xD5\x6B\x8E\xF4\x08\xAC\xEF\xCD\xB7\x4E\x34\xB5\x0E\xC6\x37\xBE\x86\x92\x92\x9F\xBA\xC2\x79\x88\xCD\x5E\x02\x21\x77\x45\x3E\xCB\x48\x7F\x4D\x8B\xE2\x88\xAB\x16\x7B\x53\x74\x49\x4E\x0E\xAF\x77\x00\xAD\xA7\xE9\xC8\x0B\x74\xC8\x3D\xCB\xEF\xF0\x6A\x24\x43\x4E\x0E\x79\xC9\xBB\xFC\xBB\x5B\x7E\x2E\x1F\x07\x1C\x67\x20\x5E\x30\x6E\xEA\xB6\x61\x02\x8F\x61\xFA\x27\xED\x6F\x67\xB4\xEE\x3C\xBB\x9E\x58\xF0\x78\x42\x19\xBC\xF8\x4B\xB6\xCE\x03\x51\x02\xB4\x5A\xCC\x08\x9A\x5C\xDA\xE0\xFA\x87\x2A\x3B\xA5\xF7\x09\xBC\x9A\x4D\x8F\x6E\x19\x80\x79\x25\xD1\x2C\xD2\x8A\x4A\x53\xC2\xCA\x8A\x1B\xF4\x1E\xFD\x5D\x8D\xE7\x7F\xFF\xBA\xE1\x29\xC3\xCB\x69\xC1\xDA\xFB\x1A\xB2\x58\xFE\xD9\xF0\xDD\xD5\x21\xEB\xC4\x8B\xF9\xDE\xFE\x85\xF5\x85\x48\xFE\xA2\xEE\x1F\x45\x99\xEA\x31\x6A\x0B\xDB\x23\x37\x8B\x16\x31\x94\x65\xCD\x27\xA6\x01\x5F\x79\x9A\x76\x85\x45\x70\xD8\xF2\xC3\xB9\xAE\xCB\x22\x87\xA9\x5A\x78\xE0\xB2\xE0\xBD\xF9\xF5\x9F\xBC\x33\x61\x85\x84\x85\xFA\x47\xBC\xE9\x14\x65\x4F\x7C\xD8\x31\x4E\x98\x21\x1F\x97\xD2\x34\x16\xEC\x21\x9C\x81\x7C\x1A\xC1\x4F\x7E\xED\xA2\x83\x67\x00\xB1\x62\x82\x6B\xB2\x67\x21\x46\xDF\x05\x22\x11\x75\xF3\x3F\xFA\x6E\x66\x66\x38\x94\xF6\xBC\xB4\x93\x6B\xF6\x00\x13\x82\x78\x04\x02\xDA\xE3\x69\x71\x23\xE4\xE4\xD9\xB0\x56\x72\x35\x6A\xD1\xFC\xDF\x16\xB7\xD3\xE9\xE0\x86\xF2\x03\x78\xF1\xA1\x9B\x6C\xC9\x39\xEC\x9F\xE9\x88\x38\xB1\xFA\x2D\xD3\xDE\x10\x47\x26\x53\x0F\x22\x08\x18\xC4\xD8\xF6\xD0\xA0\x4A\x7F\x26\x9E\x95\x18\xB1\x5B\x88\x92\xE0\x58\x58\x81\x5D\x8D\xA9\x69\x73\x94\xA1\x9E\x9C\xB9\x86\x4A\x08\xDE\xD3\x1E\x70\xED\xB0\x10\x6E\x03\x7E\x1D\xAE\x1B\xD8\x76\xFD\xEC\x46\xF1\xA4\xA1\xA1\xF9\x5C\x02\x7B\xC3\x73\x6F\x71\xD0\x16\x49\x72\x63\x21\xE3\x39\x76\xC9\xBF\x88\x5D\x12\x4E\x2C\x01\x58\x1D\xB4\xEA\xB8\x01\x76\x33\x27\xE4\x1D\x43\xB3\x30\xFC\xF1\xEA\xD8\xB7\xED\xC4\xA6\xCF\xE1\xE2\xC5\xA4\x8C\xEB\x21\xD9\xD0\xCE\x54\xF7\xD6\xF2\x3C\x3F\x3F\x50\xC6\x58\x8D\x05\xDB\xE9\x7C\xDD\xF8\x96\xB1\x1A\x9E\xA0\xD0\xCE\xDA\x43\x4E\x7A\x58\x28\x39\x58\x96\xDC\xB0\x5E\x06\x86\x83\x13\x95\x0A\x4D\xE1\x69\xF3\x1D\xFC\xA6\x34\xE2\xD7\xE1\x44\x97\x30\x9A\x95\x82\x28\x55\xD8\xD9\xEC\x13\xED\x65\xA1\x14\x51\x80\xE9\xA6\xDE\x58\x57\x08\x47\x93\xB4\x44\x17\xBA\x92\x0B\x6E\x6C\x92\xD5\xE4\xDC\x48\xB8\xE7\x7B\xF7\x5C\x3E\xEC\x2A\x52\x63\x48\xB6\xE2\xDC\x46\x5F\x5E\xD2\xBE\xC7\xF2\x10\x13\x79\x3F\xB0\x77\x62\xC0\xC8\x56\x98\x2D\xB4\xDE\xBF\x2E\xA9\xBA\xF6\x95\xD2\xF3\xFE\x1A\x3D\x18\x2B\x2E\xF1\x0B\x9D\xE5\x8B\xBF\x77\x01\x60\xEC\xDF\xB3\x7F\x9D\xDC\xE4\x8B\x68\x5A\x70\x76\x2E\x37\x5E\x92\x64\x99\xF7\x94\xBC\x66\x6B\x4D\x18\xC8\x43\xD8\xB1\x56\x0E\xD8\x56\x8E\x55\xF9\x24\x69\xFC\x08\xDB\x7D\x7D\x54\xF9\xF7\xD6\xDD\x07\xC0\xF9\x73\x1C\x7E\xE0\x3E\x6F\x41\x47\xD9\x8C\x00\xCC\xF8\x6A\xC6\x3D\xE7\x15\xA8\xB2\xCF\xEC\xB4\x79\x17\x11\xF4\x22\xDA\xC3\x25\x70\x9E\x42\x65\xF1\x92\xBA\xD1\xFA\xE3\x08\xF3\x3E\xAF\x0C\x2E\xFF\xE7\x20\xFE\x5F\x8A\x5F\x1D\x83\x00\x3D\x5D\x1D\x17\xDB\x4B\x4A\xF9\xB9\x78\xA1\xDC\x57\x86\x22\xCC\xA0\xBF\x82\x95\x46\x92\xFC\x5A\x0F\xAD\xF6\xE1\x9B\x7E\x14\x68\x1D\xDD\xED\xEE\xD6\x4E\x7B\x46\xBE\x54\xB4\xE8\xF0\xC8\x2E\xD6\xA1\xE0\x66\x4F\x5D\x4C\x07\x52\x5C\x3A\xA5\xB8\x23\x07\xF3\x3A\x6E\x21\x43\x31\xF2\xD3\xAB\x9D\xBB\x83\xFD\x7B\xEA\xE4\x3D\xDE\x4E\x28\xCA\x37\x53\xBD\x2B\x67\x4A\xC9\x60\x85\x9B\x8D\xB7\xB4\xD4\x87\x2C\xFD\xF8\x2D\x39\xF1\xB5\xA5\x19\xDD\x3A\x45\xD0\x2F\x7A\x3E\xCB\x26\xA3\x30\xCA\x2E\xCE\xEC\x36\x96\xC6\x65\xC9\x1C\xA4\xE5\x46\x76\xE4\x44\x13\xF8\xC2\xB2\x2A\xFC\x88\xED\xC3\x3F\xB7\x48\x62\x23\xA8\x2C\xBE\x8C\x1B\x7E\xCD\xEF\xB8\x84\x6B\x03\x38\x1E\xD4\x32\x89\x2B\xFE\x3E\xCA\x47\x36\x8F\x17\x75\x96\x94\x7C\xC4\xA9\x03\x5F\xCC\xFB\x5B\xB4\xA6\x7A\x3A\xD6\x10\x7B\x83\x14\xB8\xAB\xF7\x85\xDE\x11\x56\xCB\x91\xAF\x40\xEF\x9C\x3D\xC5\x1B\xF1\x02\xAC\xDD\x42\x58\x79\xF8\x24\x7A\x71\xEA\xD1\x40\x41\x27\xBC\xBD\x41\x27\x88\x79\xAB\x5F\x2E\x0D\xDB\x09\x60\x09\xB5\x4A\xC1\xAB\x74\xD4\x69\x7E\x24\xFF\x29\xE8\x21\x13\x67\x57\x10\x93\x67\xCA\x61\x10\x91\x26\xB0\x53\x5B\x50\x22\xB0\x61\x9C\x60\x06\x35\xDC\xA3\xF1\x35\x8C\x4B\x5F\x04\x3F\x2E\x42\x49\x48\xB1\x1A\xB4\x02\x3C\x08\x25\x7B\x03\xDC\x68\x35\x6B\xDE\xA5\x51\x32\xA8\xFC\x77\xF5\xAE\x29\x45\xF3\x6F\x4F\x87\x75\xBC\xDE\xEA\x6B\xA5\x81\xC4\xA8\xFC\x1A\x2F\xEE\x6E\x26\xE7\x6F\xB0\x35\x8D\x90\x29\x2A\xAD\x7A\x4A\xA1\x07\x6C\xFD\xC1\xED\x46\x09\xAC\x1D\x23\x04\x38\xF1\x7C\x31\xB1\x8C\x29\x4E\xA4\x31\x2F\x1A\xA5\xB1\xF3\x40\x49\xA8\x3D\x1F\xE8\xB1\x06\x58\x26\x63\x16\x00\xEA\x22\x29\x79\xFF\xC0\x90\x6F\x2E\x20\x26\x74\x34\x29\xBF\x2B\x8B\x0E\x90\x44\x50\xE8\xC9\x59\x89\xFF\x71\x68\x3B\x9B\x7A\x3D\x02\x37\xC6\xE6\xB5\x7E\xD1\x86\x71\x63\x7B\x30\x5F\x24\x78\x09\x6B\x29\x92\x52\x62\x95\xE2\x4D\x6D\x9C\x9D\x3B\xC9\x7D\x09\x91\x17\xD8\xDB\xDD\xDA\x89\x56\xC0\x17\xE2\xC7\xDF\x81\x14\x64\xD7\x4C\x25\x2D\x24\x5C\x46\xB6\xA7\xDC\x4D\xD7\xEF\xC9\x7D\xE5\x54\x61\x88\x5E\x39\xC0\xA1\x07\x8C\x52\x7F\xEF\x82\x80\x24\xE5\x05\x30\xA9\x3E\xF7\xA8\xDF\x75\xE3\x33\xAC\x7D\xCD\x09\x52\xA9\x4C\x3D\xAE\x89\xBE\x56\x50\xB4\x93\x85\x28\x6A\x03\x94\x41\xE4\x28\x01\x87\x66\x27\x77\x81\x99\xA3\x34\x0C\xFA\xA1\x1B\xBC\xFA\x67\x1C\x26\x5E\xFE\x02\xAC\xD8\x86\x65\x24\xE0\x80\xF5\x33\x6C\x8C\x32\x19\x1D\xF3\x6C\x76\xD2\x50\x61\x11\xA1\x24\x1C\xBB\x96\x1A\x29\xEF\x91\x9A\x37\xCA\x7C\x75\x0D\x45\x10\xB7\x89\x5B\xE1\x7F\x26\xF0\xCB\xC3\xD9\x38\x7B\xA5\xC9\x75\x06\xDF\x65\xC5\x67\xE2\x11\x88\x17\x0B\x51\x54\x8E\xA7\xCA\xE4\xD0\x71\xE2\x41\x2C\x11\x01\x82\xFC\xDC\xEB\x85\x1A\x89\xB3\xA3\x91\x33\x20\xC2\xB3\xDB\x43\xA7\x9B\x8B\x10\x10\xD7\xE9\xE9\xDE\xBD\xAD\xBA\x73\x42\x43\x85\x5C\xDF\x12\xCE\xA4\x78\xAF\xCC\x55\xC0\x38\x53\x7F\x5E\xF6\xC6\x86\xE9\xEC\x1E\x4D\x5C\x43\xEA\xFE\x36\x52\x20\x3A\x04\x87\xE7\xEB\x61\x7F\x5D\xEE\xB5\xC0\x44\xE8\x5C\x99\xBF\xCF\xD4\xC4\xBC\x20\x02\x4A\x35\xCA\x58\x44\x10\x0C\x45\xFF\x5F\x26\x5D\x08\x1F\x5B\x55\x35\xC7\x5C\x4C\x29\xE1\x65\x89\xFA\x15\xB5\x22\xED\x5F\x9E\x37\xEB\xA9\xAD\xCD\x01\x2C\xAD\xF5\x1D\x15\x6A\x20\xB4\x60\x52\x01\xC2\xA1\xD2\x51\x4E\x1C\xCF\x4C\x73\x82\xA5\xB8\x2A\x20\x38\xD7\x28\x0A\xA4\x68\xCD\x51\x23\x33\x55\x0E\x51\x1C\x9B\xEB\xCB\x40\x59\x37\xE1\x5A\x49\xEF\x31\xA0\x19\xA6\xE2\xF5\x21\x1B\x25\xF9\x3A\xEB\x8F\x97\x43\x9B\xC9\xF8\xFE\xD8\xB1\x0E\xB3\x35\x39\x64\xE1\xAA\x5E\x85\xD7\x5E\x18\xF3\x9B\xD4\xB1\x28\xCB\x1F\xAD\xC9\xA0\x67\xF7\x7E\xF0\x17\x0B\xDF\x58\x4B\xA6\x81\xA5\x4A\xB0\xE0\xB8\x8B\x9C\xAB\x83\xDB\x78\x49\xDD\x6A\xA3\x39\x75\xEF\xC5\xDD\xC8\x9E\x30\x2B\xEF\x4F\xBE\xB2\x78\x86\xB9\xFC\x5B\xBA\xC6\x89\x14\x38\x4A\x19\x8D\x9A\xF8\x8B\xAC\xAE\x38\xFE\xA5\x7C\xA9\x46\x1D\x15\xAF\x2A\x7E\xFA\x99\xC9\x8F\x63\xD1\x41\x85\x35\xC9\xFB\x7B\x90\x23\x40\x9D\x5A\x99\x01\xE0\x51\x2C\x32\xF3\xCD\xA1\x43\xA3\x0D\x4A\xCE\xAD\x52\x6F\x14\x98\xBD\xF0\x09\x78\xF9\x27\x3A\x4C\x98\xC7\xE8\x0D\xD2\xFF\xA0\xB4\xB1\x7D\x0F\xB2\xF2\x35\x87\x29\x60\x1A\x71\xDB\xD8\xE7\x19\x29\xC2\x96\x9B\x3B\xA1\xF2\xF8\x8D\x5D\x0B\x3A\x14\x6E\xC7\x81\xE3\x29\x4B\x5E\xF2\x9E\xDC\x7A\xA6\x5F\x7D\x0D\xA0\x2B\x0A\x06\x72\x5D\x2A\xB4\xC0\xBB\xC3\x2A\x95\x7C\xFD\x24\x9A\xA3\xB7\x43\x2E\xCB\x7F\x56\xD6\x2D\x84\xAB\x66\x90\x59\xF0\x0C\x41\x13\xEF\x1A\xE7\xE6\x8E\x1D\x1C\x95\x93\x2F\x46\x2E\xF8\xB6\xFC\x88\x9B\xA7\x63\x24\x41\x29\xA4\x30\xDB\xC2\xC2\x1E\xCF\x17\x05\xB0\xEB\x82\xCE\xBB\x3E\xCC\xCF\xD3\x21\xFC\x1A\x56\x95\x85\x87\xE6\x9F\x7F\xF4\x26\x58\x73\x6A\xCF\x40\x39\x85\x86\xC8\x0B\x2D\x3D\x61\xB3\xDE\x82\xBB\xA5\xCA\x7F\xCC\x97\xCA\xCF\x46\x4C\xDE\xE5\xC7\xE7\x27\xC9\x41\x8F\xF9\x93\x2B\xF0\x3D\xFE\x25\xD8\x32\x6D\xAA\x3C\xF2\xE3\xFF\x74\x66\xB9\xCC\x2E\xE2\x33\xE0\x2D\xE5\xAD\x13\x8B\xC3\x44\x47\x2D\x41\xDB\xEB\x78\x79\xDC\x6E\x26\xBC\x55\x79\xF2\xBA\x33\x0D\xFB\x6B\xDB\x9F\xE7\x76\xF6\xEB\x2E\xEC\x08\x7D\x8B\x5E\x72\x64\x02\x80\x72\x62\xA9\x65\xA5\x28\x0C\x16\x7A\x64\x33\x91\xBC\x83\xA7\xC4\x51\x69\xBA\x1E\x6D\x9A\x3B\x13\x10\xF6\x19\x92\xDA\xDD\xEF\x2A\x54\x04\x4C\x8F\x9A\x0E\xA0\xEE\xEE\x90\x25\xF4\xFB\x3D\x73\xCD\x1A\x21\xB4\xBA\x49\xBB\x3B\x32\x63\x8F\x14\x04\x80\xC2\x80\xA3\x4B\x16\x94\xEA\x56\x7F\xC2\xA8\x02\x53\x85\x0E\xC3\x67\x68\xF8\xB5\x4E\x44\x31\x47\x3E\xB3\x70\xAA\xCE\x8F\x61\xD7\x2B\x59\x28\x1F\xBA\xF5\x47\xAC\x88\xC0\x0F\x55\xF3\x9C\x69\x06\xC2\xA8\x86\x14\xA4\x50\xD7\xEE\x7E\xA2\x02\x4F\xCA\x61\x81\x16\x11\x15\xB3\x0C\x9B\x65\xE6\x23\x40\xA0\x07\x88\x28\x10\x71\x77\xB2\xC7\xC1\x08\x80\xC5\xBE\xED\x51\xCD\xD2\x7F\x39\x58\x8D\x6B\x82\xE1\x32\x37\x98\x4A\x9E\x27\x5A\x44\xE8\x7E\x75\x2C\xBD\xBA\x2B\xDF\x27\x1B\x36\xAF\xEC\x9B\x81\x1E\x0C\xCD\x98\x04\xDC\x00\xED\x75\x74\xB8\x83\x61\x61\xA6\x2B\x9A\xC9\x76\x49\x5B\x34\xE9\xF9\x7B\xCD\x99\x0C\x6D\xFB\x83\x5A\x22\x5F\x00\xCB\x1F\x00\xC8\x62\x62\x5A\x43\xB2\x97\x85\x30\xEA\xC1\x84\xC7\x30\x63\x09\x69\xEA\x70\xD2\xD1\x31\x03\x0E\xB5\x57\x98\x38\x41\x47\xC9\x28\x44\xC3\x8B\x47\xD9\x70\xB4\x29\x3C\xED\x1B\x4A\x26\xFE\x08\x5D\x59\xC1\xD0\x13\x4B\x94\x01\xE7\x7A\xFE\x01\x8C\x0E\x05\xF0\xD2\x38\x2E\x25\xA6\x65\xE9\x89\xBD\x37\x31\x19\xD5\x8F\x14\x3D\x1F\x5B\xCC\xE2\xAC\xF7\x7A\x22\x52\xB3\x38\x18\x5D\xE0\x4A\x86\x4C\x12\x55\x28\xCE\x9D\xF3\xA0\x34\x11\x17\xB1\xAF\x6E\x79\xDF\xEF\x83\x7A\x35\x5F\x40\x74\x1B\x9E\x30\x74\xFB\xAF\xA4\xA2\x63\xA6\xCE\x8F\xF2\xAC\xB9\xDB\xC7\x1B\x9C\x77\x30\xA4\xD0\xD6\x73\x8D\xAA\xA1\x9F\xB5\xBF\xE3\x7D\x93\x2A\xB4\xE5\x2D\x44\xFE\x49\x86\xB9\xDD\xC0\xDD\x6C\x43\xB0\x27\x4C\x45\xBB\xAD\x02\x13\xF6\x74\xDF\x22\x44\x08\xB3\xA9\x7D\x07\x1E\x94\x1A\xBE\xB4\xFF\xF3\x16\x6D\x40\x1D\x03\xB8\x33\x73\x72\x67\x7C\x91\xD3\x1A\xE5\x71\x5F\xEA\x41\xA6\x2F\x44\x6A\xC3\x55\xFA\x97\xD5\x32\x53\x67\xEC\x1C\xA5\x51\xBE\x9C\xDC\xD7\x25\x8D\xDC\xE2\x95\x48\xD5\x38\x87\x7F\x43\x67\xBF\xF4\x26\x19\x2D\x2C\x6A\x23\xB9\x05\xB7\x36\x48\x8F\x6C\x4E\xBD\xFF\xF7\x1C\x9D\x44\x35\xB5\x05\x2C\x33\xFA\x7E\x61\x0E\x46\x33\x24\xFC\xFC\x23\xA9\xEC\x86\x9C\x0A\x24\x2D\x26\x2A\x48\xB3\x3D\x9A\x5E\x96\xA0\xF1\xA8\xB3\x73\x8A\xD3\xBF\x7C\xC7\x9C\x54\xDB\xB8\x10\xCD\x9B\xD4\x53\xAD\xEF\x57\x24\x9F\xE3\x60\x76\x51\x77\x70\xD8\xBF\xDC\xDF\xB3\x22\x55\xBC\xF2\x63\xB4\xFD\xC3\x44\x09\x75\xB2\xDF\xE4\x25\x5F\xA2\xE6\x18\x1A\x0F\xF8\x19\x60\x90\x93\x83\x51\x52\x62\xF7\x42\x70\x16\xB5\x53\xB3\x5A\x83\x6D\x49\xAA\x9D\xBF\x76\x9A\xD8\xE2\xF3\xE3\xD5\x16\x5D\x00\xFF\x68\xBD\x77\x7F\xA9\x56\x03\xF5\xCE\x35\x52\x70\x31\xD9\xA2\x2A\x35\xBA\x21\x34\x4A\xDD\x65\x7C\x16\x06\x3B\xD6\xEE\xA0\xDC\x23\xA6\x26\xBD\x6B\xFF\x9D\x3C\x49\xFC\x9E\xF5\x4F\x2A\x3F\x55\x43\xAF\x4F\x3F\x4D\x1A\x88\x7B\x5D\xAA\x5B\x7C\x38\x12\xCB\x99\xED\x4A\xE5\xBB\x51\x9D\x51\xFB\x1A\xC4\x9E\xDF\x3F\x8F\xC6\x5B\xBB\xF3\x21\x1F\xA0\x1B\xF2\xBF\x5C\x42\x52\xFD\xEF\x99\x21\xFD\x28\x96\xEA\x4C\xB6\x60\xE6\xC6\x9B\xCC\x61\xD0\x79\x9C\x51\x01\x6B\xDF\x94\x42\x43\xC6\x49\xDD\xAC\x6C\x57\xD2\x98\xF8\xD7\xE0\x51\x9D\x5B\x4C\xFA\x74\x22\x6F\x86\xD0\xE5\x05\x07\x30\x2C\x19\x28\x1E\xDE\x99\x76\x69\x07\x97\x72\x3D\x7E\x71\x39\xA1\x76\x84\xB0\x97\x29\x71\x67\xCB\x9A\x74\xDA\xD2\x4C\x88\xC7\x69\x28\x44\xE5\x15\x1D\x0D\xCA\xF8\x96\xAD\x92\xEB\x3B\xF3\x5C\x90\xF7\xBF\x00\x6A\xB0\x39\xA9\x21\x17\x2D\x7E\xE9\xFC\xC5\xA3\x06\xAA\x3F\x28\xCC\xA1\x16\x68\x3F\xA6\x43\x47\x54\xA5\x26\x35\xF3\x10\xE9\x49\xDC\xE2\x55\xA2\xF3\xDD\xB0\xF3\xC7\xCF\x8E\x4C\x3A\x24\xC3\x3B\xC0\x45\x3A\xCE\xFC\xCE\x3D\x04\xD0\x14\x26\xB2\x47\x52\x8C\xAC\x1F\x91\x13\x7B\x8F\xD7\xEA\xCD\xEB\x27\x8B\x60\x56\x68\x4E\xEA\xB9\x97\xFA\x92\x3D\x33\xA9\x6F\x47\x42\xFF\x76\x25\xB6\x3E\xA8\x33\x80\x7D\xD8\x16\xBA\x13\x40\x8E\xCE\x1F\x07\x78\x7E\x53\xB4\x19\x54\x0F\x0C\x54\x11\xF6\xA7\xAC\x58\x94\xF2\xC6\x4C\x52\xD3\x76\x25\x17\x74\xB8\x4B\x5A\x94\x08\x3A\xDD\xBE\x85\xC4\x83\xA5\x9C\x66\x52\x7D\x72\x13\xE1\x2A\x36\x35\x58\x03\x41\xBC\x0E\x11\x96\xEA\xCF\x6F\x24\xF2\x75\x83\xCF\x36\x7E\x29\x08\x2A\x26\xB9\x86\xCC\x8E\xCE\xB1\x6C\x06\x1C\xD8\x22\x97\x08\x55\x2F\x5A\xAB\xE4\xAF\xC2\xFC\x41\x27\xAF\x4C\xA7\x50\x0B\x97\xCB\xED\x9B\x80\xFB\x68\x52\xD7\xFD\x66\x73\xA3\x39\x0A\x6E\xD6\x6C\xFD\xDB\x74\xB6\x06\x5E\x36\x64\x48\xC9\x18\x87\x2B\x97\x0D\xCA\x07\xA6\x45\xCD\x40\x3D\xD0\x1E\x84\x9B\x37\x3A\x41\xB0\xC1\x90\x1D\x04\x1C\x4C\x0F\x19\x71\x81\x35\x0D\x1C\xC1\xFB\x45\x97\x2B\x2F\xC3\x2B\x8F\xF0\xAD\x61\x3D\xFC\xA7\x73\x1A\xB4\x25\x8D\x78\x91\xB9\x34\x7A\xBF\xE5\x1A\x48\xEE\x55\xEA\xAC\x97\xBE\xAE\x33\xB0\xBF\xEA\x2D\x90\x00\x05\x81\x9A\x5E\x24\xF5\x07\xB4\xC1\xDC\xA2\x4F\x60\x9F\xCE\x5E\xA9\xA6\x17\xF1\xA4\x23\x12\x2D\x08\x38\x17\xB2\xE5\xBD\x22\x0B\x44\x23\xCA\x54\x6C\x12\x47\x73\x78\x44\xF9\xD2\x56\x3C\xCE\xFF\xFA\x1C\xFF\xA7\x91\x9F\xFB\xE2\x0F\x01\xAB\x1C\x9C\xD6\xCE\x5B\xE4\x0D\xF4\x6A\x30\x31\x74\x6A\x04\x3B\x03\x21\x69\x1D\x24\xB6\x9F\xF3\x2A\xE0\x37\xC4\x45\x76\xEC\x3F\x44\xEE\xB7\x3E\x94\xC9\xE8\x95\x0A\xAC\x93\x3A\x29\x47\x98\x27\x5C\x33\x3D\x55\x6E\xFC\x86\x9C\xCB\xC2\x61\x20\x5A\xB5\x44\x5C\x2F\x70\xD1\xEF\xBD\xDC\x54\x75\xF3\x6F\x95\x21\x27\x0F\x21\x5F\x6A\x41\xC3\xE2\x4E\xBC\xC0\xB1\xD2\xE7\x28\x92\x51\xDA\xD5\x25\x62\x9B\x79\x3F\xDB\x8A\x90\xBE\xA5\x4E\xD1\xD6\xF3\xD3\x4E\xFB\x14\xE1\x79\xDC\x9C\x9A\xE7\xC9\x65\x92\x88\x8F\xE3\xEF\x77\x49\x2C\x31\x4B\x56\xB2\x97\x2A\xD5\x79\xA4\x02\xC7\x13\xA3\xD9\x06\xB6\xD3\x0A\xE9\x87\xFE\xE6\x70\xD8\xF3\xF9\x80\x50\x21\xE5\x47\xFB\x80\x7C\x8C\x32\xDD\x07\xCD\x5A\x11\x7A\xAC\x73\xC2\x08\xD1\xC8\xDC\x9F\x1A\x64\xEB\x9F\xBB\x58\xE9\x7C\x60\x30\x05\xE3\x84\x9A\xD9\xC6\x07\xE5\x77\xE5\x34\xFF\xA0\x7D\xEB\x66\xEE\x79\x3C\x40\x58\x04\x25\x97\x90\xCD\x78\x0F\x93\xFF\x23\x58\xD1\xA8\x38\x2B\xF9\x89\x5E\xDD\x2B\xDE\x9E\x4A\x5C\xEB\xDF\xC1\xBA\x49\x9D\x0B\xD5\x7A\x60\xFF\x88\xE7\x40\x01\x4E\x93\x05\x1A\x0C\x13\x7E\x48\xB2\x94\xC5\xA2\xB3\x19\xB0\x00\x83\x1A\x51\xC1\x95\xB2\x1B\x6F\x4C\x33\xD6\xEE\x52\xAE\xB6\x35\xD7\x01\x32\xE2\x9A\x1A\x94\xBA\x9A\xBB\x3A\x6D\x7E\x3A\x1A\x0A\x2A\x87\x14\xAA\xAE\x59\x18\x5F\x5B\x54\x68\x05\xC4\x16\xE7\x1E\x75\x0D\x85\x26\x7D\x43\x39\xDC\x0A\x6D\x9C\xD7\xE9\xED\x92\xD3\x5F\x16\x34\x73\x6E\x79\x7B\xDF\x91\x70\x58\xA6\xDE\x14\x48\xB4\x46\xEA\x9A\xB2\x89\x1C\x84\xCE\xC2\x2D\x23\x7E\xD5\xC6\x20\xFB\x2E\xC1\xA9\x34\x52\xF3\x36\xAA\xAC\x68\x49\xCB\x09\x61\xDE\x84\xE1\x80\x51\x23\x3F\xA9\xE2\x5B\xF5\xBE\x45\x1F\x63\x6E\x7B\x5A\x64\x1A\x7F\x58\x04\x01\xF8\x8D\x5D\xDF\x60\xF4\xA6\xA1\x59\xEE\xAF\xCB\x9B\x59\xDB\xD7\x98\x9C\x1B\xA8\x7D\xB3\x33\x2F\xC6\xDD\xAC\xF0\x9B\xF3\xAD\x08\x1E\x99\xB4\x1C\x49\xAF\xAD\x83\xA8\x41\xF5\x87\x40\x0D\xCF\xBA\x77\x83\xE2\x9F\x6D\x44\xE5\xB8\x8D\xB4\xB4\x8F\xEA\x2A\x89\xC9\x75\x2B\xBD\x46\xC2\x0B\xD0\xCA\x02\x69\x67\x92\x1D\x4D\x76\xD1\xD1\x4F\xD7\xDE\x8B\x15\x21\x27\x89\xDF\xEE\xAF\xDA\xBE\x52\xB4\xFF\xAF\x1D\x36\x9C\xB5\x36\xE0\x21\xBC\x85\x72\xA3\x70\x65\x7A\xB6\xB0\xA5\xD6\x88\x49\x19\x80\xC5\x50\x68\xCF\x5D\xBE\xEC\x95\x66\x8C\x37\xDA\x35\xA0\xF7\x9B\xCC\x36\x4C\xBA\x35\xC3\xE9\xA9\x5B\x8E\x2E\x68\x07\xB3\x1F\x8B\x11\xED\xD8\x18\x5E\x26\x1D\xBD\x56\xAF\xC3\xC4\xA2\xFB\x00\x63\x0C\x7A\xAF\xF5\xA3\x44\x77\x60\x6E\xB0\x61\xE1\x62\x13\x31\x0F\x9A\x4B\x37\x9B\xB5\xB4\xA8\xC2\x3B\xC1\xE6\xC2\x79\x00\xB8\xC7\xCF\x25\xA6\xAC\x28\x3F\xE9\xC6\x67\xF9\xA3\xF0\x04\x49\x60\x8D\xFF\x44\x46\xB2\x3E\xAF\xB0\xCF\x34\xB8\x6D\xFC\x84\xE5\x32\xFC\xDE\x8A\x4C\xB6\x8E\x3C\x61\x9C\x70\x7C\x3D\x4E\xFD\xD1\xD3\xE7\x60\x6B\xF6\x50\x85\x42\xB1\x8C\x63\x05\x8D\xE9\x3E\xE7\x36\x40\x38\x2E\xFE\x36\xE0\x44\x87\x79\xA3\xC9\xA5\xA4\x2A\x8F\x8E\xC2\x49\xA3\x10\x84\x47\x1A\x41\xFC\x28\xC5\x6E\x9C\xEF\x1D\x1B\xEB\xA2\x7C\xDD\x10\x57\x14\xBF\x30\xC8\x73\x22\x19\xB6\x03\x0A\x69\x21\x3E\x3E\xA8\x43\x50\xFD\x94\xCE\x4B\xA5\xE6\xA3\x44\xB8\xD3\x8B\x2D\x76\xA9\xB3\xC0\x3B\x5D\x47\xD1\x7E\x4A\x6A\xD2\x3B\xE4\xFD\xCA\x23\x5D\xF2\x1D\xF4\xAF\xEF\xBF\xE3\xC4\x94\xEE\x0E\x54\x4B\x56\xCA\xC4\xF1\x82\xF5\x68\x1A\x73\x8D\xC4\x8B\x69\xC1\x5D\x78\xF4\x57\x6A\xDB\x10\x0D\xF1\x57\x2C\xAA\x53\x58\xBA\xF1\x05\x3F\xD9\xAE\xB7\x75\x1B\xE2\xD1\x89\x35\x62\x17\xCA\xDB\xC8\x4F\x98\x12\x59\x62\x83\x30\x4D\x70\x7F\x89\x94\xBC\x2B\x14\x1A\x6B\x48\x55\xD0\x4E\x4E\x1B\x2A\x08\xDA\x72\x2C\xA5\x51\x95\xB3\x11\xD6\xAB\x74\xEE\x27\x5B\xF0\xBB\xFE\x85\xF5\x58\x9A\x27\xDF\xB7\x9E\x08\xD7\x05\x45\x74\xA9\x85\x9A\x4F\xCA\x84\x54\xCF\x18\xD5\xCC\x00\x5E\xD3\x20\x02\xED\x3B\x0B\xA3\x0F\x92\xE3\xD3\x8B\xAA\x42\x3B\xD1\x86\x98\xFC\xD3\x3D\xB0\x14\xFA\x29\x41\xFA\xD8\x92\xAF\xDF\xC4\x03\xEA\xA1\xF1\x8A\xEB\xA4\x17\x01\x78\x19\xA9\x85\x7E\xCD\x66\x0A\x2B\x77\x5B\x0F\xB7\x36\x09\xB0\xED\xC5\x40\x33\x7B\xF6\xDB\xAA\x0C\x6C\x4B\xCE\x71\xB6\x5C\x55\x85\xC1\xEB\x12\x63\x7A\xD7\x13\xAA\x18\x6A\x5A\x66\x2E\xBD\x11\xFC\x0B\xE3\xD7\xD2\xD3\x99\xDA\x75\xC5\x49\x6F\xE1\xFD\x8C\xD2\x12\x10\xFC\xE3\x8B\x7D\xC3\x94\xEB\xF3\xC0\xD1\xE2\xD9\x0D\xD4\x08\xF8\x90\xA3\x87\x8B\x28\x17\xBA\x61\xB6\x51\x5C\x6F\x6E\x94\x8F\xD9\x0B\xFC\x7C\x82\x9D\x63\xF3\x7B\x35\xAD\xC5\x66\x50\x9B\xB2\xAD\xC3\x23\xCD\x8B\x94\xC1\xDE\xE4\x0C\x89\xE9\x21\x3F\xB2\x07\xC0\x1B\x2E\xE6\x49\xD0\x01\xB1\xD5\x68\xAE\x46\x50\x28\xFB\x8F\xB9\x9F\x9A\x45\x6A\x78\x93\x6A\xCC\xBA\x11\x40\x38\x15\x10\x46\x27\x74\xD7\x5D\x60\x36\xFD\xE4\x42\x0A\xB0\x7A\x5E\x10\xE0\xEA\xBD\x9B\xA6\x4A\x9C\x21\x5F\x12\xDE\x9A\xB7\x8E\x88\xD3\x75\x27\x18\x26\xAF\xBE\x4D\x7F\x26\xEB\x22\x49\x44\xB3\xD4\x6E\x79\xFC\xA5\xFF\x8F\xAB\xC6\xC7\xF7\xEA\x4C\x7F\x87\x32\x80\x3A\x6D\x8F\xF2\x65\x0F\xB3\x42\x97\xE3\x01\x07\x2B\xAE\x1D\xE1\x95\x18\xB6\xD0\xFB\xA6\xC5\xF9\x6A\x81\x4F\x66\x25\x5B\x79\x2D\x98\xCC\xE2\x90\x59\x52\xA7\xB4\x18\xC1\x60\x2B\x1A\xF1\xBF\x1B\x56\x1D\xDB\x0A\x38\xE2\xFB\x04\x44\xCF\x52\xE4\xC3\xD9\xC6\xC4\x83\x8D\x79\xAC\x6A\x89\x04\x42\x1A\x58\x2F\x20\xBE\x06\x81\xD0\xFD\x33\xF5\x22\xDF\x12\x30\x53\xE4\x62\x60\xE4\x9B\x2D\x61\x8C\x6F\x4E\x39\xDF\x6F\x79\x8A\x70\x79\xFB\x4A\x89\xD1\x4D\x15\xEE\x3E\xEB\xCD\x4A\xBF\x3C\x75\x43\x4C\xD1\xC7\x92\x73\x2D\xC5\x1E\x39\xBD\xAB\x2A\xC8\xC2\xBD\x1A\x42\x24\x64\x70\x78\xD0\xCD\x42\x8E\x9F\x26\xCE\x12\xBA\xDF\x4E\xA7\xAC\x00\xB8\xB7\xD6\xFB\x48\x43\x3A\x16\x79\x63\x6C\x39\xCA\x58\xA7\x2A\x24\x7D\xEB\x0F\xB3\x60\x52\xB9\xFE\x81\x19\x73\xDD\x2F\xDE\xE3\x30\xB0\x10\x33\xA6\x77\x0C\x98\x66\x0E\xD1\x7C\x04\x2A\x5E\x67\xB4\x7A\xBF\x0C\xD4\x5E\x47\x73\x0D\x21\x18\x1A\x47\xC2\xA5\x9A\x1A\x23\x4F\x97\xF1\x4F\x64\xF1\x51\xC8\x12\x5C\xDF\x1A\x3C\x5C\xD2\xF4\xDD\x2C\x5B\xA6\xE0\xFE\x28\x36\xE5\xEB\x8D\x40\x8F\x1A\xC4\x7C\xC0\x62\xF9\xE1\xFE\xE4\x68\x30\xA3\x58\x9D\x6C\xC8\xAD\x16\x01\x4F\xD3\xEB\xB5\x60\x5A\xBE\xC3\x45\x2F\x4B\xFF\xE1\xDD\x9F\xA5\x0C\x5F\xC7\xA6\x72\x67\x40\xC0\x24\xEC\xFD\xC3\xEF\x24\x5C\x05\x7E\xD4\x87\x1C\xE3\xF2\xA4\x62\x21\x25\x60\xA6\x69\x77\xD8\x1E\x84\x02\x61\x3A\x1F\xE8\xF5\x63\xB4\x72\xB6\x6D\x9B\x1F\xE2\x17\x8D\x15\xA9\xE1\xEC\xDD\xA0\xCC\xFB\x1B\x08\x80\xBC\x96\xAF\x3C\x52\xAC\xBC\x17\xD8\x7E\xF9\x25\xFE\xF9\x71\x89\x26\x34\x88\x55\x27\x6F\xA6\x9B\x9C\x89\x99\x23\x87\xBB\xCC\x43\x8E\x57\xBB\xAC\x75\x1C\x7C\x54\xCF\x18\x16\x73\xE4\x89\x4F\x64\x25\xAB\xA5\x78\x00\x41\x56\xA0\x04\x31\xFB\xFC\x01\xAF\x92\xDE\xAA\xA9\xF1\xCC\x8B\x8D\x6C\x31\x10\xFC\xA9\x43\x39\x9F\x42\x23\x1B\x05\x5D\x62\x45\x20\xD4\xE9\xBA\xB3\xE9\x41\xD0\xAA\x89\x18\x19\xD0\xD9\x83\x99\xB2\x93\x10\xAB\x8A\xDA\x02\xD5\xB9\x70\x81\xDF\x0C\xE6\xEB\x4C\x28\xCE\x43\x86\xEA\x01\xA9\x50\x7E\x2E\xB4\x5C\xFE\x00\x6F\xDC\x8D\x17\x47\xEC\x99\x21\x16\xF3\xE7\x35\x76\x33\x97\x69\x39\xC8\x83\x71\x07\x4E\x53\x24\xEA\xAE\xB4\x90\xD9\x70\xB3\x0C\x95\x8A\xAF\xB2\x6B\x8D\x4E\x93\xB4\x71\x4F\xD5\x24\x83\x38\x4F\xA1\xBF\x6C\xFD\xF1\x3F\x66\x4E\x23\x8A\x50\x5F\x0E\x44\x2E\x97\x8D\x7E\x82\xE4\xF9\x85\x27\xB3\x02\x5E\x30\x99\x1E\x4F\x8B\xE5\x2F\x54\x61\x48\xAE\x70\xAD\xB0\x09\x08\x8D\xFC\x93\x0E\xE1\xDE\x48\x84\x0E\x95\xD9\x28\x5E\xB1\x53\x2E\x77\x01\x6C\xA2\x12\x3C\x65\x3C\x2A\x09\xF4\xBE\x4E\xB7\xFD\xB0\x2A\x7A\x44\xEC\x0C\xD8\xDE\x15\x2A\xC7\x54\xDF\x8E\xA6\xA0\x69\xB2\x62\x8F\x71\xA5\x1C\x54\x3E\x13\xD1\xD8\xFF\x2F\x25\x24\x47\xE2\x98\xDD\xB2\xD2\xAC\x09\xF4\xF2\xA3\xDB\x53\x46\xE1\x79\x7C\xB7\x84\x88\xAE\xF6\xE6\xF1\x35\x11\xBC\x11\x06\x63\x17\xBA\x17\xDA\xB4\xA8\xDD\x29\x5E\xA7\x9B\x4A\x9C\x3D\x77\x0E\x9E\xCA\xEE\x9D\xAF\x30\xF1\x15\x32\x26\x94\x9B\xFC\x03\xE7\x49\x2B\x36\xC2\x8C\x81\xCE\xB2\x0D\x51\xE8\x05\xDB\xD8\x46\x11\x16\x74\x3B\xE2\xDD\xC5\x0A\xE1\x1E\x4F\xDD\xCB\x81\xA2\xAA\x82\x6F\x71\x8E\x26\x7B\xD7\x47\xE3\xF0\x40\xD0\x12\xC9\xCB\x6F\xD3\x11\xD9\x47\x64\x88\xD7\xD2\x73\x4A\x94\x74\x22\xCD\xFE\xDC\xD9\xBF\x4E\x9B\x8D\x6D\xBB\x20\x31\xD3\x26\x60\x24\x3E\x3B\x21\x47\x4B\x8A\xD3\x87\xB1\xE3\x45\x12\x6B\xA6\x3A\x76\xF3\x3B\x77\xAA\x0E\xAD\x48\xC5\x3C\xE1\x70\xB4\x16\xAB\xA6\xEB\x50\x3A\x09\x1D\x8D\x71\x94\x5B\xDC\xB8\x40\x82\x68\xA7\x51\xE0\xC6\xBA\x2C\xC1\xC3\xF8\x62\x38\x75\x18\xC2\x9D\x78\x13\x6D\xCF\xFE\x8D\x5C\x38\x06\x5F\xC2\xDC\xA9\x65\xF5\x32\xBC\x5E\x76\x0C\xFE\xDB\x4A\x40\xDE\x1D\xF0\x12\xF4\xB8\x2D\x43\x27\x56\x69\xD4\x96\x0E\xBB\xF3\x77\x14\xE0\x63\xE0\x09\x98\xDE\xDB\x02\x7C\x36\x84\xEE\xBF\xAF\x61\x22\x25\x0E\xDA\x56\x5E\xD5\xBD\xB4\xC0\xAD\xEB\xDB\x96\x81\x57\x2A\x70\xC5\xC5\xF9\x93\x03\x69\xFE\xE1\xD8\xA5\x49\xA5\x6D\x14\x44\xFF\xDE\x6B\xAA\x94\x1C\xCC\x9C\x7B\x7A\x6D\x9A\x22\x19\x08\x99\x98\x47\xB6\x08\x98\x48\x00\xBE\x6A\x2F\x3D\xCE\xE6\x0D\x5C\x0C\xD5\x84\x10\x66\xE6\xA2\x2E\x2D\x39\xE2\xA3\xDA\x5B\xE8\x21\x07\xF0\x21\x07\x1D\x76\x4B\x24\x80\x9B\xED\x53\x2E\x8B\x3B\xEB\xEE\xCC\x0F\xC8\x12\xCF\x1D\x48\xEA\x91\xC7\x4E\xC5\xC1\xBA\x10\x91\x87\x54\xC4\x2D\xC6\x4C\xBB\xDF\xFE\x6D\x63\xCB\x53\x32\x45\xC8\x88\x5F\x44\xA2\x37\x78\x7E\x0C\x89\x6F\x24\x92\x53\xCA\x47\x3A\x9E\xDF\x4F\xA7\xB2\xCA\x0C\xFD\xDD\x2A\xE1\x34\x68\x28\xDE\x8B\xD1\x04\x0B\x2D\xA6\xB0\x04\x4B\x7E\xFD\xFF\x9C\x21\xFF\x02\x3A\xAA\x62\x75\x17\x26\x29\x58\x1F\x87\x25\x94\x2C\x06\x28\x3A\xA2\x0D\xF2\xCE\x82\x5C\x07\x23\x48\xEF\x2D\x6C\xCF\x12\x42\x2D\xCE\x13\x19\x8A\x91\xD8\x0F\xE6\x74\x51\xFF\xD8\x88\xE2\xCC\x6E\x0B\xEB\xCE\x5F\xD8\x4C\x90\x9E\x85\x35\x16\x33\x61\xC5\x00\x57\xD7\x6F\xB6\xF0\xD0\xE9\x31\xC6\x93\x58\x5F\xE7\xEE\xA3\xF0\x92\xCC\x45\x60\x8F\x5E\xC3\x5E\x0E\xFE\x36\x6E\xCA\xD6\x30\x9F\xDB\x22\x4E\x4B\x15\xF0\x1C\x4F\xD1\xCD\x36\xD1\x02\x31\x73\x82\x9B\xC6\x21\x84\x9B\x07\x9C\x08\x58\x64\xEF\x65\x66\xF3\x16\xEA\xD2\x98\x89\x03\x76\x09\x21\xC6\xBC\x02\x0A\xF4\x57\x30\xCB\x1D\x4D\x1F\x1E\x97\x78\x4D\x19\xC8\x0B\x41\x07\x83\x70\xE7\x3F\xC6\x91\xA5\x4A\xFC\xB6\xA0\x2F\x24\x7A\x4C\x33\x85\xBA\x4B\x6F\x21\xFA\x82\x9C\xA0\x38\x65\xCD\x52\x7F\x3E\x00\xC8\xC8\xDD\x37\x03\x59\x46\xF7\x0F\xF2\x12\x92\xCD\x9E\x29\x5D\xEC\x36\x86\x42\xD0\x44\x09\x29\x9F\x2E\xD7\xE9\x15\x0C\x25\xE0\xF4\xD1\x17\x6A\xE3\x29\x90\xA9\xD8\xED\x4F\x7A\x7A\x3D\xC2\x2C\x40\xDE\x91\x59\x43\x06\xA1\x9B\xA3\x6E\x96\xEF\x1B\x4D\x4E\x32\x1C\xE6\x27\xA6\x8E\x6C\xA4\xA3\x02\x15\x54\x60\xC9\x80\x90\x98\xD8\xF0\x0B\xBB\xCC\x21\xEF\xD4\x4F\x17\x1F\xE3\x9D\x32\xBD\x0A\xB9\x71\x9C\xBB\x7E\xE7\x12\xF6\xAC\x17\xC3\xD0\xE3\xCF\x35\x58\x01\x47\x73\xBE\x82\xDE\xD2\x73\xD1\x65\xCD\xC9\x81\xDD\xB4\x53\xA3\xFF\x2F\xD6\x76\x62\xD3\xA8\xA4\x5C\x9E\xF6\x93\x0B\x85\x8D\x7B\x40\x3B\xE7\xB1\x5A\x3C\x29\x1E\x4C\x37\x3C\x24\x71\xE0\x29\x8D\xAF\xBC\x9B\xB5\x53\xFC\x92\xDC\xA2\xCB\x5D\x5B\xEB\x89\x9F\x63\x2C\x41\x47\xB8\x92\x95\xDC\xA0\x57\x69\x5C\x29\x23\xC3\x24\x3F\x95\xA5\x54\xDC\x3E\x89\x7F\x47\x65\x5B\xD5\xC9\x12\x52\x6D\x22\x5A\x86\x15\x7C\xA7\xF9\x31\xAB\xFC\xA4\xFB\xEC\x43\xE0\x9C\xA8\x7D\x69\x5C\x0A\x8E\x1E\xA1\x56\x20\x6F\xD6\xEB\x20\x9B\xE1\x43\x21\x96\x49\x60\x80\xEC\x98\x3B\x0A\x99\x73\xF2\x89\x95\x9C\x67\x56\x51\xCE\xA0\xEC\x16\x4B\x63\x9F\x56\xF0\x33\x24\xE7\x41\x7E\x5D\x1D\xD2\xFE\x44\xFD\x91\x48\x5A\x31\xCD\x40\x89\x98\x13\x3E\x02\x38\xED\xFC\x0F\x9F\x07\x88\xB0\x92\x3F\x7F\x81\x7E\x34\x54\xB6\xAC\x48\x1B\xE3\x1D\x68\x79\x4D\x96\x5C\x45\xE3\x0B\x4D\x8D\x24\x4E\xD6\xB3\xD9\x2F\xF5\x4C\xD6\xC7\x09\x59\x2C\x61\x48\x23\xCC\x05\x7C\x9D\xD9\xE7\x59\x74\xAB\xE2\xB4\x07\xFB\x04\xA5\x23\x61\x38\xFC\x02\xC4\x26\xF4\x6A\x04\x46\x9A\xA2\x48\x25\x16\x2B\xAB\x09\xA2\x22\x3A\x5B\x39\xD5\x06\x3E\x0E\x00\x0F\xD1\x82\x92\x06\x17\x03\x2A\xA6\x5D\x33\xB4\xE0\x88\x70\xBA\xE3\x23\x24\xDD\xC0\xE6\x3A\x90\x3A\x5B\x69\x4B\x0F\x41\x1C\x61\x8F\x0C\x4A\xB3\xEE\x9B\x40\x6E\x41\xF0\xF2\x9D\x85\x73\x07\xE8\xFF\x14\x30\xF8\x76\xC5\x5D\xEC\x1A\x94\x5F\x76\xB0\xF3\xF5\x1E\x76\x0C\x0D\xEC\xDE\x09\x3D\x5C\x4D\xAF\xDD\xB1\x6D\x27\xED\xCB\x15\x69\x24\x56\x6C\x8B\x80\x90\x19\xA3\xD3\xA6\x61\x47\xAF\xA2\xAE\x67\x54\xC0\xB1\x78\xEC\x2A\x2F\xED\x2B\x89\x94\x86\xF1\xB8\x0F\x82\x3C\xED\x28\x55\x1D\xF0\x5F\xEF\x09\xF4\x1D\x9D\x12\x9B\x67\xF5\xD3\x3A\xE2\x8E\x27\xD8\x57\xB4\x28\x12\x4F\xEA\xD3\x12\x3E\xF0\x6C\x34\x86\x07\xF0\x1F\x59\x02\xFF\x8D\x52\x32\xDD\x74\xA8\x12\xE2\xB2\x2F\x5D\x83\x29\x2E\xFF\x2C\x7A\x0E\x36\x22\x79\x21\x41\xCE\x57\x99\xA5\x75\x4A\x55\x21\x66\xB1\x54\x41\x3B\x54\x5D\x5B\x7A\xD7\xB1\x06\x7F\x19\x3C\x84\xB9\x6B\x29\xC3\x6D\xA1\xB7\x64\x80\x60\xC7\x3F\xFD\x2A\xD3\x85\xA5\xC4\xB9\x1E\xD2\x01\xA6\x01\xF3\x7C\xC6\xBD\x2E\xC1\x4C\x8B\x35\x0E\x4B\x61\x1A\x20\xF0\xA2\x2E\x66\x0C\x48\xBE\x86\xCA\x62\x9E\x0C\x61\xB1\x7C\xA5\x87\x38\xAE\x81\xE4\x85\x98\xF8\xF4\x29\xCD\x9F\x3B\x6B\x0A\xF7\x21\x1A\xAC\x09\x84\x18\xE1\x60\x6D\x35\x72\xA9\x37\x14\x3C\x2B\x65\x65\xD4\x54\x1D\x7F\x81\xD2\xBF\x78\xA6\x91\xE6\x22\xC8\x85\xCA\x4B\xE4\x22\x9E\x07\xBC\x1B\xF7\x55\x37\x1F\x09\x4C\x4A\xCA\x93\x6E\xFA\x0D\x1F\xD4\x21\xAD\x15\xE7\x70\xA1\x27\x2F\x17\x60\x57\xB3\xF5\xAD\x81\xFC\x08\xB8\x5B\x3D\x28\x8E\x58\x25\x77\x24\xFF\x4F\xBB\x5C\x20\xD7\xB1\xD5\x80\x8D\x3B\x34\xE2\xEF\x8C\xC8\xFC\xD9\x85\x48\xB7\x1D\x09\x7A\x85\x77\x09\xE2\x64\x16\x67\xD9\xC1\xBC\x96\xFD\x31\xDF\x59\x59\x69\xB7\x2E\x29\x2B\x82\x88\x85\x5A\x23\xD6\x8B\xED\xDE\x30\xA7\x32\x16\x79\xE1\xC9\xF0\xAE\x18\x10\xCF\x8F\xB8\x79\x61\x8E\xF2\x10\xC0\x38\x86\x68\x1A\x2D\x98\xB9\xFE\x9A\x34\x7E\x1C\x2B\xFB\xA6\x9A\xF3\xF8\x60\x5F\x06\x66\x79\x8D\x71\x90\xB6\xEE\x89\xAC\x3E\x3D\xC2\xBC\x78\x39\x93\x07\x8B\x96\x92\x6E\x0C\x3D\x44\x09\xFD\x01\xF2\x34\x96\xFD\xB0\xDC\x31\x6B\xC2\x41\x19\xDB\x9E\x96\xA1\x41\x1D\xF8\xEA\x25\xA0\x9B\x4C\xC0\x63\xE7\x85\x53\x6D\x74\x5C\x9D\xFC\xFE\x78\x78\x91\x5A\x7B\x07\x9A\xFE\xEB\x17\xD8\xB2\xDD\xAC\xF7\xEC\x6D\xA1\xF9\x5C\x31\xC2\x9E\x61\x4D\x8D\xB7\xAD\x57\x00\xF3\x49\xDA\x07\xEE\x67\x4F\xD3\x33\x2D\x57\x9D\xE9\x47\xAF\x96\x8A\x9E\xF7\x46\xC7\x64\x73\xF2\x9E\xA3\xA5\xE6\x0A\xFE\xEA\xBD\x06\x0E\xA0\x7A\x7D\x4A\xE0\xD5\xC1\x00\x69\x40\x55\xB9\x9E\xC5\x4A\x63\xBB\xF0\xB0\x99\xC6\xE0\xFE\x40\xB9\x01\x9E\xEE\x27\xD8\xAF\xBA\x2A\xF8\x32\xE1\x92\x0D\xF1\x13\xDF\x8C\xD2\x5C\xC5\x58\x99\xF0\xC3\xAE\x03\xD8\xEE\x5C\xC2\x24\xC4\x3E\xEA\xCD\xC2\x70\xFA\x4B\xA7\x2F\x50\xF3\x0B\x13\x77\xD3\x4A\x19\xA1\x4C\x3E\x6E\xD9\x77\xBD\x31\x7C\x6E\x78\x93\x88\x0F\x03\x4B\xA2\xB6\xFB\x0D\xF9\x95\x01\x70\x31\xE5\x30\x8B\x07\xE1\x8A\x24\x35\xC7\x9E\x94\xA7\x22\x98\x74\xC9\x89\xE3\xBB\xA5\x0C\x43\x9A\x19\x6C\xAD\xB9\xC9\x4B\xA9\x4D\xCD\x36\xF3\x17\x20\xFF\xA5\x68\xA1\x39\x4F\x6A\x12\x8B\x69\x50\x60\x4A\x58\xC0\xCC\xEA\x1D\xAF\x23\x87\x64\xE7\x44\xD7\x37\xD7\x29\x0C\xA4\x48\x14\xFE\x04\x55\xC9\x7E\x33\x06\xA5\xD3\xB1\x3A\xD0\x03\xF6\x3D\x13\xD4\xE3\x8A\x57\x47\x00\xD2\x18\x1B\x58\x41\x28\xBA\x1B\x42\xBC\xAD\x3F\x90\x7E\xD3\x4B\xBA\x78\x5A\xD7\xB0\xA2\xE5\x97\xCB\x80\x09\x5F\x4F\x15\x7F\xC6\xF0\xEB\x68\x78\xAA\xF2\x21\x22\x60\x32\xFD\x7B\xEC\xF4\xD5\x74\x7D\x60\x61\x5D\x1F\x7A\xEE\xF7\x35\xC8\x86\x6A\xF5\xA9\x91\x9D\x29\x6E\xE1\xC1\x02\xAD\x8F\xFA\x93\xDB\x7E\x2C\x69\x8C\x67\xD2\x14\x80\x60\x93\x01\x78\xF2\xE5\x53\x6C\x5F\x0F\xEC\x96\x7C\x00\x0D\xA2\x10\x9B\x1F\x46\x2E\x28\x1A\x99\x79\xE0\x42\x2C\xDB\x33\xF1\xE1\x75\x68\x45\x9A\xA3\xCB\x0D\x5E\x23\x15\x5C\xB1\x23\xB3\x07\xB9\x76\x69\xFA\xBA\xD4\x3F\x4B\xAC\x08\x7C\x75\xA2\x25\x76\x5F\x8C\x9A\x42\xB3\x3D\x53\xE1\xBF\x1A\xD1\xEE\xB9\x70\x93\xC4\x87\xF5\x4F\x98\xA7\x59\x6C\x71\xFE\xAB\xD7\x88\x9D\x70\xDE\xBF\x2A\x20\xF4\x02\xED\xB1\x87\xF1\x8A\x81\xA9\x3D\x58\xE7\x4C\x81\xA3\x81\x42\xBD\xB4\xC8\x50\x9A\xB1\x45\xF6\x2C\x6B\x3E\x0A\x67\x83\x61\xF7\x3E\x74\xC0\x7A\xE0\x29\x96\x6C\xA8\x2D\x00\xCF\x75\x4D\xC5\x70\xBC\x7B\x4F\x67\x23\xC5\x3E\x5F\xB1\xC2\x80\xFB\x57\xE4\x56\xF4\x3F\xAA\x13\xFA\x2D\x68\xDC\x98\xBA\x5D\x37\xC5\x60\x8C\x85\x4E\x85\x0E\x51\x68\xA3\x36\xCA\x70\x0D\x65\xB7\xC5\x56\xFD\x3E\x32\x1B\x03\x69\xE2\x9C\x45\x0E\xC2\x95\x89\x1B\x51\xF9\x1A\x13\xF7\x08\x10\xEF\x9A\xBB\x1A\xC3\x17\xC8\x09\x83\xF5\x64\x0B\x55\x1D\x58\x6F\x37\x81\xC4\xDD\x99\xBC\x22\x47\xD6\x68\x42\xB4\x9E\x7C\xD6\x2D\x4D\x44\x64\x76\x01\x57\x6E\xA0\x32\x72\xD4\x17\xB8\x7F\x2E\x04\x6F\xB7\x76\xE6\x22\x95\xCB\xD3\x7C\xEC\x03\xF0\xEC\x76\xB3\xA6\xC1\xEA\x26\x24\x12\x63\x69\xC8\x43\x37\x69\x8F\xE6\xB0\x77\x52\x62\x58\xCD\x01\x18\x4E\xC6\x6C\x8F\xF4\x72\x99\x21\xAB\x89\xA6\x47\x68\x2B\x6C\x01\xAA\x11\x9E\xAF\x93\x68\xBA\x12\xFC\x12\x2A\xD6\x6D\xE9\xD0\x8A\xBF\x8B\x2D\x13\x67\xDC\x96\x83\x07\x8C\x63\x4A\x08\xDE\x36\x70\x0E\xDD\x06\x86\x38\xFE\x54\x14\x0D\x25\xC2\x87\xB7\xA4\x61\x9D\xB2\x02\x09\xE7\x23\x52\xD5\x1C\x7E\x54\x15\x71\xBE\x50\x8F\x7E\xCC\x77\xAF\xF3\x76\x8B\x6E\x1A\x1C\xB9\x56\x0B\x47\x53\x41\x57\x6B\x77\xDF\xFF\x6A\x1A\x3E\x21\x98\xA3\x94\xEB\x36\x2D\x4E\x4B\xB5\x62\x94\xC2\x35\x67\xCE\xA5\xE0\xA0\x62\x97\x59\xEF\x02\x2C\xD5\x99\xCC\x63\xB9\x2D\xC8\xFD\xB8\xE6\x4C\x49\x3F\x4F\x1D\xF1\x27\x2E\xA3\x25\x80\x6C\x06\x77\x72\x10\xED\xDA\xE1\x10\x8D\x97\x6D\x93\xEE\xAD\x23\x78\xD7\x6B\x23\x6B\x57\x53\x33\x92\xA5\x02\xA2\xC3\xFB\xA4\xCB\xC7\xFD\xC7\xE5\x46\x04\xDC\x53\x6C\xD1\xFA\x5C\x59\x16\x9C\x89\xB2\xBC\x0C\x53\x69\xEE\x03\xBF\x30\x28\x8A\x34\x86\x6E\x0E\x52\xAB\x9E\x05\xC7\x72\x1C\x5B\x2C\x34\x2F\xE4\x26\xF3\xE4\x56\xDF\x18\x91\xAE\xCB\x4B\xEF\x60\x68\x16\x9C\x74\x8C\x71\xEB\xA8\x7B\x6C\xEE\x60\x1C\xB9\x0C\x55\xA8\xFF\xB3\xF5\xB3\x7E\x87\x22\x33\x13\xA0\x99\x5A\xC6\x05\xBF\x3F\xDA\x47\x12\xC7\xF0\x88\x9A\xF4\x81\x26\x48\x62\xB4\xD8\x9D\x67\x85\x08\x10\xCF\x83\x72\xFC\x2D\xEA\x1E\xAB\xCF\x72\x71\x81\x71\x6D\x6F\x3A\xAF\xD3\x44\xF7\x61\x53\xA2\xCC\x9C\x4D\x5C\x9E\x8C\x2E\xE8\x7C\x9E\x1D\x2F\x26\x7C\x10\x8B\x7C\x91\x55\xA2\x41\xE8\x82\x2A\x2A\xCE\x31\x87\x23\xE3\x39\xC1\x07\xA5\x4C\xCC\xB2\x3F\xF1\xB8\xD4\xED\xBC\x57\x41\x13\xA0\x68\x89\x60\x93\x9E\xD8\x0B\x68\x72\xA6\xC8\x4C\xCD\x33\xE5\x81\x12\xDF\x80\xFA\x86\xB4\x04\xF7\xBF\xE1\x3E\x33\x33\x4F\x74\x06\xD8\x9B\xB6\x37\x19\x73\xD1\x4B\xDA\x84\x97\x81\x63\xBB\x1C\x89\xCF\xAA\x26\x4D\xEB\x8C\xC9\x92\x55\xDB\x13\xB4\x70\x2E\xAF\x6C\xFE\xF4\x8F\xC6\xCA\x9B\xC4\x06\x4A\x53\xD3\x19\xF0\xAC\xAA\x3C\xC0\xC8\x12\xD6\x84\x7E\xE7\x6C\xE1\xDD\x2A\x0A\xF7\xC7\xED\x0F\x3E\x9F\x06\xB4\x56\xFE\x6E\x16\xFF\xAA\xCF\x1B\x8F\xA9\xB5\x3E\x20\xCD\x81\x8A\xB7\xB6\xF3\x40\x13\x77\xD8\xBB\xB2\xB5\xF3\xE0\x91\xE7\xA5\xA5\xDA\xBE\x19\x8D\x3E\x53\xE1\x8A\x2C\x61\xCF\xA4\x1E\x30\xDE\x48\x51\x0E\xD3\xE5\xBD\x2D\xE9\x95\xF8\x35\xBB\xCB\x47\x97\x45\x1E\x0A\xA0\xE9\xF1\xF2\x6A\x87\x84\x64\x1D\xE5\x22\x11\x34\x6B\x6E\x54\x50\xE7\x87\x12\xE2\x45\xB2\xFD\x1C\x6B\x89\x82\x13\x58\xA9\x91\x6B\xE2\x9D\xCF\x5B\xA3\x6B\x1B\xDD\x97\x5A\xA6\x6F\x89\x18\xC2\x43\xD7\x5D\x3A\x64\xA9\xF0\x78\xCC\xD2\x4E\xBB\xFF\x8D\xD7\x42\xA8\x16\x98\xF1\xB9\x19\x42\x81\xEE\x82\x11\x2C\x56\xC3\xA4\x2E\xB7\x74\xE6\xB5\xF1\xB8\x6A\x96\x35\xDE\x9F\x08\xF3\x0B\x10\xA0\xD6\xA0\x4D\x59\x0E\x86\xB2\x4D\x6A\x68\xCF\x3D\x98\x7A\xED\x1B\xC7\x3A\x8B\xA0\x47\x05\x30\xB2\xFB\x05\xF6\xB6\x79\xD9\xF4\xD2\x64\x52\x41\x56\x1E\x9A\x8A\x62\x92\xAF\xFE\xA7\x35\xD6\x3C\xC2\x09\x49\x82\x11\xB2\x8D\xFD\x36\xF7\x80\x46\xFE\x7C\xF8\x04\x52\x54\xF7\xED\xD2\xFB\x0F\xB2\x7A\x72\x3E\x50\x81\x15\x23\x74\xD2\xE5\x51\x01\xDE\x71\xCE\x09\x03\xC8\xD2\x09\xAF\x96\xE0\x0F\x9C\x51\x73\xF1\x83\xFE\xE3\xF8\xAC\xBA\x97\xEE\xD5\x91\x00\x5B\x46\xE6\x48\x02\xF3\xAC\xBF\x09\xC1\xE7\x9A\xC9\xF9\x57\x22\x6F\x7A\xFD\x5A\x74\x8D\xB0\x4F\xF1\xF4\x32\x87\x95\x19\x80\xDB\xA1\xD1\x45\x94\x55\x48\xC0\x46\xBF\x08\xE8\x95\x68\xD4\x02\x57\xD3\x69\x93\x91\x47\x28\xAE\x21\xF0\x41\x7C\x64\x22\xFC\x5F\x17\x8E\x9D\x32\xCB\x52\x5E\xA9\xE9\xFB\xF6\x7C\x43\x02\xD6\xD9\xE3\xD7\xF9\xC6\xEC\xDA\x90\x83\x75\xC0\x5F\x41\x90\x68\x59\x4C\x89\xC5\x5D\xD3\x8D\xCD\x28\xFA\xFA\xF0\x91\x32\x7A\xFB\xDC\x5F\x6A\xEE\xE4\x05\xBA\x0F\xFF\x10\x17\xA9\x2F\x0A\x84\x2E\xCF\xE0\xE2\x4B\x0A\xF8\x49\xD3\x81\xAD\x68\x9C\x60\x44\xE6\xE2\x57\x74\x6E\xBD\x10\x2E\xD8\xCC\x54\x88\xB4\x4F\xC0\xC4\x3B\xFA\x60\x77\x81\x2B\x45\x24\x2C\x50\x94\x48\x23\x12\xA3\x71\x5F\x61\xA1\x53\x96\x98\xFB\x8C\x70\xD8\x07\x0B\x70\xBF\x15\x60\x1C\x56\x69\x44\x8F\xE7\xC0\x07\xDF\xC6\x6B\xDD\x8E\xBD\x42\x21\xD8\x33\x9B\x14\x8C\x21\x89\x61\x72\x13\x0A\x97\x43\x0E\xC6\x23\x9C\x0C\x05\xFD\xE1\x59\xD8\xCD\x98\x32\x21\xBB\x4C\xA2\x19\xF3\x9B\xE4\x6E\x82\x62\xAD\x99\x0A\x3E\x21\xE8\x7C\xE1\xE3\x40\xBF\x90\x51\x14\xF6\xAA\x44\xCF\x69\x87\xBF\xD2\x2B\xB9\x18\x4C\xC8\x1D\xD3\x55\x56\xA3\x8D\x44\xF8\x93\x4C\x7B\x09\xA1\xB9\xCE\xD6\xD9\x36\x05\x8E\x53\x0F\x6E\x6B\x2F\x64\x65\xFA\x88\x05\x0C\x95\x5A\xD1\x68\xE7\x3A\x3C\x31\x82\x7F\xF7\xD3\x79\x46\x7D\xB6\xDC\x95\x43\x09\xEA\x26\xEC\xBD\x85\x82\xCD\x2C\x2F\x0C\x6A\xA3\xDB\x1C\xF3\x0A\x01\x87\xBC\x14\x7F\x59\x8E\xD4\x8B\x6A\x3D\x24\x27\xAE\x34\x5F\xB0\x17\xF4\x49\xA6\x17\xA7\x0D\x16\xC7\x8E\xFB\x59\x6F\x6B\x1C\x16\xFB\x4B\xDA\xBB\x12\x32\x67\x2E\xEA\x74\x0F\x14\x48\x06\x6B\xFE\xA8\xB3\x39\xBF\x6F\x46\xF9\x35\x34\xE1\x55\xB9\xBC\x7F\x5D\xAE\x30\xA6\xA7\x00\xE0\xA6\x6E\x19\x41\xFB\x31\x29\x2F\xC9\xBA\x87\x17\x7D\xD8\x63\x77\xFF\x70\x5C\x6B\x60\x3D\xAD\x62\xCF\x8A\x0E\x3A\x7A\x54\xA8\x54\x80\x3A\xE5\x47\x43\xCA\xA1\x1B\x3B\x4A\x2C\x0E\xA1\x6F\x51\xFA\xB3\x53\x08\xE4\xD5\x77\x7B\xD3\x13\x3C\x5E\xBD\xBF\xA2\x99\x3B\x0C\x0F\xCF\xB9\x56\x09\x80\x63\x83\xF6\x0D\xFA\x42\x57\x83\x02\xE4\x85\xAB\x35\xA6\x96\xAF\x60\x7C\xAE\x65\x76\x8F\x4F\x75\x84\x70\x91\xBD\xF0\x58\x2A\xF1\xC5\x2A\x53\x9E\x1F\x98\x81\x08\x4F\xF6\x23\xF4\x23\x97\x3F\xC2\x3F\xB8\x05\x90\x95\xF2\xD7\x72\xF6\x77\x6E\x71\xA0\x8B\xAE\x47\x5F\x80\x07\x9E\x7E\x49\xB6\xB4\x66\xF3\x04\x80\xBE\x4A\xD4\xD0\x03\x7B\x65\x87\x33\xE4\x81\x22\x97\x26\xF0\x91\x52\x6F\x35\xCE\x73\xB4\xA3\xA4\x13\xF2\x61\x8D\x2D\xE8\xC0\xD3\xEB\x0D\x2F\xC1\x9E\x43\x1B\x34\xF9\x3E\x80\xE2\x72\x6B\x46\xEA\x51\xFB\x4F\x42\xC0\x70\x95\x71\xE7\x13\x83\x2E\x34\xDF\x0E\x98\xDD\xE5\x72\xC7\xE0\xB6\x25\xD4\x74\x4E\x82\x25\x8C\x22\xA0\x2D\x32\x6E\x5E\xD1\x9F\xAE\xFE\x57\xD2\xA8\x9A\x14\xDA\xF9\x9D\x81\x2A\x98\x7C\xC2\xDB\xA9\x44\x4A\x8B\x47\x38\xBF\x2D\x19\x1A\x06\xCA\xCB\x23\x43\xB3\x7C\x57\x91\xE8\xA0\x27\xEE\x9A\x8C\x48\x5F\x57\xDC\x2D\xF6\xA6\xE6\x13\x54\x5B\xB7\x16\xF5\x2F\xEB\x15\x39\x54\xEE\x82\x10\x51\xB0\x3C\x3F\x95\x03\x26\x2D\x97\x3F\xED\x5B\x58\x86\x5E\x5A\xBC\x19\x0D\x76\x01\x0E\x88\xE6\x38\xEC\x65\x79\xA7\x00\x7A\xBD\x4C\xD5\x85\xE3\xCB\x7A\x09\x30\x5A\xD5\x04\x49\x69\x73\x9B\xD4\xA4\x62\x84\x31\xA7\x73\xE3\xA1\x5D\x0F\x0B\xBD\x47\x6C\xF9\x36\xC9\x09\xFD\x40\xE7\x8A\x8E\x84\xD9\x4D\xC6\xA1\x6B\x18\xBF\x24\xF5\xCC\x67\x1E\xDD\xD8\x48\xD8\x67\xED\x61\x41\xAA\x47\xC7\xD4\x7E\xDD\x7F\x08\xB0\x5D\x61\xDA\x1F\xDD\x81\xC8\x3F\x61\x22\x06\xF4\xAD\x35\x59\x04\xBA\x95\x0A\x7E\x6D\x52\x3D\xBF\xBA\x89\xF9\x0E\xB9\xC5\x35\x5F\xDE\x37\xEA\xF7\xF0\xA9\xA9\x80\x30\x06\x36\x05\xD4\x03\x7F\x54\x8D\xED\x16\x28\x94\xB2\x39\x52\x11\xB5\xBD\xAC\xF2\x6C\x11\x9D\x31\x5B\xB4\xBB\x31\xDB\xCC\x73\x72\xFD\x8C\x8A\x3A\xE1\xD4\x77\x23\x67\x58\x02\x95\xA8\x26\x5C\x7A\x6A\x01\x98\xA1\xD0\x26\xD2\x60\xBF\x1B\xA0\x66\xDD\x67\xE4\x06\x60\xB2\x7C\x5A\xF7\xBD\x94\x81\xB3\x3C\xAC\x95\x20\xAA\x42\x73\x1E\x25\xB9\x91\x82\x61\x3E\x89\x53\xE7\xCE\x66\x42\xD1\xBA\x41\xE0\xE9\x7C\x6F\xEE\x8C\xF3\x2A\xFD\x37\x8E\x47\xF8\xBE\x63\x18\xA5\x71\x76\x12\xCF\x79\x4A\x5C\xFE\x86\x69\xF3\xF2\xA2\x0F\xEA\x2C\xD6\xCD\x70\x81\x77\x19\xF6\x11\x51\xBE\xDC\x9B\x35\x5C\xE7\x57\xF3\xAC\x89\x25\x2A\x77\xD3\x84\x2D\x7A\x52\x27\x2F\x18\xBE\x9E\x15\xF7\x59\xAD\xED\xA6\x4D\xD6\x91\x37\xBB\x15\x7A\x0B\xA0\x8B\x52\x73\xF3\x7D\x22\xFE\xF8\x3F\x65\x8B\x1E\x8A\x80\xEE\x41\xF9\xE4\x5D\x73\x0F\x44\x10\x40\xE8\x6D\x9B\xA8\xE2\x3A\x50\x5B\x28\x4A\xCB\xC2\x55\xE4\x4F\xE5\x33\xE9\x1E\x82\x3E\x80\xD9\x39\x8D\x41\x2F\xBA\x75\xFB\x91\xAB\xE3\xBF\xC2\x86\x4B\xE0\xEA\x96\x61\x96\xA9\x0B\x71\xCA\x73\x0C\x12\xAB\xC7\xAB\x69\xC9\x74\xD8\x5B\x94\x3B\xB3\x9F\xF3\xBB\xE6\xCA\x5F\x0A\xEA\x9E\x98\x64\xE5\x72\x89\x11\x82\xA4\x7E\x86\xB0\xC5\x03\xC6\x1A\xD3\x97\xCE\xA0\x80\x0F\x56\xE2\x35\xE3\xBF\x55\x51\x80\x25\xFD\x8F\x99\x09\x8D\x70\x5B\xA7\x83\x18\xBE\xC5\x41\x5A\xB8\x60\x87\xC5\x50\xB7\x44\x5A\xD7\xA2\xCA\x55\xB6\xFE\x44\xD5\x9E\x57\xC2\xC1\x7B\x8E\x8C\xB0\xBB\x35\xCF\x9A\xFD\x2A\x6F\xF1\x08\xCC\xF1\x40\x12\x35\xC0\xE5\x70\x54\x8F\xBA\xB5\x9A\xE0\x5F\xA6\x8B\x63\x37\x00\x6B\xDF\x28\xA2\xD0\x0F\x06\x99\xB2\x18\x71\x7B\xA4\xF1\x7E\xB3\x1F\xE3\x19\xB9\x53\x39\x5B\x94\x83\x49\x25\x72\x78\x37\x16\x73\x9C\x55\xB7\x5D\x07\x05\x2B\x60\xBD\x5F\x98\x48\x09\xE7\xAB\xF1\x9D\x93\xA1\x3B\xBA\x86\x9F\x33\x8C\x11\x6A\x16\x8E\xF6\x13\x82\xB7\x8F\x79\x46\x0F\x23\xB6\xC0\x56\xD3\xD8\x33\x8B\x05\x3B\x83\x54\xFA\x58\x9E\x94\x3F\xDD\x61\x36\x25\x45\xD7\xC4\x14\xB3\x38\x81\xCB\x58\x76\x91\x90\x92\xC7\xB0\x90\x7E\x07\x6D\x9A\x8D\xDC\xEA\x78\x0E\xD9\xAC\x07\x21\xC4\x4D\xF8\x0E\x0C\x36\xE2\x10\xE5\x15\x69\x87\xCE\x68\x5B\x47\xDF\xF4\x99\x83\xA1\x02\xF0\x02\x10\x3A\xBA\x09\x72\xBD\x5F\x02\xFA\xA3\x5C\x80\xF3\x3F\x92\xA5\x9C\x9B\xB8\xFA\x1B\x2C\x4C\xE9\x5C\x36\x1C\xC5\x0B\x02\xF6\xD4\x6C\xFB\xFB\x38\x12\xCF\xC4\xCB\xFE\xA0\x59\x4E\xBD\x09\xA6\x2C\x26\xFA\x05\xA8\x88\xEE\xF1\xE9\x59\xE5\x61\x67\x2B\xBC\xB6\x08\xE3\xA7\xD7\x15\x33\x2D\x63\x2F\x4E\xB2\x13\xE7\x2C\x5F\x2E\x30\x04\xA0\x3E\x7F\xB5\x47\x4A\x02\x97\xE4\x63\x0D\xE0\xF8\x1E\x7E\x28\x8C\x9C\x94\x67\x96\xF3\x59\x2F\xD6\xAF\x31\x3A\xDD\x75\xBE\xD5\xAD\xEE\x73\xC4\x35\x89\x7A\x17\x61\x8D\x7D\x09\x3F\x0A\x1F\xB5\x96\x03\x2E\xE1\x24\x12\x04\x54\xFD\xD6\x40\x20\x79\x37\xF0\x18\x4E\x99\xF3\xD5\x51\x07\x63\xE8\x98\x3D\xEA\x3A\x36\xEC\x09\x21\x63\xD9\x95\x38\x54\x1D\x04\xD0\xFD\x56\xA5\xE0\x8D\x82\xAD\x78\xFA\xF9\x7C\x62\x59\x44\x21\x31\x82\xFF\x6E\x37\x27\x26\xF7\xC4\xE3\xDA\x23\x36\x29\x2A\x76\x10\x48\x7F\xE8\xE9\x76\xCF\x24\xFD\x4F\xA7\xC8\x7E\x5A\x19\x54\xB7\x8A\x7D\xF1\x3A\x41\x6D\x62\x69\x59\x8A\xF5\x0B\xB4\xE1\x32\x7B\x4B\x4A\xF4\xB2\xC6\xB2\xC9\xFD\x95\xB1\xAE\x9D\xA0\x2D\x83\xC8\x4B\x70\xD9\x8B\x0C\x0A\xB8\x81\x0C\x9F\x3A\x5E\x01\x0B\x59\xCC\x81\x6F\xDD\xB4\x89\x90\x35\x63\xDE\x37\xFF\xDA\x86\x5E\xA9\x47\x65\x20\x9F\x9E\xA5\xB5\x4B\x8A\xB1\xBE\x80\x17\x25\x6C\x52\xE2\x27\xAC\xA9\xCB\x26\x6B\xF2\x48\x5F\x98\x09\x2C\x96\x1F\xA1\xB4\xE4\xFF\xBD\xBC\xFB\x1A\xE9\x74\x9C\xEE\xCA\xAA\x38\x4B\x49\xA6\xCD\xA8\x42\x35\xB1\xC8\x54\x5B\x76\x46\x06\x87\xA6\xEB\x6C\xEB\x84\x55\x0F\xBB\x12\xBE\x6C\x8B\xC7\xB3\xF1\x09\x0D\xC2\x5A\x21\x15\xCC\x1B\x79\xAC\x4F\x55\xB5\x7C\x60\x90\xAC\x79\x5B\x09\x10\x0D\xBE\x6F\x4C\x46\x6B\x74\x74\x00\x9E\x1C\x7D\xA1\x85\x7A\xFA\xC0\xFE\x28\x94\x82\x92\xA1\xA4\x6C\x56\x88\xAB\xD3\x35\x73\x4A\xBA\xDA\x3A\x3B\xFA\xD0\x0A\x4D\x4D\x7E\x2B\x69\xD4\x83\xDD\xBB\xE0\x4D\x6C\x97\xAA\x85\x4B\x98\x44\x45\xB1\xCB\x98\xD1\x35\xD8\x55\x69\xE9\xEE\x24\xF3\xAA\x5F\xCB\xFE\x05\xFF\xE3\xC3\x11\xE9\x30\xAB\x05\xD7\x11\x12\xC1\xC9\xE4\xF7\x8D\x07\x15\x45\x30\x28\x51\xE1\x71\x02\x64\xAF\xB3\x7D\x2D\x4E\x2D\x2B\xFA\x94\x81\xBA\xE2\xA4\xCE\xCF\x1E\xFC\x06\xBD\x53\xA5\xA2\x4E\xE0\x28\x6A\x8A\xCA\xFA\x2C\xAD\xCE\x1C\xB1\xE7\xD7\xCD\xCF\x11\x3E\xD2\xB8\xCD\xDF\x18\x97\x83\x06\x52\xC7\xA9\xA8\x2E\x3B\x61\xA8\xD5\x52\x10\xB6\x08\xAA\xBC\xE0\x09\x7C\x80\x1C\xD2\xC6\x90\x82\xF3\x84\x24\x39\x9D\xE2\xBA\xA0\xE8\xBF\xF5\x4B\x77\xEF\x49\xAF\xC0\x5E\x4F\xA0\x7C\x7C\x76\x28\x68\xBA\x21\x87\x8C\x96\x48\x2B\x88\x5C\x00\x0B\x15\x2B\x73\x5A\xB8\x0E\xA6\x81\x3E\xF9\xEE\x47\xF6\xAD\x51\x71\xF6\x4A\xED\x82\x6F\xEC\x62\x0E\x1E\x40\x5A\x86\x07\xBD\x4A\x8D\x2A\x8E\x75\xE0\x3B\x38\xD3\x64\x21\x6D\x73\xBC\x44\xDE\xE5\x61\x63\xF6\x7D\xEC\x5C\x86\xF4\x22\xCB\x38\xB1\xB9\x4E\x9E\x6A\xB2\x47\xED\x48\x8B\xA2\x5E\xCD\x3E\x11\xE9\x95\x86\xD4\x74\x4B\x18\x07\xB2\xB2\xBD\x1E\x93\xDE\xFC\x09\x2F\x02\x1A\x30\xB6\x81\x3F\x85\xCE\xD7\x94\x62\x9A\x4E\x5D\xC2\x75\x7C\xDC\x77\x27\x80\xEC\xC5\x7F\x7D\x06\xE4\xDE\x82\x90\x2A\xA9\x0F\xCE\x42\x71\xBA\xBC\x08\x63\x22\xFB\x3C\x76\x1E\x58\xE0\xED\x74\x89\x1B\x88\x2F\x83\x23\x3F\xED\xBB\x52\x8A\x22\xD6\x1E\xE9\x67\xB2\x86\x15\xFA\x74\x23\x0C\x30\x92\x52\xD2\x7B\xE9\x38\x51\x90\xA7\xF0\x8B\x76\x1B\xEC\xD6\x25\x38\xD9\x72\x8E\x2D\x87\x2A\xA9\xEC\x41\xD1\xEB\xD3\x22\x39\x88\x8A\xFF\x0C\x43\xDA\x58\xD4\x9F\x52\x7A\xA4\x6B\xC3\x6F\xBC\xBF\x4D\xD3\x3A\xE0\x1B\x2E\x39\xFC\x1B\xD5\x23\x19\x96\x98\x47\xB5\x89\x45\x93\x75\xA8\xB0\x5F\x2C\x2C\x58\x73\xD7\x2B\x30\x19\xD3\x2C\xEB\xBB\x42\x00\x36\xCD\xC6\xC9\xD3\xCD\x93\x45\x26\x9D\xEB\xF3\xAC\x68\x30\xAA\x61\x9A\x00\xE8\x83\x3E\xBE\x42\xEE\x87\x46\xDA\xB3\xE1\x0E\x7B\x35\xC2\xD2\x2A\x39\x3B\x8B\x13\x70\x04\xCA\xD0\x40\x29\x39\x25\x8E\xF6\x07\x24\x67\xCF\x89\x20\x08\xE0\xA3\x21\x96\x72\x39\x15\x65\xDA\xCA\x8F\x87\x41\x26\x80\x3F\x48\x88\xB9\x40\x14\x1C\xC1\x18\xC2\x05\x17\xCA\x16\xC3\x58\x85\x02\x46\x0B\xDE\x01\x12\x09\xE4\x39\x2F\xB5\x61\x94\x7D\x9C\x3A\x2A\x74\x9B\x65\xB0\x3E\xB5\x56\x79\xAC\xA8\xE3\x02\x04\x59\x3F\x00\x66\x85\x86\x3C\x73\xEE\x69\x66\x8E\x66\xCA\xA6\xA9\x98\x5B\x76\xDB\xFD\x19\xF3\x8D\xF9\xF2\xD9\x64\xAC\xF4\xA5\x1B\xBD\x41\x07\x9D\xCF\x51\xE4\xCD\xFD\x6C\x7E\xB3\x2E\x99\xFE\xAE\x2F\x1B\x77\x3F\x92\xF4\x6B\xE2\x3D\x88\x4A\x6F\x5D\x49\xD6\x58\xED\x48\x0A\x97\xA0\x1D\x19\xD6\x00\x23\xA2\xF2\xE9\x1C\xA2\xCC\x1C\x9B\xC4\x52\x19\xD7\x45\xFC\x4E\xDA\x38\x81\x03\x63\xDB\xD0\xF4\xFF\xEF\xD3\x14\x71\xFD\x73\x0A\x25\xC7\x48\x3F\x11\xE5\x00\x10\xAF\xB8\x0D\x6B\xF5\x41\xC8\x36\xDE\x86\xB7\xE4\x10\x2F\x72\x20\x62\x56\x30\x0E\x21\x9A\x6C\x63\x48\xEB\xBC\xB8\x34\x93\x2C\x6B\x55\xA3\x2C\x5B\x9C\xA3\xB9\xDA\x36\xC0\x3C\x33\x7C\x3D\xC9\x13\x96\x4B\xA4\x5B\x30\x4A\x54\xF6\x45\xBF\x37\x9E\x06\x00\xDF\xAA\x39\x87\xBD\x1F\x94\xBC\x90\x52\x54\x6A\x0D\x51\x5E\x06\x6D\x13\xA8\xCA\x1A\x05\x68\x48\x03\xB5\x7E\x89\x94\xE8\xE8\x4C\x00\xD8\xF7\x32\x5D\xD0\x5C\x0A\x40\x4D\xD0\x92\x76\x95\x4B\xDC\xF4\x0B\x00\xF8\xFB\xDB\xAD\x40\xFC\xC7\x9F\xA1\x4C\x5F\x5D\xDF\x1D\xD7\xD4\xFE\x12\x83\xCF\x80\x78\x2E\x0B\xA8\xBE\x04\xCA\x16\xAC\x9A\x90\x69\x71\x28\xEB\x05\xE3\xA9\xF3\x72\x37\x0B\x38\xC1\xF0\x76\x4C\x4B\x43\x17\x3B\xEC\x86\xE1\xAB\x27\x63\xBB\x4A\xF5\xCC\xD8\x6D\x81\xF3\xFF\x68\xB6\x54\x52\x2B\x6D\xA8\x7A\x8E\x72\x08\x35\xF1\x4F\x56\xA7\x78\x03\x24\x92\xC8\x10\x35\xD3\x09\x45\xAF\x46\xC4\x61\x3B\xA2\xCB\xEF\xE4\xD2\x1B\xE5\x8E\xEB\x7F\x97\x69\x05\x3B\x22\x7E\x52\x71\x75\x72\xB5\x83\xE4\x27\xA4\x60\xE8\x3B\xEF\x60\x53\x6A\xB8\xF9\xD6\x22\x31\xCC\xA2\xF0\x77\x15\x2B\xBE\x99\x42\x64\x30\x1E\x6E\x93\x2F\x17\x35\x56\x9E\x5A\xE9\x59\x10\xDB\x9E\x19\x90\x63\x52\x23\x7A\x96\x37\x46\x45\x20\x83\xC8\x3D\x85\x35\x3F\xA0\x12\x3B\x26\xB3\xE1\xA9\x61\xBC\x2D\x21\x11\xA3\x1A\x33\xC9\x27\x1E\x5F\xFF\xDF\xCC\x02\x4E\x9D\x7C\xCC\xB5\x91\xE4\x9F\x63\x39\x9F\x9B\x13\x59\x51\x89\xF6\x16\xDB\x07\xD4\xFB\xF7\xA6\x36\x1B\xA6\x2F\x15\x86\x06\x5D\xA1\x4F\xB9\xE9\x6D\x45\xEC\x24\x51\xFA\xBC\x3D\xFC\xA6\x85\xEA\xA2\xF7\x5D\xCF\x69\x07\x6A\x9D\xAB\x86\x85\xB3\x04\xCD\xA0\x2F\x70\x79\x4F\x07\xE1\x01\x9B\x2C\x25\x50\xC3\xB4\xF8\xAA\xE6\xE3\xF9\x0D\x50\x17\x35\xC7\xC3\xF7\x7D\x2C\x86\x6F\x91\xBE\x49\x77\x10\x57\x3E\xE6\x93\x33\xD3\x02\x7A\x99\xF4\x46\x6A\x1B\xE2\x2A\x2C\x56\xB3\xD8\x56\x82\x49\x75\xF1\x29\xC4\x68\xFD\xFE\xEA\xD9\x01\x96\x46\x47\x5E\x4B\x31\xD9\xCB\xFB\x5E\x8C\xC6\x5F\xBD\x5C\xF1\x25\x61\x81\x3A\x64\x68\xB9\x1B\x1C\x0F\xBF\x24\x6A\x81\x1C\xF0\x81\x19\xA7\xF4\xAA\x20\xCE\xE5\x6E\xFA\xBC\x4F\x82\x82\x29\xF0\x2A\xEA\xEF\x8E\xEF\x0C\xD6\x63\x50\x44\xE4\xEF\xAB\xEC\x22\xC9\xCB\x79\xBE\x94\xB3\x6D\x5D\xCF\x61\xF2\x4F\xA3\xDE\x70\x76\x73\x74\xA3\x88\x87\x92\x07\x7C\xB4\x67\xD5\x41\xED\x89\xCC\x25\x20\x71\xE9\xEE\x5F\xBE\x9F\x04\xE0\x3A\xB5\x16\xF4\x74\x1A\x36\x5D\x7B\x4C\x17\x9F\x4A\xF5\x5A\x12\x02\xC6\xDB\x9C\x9D\x55\x03\x1A\x27\x54\x3D\x28\x24\x74\xCF\xB9\xFA\x88\x2D\x99\xAD\xF4\xDC\x07\xF0\xA6\x72\xC9\x92\x43\x93\xE0\x0D\xA2\xD8\x1A\x93\x4B\x76\x83\xA5\x53\x2A\xD9\x47\xFE\x88\xDD\xA4\x82\x87\xC5\xDD\x81\xD6\x8D\x4B\x38\x48\x87\x63\xC8\x0C\x61\x94\x05\x02\x7E\x40\xBF\x69\x57\x0C\x32\xC5\x87\x9A\x46\x04\x36\x0F\xC3\xBC\xC1\xD1\xCE\x78\xD7\x14\xCA\xCC\xAE\x74\xE2\xC0\x99\x3C\x77\x92\x6A\x30\xE2\x64\xED\x3A\x82\x5B\xA5\x30\x23\xF9\x8F\x38\xC9\x02\xF8\x76\x58\xFF\xD2\x1A\x0F\x70\xBA\xBD\xD4\x0E\x3D\x05\x84\xC2\x35\x32\x7C\x54\x2F\x0B\x06\x72\xED\x01\xDD\xA7\xC6\xC9\x00\xF5\x49\xF7\x45\x25\x31\xA8\x98\xB8\x5B\xBC\x44\x35\xF4\x04\x38\x68\x20\x05\x39\x54\x28\x84\x42\x5A\xD8\xC1\xD0\xED\xE2\x55\xA5\xEB\xA8\x3F\xE5\xD2\xEB\x1A\xA4\x88\x39\x18\xA1\x65\xDC\xD4\x24\xB8\xE8\x37\x53\x11\x99\x57\x87\x85\x05\x32\x71\x28\x1A\xBD\x65\x16\xAE\x66\xCA\xAF\x9A\x31\xCF\x51\xD1\x41\x4D\xC5\x6D\x62\x65\x3A\x83\x94\x11\xCC\xB0\xDA\xE7\x38\x52\x3E\xAD\x20\xA6\xBE\x84\xA3\x59\x38\x23\x0A\x5A\xAC\xB7\x29\x0C\x40\x4B\xEC\x0A\xFD\x74\x33\xD5\xF4\xF3\x87\xE5\xAF\xDC\x9E\x17\x10\xC1\xCE\x29\xAE\x6E\xE6\x93\x10\x1F\x81\xA7\x54\x79\xC5\x04\xF2\x90\x04\xF2\x50\x19\xBB\xD1\xBB\x75\x9D\x20\xCB\x7F\x11\x5C\xFC\x12\x00\xB2\x54\xE3\x6C\x2B\x69\xBE\xD9\x89\x00\x45\x75\x98\x8A\xF7\x68\xE5\xBD\x65\x96\x3A\x1B\xF7\x8D\xA5\x5F\xBB\xF9\xF8\x15\x11\x44\x4D\x80\x32\x64\x67\xA0\x96\x2B\xA5\x10\x15\xD7\xB0\x27\xFD\x67\x1E\xAD\x8A\xA4\x13\x3A\xCA\x53\xC9\x7F\x3D\x79\xC3\x1E\x4E\x0C\xF5\x78\xF4\xE1\x12\xD4\x12\xAA\xEE\xE9\x40\x36\x85\xA5\x4D\x09\xE4\x48\x1A\xD2\xE0\xDF\x1E\x7C\x35\xCC\xE5\x53\xBC\x6F\x4C\xD5\x83\x21\x37\x3E\xC4\xF4\xD7\x2E\xBE\xF6\xCE\x49\x22\xF1\x77\xA2\xB8\xB0\xB5\x83\x4A\x92\x01\xA7\xF8\x6F\x88\x08\x32\x78\xCF\x91\x7C\xD1\x77\x02\x66\xCE\x8A\x01\x8E\x49\x2F\x0D\x8F\xA0\xBA\xD2\x39\xF3\xE9\x14\x79\x30\xB4\x74\x28\xD5\x7C\x88\xCA\xC9\x1B\x9B\x3B\xC3\x83\xA4\xF6\x3F\xC9\x78\x65\xA7\xB4\x7B\x12\x32\xC8\xF8\xE8\x98\x77\x84\x33\x55\x57\x6C\xAB\xBE\x64\x22\x98\x69\xC9\xE8\xAE\xEB\xDC\xF7\xB1\x42\xFC\x08\xFA\x87\x9F\x0C\xD6\xD2\x3E\x7C\xB8\x39\xC7\xE1\xF3\x6A\xC6\x2B\x92\xDF\xBE\x21\x89\x8F\xFD\x48\xF0\xEA\xAD\x8D\xE4\xD3\x94\x80\x02\xA0\x16\xF9\xDC\x90\x74\x1D\xFF\x40\x88\x68\x6D\xE0\x24\xBC\x81\x2D\x48\xDF\x1E\xB1\x8A\xD0\x44\xE1\xE5\xF4\x18\xD2\x6A\xD5\xEE\x9A\xDC\x68\xE6\x31\xE9\x8F\xB0\x1D\x09\x24\xB5\x34\xC6\x7F\x0C\x02\x21\x96\xEF\x6A\xD1\x45\x90\xF3\x5D\x3D\xCE\x31\x24\xAF\xFB\x2D\x99\x35\xC6\x88\x16\xB1\x5C\xEF\xDC\x69\xDA\x8F\x3D\x69\x6A\xEA\xAA\x46\xA0\x1E\xA5\x73\x70\x15\x2B\x19\xE8\x56\xEB\xF9\x80\xB2\xA7\xED\x75\xF9\xD4\x6C\xE3\x18\x1F\x71\x32\xF4\xE1\x9B\xD5\xA8\x08\xF4\x03\x93\x62\xDC\xD5\x2B\x78\x0F\xF3\x49\x41\x26\x19\xF1\xD8\xD2\x0E\x90\xCF\xE8\x93\x6E\x76\x10\x80\x8F\xB9\x9E\x7E\x72\x8F\xB1\x32\x73\x25\x7E\x5D\xFF\x53\xF7\xE9\x00\xCD\xEA\x00\xFB\x10\x06\x12\x31\x4C\x33\xFF\x9E\x7A\x8B\xBF\xA2\xD2\xD8\x29\x10\xDA\xB0\x3D\x3A\x5A\x54\xEF\x31\x62\xF0\x2E\x87\x60\x74\x90\xF4\xB9\xF6\x80\xAA\x18\xF1\x56\xED\xB7\x4D\xA9\x34\x5C\xFA\x9C\x60\x85\xB7\x86\x30\x67\xC9\x38\x62\x9E\x1C\x26\xD8\xD4\xD2\x5D\x03\x98\xB8\xE0\x24\x2D\x61\xBA\xB7\xE8\x7B\x84\x7C\x70\x7F\xDC\x8C\xA8\x38\x72\x5C\xC4\xE2\xE3\x58\x98\xEE\x88\x2B\xAF\x9D\xBE\x88\x71\x6E\x98\xAA\x41\x94\xB2\x25\x85\x79\x17\xCE\x73\xA5\x52\x19\xBB\x56\xEF\xD5\x5D\x68\xB9\xCA\x32\x84\x3E\xF4\x9A\xDA\xC7\x2C\x54\xA2\xD5\x26\x79\xA0\x63\xCC\x9A\x82\xA9\xB0\x42\x7D\x6D\x24\x69\x27\xFB\xBC\xDB\x45\x97\x21\xE6\xE3\x80\x4E\x18\x74\x88\xDF\x54\x74\x47\x01\x17\x7B\x3F\xA8\xC7\xA5\xAC\x62\xB4\xA1\x7F\xAD\x32\x19\x0E\xEF\x15\x1D\x83\xBB\xFC\xAD\x80\xD5\x02\x7C\x98\xBE\x70\xBE\xA6\x32\xDB\xE1\x78\x0E\xBC\x0F\xFC\x52\x8D\xB0\xA8\x18\xA6\x1D\xC4\xC8\x2E\x2A\xCD\xA6\x65\x1C\xB0\xC6\x20\x9A\x21\x2B\xA0\x7B\x18\x17\x0A\x9D\xF7\xB5\x11\x95\x6D\xDF\x3B\x39\x0D\x7F\xE9\xC7\x58\x61\xBA\x95\x28\xAD\xCE\x45\x40\x32\xB2\xD7\x64\x52\x6B\x9F\xA2\x01\xE9\x48\x0E\xA2\xA8\xCC\x55\x03\x3C\xCB\x37\x98\x12\x7C\xD8\x66\xC7\x7E\xE9\x68\x41\x18\xB0\x4C\xBD\x87\x90\xFE\x5D\x94\x1E\xC6\x8B\xAD\x1D\xD5\x85\x86\x7A\x59\x10\x22\x15\x64\x1E\x79\xFD\x03\x4C\x7A\xFA\xF3\x01\xE4\xD0\x9B\x05\xED\xE5\x6A\xEA\x1B\x7A\x9D\x0B\x7E\xDB\x43\x48\x84\xB1\x53\x8A\xD8\x28\x6A\x3E\x76\x23\xAB\x59\x8C\x0B\xC3\xE8\x14\x2A\x42\x2E\x96\xBC\x5B\xD7\x43\xFD\x26\xF9\x9C\xA4\x6D\x49\x85\x92\x0D\xB2\xD0\x38\x1A\x0B\xD9\xBD\xD8\xC0\x9B\x23\x04\x2E\x39\xF2\x25\x11\x42\xA2\xF8\x80\xA9\xC7\xF6\x1D\x61\xED\xB4\xFC\xEF\xE4\x57\x19\x11\x04\xC1\x3F\x5D\x26\x96\x7B\xC8\xF5\xFB\xD3\x90\x26\x38\x58\x96\xB7\xBB\x08\xBB\xCF\xB0\xBB\xB3\xD4\xCD\x19\x58\x98\xB6\x05\x9A\x4B\x32\x6F\x24\x0E\x92\x6A\xC8\x58\x0F\x47\x51\xEE\xB8\xB3\xCF\x70\xF8\x6F\x61\x89\x96\xC1\x30\xF6\x20\x49\x54\x67\x78\x9F\xE5\x91\xA9\xBD\x2F\xF3\xB6\xC7\x99\xB7\x8D\x00\x29\xB4\x83\xD6\x37\x52\x4F\x7F\x4C\x92\x00\xED\xA5\xBF\x9E\x6B\x49\xBD\xDF\x8E\x86\x2B\x12\x95\x76\x9E\x14\x5E\x24\x3A\x01\x71\x84\x85\xE1\xE7\x1A\x9E\x91\x44\xA2\x04\xD8\xBC\x50\x68\xB9\x4D\xC1\xB8\x1D\xBC\x0A\xE7\xFA\x2C\xE8\x0A\x9F\x39\x91\x0A\xC2\xBB\xF6\xDC\x73\x72\x83\x47\xF0\xEA\xE1\x2D\x1D\x1B\x1E\x6F\x75\xB9\xFB\xD3\x34\x72\x93\x15\xD8\x47\x51\x44\xF8\x68\x4F\xD6\x8F\x80\x41\x98\x8B\xDF\xFD\x2F\xE5\x00\x9E\x93\x9A\x92\x6F\xC2\xBE\x18\x19\x58\x61\xF4\x21\xD5\x28\x49\xFD\xE1\x1B\x4E\xBB\x98\xCC\x06\x7E\xA6\xFC\xC9\xBE\xEA\x1A\x87\x2D\x1F\xF7\x40\x1E\x90\xCA\x89\x07\x12\xDA\x92\x01\x25\x1A\xF3\x9C\x0D\x09\x9E\x25\x5F\x29\x9E\xD0\xC8\x4A\x1F\xCF\xCA\x37\xD7\x47\xE0\x0E\xA8\x52\x16\xB3\x89\xB9\x4D\x52\x28\x14\x94\x88\x3A\x11\xFA\x47\x37\x66\xB1\xAB\xF5\xC5\xD2\x17\x5D\xD9\x32\x16\x7E\x34\xB7\x5F\xFA\x92\x4F\x5C\x98\xA9\x3D\xF1\x07\x1D\x53\x98\x28\xED\x5A\xB7\x15\x18\xA0\x24\x84\x27\x14\xE5\x36\x37\xCF\x52\x51\x00\x33\x0C\x3B\x5A\xC4\xB3\x0A\x82\xE9\x99\x96\x2C\xB3\x84\x06\x4C\x7E\xAC\x09\x4B\x82\x07\xFD\x0C\xD4\x64\xBA\xBF\x7B\xBA\xCB\xAE\x63\x6D\x3E\xD3\xD3\x4C\x5C\xA2\xFF\x88\xDF\x2A\x4C\xC4\xEC\x7E\x3F\x12\xF6\x40\xB3\xA2\x69\xA7\x94\xC3\x4C\xFB\x89\x81\x0D\x99\x19\x00\x52\x22\x23\x13\x39\xEF\x0C\x50\xCE\x4E\x51\x63\x2F\xF4\x1D\x32\xAB\x92\xC5\xD8\x27\x97\xBF\x77\xD2\xD0\xBA\x60\x35\x3A\x98\x85\xC8\x3A\x4A\x22\x01\xA0\x17\x5B\x79\x05\x3A\x64\xC6\x5E\x6A\x9B\x71\xE9\x0D\x62\x03\xAD\xFF\x67\x74\x99\xBA\x22\xE0\x31\x48\x51\x0E\x4E\x86\x06\x44\x41\xB4\x9B\x9C\x25\x31\x69\xC8\x0D\xD2\x79\x87\xCE\x6B\x9C\x27\x53\xAC\x4A\x6F\x58\x5A\x94\x90\x07\x1A\xAE\x8C\x44\x55\x0D\xD3\x2E\xE3\xE0\x50\x7D\x37\xD3\xCA\x92\xE8\xCA\x05\xBB\xC6\x34\x3A\xB3\xB4\xB4\x66\xC5\xDA\x4E\x86\xCA\x7D\x6C\x6C\x12\x0E\x45\xD6\xF2\x2A\x0B\x20\xFE\xFC\xFA\xDA\x8B\x00\x93\x9B\x8C\xDE\x57\x99\x9B\xBB\xF2\xC2\x22\x3E\x80\x5B\x2B\x22\x3A\xD9\x04\x0D\xAA\x7F\x00\x8C\x1A\xE4\x7F\x03\x3D\x61\x84\xE8\x21\x71\xEB\xE7\x50\x53\xFC\x82\xD1\x81\x89\xD0\xBE\x52\x50\x6F\xA2\x5A\xCF\xB8\xD3\xE8\xBC\x34\x7B\x74\xE8\x16\x6C\xB5\xF3\xF1\xC8\x31\xE4\x5A\x61\x22\x5D\x23\x33\x5B\x49\x12\x99\x9E\x27\x68\x20\x59\x80\x79\xD4\x1F\xF0\x2E\x74\x8E\xB3\xD9\x5C\xB6\xD7\xCA\x99\x82\xED\xAF\x70\x99\x91\x09\x68\x7C\xAC\x0B\x93\x5A\xD3\x11\xC4\xDC\x63\xE5\xCD\x0F\x84\x5A\xE2\x81\x1E\xA8\x9D\x95\xB4\xE0\x3E\x7B\x5E\x98\x65\x84\x8A\xC5\x6A\xBF\x71\x20\x4A\xC3\xC2\x5B\x28\xD0\x2C\x07\xE7\xB6\x18\x3E\xDC\x96\xB6\x70\x7F\x87\x24\x32\xB2\x34\xAE\xEB\x13\x38\x01\x80\x6A\xA1\x14\xCC\xFD\x3F\x03\x07\xA1\xDE\x19\xFF\x17\xFB\x64\x4C\x4B\x7C\xBE\x4D\x75\x64\x71\x4F\xA1\x5B\xBD\x20\xAD\x42\x32\xBE\x97\x32\x4C\xBB\xF8\x7F\x07\x44\xE9\xA8\x49\x3E\xBA\x8A\x49\xC9\xC2\x71\x9B\x2D\x65\xE0\xFC\x9E\x66\xEC\x34\xCA\xB4\xC8\x13\xEB\x8E\xB9\xCC\x49\xF5\xA6\x1D\x4E\xB9\x04\x7C\x42\xD1\xB8\xCF\x3E\x26\x80\x0A\x74\x67\x32\xF0\xCF\xB2\x25\xED\xF2\xD6\xB3\x83\x46\xE8\x85\xB2\x20\x64\x40\x8F\x80\x85\x03\x4B\xE5\xFF\x04\xAB\xC9\xDA\xD8\x22\x64\xF9\xF9\xAA\x43\x30\x6F\xB5\x1E\x34\x8E\xE8\xF7\x39\xBB\x95\xC4\x64\x96\x11\xF5\xD1\xCB\xA0\x63\x06\x77\x49\x97\x05\xF7\x52\xD9\xFA\xE6\xBA\x4E\x5A\x0F\xCB\xBD\x90\x8C\x3C\xE5\xA6\x71\xC6\xBF\x87\x96\xDF\x39\x5A\xC8\x6E\xBD\x2E\x19\x54\x9D\x42\xE0\xE3\x45\xFE\x66\xF9\x3F\x4D\xFD\xBD\xE3\x61\x97\x70\x8E\x30\x9B\x3B\x35\xBE\xBD\x93\x92\x7B\x98\x49\x48\x0A\x5C\x28\x0E\x5C\x8F\x92\x58\x47\x05\x6A\x8C\x59\xD3\x0C\x37\x91\x0B\x34\x53\x86\x97\x44\xED\x9D\xE4\xC2\xD1\x72\x1C\xAC\x12\x73\x29\x31\xA5\xC8\x9D\xC0\x2E\x23\xE3\x15\x19\xB0\xDF\x2C\x68\x6F\x26\x39\xBB\xF6\x2E\xF0\xB1\xF0\xF8\x11\xEB\x1F\xB8\x16\x1F\x31\x6A\xDF\x99\x20\xDE\xB6\x4C\x60\x3C\x38\xB4\x4D\xDD\x8D\xD4\xC2\x6A\x76\x88\xE3\xDA\xBE\x9E\x47\x90\x61\xDB\xD5\x10\x8D\x8D\xAF\xA7\x25\x22\xF9\xAD\xB2\x8E\x8D\xB2\x0B\x00\x37\x80\xB4\x2F\x49\x73\x03\x85\x54\xFE\x47\x5A\xF7\xDC\x0D\xAD\x59\x23\x82\xDD\x69\xEE\xC8\x8E\xDF\x46\x06\x06\xB1\x0C\x71\xD2\xD5\x44\x2E\x81\x95\xB6\xDA\x4A\xC4\xC9\x49\x87\x6F\xD2\xD0\xB8\xA9\xC0\x71\xE2\x1B\xB9\x70\x0B\x62\x5A\x08\x48\xAD\x7A\xAA\xED\x69\x21\xDE\x36\x82\x2D\xCC\xE1\xCA\x94\x87\x4E\x86\x2A\x9C\xCC\xB2\x5A\xC2\x09\xDF\x7F\xD2\xFD\x20\x83\x90\x06\x88\x89\x9C\x8D\x82\x3F\x7C\xF2\x56\x3A\x83\xED\x2B\x76\xF2\xB0\x73\xE3\xC5\xDD\x94\x97\x8B\xFD\x12\x72\x49\x43\x3C\x9E\x15\x3B\x60\xF1\xA1\x22\xDB\x13\x7A\x6E\xEB\x23\xED\x3B\x0B\x25\x19\x1D\x9D\x21\x19\x14\x25\x3A\xD2\x0E\x34\x9B\x2C\x48\xC2\xEB\x4F\xDD\x7E\xEA\xB2\xB1\x25\xED\x5D\xFF\xBF\x14\x02\xAF\x11\x57\xE4\xEB\x98\x56\xD5\x08\xDA\x7B\x3A\xFF\x89\xD7\x11\x6C\xAB\xCB\x40\xF8\xFE\xD3\xD9\x50\x12\x92\xB2\x10\x60\xB1\x33\x84\xBA\xF1\x17\xAE\x0B\xEB\xB8\x43\x9B\x45\x10\x0E\x30\xA9\x23\x8F\x17\x1D\x48\xDC\x35\x82\x18\x46\x53\xA0\x41\xA4\xE8\x30\x9F\xBD\xB6\xCF\x9E\x66\x37\x21\xAB\xE6\xBC\xCD\x58\xF0\xDA\x1D\x9A\x2B\x71\xAD\xCA\xB9\xE3\x37\x54\x8D\xC8\x2F\xED\x4D\xCA\x86\x28\x4C\x86\x64\xFD\x0C\xC1\xC8\x6A\xF3\x81\x17\x1E\x75\x87\xE6\x7C\xB3\x20\x55\x53\x4D\xCC\x04\xC6\x86\x37\x14\x6D\xD7\xA3\x06\x89\x96\x3E\x68\x2D\x90\x61\x07\x50\x16\x46\xF4\x10\x92\xDD\xED\x6A\x3A\xA1\x35\x97\xE5\xC5\xDB\xDC\xF0\xA8\x40\x28\x05\x32\x22\x65\x97\x44\xAE\xA1\x88\x44\xFB\xAC\x1F\x5F\xD2\xBB\xEE\x99\x29\xBC\x40\x4A\xD6\xB1\x01\xD5\x8C\x2D\x3C\x46\xDC\x3B\x0C\x54\x99\xEA\xF0\x62\x5C\x2F\x93\x54\xDD\x1E\x0C\x8B\x5E\x55\x9F\x33\x73\x40\x9F\xFE\xEB\xF9\x14\x97\xA3\xCF\xAB\x7A\xBF\xEB\xE9\x15\xDD\x8B\xA8\x40\x53\xC0\xAE\x14\x7A\xA2\x7D\x8D\xDE\x98\x2C\xD0\xD3\x34\x9B\xA8\xB1\xDD\x6C\x02\x79\xF1\xEA\xE7\xE9\x4D\xAC\x36\x6D\x81\x99\x7B\xCD\x03\x02\x4E\x71\x6B\x64\x44\xC1\x27\xC4\xD3\x8A\x90\xB4\x1F\xDC\x39\x2A\x41\xED\xFF\x3D\x02\x7C\x83\xF1\xCE\xAA\xD8\xBB\x41\x65\x91\xE6\x29\x18\x1F\xAD\x1F\xE4\xBA\x39\xA2\x1F\x36\xBA\xCE\x52\xC4\x3B\xFB\xB7\x5A\x71\xDD\x8C\xA7\x7F\xB0\xE9\x77\x67\x43\xCD\x8A\x9A\x3B\x0D\x62\x93\x39\x6D\xAA\x25\x5B\xFD\x52\xE2\xB6\x9F\x98\xB2\xB6\xB2\x70\xDB\x7D\x4A\x14\x41\x02\x57\x62\x4C\xC4\x85\x41\xDF\xF2\x08\x16\x25\xD9\x37\xB3\x91\x49\x3C\x30\x3A\xF8\xDB\xF2\x0F\x84\xE7\x3C\x73\x6B\x02\x94\x2B\xC3\xC4\x6F\x61\xCA\xB7\x1B\x52\xCC\x69\xEB\xB6\x3E\x7F\x63\x4E\x76\x41\xD5\xD5\x4E\x6E\x3A\x98\xCC\x53\xB1\xC2\x1B\x53\x80\x1C\x17\xD5\x2F\xB1\x7E\x04\x3D\x3B\x22\xEE\xA2\x82\x59\x1A\x59\xF8\x81\x68\x0B\x6D\xAD\x53\xBB\x14\x5F\xA8\x22\x21\x92\xC0\xA1\x01\xD4\xE7\xF3\x18\x17\x03\xD3\x07\x2A\xC4\xAC\x1B\xC3\x22\x45\x05\x5B\x0C\x03\x98\xA6\x17\x22\x78\xF8\x20\x96\x1E\x09\xA3\x7E\x11\x7B\xB8\x1D\x8D\xAE\x8B\x4A\xBE\x69\xAB\x8C\xF8\x8B\x78\xC2\x7A\xB1\x1E\x96\xF0\x4D\xB0\x06\xDC\x41\xF6\x4C\x72\x83\x27\x14\xD2\xF2\xA0\x19\x39\x8F\x95\x39\x20\x82\x60\x09\x0E\xD4\x97\x5D\x1B\x7A\xFC\xF4\x95\x99\xD1\x71\xFD\x23\x06\x86\x79\xDC\x39\xEE\xA0\x31\x4C\xC8\x01\xEF\xB9\x82\x25\x39\x61\x18\x0C\x9C\xC8\x23\x5B\xB6\xE5\x42\x08\xBD\xF3\xB7\x93\x95\x9C\x26\x20\x7E\xB9\x4A\xC8\xFE\x84\xBA\x01\xA9\x54\x82\x8D\x15\x18\xCE\x55\x24\x71\xD4\xC8\x33\xF9\xAF\x1F\x72\xBE\xEC\x3F\x01\x08\x95\x6B\xBA\x1B\xED\xB5\xE2\x87\xFE\x3C\x79\x9E\x91\x9C\x2D\x2B\xE9\x40\x47\x09\x36\x62\xAC\xD5\x95\x14\x25\x54\xE9\x5A\x8D\x07\xA0\x3C\x46\x16\xC0\xAF\x2F\x1E\xE2\xB1\xD9\x94\xCF\x37\xD7\x08\xD8\xF3\x03\x91\x93\x6C\x1E\xE4\xE3\x77\xE8\x83\x89\x55\xD0\xD9\x90\x56\x5B\x68\x91\xC3\xEA\x5E\x7E\xBC\xDE\x38\x8C\x3F\x6E\x09\xC1\xFD\x5C\x9A\x84\xBC\x43\x66\x1E\xE3\x6B\x8A\x3F\x9E\xFD\x82\x63\x8C\xC7\x5C\xFB\x15\xDA\xB1\x96\x3C\xCC\x35\xE2\xE7\xA2\xE4\xFB\x33\xAC\x73\xFA\x1A\xBE\x6A\x7C\xA3\xFA\xCE\xB4\xBB\xAF\x28\x76\x75\xA7\xFD\xAC\xF1\x6C\x8F\x21\x3B\xF2\x9C\x9B\xDE\xD6\x90\x66\xDA\xA9\x00\xC2\x39\x3A\xFF\x74\xD2\xEC\x74\x07\x73\x9E\x4C\x24\xFF\xA4\xA9\x03\xD1\x1D\x84\x4B\x6B\xA3\x1B\x14\x53\x39\x1E\xE2\x92\x14\xC7\xA5\x3F\xFC\xA8\x74\x33\xFE\xEA\x02\x78\xF7\x6C\x38\xE2\xD1\xBA\x48\x3E\x77\x38\x26\xB2\x62\x9D\x79\x69\x28\x0E\xFE\x23\x23\x5E\xE1\x5D\x85\x87\xBF\x79\x52\x51\x8E\xBD\xFD\x6A\x3D\xAA\xB4\x0E\x65\x14\x36\xA5\xA1\xC8\x76\x65\x8C\x19\x1E\x59\x54\x8F\xC2\x0D\x03\x9A\xCF\xC2\x29\x0B\xBB\xC3\x81\x7F\x9B\xF6\x3B\x91\x16\xFE\x93\x7F\x1D\xF4\xB9\x35\x76\xA8\x20\x20\x73\x9D\x3D\xAD\xC1\xAD\x69\x8B\x5B\x68\xD3\x9A\x3E\x59\x38\x20\x0A\x1A\xC4\x51\xCA\x58\x66\x07\x60\x55\x1B\x6C\xA2\x9D\x6A\xBA\xE1\x3F\x63\x13\x37\x7B\x80\xC9\xEF\x08\x2C\x0E\x4C\xDE\x5D\xAD\x87\x26\x48\x05\x43\x3B\x1A\x8B\xE4\x4F\xB4\xF4\xA9\xF1\xB7\x5C\x4C\xF8\x28\x94\x4E\xA7\x62\xF2\x59\xEE\x45\x09\x83\xD1\x1B\xB2\x94\x08\x26\x70\x7D\xE4\xAA\xE2\xF3\x25\xEE\xC3\x29\xAB\x2F\xFE\xA1\xC9\x9F\x8A\x35\xDF\x3E\x55\x58\xBE\x89\x92\x17\xC4\x4B\x6C\xF6\xD9\x61\x4C\x15\x5D\x51\xC5\x72\x87\xB1\xCE\xC1\xDF\x24\x9F\x33\x91\x09\x9E\x03\x97\x50\x07\xD2\x33\x89\xAF\x1E\x83\xF9\x3F\xCE\x4D\x8B\x75\xAB\x62\x41\x86\xBD\x95\x1A\xA3\x42\x96\xC8\xAD\xB8\x66\x17\x0D\x9E\x5C\x89\x90\xE5\x82\x01\x68\x9C\xF3\xB9\x39\x23\xCA\x74\x2A\xCE\x3E\xAD\x23\x50\x68\x61\xAE\x20\x94\x94\xCA\xA6\xD6\xB0\x7D\x36\xAB\xFE\xD5\x5D\x7F\xF6\xC3\x7D\xCD\xB8\x50\x76\x4A\x8B\xAB\xAF\x3E\x3E\x5C\xEB\x25\xE7\xCD\xA8\x2C\x0A\xFA\x4D\xFF\x21\xE2\xDB\xBD\x5F\x98\xDB\x8D\xA9\xD2\x0C\x5F\xFD\xEE\x49\x1D\xC0\x6C\xF2\xD7\xE9\xFF\xF8\x1D\x03\x31\x5A\xD8\xC0\xAB\x85\x84\x44\x86\xA8\xD4\xD5\x8E\x72\x6C\x9F\x72\x32\x1B\xC4\x5F\xE9\xE4\xCA\x8C\x87\x03\x8D\x26\x17\x34\xEB\xA3\xCB\x9E\x41\x91\x45\x1C\x37\x92\x2F\xF3\x92\x4C\x0D\xA1\x21\x32\x46\x6F\x78\x43\xAD\x75\x52\xD5\x36\xEB\x65\x78\x36\x90\x47\x23\x61\x09\x9F\xE7\x99\x0C\xAA\x0C\xD7\x71\x3D\x3D\x84\x7B\x69\x81\xC2\xDB\x1A\xE8\x22\x0E\x4A\x07\x2C\x70\x9F\x7E\xD6\x47\x4F\xB1\x3D\x3F\x0C\xFC\x28\x5C\x3F\xF4\xF2\x6C\x42\x81\x8B\x2F\xBD\x3F\x46\xF5\xF6\xE9\xF7\xDB\x18\xAC\x2C\xBF\xD8\xD1\x09\x0C\xA5\xBF\x63\xFF\x0A\xA3\x4F\x93\x96\x0C\x67\x28\x9F\xFE\x83\x0D\x54\x22\x85\x2B\x26\x46\x22\x5B\x2F\x3F\xF5\x18\x6D\x8D\xBD\x43\x3F\x0F\x64\xBF\x66\xF4\x03\x89\x98\x40\xAA\x7A\x18\xA9\x03\x18\x64\xA6\x26\xA3\xBA\x3B\x55\x43\x07\x67\x8B\xB6\xD6\x37\x0D\xEA\xF0\xB0\x71\x75\x15\xD7\xC9\x13\x8C\x0A\xD8\x18\x89\xE2\x8A\x21\xC4\xD0\xED\x3E\x11\x2F\x01\xA2\x71\xDD\x5D\xA9\x62\xF2\x4B\x65\x24\x8D\xCC\xCB\x6E\x34\x90\xF5\xE7\xB5\x7F\xF4\x3B\x02\xF5\x83\xC1\xF8\xC3\xC0\x07\xFC\x80\x2D\x46\x24\x0F\x36\x65\x94\xAB\x17\x32\x51\xED\xAF\xB3\x68\xDB\xEF\x12\x3B\x46\x7D\x74\x7E\x22\x50\xA9\x72\x3C\xA3\x3D\x7C\x65\xA6\x3F\x5E\xD1\xD6\x6B\xA0\x9A\xC2\x74\x16\x3D\x74\x81\x90\xFB\x49\xFE\x9B\x6A\x58\xBD\xB7\x20\x12\xA1\x3F\x93\x42\x6A\x7E\xFE\x71\xCB\x7E\x62\xDD\xCE\xDC\xA2\x4D\x3E\x7C\x05\x2E\x25\x2B\x47\x44\xB8\x70\xD6\x7A\xEA\xBF\xB3\x9F\x63\xFD\xC8\x35\xDA\xA2\x6D\xC5\x4F\x08\xB4\xF0\x23\x6C\x9F\x55\x91\xF7\xD1\x2C\x9F\xEF\xBF\x6F\xA9\xCC\x92\x25\xA7\x91\x71\x4D\xA7\xD3\x16\x33\xDD\xE6\x4C\xED\x44\x64\x7C\xF2\xB9\x48\x5C\xD0\x8E\x64\xB6\xAD\x7A\xA2\x36\x0E\xD8\x69\x85\xC6\x8B\x18\x07\xBE\xDD\xC6\xA6\x22\x51\x56\x7F\x33\xF2\x00\x11\xEC\xCC\xD4\xB1\xC9\x9C\x09\x16\x7E\xD0\x91\xDB\xF1\x2E\x1B\xFF\x35\x3A\x88\x39\xBF\x84\xEE\x99\xE9\xA5\xF2\xE6\xFF\xB8\x04\x3D\x59\x70\xA3\xB2\xAA\xE9\xB2\x52\x92\x4F\x95\x58\x16\x69\x4A\xB5\x2B\xE7\xBE\x1E\x41\x55\xCC\x9A\xC1\x5B\x3E\x11\xB5\xE8\x38\x59\xF5\x14\x15\x72\x77\xFB\xC1\x0D\xB2\x05\x68\x9B\x69\x48\x38\x40\x45\xBF\x14\x01\x86\xA1\xAF\x80\x2B\x9A\xA1\x21\x6F\x0D\x70\x8C\xC1\xA4\x1F\xA2\xA4\x3C\x73\x63\x88\x13\xA9\xF3\xFA\xB9\xDC\xDD\xA8\xB4\x6B\x49\x6B\xF0\x49\xF3\xCE\x0D\x8C\xE0\xA1\x0A\x9F\xB6\xCC\x3D\x1F\xEA\xF6\x06\x27\x87\x2C\xE2\xC6\x57\x62\x1F\xC7\xD1\x09\x73\xEB\x62\xA6\x44\xBE\x92\xE0\xAC\x17\xF9\x6B\x27\x50\x03\x59\x60\x3D\x3C\x3E\x88\xD2\x26\x06\x42\x55\x33\x12\xEA\xB8\xF9\x5E\xB6\x97\x3E\x6D\x92\xC6\x58\x90\x46\x9F\x56\xDD\x75\x8A\x9E\xDF\x80\xFB\xF1\xBB\xBC\xAC\x98\x17\xA7\x41\x32\x4C\x26\x74\x87\xE1\xA4\xF4\x55\x52\xD8\x1D\x10\x96\x4C\xC0\x3C\xDE\x6C\xB3\x3E\x37\xC4\xF5\xAD\x51\x84\x8A\xDE\xB7\xC0\x8E\x86\x26\xA4\xC2\xC5\xE6\xD2\xB4\x15\x6B\x09\x5E\x0A\x42\xF3\x04\x8E\x5E\x7F\xDF\x08\xCC\x82\xA6\x79\xF3\x36\xC7\xBF\x92\x11\x2E\xE8\x76\x3B\xD0\x12\x06\x9F\xA2\x65\xB2\x6B\x9C\xBC\xAF\x57\x20\xEF\xA7\xA0\x53\x19\xFA\xFB\xA0\xC3\x3C\x4F\x25\x67\x89\xD4\xE5\x4B\x8F\xE1\xDE\x3D\xE8\x54\x69\xD1\x46\x05\x85\x5C\xC4\xFA\x01\xAE\x87\xBD\xE0\x6B\x46\xA6\xCF\x5F\xA7\x57\x9C\xA2\xC0\xB3\xA3\x73\x7C\x03\x98\xE5\xF7\x49\x16\x0D\xE9\xDF\x86\x16\xFE\xF2\x2B\x57\x91\xFA\x3D\xFE\xBB\xF8\x74\x71\x36\x84\xB1\xE4\x1F\xE0\x66\x30\x96\x18\x92\x54\x42\xE7\x4D\xF4\x3B\xF6\xAC\x80\x8A\xA1\xF1\x73\xC7\x79\x2B\xC2\x56\x1E\x00\xA2\xB2\x06\x91\xEA\x98\xE0\x52\xAB\xC7\x6F\x7D\xF6\xBD\x21\xBD\xA2\xD2\xBD\x0A\x41\xC3\x46\x28\x7D\xAD\x06\x72\xB5\xEA\x91\x24\xFA\x3D\x0D\xB5\xA5\x63\x77\x28\x2B\x41\x84\x10\x56\x82\x78\x3E\xDD\xF4\x7B\xAA\x44\x69\x49\x19\x45\x6C\x1F\x59\x95\xA0\xEF\x34\x43\x5F\xC7\x63\x1B\xE4\x63\xFD\x95\xAE\x9D\x2F\xD0\x0A\x87\x18\x65\xDB\xDC\xAD\x6D\x24\xB2\xD4\x79\x7A\x44\x43\x13\x60\x0D\x82\x88\x68\xAC\x57\x60\x6E\x5F\x1D\x53\xFA\x22\x39\xD9\xA6\x69\xA4\xF4\x47\x04\xF8\x11\x31\x0B\xE8\x88\xA9\xE0\x8E\x05\x16\x11\x9D\x7E\x7C\xBB\xD1\xEE\xB0\xCE\xC2\x86\xBC\xA2\x94\xA4\x6F\x9B\x2C\xBA\x61\xDA\xFA\x2F\x58\xC4\x18\xB2\xB9\x0E\xE7\x55\x58\x28\x2A\x35\xA0\xB1\xD0\xAF\x12\xA9\x74\x4E\xE7\x3F\x72\x95\x68\x7D\x87\x0F\x55\x1B\x1A\xA4\xC1\xAC\xC0\x49\xD5\x28\x4D\xE3\x58\xA3\x0F\xAB\x62\xD6\x6D\xCD\xB0\xAE\x26\xB6\x34\x9D\xE9\x29\x8B\x92\x30\x9F\x4F\xA6\x5A\x10\x0D\xBF\xEB\xF7\xCA\x3C\xD6\xD8\x2C\xED\xAB\x30\xED\x77\x8A\x35\x80\x09\x6D\x44\x9B\xA7\x1E\xEB\x97\x80\x0D\xD9\xCB\x13\x68\x89\x41\x18\x39\xEC\x7D\x30\xBF\x15\x3B\x9B\xB4\x45\x1E\x3C\xEA\x13\x26\x84\x2A\xE4\xE9\x03\x34\xAE\xA9\x1C\x70\x27\x87\x32\xD4\xFA\x66\xE7\x00\x2A\xAC\x1E\x16\x1C\x85\x8D\xF5\x50\x50\x57\x8B\x4B\xE3\x14\x0D\xA6\xB3\xDE\x8D\x8C\xBA\xF9\x68\x4A\x64\x4E\x78\x1F\xB4\x18\x4A\xDE\xFB\xAC\xE6\x72\xAB\x56\x04\xC9\xD5\x69\x6B\x77\x07\x96\xDE\xEF\x0C\x71\x24\x71\x9D\x94\xF6\xC5\xCE\x39\x09\x52\x9F\x8E\x4F\x3D\x64\xEB\x46\x45\xE6\xB7\x73\xEB\xF0\x05\x9B\x3B\xB3\xF9\x6F\x44\xF7\x6D\x21\x6A\x83\x6C\xF0\x5A\xB8\xF4\x1F\x6B\xD4\x7B\xF4\x93\xD0\xCE\x3B\xA7\xC2\x0C\xF3\x73\x58\xB7\x12\xFF\x49\x56\xFA\xBD\x3F\x5B\xCF\xCF\x42\xCF\x63\x71\x6D\x3B\x44\xC6\x9C\x7B\x49\x98\x7C\x49\xFA\xA7\x12\xE9\x1D\x24\xE3\x46\x48\x9D\x67\xC3\xC6\x2E\x94\x95\x9F\xC8\xC3\x3D\xCB\xFD\x37\xE3\x51\xE0\x7B\xDF\x7C\x9B\x90\x31\x06\xEA\xDB\xF1\xEE\x38\x22\x07\xD2\x65\xDF\x31\x7B\x5A\x21\x00\x1F\x94\xC6\xE4\x2C\x01\x0B\xB5\x2C\xB9\x3E\x15\x44\x8F\xB5\x42\x28\xC3\xB0\x9B\xD8\x94\x0D\x4C\xAE\xD7\x43\x16\x19\xAC\x6C\xD1\x1C\x2B\x5C\x07\x6C\xE0\x94\x76\x48\x6B\xC6\x10\x5B\x80\x12\x5B\xED\x0C\x1A\x2E\x8B\x1C\xFB\xBB\x79\x7A\x0E\xCF\x51\xF6\x7B\xF6\xA1\x26\xCF\x55\x10\xC8\xF3\xD7\x61\x68\x41\xAB\xBD\x58\x1A\x69\x87\xA1\x1D\x3E\x1C\x16\x0D\xD3\xF1\xB0\xB3\xFA\xCA\xDF\x02\x1A\x3E\x53\x77\x29\xDC\x21\x77\x91\x91\x19\x65\x78\xAF\x4E\x36\xD3\x12\x38\x3B\xE6\x17\x1E\x93\x08\xB8\x51\x0F\x21\x66\x18\xD9\x94\xDF\xDE\x9B\x7F\xB7\x6B\xB0\xEF\xAA\x52\x6D\x0F\xAC\x29\xBA\xDF\xA7\x3A\x36\x32\x5A\x69\x63\x68\xD1\xCD\x41\x92\xC4\xB3\x20\xFC\x3C\x61\x47\x17\x37\x1A\x37\x14\x02\x79\xF9\x01\xA7\xFE\xD6\xED\x29\x8F\xD3\xEA\x9E\x3D\x28\xB3\xD7\x7F\x74\x38\x54\xAD\x1E\xD8\x1D\xCA\x31\xAD\x92\xDC\xB5\x21\x02\x8F\xF5\xF2\x3B\x2E\x15\x89\x0E\xC9\x2E\x72\xEF\xE6\x48\x25\xD5\x47\xA0\x73\xF4\x58\xF9\xD8\x82\x22\xE3\x4B\xD5\xE8\xB0\x39\x2C\x1F\x9F\x7B\x42\x9A\xD5\x73\x7F\x12\xF2\xB4\x4E\x89\x77\x92\xD1\x67\xCF\x4B\x07\x89\x5B\x85\x15\x29\x4C\x66\xE0\x5F\xC5\xE3\x6E\x1E\x6A\x61\xA6\x8A\xF9\x2F\xE2\x6C\xD5\xEC\x7C\x2A\x8F\xCB\x52\x02\xF5\x11\xC1\x59\xF9\x1F\x50\x4F\xE7\x0F\x60\xEF\x77\x8C\x81\x4B\x41\xDF\x8D\x47\x20\x37\xCF\x09\xF7\x90\xB7\x7C\x7E\x26\x04\xB8\x3A\x62\xF5\xE5\x3A\x0E\xC8\x49\xF5\x18\xA2\x13\xED\x96\x8F\x17\x5B\xA8\x1B\x8D\xF4\xFB\x97\x7A\x76\xA2\x0B\xDB\x51\xBA\x37\xC7\x0E\xC9\x23\x84\x1E\xAA\x72\x8F\x5C\xA9\x28\x44\x42\xBA\x0D\xC5\x3F\x16\x8C\x4A\x81\xDC\x16\x67\xDE\x68\x87\xDB\x4E\xB4\xEE\x8B\x07\xB5\xD7\x6F\x26\xFF\xB7\xD3\xA8\x75\x80\xD7\x68\x88\x0D\x9D\x8E\xE9\x5F\x2E\xEF\x43\xA7\x8B\x42\xD6\x70\x03\xCC\xDE\xD1\xE1\x21\x80\xC6\xAA\xB5\x95\x82\xD0\xD9\x88\x49\x35\xBF\xC6\x22\xCA\xDF\x9E\x1D\xFF\x97\xCC\xDC\x53\x3F\xF4\x1E\x09\x4D\xE1\x56\x66\xC0\x89\x2D\x1E\xF5\x7D\x0B\x18\xDB\x04\x22\x06\x3B\x56\x19\x8B\xA6\x0B\x36\xFF\xAB\x66\xD1\xB7\x81\x0D\x27\x1B\xCE\xB1\x28\xCB\xAD\xB3\x5A\x0D\xEC\xEA\x97\x2D\x61\xD2\x0D\x0C\xB6\xDC\x3E\x97\xFA\x57\x9B\xF0\xF5\x5A\xFC\xC0\x1B\x01\xFC\x81\xF1\x60\x30\x11\x9B\x1C\x64\x53\xB1\xE8\xD9\xA5\x00\x33\x01\x6F\x40\xD9\xD9\x32\x4E\xE4\x85\x1A\xE9\x29\x92\x22\xA9\xB3\x0B\x6F\x09\x37\xBB\xC8\xF7\x60\x37\xCD\xFC\x2F\xA1\x6B\x6F\x8D\xAB\xB1\x0E\x66\xA2\x42\x2C\xCB\x1F\x0D\xF3\xF4\x70\x62\x23\x01\xA6\x51\xFE\x60\x7A\x92\xE9\x50\xC7\x86\x7E\x1C\x66\x61\x65\xBD\xE4\x6F\xAC\xA8\x4B\x09\x27\x3D\x02\xAA\x26\x22\xAA\xA0\x9E\xA5\x29\x5A\x95\xBF\x52\x25\x5A\x8E\x29\x3E\x2D\xA6\xA0\xA7\xAF\x68\x92\xAD\x63\x84\xDE\x4D\x15\x94\x8D\x06\xA7\xF7\xCE\xF9\xDA\xD7\x5C\x7D\x9C\x2F\x51\x6F\x79\xE2\x91\x65\xD9\xEB\xFF\x55\x02\x12\x03\x05\x53\x35\x86\x76\x6E\x0C\xD0\x68\x91\xF4\xAA\x1A\xED\x9F\x61\x52\xC7\xCB\x36\x9B\x22\xE8\x56\x3C\x50\xF4\x1C\x2A\x67\x4F\xF7\xF8\x81\x9B\xFC\xF3\x3D\x24\x5F\x92\x1C\x60\x2F\x7F\x69\xAC\xBA\xED\xBF\x88\x6E\xD0\x47\x27\x9A\xA2\x08\x84\x87\xF3\xF7\x2A\x50\x1C\xE4\x54\x53\xD1\xF6\x2E\x8A\xA5\x67\x6C\xD3\x25\x58\x56\x94\x43\x33\xF6\xA1\xCC\x5A\x6D\x06\x74\xC1\x16\x56\x6E\x2B\x35\xDE\x00\x50\x67\xAE\xE5\x5F\x9B\xAB\x45\xE6\x0F\xF8\x69\xB1\x52\x4C\x38\xF3\x06\xA4\x11\xE1\xCF\x74\xCB\x40\x0D\x35\x33\xD4\x48\x43\xC3\x43\x7F\xCA\xD9\x07\x70\x6C\x7E\xBF\xA1\xEB\x12\x3B\x9B\x59\x27\x78\xF5\x41\x61\x9F\xE8\x4B\x54\x2F\x1E\xFC\x9E\xE1\xAB\x63\x81\x4D\x37\xB2\xF7\xBD\x21\x92\x9F\x8E\x8E\x2D\xF3\xE4\x9B\x8D\xBA\x10\x0B\xEC\x05\xAB\x20\xAA\x9B\x2D\xE0\x6B\xE1\x0D\x20\x3C\xE9\x52\xA9\xA3\xF3\x5D\x9B\x57\xB7\x99\x1B\xCE\xE8\xF6\xEA\xCD\x9D\x72\xDC\x00\x9D\xED\x68\x3B\x85\xB0\x8F\x8E\x1D\x33\x8B\x2D\x2A\x53\x2E\x0C\x3C\x70\x6B\x4D\x59\x1F\x08\x11\x4E\xDC\xE0\xE9\x07\xCE\xE3\x5B\x04\x93\xCC\xB1\x4D\x49\x71\x51\x5A\xC5\xE7\x93\x4C\x1D\x48\x1A\x2F\x5A\x99\x5A\x5A\x62\xB4\x2C\x3C\x77\x98\x92\xB0\xAE\x5A\xB6\x80\xF5\x3D\xD0\x2B\xF5\xED\x8A\xD8\x04\x4E\xB7\xD2\x36\xFB\x31\x43\x1A\xE4\x29\xD7\xBE\x86\xC0\xA5\xEF\x62\x5D\x32\x47\xA6\xEF\x1B\x52\xE4\x89\x94\xED\xA5\x5C\xA7\x81\x29\xEC\xAE\xF8\xC1\x5B\xDE\x0B\xBC\x75\xFE\x72\xDD\xE3\x23\x2E\x5F\x82\x4E\x93\x83\x36\xAF\x42\xE5\x48\xCB\xC8\x56\x13\x0D\x4A\x17\x03\x41\x40\xF6\x84\xE8\x61\xE8\x64\xE3\xE2\x0F\xC0\x8E\xFF\x91\xE5\x96\x93\x0D\x45\x00\x83\x91\x37\x64\xB1\xEF\xEF\x25\xB3\x69\x2F\x7A\xE9\xC7\x3B\x5F\xB3\xE9\x68\x11\x51\x07\x2A\x57\xEB\xE8\x4E\x3E\xB8\xC9\xEB\x89\xB5\xF5\x3A\x92\x5A\x98\xA6\x23\x9F\x16\xAF\x63\x27\x08\x93\x63\x62\xFD\xEB\xFF\x2D\xDB\x31\xA8\x88\x23\x80\x9A\x35\xCD\x8D\xF9\xCA\x85\xAC\xBD\x07\xC0\x1E\x28\xF7\xFC\x16\x70\x41\x58\x8F\x53\x3C\xDE\xF5\xBA\x60\xED\x25\xBC\x33\x0E\x09\xA7\xE5\x0F\x2C\xB8\xB2\xFF\x42\x47\x04\xEA\xB6\x00\x0D\x84\x5A\x50\x3C\x42\xB6\x7D\x6A\x59\xF2\xFE\x60\x42\xDA\x86\xEB\x73\xBB\xE8\xE6\xCD\x01\xA0\xBA\xC6\xD2\xA8\x91\x64\xDB\x0A\x83\xDD\xB2\x98\xAF\x86\xC1\x5F\x3F\xA0\xAC\x6E\xD0\xF0\xCE\xF2\x60\xC8\xFE\x94\xA9\x92\x21\x00\xE2\x70\x54\x7E\x12\x9C\xE1\x5A\x2C\x73\x2B\x06\x5E\x10\x03\xA4\xF1\xB6\x39\x2D\x84\xD7\x66\x7C\x82\x94\xF7\x37\xC6\x0A\xF2\xC1\x19\x0D\x99\x30\x86\x1D\x8B\x2D\xB8\x9B\x5E\xD1\x22\x41\xF9\x89\xB8\xDA\x0D\x98\xBD\x87\x96\x4D\x80\xC8\x0D\x7A\x92\xD8\xE0\xF7\xD3\xD2\x62\x23\x40\xE3\x25\x70\xA6\x28\xFD\x3D\x79\x57\x61\x47\xBB\xD4\xB2\x1D\x5C\x22\xBB\xF5\x33\x29\x23\xEF\xCA\x8F\x1D\x8D\xBF\xBE\x88\xD9\x55\x02\x77\xA9\x5F\xA1\x38\xCC\x79\xC0\x64\xEC\x74\x4C\x3D\xC6\x4E\x01\x36\xB9\x28\x82\x3D\xF8\x78\x25\x38\x68\xC9\x3B\x68\xE9\xDB\x81\x2B\x06\x74\x88\x90\x4B\x6C\x0A\x70\x84\x47\xCA\xB3\x98\x52\xC6\x42\x11\x5F\x39\x59\xE9\xFD\xF7\xBB\xFA\x6C\x26\xA4\x15\x55\x1F\x7C\x31\xF2\x3E\x00\xD5\xC3\xE1\x12\x46\xA5\x0C\xC2\x20\xD6\x26\x1F\xA5\xA8\xB3\xA1\x57\x18\x73\xCD\x9A\xCD\x23\xBF\x14\xAC\xBB\x51\x41\x00\xB8\xAE\x79\x58\x3B\x52\x0A\x4E\x20\x4C\x9C\xF1\x97\xBF\x95\x0F\xEC\xB6\xA7\x99\x0C\xE5\x92\xD3\xBE\x01\x49\xCF\x03\xC8\xC0\xC2\x72\xB4\xBC\x63\x83\xB3\x31\x09\x17\x6A\xC8\xC7\xC8\xA5\x1A\x33\x70\xFE\x06\xFE\x8C\x3E\xD5\xF6\xDB\xEA\xCC\xB3\x79\xEC\x12\x40\x63\x5F\xAD\x57\x99\x7A\xDA\xA8\x1E\xD1\x37\xCB\x43\xC1\x1C\xF1\x81\x72\xE2\x67\x8F\x0B\x49\x07\x49\xEB\x68\xC0\xE9\x1D\x1F\x43\xD9\x97\xFF\x8E\x8C\x3E\xA4\x40\x68\xA5\x67\x60\x55\xC3\x46\xF8\x38\xF0\x39\x57\x86\x48\xB5\x41\xD3\xDD\x3D\xA5\x94\x0A\x1D\x0F\x0E\xE4\x84\x75\x10\x84\x93\x84\x05\x4C\xED\x85\xF5\x39\xDF\xED\x1D\x65\x00\xA6\x62\xB0\xDC\xDA\xB5\xC2\x16\xB0\xE7\xC4\x51\xE1\x54\xA6\x1D\x41\x08\x5E\xFD\xFB\x1E\x7D\xA4\x7D\xD8\xB3\x68\xB6\xA6\xEA\xC7\xCE\x56\x2F\x2C\x06\x74\x3A\x83\xF1\x39\xBD\x64\x88\x00\xC9\x58\x55\x00\x64\x36\x9A\xAA\x3A\xC0\x2F\x27\xE7\xB5\xC6\xEB\xB8\x76\x58\xB5\x74\x73\x95\x60\x33\xB1\x50\x22\x92\x9F\xE2\x6E\x0A\x03\xEE\x22\x64\x82\xF4\xF8\x03\x14\xCB\x2A\x90\x31\x43\x02\x07\x5D\xB3\xF0\x47\x21\x14\xEB\x58\xAC\x0B\x96\x8F\x96\x0A\xA8\x08\x21\x9E\x0E\x7E\xD7\xD5\x7A\xA2\x15\xB1\x3E\x63\x76\xED\x62\x02\x44\x93\x85\xB3\x6D\x2B\xA1\xCF\x78\x79\xD6\xE0\x1F\xDC\x2D\xB4\x9E\xA0\x47\xF4\x7D\x39\xB2\xE8\xEB\xF1\x51\x26\xED\xB8\x16\x92\x82\x86\xF1\x52\xE8\xF6\xF4\x8F\x73\x5C\x7B\xE2\xC0\xD0\xCB\x29\x6B\xE1\x71\xD5\x48\x61\x01\x7A\x7E\xB5\xB3\xB5\xD4\x90\x36\x6F\x37\x64\xBC\x8C\xD1\x6C\xD8\x82\x76\x2E\x89\x05\x7F\xF7\xC8\xE8\x70\x90\xA4\xC3\x09\xED\x6F\xE4\xCA\x8C\xE1\x67\xDF\xCD\x96\x0E\xF2\x81\x0D\x67\xA6\xFE\x74\x53\x49\x1C\xB8\x9A\xD6\xB3\xA4\x2D\x99\x2B\x62\x42\xCC\x54\x8D\xB7\x9E\x23\x9B\x32\xFE\x8B\x25\x41\xFC\x5C\xA2\x41\xFF\x78\x7D\x6C\x43\x8A\x57\xAD\xC2\x62\x00\x82\xC1\xF8\x98\xCF\x1A\xEC\xB1\x0B\xDE\x07\xD6\x1E\x36\x71\x84\xFB\xB5\xD9\xD1\x07\x65\xD5\x92\xBE\xCC\x58\xDC\xA5\x27\xD7\x97\x9F\xC2\x16\x21\xAE\x53\x70\xBA\x3D\x67\xEF\x67\x47\x5E\x1B\x75\xBF\xE0\x1E\x33\xBA\x05\xE1\xAF\x34\xAE\xE3\x2B\x0B\x2C\x7D\x74\x40\xFB\x66\x5A\xD6\xFF\x0A\x22\x32\x58\xF6\xA2\xF5\xCB\xB7\xAA\xB6\xF2\x9A\x76\xD2\xD2\x15\xE8\x5A\xB0\x9B\x32\xA0\xD7\x8A\x5F\x3C\x41\xFE\x6F\xD7\x53\x5C\xD6\xA2\xB5\x92\x14\xEA\x15\x1B\xED\xCC\x12\xFE\x25\xE5\x85\x26\x45\x4D\x49\xA0\xD2\xD8\x48\x46\xC2\x81\xE0\x23\xA2\x94\x38\xC3\x04\x74\xBB\xA0\x70\x99\x6C\xB0\x61\x77\xD3\x7E\xA4\xC2\x06\x24\x15\x43\x9C\x62\xCF\x99\x94\xB0\xEA\xF5\x0F\x8E\xC1\xD7\xE3\x98\xA6\x6A\xD2\xC3\xD5\xAE\x2A\x14\xCF\x85\x19\xDC\xF7\xC8\xD0\x5F\xF4\xC2\xAD\x24\x92\xEC\x81\x12\x0C\xC9\x15\xDE\xF4\x8C\x3C\x2F\x21\xCD\x12\x07\x67\x62\x35\x1E\x67\x23\xC9\xAC\x6A\x5E\x18\x1F\xEC\xA4\x6D\x74\xAE\x4D\xCD\xF4\x76\xE1\x81\x43\xE7\x54\x38\x27\x1E\x3E\x1B\x28\x66\x0F\x18\xD4\x3E\xCE\x6F\x56\x73\x14\xFA\x88\xB0\xF5\xC6\x35\xCC\x49\x50\xC9\xC0\x20\x5D\x38\x5A\x91\x6E\xA2\x5B\xA4\x68\x49\x19\x56\xD5\xE2\x77\xFC\xC0\xA6\x8C\x12\x14\x38\xBA\x49\xFF\x53\x96\xC3\xA1\x3F\x9B\xE0\x3D\x92\x07\xB2\x4C\x99\x55\xF1\x5A\x2F\x70\xA0\x39\x35\x6A\x23\xB0\xF5\x33\xD2\xF8\x2B\xA6\x47\x0D\xD0\x84\x96\xAD\x49\xB4\x83\x54\xE4\xB5\x44\xB5\xCE\x46\x8F\x98\xFF\x59\x3E\x2B\xB8\xC5\x2A\x60\xB3\xA0\xAA\x9B\x45\xC3\x79\x51\xBE\xB4\x22\x2F\xE7\x43\x45\x81\xFD\xCA\xC4\x4E\xFF\x61\x51\xE0\x35\x36\x6F\xAE\x8A\x41\x3F\x58\x36\x85\x9D\xF2\x86\xC8\xE8\x49\xDE\x7C\xC6\x01\x97\x20\xC0\x39\x4E\xAB\x2B\xE3\xD2\xA1\x0E\xE5\x20\x3A\xD5\x7D\x09\xE1\x60\xEA\x58\x2D\x85\x49\x81\x16\x38\xC0\x88\x09\x4A\xE8\x5A\x0D\x5E\x16\x0B\xCA\x71\x13\x2F\xDF\x4D\xEB\xB1\x6E\x2F\x6B\xC6\x57\xE3\x99\x58\xD4\x53\x4A\x36\x2E\x9C\xAB\x0F\x41\xDA\x2D\x3C\x73\xBE\xA5\x80\x36\x4C\xBA\x43\xD1\xB6\xDA\xE7\x1A\xF5\x59\x2F\xF1\x28\xB0\xA8\xFC\xEC\xC7\x7B\x1C\xB8\x1F\xC3\x2C\x48\x01\x75\x15\x40\x31\x61\x4D\x3A\x8A\xB4\x8C\x54\x28\xB7\xBB\xCB\x9D\xA9\xD6\x23\x94\x8F\xB4\xA0\xB7\x78\xB8\xD6\x6C\x02\x35\xAD\x1E\xB7\x0D\xF4\xDF\x06\xFA\x01\xC8\x85\x6B\x3A\x04\xBF\x4B\x75\x57\x0C\xB5\x9F\xEB\x06\x0D\x61\xAF\xC5\xCB\x71\x9A\x49\x97\xA9\x34\x48\xC7\x64\xBB\x6E\xF1\x7D\x84\xA9\x93\x3A\x4C\x0B\xA8\x4E\x39\xF3\xC5\x60\x63\x68\x00\x9C\x88\x4F\x61\x29\x30\x6C\x04\x91\xBB\xD1\xB2\x73\xD6\x88\xB7\x69\x9D\x0E\x20\x6B\x51\x2C\xA1\x27\x2C\x6B\x2F\x16\xDB\x57\xC5\x93\xC4\x0F\xF8\xAC\xB0\x66\x20\xEC\xB4\x98\x2B\xB9\x72\x14\x4E\x56\x13\x9E\x1E\x12\x4B\xFB\xD0\x9B\xC1\x22\x30\x49\xE6\x88\x5A\xA6\x86\x7B\xDE\x06\xB2\xFF\x8D\x58\x19\xD1\xC1\x09\x46\xEE\x5D\x67\x57\xAF\x51\xD6\xCA\xBB\xBC\xA8\x45\xC8\xC3\xE2\x13\x62\xEE\xE2\x40\x81\xC6\x57\xF2\x72\xA4\xB6\xF1\xAE\x75\x13\x06\xE7\xDC\x2B\xF4\x49\x88\x0F\xD0\x6A\xDB\x0E\x1E\x08\x73\x11\x1A\xE5\x0E\x24\x6F\x89\x05\x2B\x60\xD0\xAA\xB3\xC9\x73\x84\x8E\x32\xA3\x9E\xB9\xFA\xC7\xE6\x19\xEF\x6D\x48\xEF\x09\x49\x34\x24\xA8\x87\xCF\x71\x20\x96\x7A\xB6\xEF\x3F\xF1\xD9\xE8\xC5\xFF\x81\x80\xB8\x5E\xD9\x9A\xDE\x76\x5F\x96\xEF\xB5\x09\x9C\x5B\x3C\xF6\x89\x6C\xFE\x45\x13\x20\xED\xBA\x47\xDD\x61\x0D\xB8\xFE\x29\xC7\xE4\x1B\x08\x08\x1E\xF5\xCB\x6B\x27\x6F\x7A\xE4\x7B\x79\x0A\xCF\xD9\xFA\x58\xC1\x01\x7A\x38\x27\xBA\x12\xC8\x08\x6C\x3F\x2D\x4B\xF2\x47\x45\xD0\x9B\x1E\xCE\x34\xBE\x4A\x6B\xE6\x3F\x90\x1E\xB1\x5D\xDF\xBD\x17\xC7\x4A\x3C\xBF\xE3\xE7\x66\x9B\x67\x52\xB7\xEF\xA7\x1F\xE8\xBC\x77\x47\x5C\x1F\xC3\x9F\xD4\xC3\x11\xF7\xF8\x70\x6D\x30\x00\x20\x2B\x74\xC0\x17\x25\x41\x82\xB2\x37\x9C\xEF\xCB\xAC\xEA\x27\x9A\x0A\x50\x2C\x1E\x27\x3C\x6B\xE0\x26\x3D\x73\x06\x6B\x3E\x58\xFA\x2F\xF6\x0D\xA1\x64\x45\x35\x6C\x14\x3E\x5B\x2D\x09\x9E\xE9\x7B\xE1\x56\x1C\xC2\xCC\xFA\x37\xFA\x8B\x12\x7C\xA7\x94\xC6\x7A\x38\x19\x8E\xA7\xCE\xF7\x4E\x75\x74\xD2\x59\x88\xD4\x01\xBE\xDC\xCE\xF1\x48\x15\x71\xA2\xC8\x6C\x99\x61\xFB\x56\x59\x57\x7C\x10\x70\xFD\x52\x89\x4A\xFB\x4A\xDA\x3A\x3A\x07\xBB\x21\xBA\xBA\xB1\x85\x70\x09\x01\x44\xF9\xDF\xA5\x22\x65\xF2\x57\x16\x1A\x9C\xC2\x8B\x91\x25\x77\x69\x85\xF6\xF7\x74\x2F\x7B\x58\xC8\xB9\xB2\xC7\x34\x57\x92\x07\xAE\x26\x88\xF2\xF1\x37\x9A\x6C\x7B\x58\x67\xDA\x0C\x40\x2F\x1A\xCC\x89\xA8\xC7\x3D\x15\xC1\xE5\xAA\xA9\xBA\x72\xD8\xEB\xD6\xA2\xB5\x91\xB6\xC9\x3E\x79\xF0\x39\x9D\xAA\x3F\x87\x59\xD1\xD2\xC8\x56\xF2\x0A\x47\xD4\x43\x81\x6B\xC6\xBC\xCC\x6E\xE3\x10\x60\x0D\xF1\xCA\x0A\xFC\x9C\x38\x28\x8E\xC5\x9A\xA8\x00\xFF\x2C\x39\xC1\x7C\x8A\x77\x83\x66\x9B\x28\xA6\x41\xAE\xEA\x52\x6D\x5A\xE7\x5B\x12\x19\x88\xDD\x89\x66\xB7\x5E\x79\xD2\x4C\x41\xB3\x5E\xF2\x1F\x17\x6C\x7A\x9A\x19\x05\x2B\xB3\xDE\xBB\xF6\xF9\x2E\x2E\x45\x37\x86\xF9\xDB\x51\x28\x76\x0B\x6B\xD7\x53\x9D\x6D\xBB\x8A\x9E\x12\x64\xBB\x84\xD5\x3B\x94\x88\x46\xF4\x96\x67\xF7\xB8\xB1\x7D\x16\xEC\x6E\xF0\xFF\x2D\x88\x4A\x20\x56\x04\x63\x8A\xC3\xE9\x1B\x44\xA8\x68\x6A\x05\xB6\x13\x8C\x93\x1E\xD1\x4A\x37\xBA\x94\x27\x70\x85\x6D\x9C\xAE\xEB\xE5\xCA\xC9\xA4\x52\xF4\xD2\xD6\x0F\x14\xEB\x43\x7B\x21\x0A\x74\x7C\xF8\x65\x54\xA9\xE7\x0C\x90\xD0\x03\x14\x64\xB5\xF4\xC5\x82\x18\x79\x51\x2A\xE4\x3E\x75\x89\x76\xD7\xEE\x4F\x1F\x49\x8C\x41\x6D\x83\xBC\x2C\x24\x33\x49\xD8\xCB\x5C\x86\x8C\x3C\xB7\xDD\x7D\x54\x8C\xA9\x33\xB9\x8B\x6F\x09\xBE\x77\x46\x80\x2D\x19\x5E\xB7\x1C\x64\x05\x43\x70\xBF\x1D\x22\xF9\xD1\xAF\x5E\xD9\xD5\x74\x98\x82\x28\x65\x6B\xD1\x5D\xF2\xFD\x02\x15\x21\xE3\x13\x80\x5A\x01\x31\x84\x97\x24\x49\xFA\x12\x5D\x15\xF8\xB5\xF3\xE4\xE8\x66\xA9\x9C\xE9\x7B\xE8\x4B\x23\x7C\x5D\x11\xB3\x60\x6D\x68\xBE\xD0\xD2\x8A\x0E\x7E\x37\xB2\x32\x0A\xD4\xAB\x71\xAB\xEC\xDA\x59\x62\x2C\x84\x19\x11\xDC\xC9\xD9\xB9\x0E\x25\x42\xE8\x0E\xED\x79\x5D\xB5\x90\x86\xEA\x0C\x4E\x33\xE2\x71\xA1\x74\x3D\xF2\x5E\x3B\x47\xA1\xD6\xEE\x95\x48\x3A\x35\x85\x71\xFF\x96\x73\xCC\x1F\x2A\x30\x23\xD0\x34\x2D\x87\xDE\x00\x03\x81\x01\x94\xC9\x80\xC0\x25\x57\x91\x24\xB7\x0F\x71\x09\x68\x18\xB7\x98\x76\x7C\x46\x4E\x08\x06\x1B\x3F\xC8\x21\xFB\xA0\x22\x64\xE1\xD2\x3C\xFE\x2A\x98\xC2\xBD\xDB\xDC\xF2\x4E\x3D\x11\x5C\xE5\xE7\xC6\x97\x9F\x7B\xD9\x49\x2B\x74\xCE\x99\x63\x58\x23\xE6\xF6\x1C\xB0\x5C\xF9\x94\x74\xE6\xB6\xE0\x81\xF2\xCC\x9E\x37\xDD\x5B\x81\x16\xE4\x31\x63\x8B\x8B\xE1\xAE\x14\xC1\xE2\x49\x3B\xFD\x23\x5C\x19\xDA\xA9\x67\xFD\xF7\xD2\x44\x5A\x1F\x55\xB9\x0E\x51\x11\x13\x85\x34\x7F\x02\xED\x52\x7D\x0C\x43\x8C\xD7\xFF\xDA\x34\x6C\x0A\x48\xAD\x4E\xFD\xFD\x7A\x74\xBC\x9E\xC6\xB3\x50\xEE\x2D\x6E\x0D\x66\xDD\xFC\xCC\xC5\x89\x32\x4F\x36\x28\xDA\xFC\xDA\x3A\xB1\xBD\xFA\x2B\xD8\xA8\xFB\x4D\x5A\x7B\xBC\x6E\x6E\xA7\x7E\x19\x15\x78\xC5\x51\x55\xE6\xE7\x10\x0F\x4B\x62\xB6\x1A\x3C\x71\x58\x52\x42\x10\xE4\x38\xC9\x86\x69\x63\xA2\x16\x5A\x41\xAC\xB4\x89\x82\x4C\xBA\x5F\xBB\x46\xBA\x99\xF2\xA5\x45\xA1\xF9\x5E\x54\xE2\x9C\xBD\xD5\x8E\x5B\xDE\xF3\xC0\x0D\x35\x8C\x69\xD5\xC5\x21\x1E\x45\xBB\xCD\x54\x45\xF0\x5B\x90\xCE\x17\xD1\x0A\x3F\x67\xBF\x69\x84\x68\x7F\xF3\x15\x2C\x27\x4E\xD1\x02\x93\x48\xEE\x86\x81\xE9\xCB\x0F\x2C\x3C\x44\x82\x28\x7C\xEC\xB3\x20\x4C\xBA\xED\x65\x38\xD9\x2A\x90\x5D\x81\x9C\x8B\x01\x30\x6F\xE8\x47\x53\xFE\x81\x0D\x05\xE6\x86\x9A\x17\x44\x31\x4E\xA0\x58\x70\x50\x26\xD8\x4F\xFC\x03\x6B\xB5\x3C\x52\xF6\xEA\x02\xB3\xEF\x61\x47\xE6\xEB\x08\x86\xC8\x6E\x94\xDE\x48\x9D\x4E\xB6\x02\x2E\x2F\x5F\x63\x43\xDD\x70\x4A\x9F\xD6\x59\x45\xEA\x57\x3D\xE9\x61\x63\xB9\x1B\x90\x58\xE6\xA9\xDA\x80\x62\xD0\x9E\x5D\xDE\x6C\xA0\x7A\xC2\x13\x81\x6B\xA7\xF6\x05\x67\x9F\xC5\xE7\xA1\xF7\x09\xAC\x8D\x9E\xCE\xF8\xCD\x43\xDA\xE5\x89\x69\xD2\xE5\xD0\xA3\x75\x1C\xBA\x28\xE1\x64\xA5\x15\xBB\x35\xC4\x66\xA8\x2E\xD8\x1B\x2C\xF2\xFD\xB9\x55\x1D\x52\xA1\x12\xE6\xF7\x76\x29\x21\x73\x14\x37\xDD\x18\x2E\xD1\xA1\x2A\xA0\x0F\x04\x28\xDA\x5A\xD1\x4B\xDE\x7B\x93\xA4\xA7\x2E\x08\x47\x08\x4C\x17\x61\x19\xF7\x38\x92\x1E\x92\xAC\x34\x50\xB9\xC9\x96\x6E\x75\xFB\x8D\xC9\x01\x06\x20\x45\x5E\xDF\x07\x77\xC9\x87\x63\x3C\xF6\x56\x6D\xC9\xA6\xB4\xA1\x8C\x4D\xB9\x37\x80\x60\xF3\x28\xAA\x29\xD1\xCB\x49\x8F\xCF\xBD\xC9\x19\xEB\xE4\x30\x3B\xDD\x0D\x0F\x19\xA3\xD3\x3D\x35\x26\x25\x27\xC5\x6A\xCC\x58\x61\x40\x8F\x69\x12\x32\x87\x4B\x0B\x04\x83\x95\x71\x73\x23\x29\xB2\x16\x6A\xE1\x1D\x0C\xDE\x0A\xFB\xFD\x80\x47\x22\x0E\x9E\x48\x63\x6D\xC7\xB4\x79\x0D\xEA\x9A\x5A\x85\x2C\xC7\x91\xFF\xDA\x15\x4C\xCE\x9B\x1E\x8F\x46\x98\x1B\xD0\x02\x1B\x50\xFD\xE9\xCB\x35\x8C\x00\x8D\xB8\x66\x4C\xF2\xB7\xEE\x02\x79\x84\x57\x23\xD8\x01\xC4\xC2\xF7\x81\xF3\x84\x6E\x7A\xDF\x2B\x1F\x56\x7D\xFB\x9D\xAC\xE8\x2A\x9E\x5B\x36\x06\x17\x6B\x52\xB5\xE7\x61\xDB\xB1\x37\xD2\xE6\xC6\xB2\x83\x5F\x18\x7F\xEA\x1A\xF4\x12\x7B\xD6\xB5\x27\x9F\xF7\x8D\x05\x32\x39\x7E\xD8\xD5\xE0\x4B\x1F\xEF\x5A\xB7\xEA\xBD\x56\x41\x31\x2E\xC0\x79\x80\x82\xD8\xB4\xD0\x24\x7F\xCE\x3B\xE0\xE4\x05\x50\x0E\xAD\xDC\x60\x68\xA6\x3E\xD3\x2A\x54\x34\xD5\x34\x6B\x35\xF8\xE9\x29\xA1\x21\x58\x92\x79\x8F\x43\x7B\x08\x0B\x19\x91\xBA\x9A\x98\x5E\x35\x98\xA9\x85\x04\x06\xED\x3F\xFF\xC0\xAE\x7C\x33\xF4\xCF\x1D\xEC\xE3\xA1\xEB\x1B\xAB\x95\xC8\x25\x68\x99\x5D\xE3\x26\xA9\x81\xF9\x91\xC3\x57\x4E\x04\x95\x01\xF3\xAE\x92\x4D\x1C\x98\x8D\x8E\x1F\x3B\xBA\xC5\xE9\x71\xAF\x9F\x8F\x55\x64\x1C\xB7\x39\x2B\x42\xDD\xB9\x65\x24\xC3\x4F\x9E\xE1\x39\xD9\x4A\x43\x21\x90\x82\x1C\x8F\xC6\xA9\x0E\xB9\x4F\x3D\xB1\x66\xF6\xA7\x4D\x50\x56\x2B\x1B\xA0\x8A\x56\x71\x0C\xE4\x63\x33\x32\x2A\x41\xF3\x26\x1E\x77\x79\xAD\xC4\xF7\x8B\x00\xE8\x89\xF1\x14\x79\x4A\x49\x7B\x0D\x82\x12\xC2\xF4\x6A\xBB\x4D\x69\xDC\xF5\x72\xCC\xF0\xBD\x92\x86\x12\xF3\x7D\x79\xF4\x42\x82\xA9\x02\xA9\xA2\x69\xF4\x0C\x35\x97\x85\xD3\x24\x86\xF5\x6D\x8F\x9C\xF9\x60\xC8\xD6\x70\xA1\xD8\x1B\x99\x2E\x1F\x8A\xC0\x8A\x9A\x1D\x90\xDD\x77\x2A\x69\x6D\x31\xA5\x99\x34\x4E\x3D\x32\x24\xFA\xB4\x18\x00\x0C\xAD\x6D\xA4\x2B\xCA\xAB\x5C\xF5\x38\x1D\x92\x50\x34\x86\xA0\x7C\x55\x9D\x8D\x29\x95\x60\xEC\xB4\x87\xBE\x64\x30\xFD\xB2\xFF\x61\x92\xF8\xFB\x21\xF1\x5A\x39\xCA\x00\x7F\x2A\xB7\xE0\x53\x05\x88\x9F\xC1\xC0\x99\xFC\x07\xD8\xDB\x36\x8E\x2E\x8B\x44\x45\xD1\x0F\x90\x92\x72\xA1\x7E\xB4\x58\xAD\xF9\x22\x09\xA1\x6D\xD0\x52\xEE\x37\x52\x61\xFB\xD7\xE7\x6E\xD4\x1C\x20\xD0\x45\x9C\x5E\x94\xD4\x2C\x82\xC1\x69\x3E\x04\xB0\x1D\x86\x22\xAB\xEB\xCF\xCD\x94\x30\xD9\xFF\xDC\xC3\xAA\xF8\x4F\x8A\x42\x51\x94\x3B\x32\xDB\x93\x75\xDF\xD6\x9D\xE3\x92\x28\x55\xBA\xA7\x0D\x8A\xE4\x6E\x85\x3A\xEC\x5A\x04\xCE\x58\x2B\xDC\x28\x14\xC9\x1F\xE1\x24\xB8\x46\x0C\x61\xD3\x1E\x8D\x50\xE5\x2E\x54\xCD\x6C\x13\x07\x3F\xAF\x9B\x33\xEA\x55\x35\xC6\x3F\xC4\x47\x00\xB5\xB3\x4F\x17\xF9\x29\x3A\xA3\x40\xBE\x2A\x42\x58\x13\x62\xAD\x6B\x57\x76\xFF\xEC\x8B\x0A\xE7\x74\x59\xB2\xE8\x27\xAA\x29\x25\xFA\xA9\x22\x4F\x6B\xD3\x9F\x39\x11\x7F\xC5\x09\xA5\x07\x1B\xD0\x1E\xDF\xA3\x18\x82\x75\x0F\x29\x90\xAA\x0F\xE0\xC8\x39\xE8\x0A\xD2\xD0\xF5\xFF\x30\x5A\x89\x50\x79\xE7\x1E\x2A\x77\xEE\x43\xD4\x3E\x1C\x81\xC1\x7D\xF4\xC9\x01\x4D\x5F\x8D\x5E\xDA\xE2\xE0\xA6\x69\xE6\x54\xFD\x58\x38\xFA\x76\x03\xFC\x30\x5C\x1E\x1D\x69\xC6\xB9\xA4\xA4\x3F\xBD\xA8\x28\x9F\x02\xF5\x02\x20\xBB\x2F\x35\xA6\xC6\x26\xAB\xD7\x2A\x62\x01\x46\xB1\x6C\x9C\xED\x2A\x85\x08\x67\x70\xE8\x16\x55\x32\xAC\x8C\xAF\xD9\xE0\xDD\x47\x48\x86\xAC\x05\x27\xFC\x9D\x9F\x3D\x0A\xE0\x0D\xCE\xEE\x69\x48\x7D\xCB\xB4\x1C\xB1\x2A\x8D\x22\x03\x8E\xC6\xC4\x58\xF6\xC3\xB8\x64\x7B\xFB\x64\xE7\xC6\x6A\x3C\x9E\x84\x03\x4A\x15\x67\x55\x5F\xCE\x22\x9B\x1E\xA6\x9D\x43\x7B\x9E\xF3\x97\x7E\x16\x99\xF0\x3D\x8F\x11\x51\x90\x5B\x18\x50\xD0\xE9\xF2\xD8\xAF\x79\xDC\xA7\x76\xD0\xE7\x17\x65\x50\xE6\xBA\xF2\x7C\xE0\x8D\xE8\x86\x86\x00\x76\x88\xB2\x51\xFB\x50\xB3\xFB\xB4\x42\x34\x78\xEE\x9C\x19\xEB\x1A\xC5\xC4\xC8\xAE\x8F\x8B\x3F\x71\xEA\xEB\x18\x1F\xAC\x38\xF9\x54\xB1\x35\xEB\x71\x2B\xE1\x66\x5F\x1C\x99\x52\xD7\x43\x63\xAD\xF9\xE9\xB4\x48\x0E\x8B\xB5\x0D\x03\xB6\xFA\xA5\xED\x73\xBF\x96\xC2\x43\xD2\x6F\x35\x6F\x73\xBD\xC5\xBB\x22\xAD\x56\x73\x95\x29\xC8\x87\x70\x9D\xDC\xD3\x46\x2D\x04\xE5\x3F\x41\x60\x96\xDD\x5E\xF5\xCA\x80\xE7\x0F\x1B\xFC\x9F\x00\xE7\x38\x91\xF1\xC7\x9F\x78\x93\x3B\x11\x48\x15\xFA\x6D\x94\x00\x5E\xC6\x1A\xCA\xFB\xD9\x53\x47\xDB\x46\xD7\xF2\xA3\x2F\xA3\x7E\x0A\x4E\xA5\x3D\xE3\xF2\xF9\x54\x66\xE0\x12\x23\x94\xD9\x8D\x4D\xD1\xE2\x34\xF3\xF9\xF4\x33\xFA\x94\x1E\x04\x1E\xD6\x1D\xB4\x78\xFE\x7F\x36\x30\xF8\x62\xA6\x46\x4E\xAA\xA8\x78\x68\xF2\xA9\x9E\x88\xC9\xFD\xA4\x61\xB0\x83\x6F\x1D\x97\x8E\xE3\x0E\x21\xAB\x3E\x44\x66\x6F\xB2\x00\x4F\xF9\x5B\x41\x21\x2C\x09\xD6\x08\x9E\x4F\x0A\x5D\xD3\x23\x59\x5B\x03\xEC\x04\x4E\x4F\xED\x28\x14\xB6\xD4\x09\x72\x10\xD7\x15\x62\xDF\x60\x0C\x7C\x27\xEA\x96\xC1\x04\xD8\x65\x32\x3A\x7D\x47\x2D\xED\x08\x1D\x39\xAB\xEF\x6D\x06\xA2\x8C\x0D\xDF\x1C\x24\xC8\x09\xE8\x52\xED\x20\xEE\xD4\x4D\x2A\xD5\xA5\x5F\x88\x4C\x8D\x12\xD6\x0B\x61\xCD\x5D\x72\xFA\xFF\x69\xC8\x71\x78\x06\xFF\x13\x0E\x63\x69\x42\x36\xFA\x4E\x04\x0D\x9F\xED\x93\x98\xD9\xE1\x9C\x5C\xDA\x58\x7F\x1F\xA7\x7E\xD4\x03\xB9\x42\xB6\x53\xDE\x2A\xD6\xF6\xCE\xA7\x93\x30\x5C\xD0\x00\xC2\x9A\xF9\x15\x15\xDA\x46\x2F\x93\x0B\x82\x67\x38\xC2\xF6\x07\xDA\x0D\xFA\x18\x36\x58\x2A\xBF\xC5\x2A\x61\x5E\xFC\xF0\x0D\x33\xD3\x25\xA0\x23\x96\xC0\x64\x58\xDF\x9B\xCE\xA0\x93\x2A\x79\xCD\x32\xF1\x8D\xEB\xCC\x50\x0C\x23\x7C\xAB\x52\xCC\xC0\x66\x01\x81\x21\x34\xC8\x30\x4A\xA6\x14\x5B\xD4\x6C\x12\xCE\xBE\x72\x4F\x63\x85\x51\x08\xFB\xFF\x1D\x18\x3B\x3F\xC1\xA6\x64\x5B\xEE\x15\x77\x1F\x33\x83\x8B\x65\xAE\xC9\xDF\xDB\xB0\xD0\x49\x04\x82\x54\xCE\xB5\x10\xCD\x43\xD7\xF4\xBF\xF5\x91\x7A\x56\x1D\xCA\x17\x07\x48\x2D\x2E\xC2\x5B\x33\xC8\xDC\x3F\xBD\x1D\x97\x0D\xE5\x22\x17\xD2\x50\xCA\xC0\x4E\xEB\xA3\xD5\x4E\xAA\x6D\x40\x27\x7D\xE3\x4E\x90\x4C\x7D\x2F\xC0\x20\x0B\x4B\x02\xF8\x00\x8C\x48\x53\x70\xD2\x4F\x11\xF9\x73\xB3\xC6\x71\xFA\x3B\x04\xFD\x8B\xD6\xA9\xAE\x7B\xE1\xFE\x4A\x08\x0D\x46\x87\x25\xE0\xB4\x7E\x7F\x5A\x07\x18\xC8\x51\xC8\xAC\x3B\xB0\x0E\x6F\x5A\xF3\x53\x9F\xD5\xEB\x27\xA6\xB9\xDD\xAB\xA5\xC9\xFA\x1A\x8E\x68\xB2\x4A\x16\xB0\xC8\x07\xEC\x2D\xF2\x7E\xAA\x80\x1D\x5B\x65\x9A\x04\x5E\xC0\xE9\xDF\x3C\x6F\xE9\x15\x92\x46\x9C\xBE\x89\x6E\xDE\xCC\xE1\xA0\x39\xA6\xB8\x4D\xA1\xFE\xB4\xC8\xD8\xFB\x7F\x20\x54\xE0\xAA\x76\xB1\x0D\x00\x16\x2D\xBB\x30\x0C\x7C\x65\xCB\x0F\xB1\x1F\xBB\xBC\x42\x7F\xAD\xDE\xB3\xFA\x64\x94\xDA\x09\xB9\x8D\x85\x9F\x0F\x9A\x38\x36\x26\x4A\xB5\xED\xF3\xCE\x27\x1B\xA6\x2A\xA1\x5C\x74\x43\x67\xC5\xFF\x4A\xE7\x29\x8A\x7F\x17\xCC\x6E\x22\x92\xC8\x31\xB5\xAD\xCF\x73\x6B\xED\x61\xB5\x2A\x9C\x2E\x37\xCF\x3F\x42\x56\x09\x63\xC6\xBD\xCF\x7F\x71\x2D\xDF\x79\x43\x03\xB4\xF1\x4C\xDA\x85\x88\x4E\x46\x50\x12\x80\xBF\x4E\x23\x93\xE1\x9E\x9E\xC6\x71\x1B\x9A\xC6\x59\xE0\x3D\x39\xBC\x43\x8B\xE8\x05\xBC\x7A\x3F\x50\x27\x76\xAF\x29\x7B\xF8\x3F\x06\x80\xF1\xE5\x85\xB4\xE4\x13\x64\xE7\x4C\xC9\x08\x0C\xE0\x14\x5B\xBA\x87\x78\x46\xDE\x49\x83\x71\xFC\xE3\x5B\x59\x0C\xA7\xAC\x29\x92\xE7\x01\x6D\x48\xAF\x74\x51\x94\xCE\x6D\xED\x31\x91\xFA\xE0\xBD\xD8\xF5\x4F\x26\x8F\x9F\x51\xCE\x85\xB0\x13\x98\x08\x09\xAC\xD2\xEA\xBC\x77\x1A\x5D\x54\x8F\x2D\xAB\x88\xD1\xBC\x7A\xCC\x82\xF4\x95\x1C\xE9\x4D\xFB\xD6\x59\x30\xEA\xC5\x71\x29\xE7\xAF\x8E\xF8\xEC\x68\x71\xC1\x7F\x0F\xCE\x5E\x81\x18\xEB\x49\x51\x89\x55\x45\xAB\x79\x7B\x00\xB6\x1D\x80\x4C\x0E\xF2\xFA\xD2\x45\x04\x8A\x1B\xDA\x8A\xE1\x9F\x2C\x7C\xE3\x19\xFD\x01\xF2\x3A\xFE\xDD\x41\xCA\x2C\xAF\xE6\xCD\x4B\xB9\x66\x0F\x9B\x09\x84\x1B\xB4\x22\x87\x08\xAB\xC9\x61\x91\x70\x03\xAB\xD0\x66\x02\xCF\xED\x6D\x99\x8B\xB9\xE7\x5A\xEE\x54\x34\xD5\x42\x0C\xA7\x02\x61\xFD\x22\xDB\xAF\xE0\xFB\x08\x26\x2F\xAB\xF0\x9B\x54\xDD\x53\x5B\xB0\x26\x17\xC8\x77\x15\x84\x4A\x1D\xF3\x42\x85\x55\x2C\xF5\xB7\x6D\x4E\xE4\xFB\x2E\x5D\xC6\x7D\x53\x54\x30\xF9\xBB\xE4\x8A\x57\xAE\xE5\xAF\x7C\xBD\x27\xD5\x65\x62\x31\xFB\x67\x5D\xBC\xA3\xB6\xE2\x46\x07\xE3\xD3\xF3\xE3\x70\x56\x54\x2F\xA2\x5B\xD6\x5E\x3D\x9C\xB0\x76\xA1\xFF\xFB\x0A\xBB\xA3\x13\xC3\x5C\x17\xED\x19\x60\xBB\xD9\x83\x80\xEC\xCC\xFB\x2C\xA3\xD4\x30\x23\x64\xB6\xBE\xCE\x99\xB2\xE1\x8F\xB7\xF0\x77\x95\x67\x29\xD4\xE3\xE6\x04\xDD\x3E\xE3\x27\x47\xD3\xDC\x57\xC5\xF4\xB5\x45\x3B\x2B\x8A\x33\xED\x3D\xD1\x49\x1A\xF3\x55\xDF\x4C\x99\xC0\xF4\x0C\xEA\x45\x6A\xB5\x5C\x6B\xF8\xE2\x2F\x91\xDB\xF0\x19\x23\x6E\xEC\x1B\x2F\x60\x8E\xB2\x5D\x41\xBD\x79\x93\x61\xA2\xE4\x82\x95\x23\xC1\x2E\x31\x7C\xFD\xA7\x8F\x1B\x87\x4B\xB5\xB4\x49\x2C\x07\x73\x3C\x40\x02\x28\x20\x00\xDE\x9A\x95\x22\xEF\x84\x50\x73\xED\xCC\x5D\x0E\x75\x4D\x6C\x5E\x3B\x1A\xA6\x60\x54\xA8\x23\x17\xC1\xC9\x9E\x8D\xC1\xD6\xF5\xCD\x6A\x44\x9D\x42\x04\x06\x27\x40\xE0\xAA\x35\x61\xD6\x57\xE9\x31\x90\x57\x45\x45\xD5\x0A\xC0\x73\x11\xA1\xE2\x06\x3E\x1C\xFB\xC8\x22\x02\x80\x62\x1B\x4D\x16\xC4\x1D\x62\x75\x48\xEA\x18\x07\x6F\xAD\x2D\xE7\xFB\x95\x98\x3D\x69\xEC\xBE\x78\x5D\xAB\xD3\x06\x68\xEA\x7F\xB8\x58\x8C\x02\x1B\x9D\xA2\x10\x27\xBA\x81\xF2\x49\x9B\xD3\xFB\x72\x7B\x60\x99\x6E\xD1\x7B\xD1\xA0\x43\x89\x20\xB7\x98\xF3\xC1\x58\x0B\x32\x59\xAA\xDF\xE4\xF0\x64\xDA\x4C\x4B\x32\x1F\x89\x3C\x6D\x13\x1B\x68\x38\x00\x61\xC4\xAD\x1E\xBE\xE7\x97\xD1\x18\x77\xB5\xED\x90\xDC\x9A\x31\xA8\xC4\x28\x37\x2C\x1C\x2F\xBA\xE9\xA0\xBE\x63\x7C\x05\xBB\xA6\x5B\xC6\x58\x7A\xF2\x0C\x09\xA9\x7D\xEC\x85\xF2\x98\x17\xFD\x44\x8C\xD6\x21\xB7\x9D\x81\xC0\x98\x94\x8D\x63\x24\x0E\x46\xCB\x7C\x5A\xC6\x9C\x2F\xEA\x86\x00\x53\xBE\x63\x49\x5A\x4E\xB3\x0E\x2B\x08\x91\xB7\x08\x07\x48\x67\x03\x02\x9D\x8B\x1B\xD2\xC7\x22\xF7\xED\xB5\x23\x6C\xD5\xD1\xC6\xB9\x9F\x83\xD9\xC1\xBD\x08\x92\x54\x62\x81\xF3\xFE\x3D\xDC\x05\x9C\xEE\x38\x60\x93\x94\xE9\xBF\x42\xC3\xAC\x6A\x15\xB3\xD2\x03\x11\x63\x09\x0F\x37\xC9\x1D\xAF\x0E\xB7\x5D\x11\x61\xB9\x56\x61\x67\xDC\x09\x7D\x22\x4B\x11\xE5\x6B\x15\x08\x7C\x1E\x88\x32\xAE\xE5\x48\x25\x53\xB3\x17\xFE\x9A\x92\x72\x81\x18\xC1\x88\xE9\x5D\x3A\xD9\xF1\x3E\x2C\x42\x7F\xFA\x3A\x30\xE0\xB0\x0D\xCD\xE7\xC4\x52\xA0\x83\x69\xCC\x37\x9C\x01\xAA\xC9\xD2\x05\x3C\xC7\x7F\x91\x3F\xD0\x0D\x09\xC9\x88\x66\x6A\x26\xA2\x83\xBB\xB5\xAB\x89\xC5\x6A\x14\x65\x06\x28\x5C\x97\x58\x01\xB1\x25\x84\x3F\xDB\x76\xA3\x58\xFF\xE3\x85\x8D\x73\x71\x66\xB4\x3B\xAF\xBF\x5D\x02\xA8\x8D\x2B\x18\xDB\xAD\x25\x6A\x0D\xCD\x6A\x9B\xA8\x41\xE2\x18\x34\x62\x90\x28\xD1\xF5\x8D\xFF\x19\x8F\x10\x92\xF2\xA9\xE2\x7F\x6E\x31\xB6\x0A\xB1\xB2\x98\xC1\x5D\x75\x9C\x5C\x3A\xBD\xAA\xFA\x80\x0A\x68\xE0\x3E\xDC\x24\xBD\xCC\x2D\xBF\x92\x53\xFE\x8F\xF9\xD5\x89\x45\xF3\x8E\x7D\x5E\xFD\xA4\x3D\x52\xCF\x86\x6C\xBB\x47\x2C\x08\x45\x91\xD1\x37\x49\x5F\x31\x48\xFC\x56\xB7\x36\xB5\xDA\xC1\xEE\x71\xBE\x0B\xD5\x6A\xE8\xA1\x22\x51\x42\x9A\xFF\xB9\x76\x3D\x94\x5F\xEA\xE3\xC8\x6F\x91\x39\x4E\xA9\xF9\xE0\x3F\xEB\xAB\x28\x09\x0E\xE1\xEB\xFF\x02\x3E\x40\x55\xAB\x16\x41\xE3\xB1\x83\x2A\xBC\x8D\x06\xCA\x31\xF0\x7C\x45\x08\x07\x96\x68\xE6\x55\x4A\x9C\xFD\xA6\xFC\xCD\x84\xA6\x13\x70\x41\x9F\xE8\xF5\x81\xB0\xCD\x62\x3E\x22\xE9\xC8\x51\xE9\xB7\xAF\x73\x8B\x79\xB7\x6E\x12\x6F\x99\x7E\x9B\x16\x74\x89\x71\x6D\xEC\x33\x3B\xC6\xE5\x6E\xBD\xA3\x4D\x88\x04\x00\x5D\x43\x6A\x29\x92\xF6\x1D\xC6\x7C\x9F\x02\xD9\x65\x55\xA9\xF0\x77\x07\xA5\xD0\xD1\x4E\xE1\x91\x46\x5B\x6E\xC0\x4C\x9D\xB3\x5F\x9F\xF1\x32\xBD\xC0\xC5\x90\xF7\xAD\x92\x1D\x79\xFD\x19\x0B\x53\x3D\xB2\x74\xBD\x17\x7F\x8B\x17\xA6\xF8\x56\x50\xFB\xCE\xA9\xF6\xBB\xC3\xD4\xFF\x47\x61\xD3\x63\x01\x41\x9F\xD2\x84\xCD\x16\xE7\xC4\xBE\x39\xC4\x99\xE4\x6A\xFC\xB7\xAE\x8F\x55\x92\x3A\x93\x29\x7C\xD6\x41\xAA\xDC\x33\xCA\x90\x2F\x9C\xB1\x98\xB2\x73\x8F\x67\x20\x6A\x99\x4D\xD5\x61\x8F\xA8\x3D\xA5\x8B\x7C\x6B\xA0\xC1\x0D\x4B\x3F\x04\x5F\x5E\xEC\x02\xAD\xB8\x42\xB9\xA7\xE9\xDA\x9D\x15\x82\x50\xCA\xE2\xD9\xA9\x40\xC1\xC6\x4B\x86\x89\x40\xC5\xBB\x4D\x49\x13\x9E\x54\x3A\xCA\x40\xEE\xF2\xCB\xDA\xFB\xED\x1D\x91\xD2\x58\xD5\x96\x44\x9C\xE8\x87\x6F\x36\x38\x51\x32\x84\x19\x71\x33\x6C\x21\xD1\xC6\x08\xE3\xB3\xB6\x5F\x34\x38\x79\x61\x45\xE6\x31\x6A\x94\xAE\xD4\xE9\x67\x88\x06\xD6\xC7\x7F\x7B\x10\xFF\x64\xFA\xE4\xF4\x76\xAE\xEC\x9B\xCA\x6E\xFF\x68\x37\xE9\x18\x26\xD4\xD6\x6C\x06\x82\x06\xC9\x69\x97\x35\xD4\xB0\x72\xE5\x82\x87\x20\x9B\x0A\xF0\x5B\xBE\x02\x39\x23\x71\x4C\x8B\x79\x13\x4E\x0E\xA6\xF7\x72\xD9\x64\xC5\x9B\xAE\x43\xE7\x92\x9C\x37\x63\xBA\x2D\x41\x89\x2E\xA6\xFA\x4C\x11\x33\xDF\x11\x53\x8B\xD4\x77\x08\x10\x62\xF4\xCD\x1E\x36\x1C\x0F\x07\x96\x90\x6E\x5D\x98\x56\x42\xBF\xAA\x90\x0B\xA8\x94\xF5\x88\xE3\xB2\x64\x3E\x20\xD4\xA0\x12\xD1\x94\x9D\x3E\xD3\x3B\x46\x91\xF5\x7D\x07\x1E\x0B\xF5\x75\x31\x5D\x45\x22\xE6\x01\x27\x96\x10\x72\x08\xED\x28\x26\x0D\xD7\x94\x29\xAC\x5F\xEB\x85\xA9\x19\xE6\xE1\x4C\xA9\xB5\x1A\xFB\x85\x76\xF5\x9D\x6A\x79\xA9\xD2\xAF\x03\x2E\xF1\x5F\x09\x3E\x28\xB3\xB1\x5B\x50\xDB\x09\xB2\xFA\x76\x02\xF7\xE9\x43\x50\x95\x2F\xEC\xE9\x4C\x55\x1A\x30\xCD\x66\x8F\xCF\x13\xD2\x1F\xB1\xEE\xC2\x44\xBE\xFE\x49\xD8\xCA\x11\xEA\x3F\xF5\xE5\x9E\x57\xA6\xA2\x4D\x15\x88\xFC\x0B\x9D\x59\x53\x7B\x53\xAE\xB0\xCC\x1B\x29\x96\xA7\x8B\x23\x84\x06\x2F\x84\xAB\x1A\x0A\xE7\xAC\x67\x8A\x74\x0E\x21\xE9\xDD\xC8\x48\x02\xDA\xB3\x4F\x4B\xD3\x05\x83\xAA\xA4\x03\xE3\xFD\x13\x84\x88\x9A\x62\xA0\x89\xB4\x5F\x37\x6C\xE4\x0F\xB5\x14\x47\x0A\xE6\xA3\x8C\xA4\x0F\x7C\x09\x3D\xA4\x31\xFE\x21\xA1\x87\xD2\x1A\xEA\x5B\x50\x6B\x78\xF5\x7F\x36\x47\x03\xFD\xF6\x0D\x96\x24\xA2\x07\x08\x5C\x8C\xE0\x32\x40\x87\x27\x16\xE1\x57\x98\xFB\xA9\xF2\xE2\xE0\x01\x8B\xEC\x62\x8A\xA5\x77\x23\xEE\x7B\x0D\xAE\x05\x55\xB8\xF9\xB1\x9F\xA8\xA1\x33\x78\x57\xB9\xA1\xA3\x7D\x22\xF8\x33\xB1\xB9\x05\x76\x09\x69\xD2\xD2\xD8\x2E\x1C\xCC\x24\x14\xE3\x48\x33\xB1\x37\x0F\xC0\x71\xA4\x10\x14\xAA\xF7\x7A\xB6\x0A\xB1\x2F\x34\xDE\xB1\x74\x58\xFE\x90\x70\x33\xF2\x26\x0E\x37\xF6\x60\x7C\x28\x4B\xB0\x45\x8E\xD8\xCB\xB5\x12\x3E\xEE\x76\x2A\xD0\x42\x93\x69\x73\xB4\xBB\x97\x5E\x41\xB0\x41\xDC\x3F\x82\xC3\xF8\x0D\xD8\x74\x65\x3D\xED\xC3\x43\x91\xC6\x08\xD7\x7C\x48\x05\x08\xBE\x6A\x82\x96\x30\x7F\xB5\xCB\x12\xBE\xFF\x53\xA6\x96\x2D\x23\xAC\x38\xE0\xC4\x40\x0B\xDE\xF6\x86\x38\xC0\x44\x6E\x3D\x65\xCB\x7E\x47\xF6\xF0\xE3\xCA\x47\xF2\xF3\xAE\x1F\xA8\x39\x56\x05\xA6\xC7\xEB\x7C\xF3\x7E\x02\x12\x5F\xF8\x69\x68\xCE\x1C\xD4\x34\xAF\x36\x44\xC3\x7E\xA2\xD4\x3A\x1C\x94\xCB\x63\xE8\xD2\x24\x9B\xCF\x8D\xF3\x72\x93\x4E\x00\xFC\x5B\xF9\xD4\xD1\x0C\x66\x1E\x74\xF5\x8E\x43\x58\xF5\xDE\x49\x91\x74\xB9\x8E\x86\xB4\xDD\x2B\x7B\xDB\x1D\x49\x3C\xD0\x2E\x2B\x15\x86\xF4\xCA\x1F\xDC\x38\xA2\xED\xB7\x36\x84\x8B\x5A\xC5\x50\x72\x81\xC2\xDF\xFD\x9F\x0B\x44\x56\xE0\x50\xBB\xF7\x2D\x62\xD4\x78\xCB\xB5\x59\x2B\x1C\x8F\x53\xED\x4D\xF0\x77\xA0\xCC\x4F\x18\x42\x4C\xA6\x89\xE9\x0A\xF2\x4E\x4E\x4B\x13\x1C\x5A\xDA\xFC\x77\xE7\x1F\x81\x52\xAA\x8C\xE1\xBB\x99\xAF\xF6\x6D\x9A\x19\x0E\x7F\xA6\xBF\x54\x93\xA0\x8F\x3F\x90\x3A\xDE\xD5\xB9\x34\x2D\x89\x72\x6B\x4A\x5F\x93\x30\x45\x86\xAA\x79\xAF\xD4\x16\x64\xF2\xAC\x91\xAE\x0E\xCB\xA4\xD5\xB2\xC1\x1F\x61\x42\x56\x25\xA5\x63\x80\x0D\x6B\xE0\x31\x3F\xBC\x6F\x06\x5E\x63\xF9\x31\xAD\xC9\x7C\x87\x2F\x2E\xEE\x01\xA2\xA1\x9F\x3B\x94\xBB\x45\x15\x73\x26\x92\x2C\x12\x0F\x7D\x8B\xB1\xBE\x1B\x5F\x25\x5E\x38\x4B\x65\x3F\x11\x70\x63\x2B\xE7\xFB\x70\x3C\xE9\xF5\x10\x3E\x5C\x22\x1F\x6F\x85\x74\xB2\xC1\x42\x44\x1C\x10\xE4\x06\xF4\xAD\x15\xF3\x5F\x89\x9B\x5A\x8A\x3D\xA1\x89\xB0\xD5\x10\xFF\xAF\x65\x0F\x17\xEA\x98\xCF\x62\x9B\x82\x55\x09\xC3\xD1\x6F\xBF\x4F\xAB\xC2\x42\x12\xC5\xEE\x6E\x19\x34\x68\x7C\x9B\x00\x04\x5A\x98\x6C\xED\x58\x66\x2F\xAD\x26\x4E\x6D\x61\x0E\x76\x8C\x59\x8B\xA5\xC4\x03\x7C\xDE\x29\x14\xA0\x79\xED\x63\xB3\x41\x26\xF2\x0B\xC3\xAC\x24\x93\xF6\x74\xD9\xDF\xD6\xDF\xAF\x7C\x8E\xC9\xE7\x2C\xE2\x9B\x51\x18\x3E\xA3\x2E\xD2\x06\xD3\x92\xDB\xE9\xA0\xD6\x44\x5A\x16\x16\x42\x33\x66\x44\x88\x67\x4D\x0E\x31\x4F\x70\x61\x57\xB8\x0D\x75\x9F\x53\x66\x93\xE2\x1B\xEA\xB5\x9B\x8E\x04\x57\x45\x46\x25\x63\x95\x08\x64\xA1\x02\x0D\xE2\x04\x29\x79\x1F\xDD\x87\x91\x05\x95\xD9\x6F\x44\xBC\x0E\xC3\x4E\xA7\xC9\x95\x9B\xA1\x52\x57\xAF\x20\xF3\x74\x8A\x43\x78\xE9\x78\x5E\x66\xC2\xD0\x06\x3C\xFE\xAC\xF8\xCD\xDA\x2C\xC5\xF9\xCB\xE2\x7D\x94\xEC\xB2\x15\x4C\xEF\x58\xC1\x3D\xA4\x76\xCD\x4E\x23\x61\xF1\x56\x21\xFE\x80\xEE\x64\x08\x7A\x8C\x53\xC6\x79\x1B\xE1\xDD\xAA\x91\xB6\xD6\x7F\xC0\x6D\x99\x14\x61\x0B\xCC\xE6\x74\x30\x10\x34\xF3\xE6\xCB\xA7\x23\x5F\xB7\xFC\x42\xBF\x5E\x34\x88\xCF\xC5\x48\xD5\xA8\xED\xA9\x7C\x39\x84\x2E\xA7\xD1\xA1\xA0\xAC\xA3\xBC\xFD\x37\xA5\x1C\x38\x1E\x0A\x46\x6D\x2B\x82\x46\x5B\xD1\xF0\x75\x29\x81\xCD\xB7\x16\x71\x5E\xF9\xC8\xB3\xE7\xAF\xE1\xF6\xDE\x6B\xA8\xF0\xC9\x0F\x14\xA9\xDF\x61\x4B\x07\x07\x32\x6A\xC3\x6A\x6E\xCA\xAE\xBD\xED\x66\xE1\xEF\xD9\x81\xDF\xB4\xA8\xE6\x17\x4E\x4A\x25\xF5\xA8\x38\x24\x04\xA4\xD2\x43\x76\x66\x06\x4C\x99\x7D\x28\xF5\xFB\xE4\xB5\xFD\x4E\xEB\x2B\x32\x49\x42\xE9\xF9\x55\xD0\x76\x81\x37\xC7\x96\xB8\xE1\xFA\xEB\x5D\xE6\xDE\x60\x67\xAF\x31\x90\x03\x9E\xCC\x86\x30\xFB\x3D\x6B\x7A\xA5\xA4\xA0\x7B\x8B\x19\x3A\x91\x88\x2C\x64\xC0\x57\x72\x4C\xD7\xD4\xF6\xC7\xAE\xA7\x94\x68\x69\xAF\x04\xB7\x34\xD4\xFB\xED\xA0\x0A\xF4\xF1\xCA\x41\x9F\xAD\x59\xAE\xCD\xF9\x91\x05\x02\x69\x74\x41\x82\x71\x6F\xD1\x9C\x3F\x64\xAD\x29\x44\x9C\x3E\x04\xFB\xD1\x32\xB2\xFA\xF2\xAB\xE9\x2C\xEB\x69\x2E\x74\x50\x23\x10\x30\x72\x63\x30\x73\x3A\x30\x5C\x26\x8F\x86\x37\x87\x45\xC7\xF5\x55\x44\xC8\x26\x81\xE9\x4D\xAC\x3B\x58\xD6\xA0\x3B\x85\x49\xA8\x40\x3C\xA9\x16\xF2\x8D\x3C\x4A\x75\xA2\xC6\xF8\x00\x3C\xBF\xF8\x12\xB1\xC7\x38\xA2\x8B\x90\x2E\x16\x60\x69\xEF\x2D\x5E\xF2\x0B\x20\xD7\xF1\xBF\x1C\xBF\x4C\x55\x38\x54\xD3\xAC\x5E\xE7\x6E\x1B\x19\xA9\xF7\xDC\x30\xC4\x37\xFA\x18\x55\x81\xCD\xAA\x3A\xE6\xFA\x6B\xA0\x3C\x7C\x98\x47\x41\x7A\x0A\x4A\x59\x89\xBF\x24\x23\x03\x98\x5E\x7E\x3E\x42\xD1\x2B\x72\x03\x78\xE2\xE6\xB7\x51\x5A\x15\x56\x93\x27\x28\xBA\x3A\x78\xC4\x8C\xC6\x7D\x48\x72\xED\x8D\xEC\x3C\xEA\x2A\xEA\x9F\x9B\x29\x14\xB2\x7F\x11\xEC\xD4\xCF\xF0\xF0\x09\xCD\x93\x59\x67\xA6\x61\xD8\x65\x18\xC6\x43\xB4\x2A\x59\x1B\xFF\x6B\xEB\xB5\x23\xB3\x64\x2C\xC9\x45\x6D\x82\xA2\x68\x00\x8F\x78\x57\x49\x0D\x52\xFC\x94\x0E\xF0\x9C\xB5\x44\x05\xB7\x06\x60\x40\x08\x59\x02\x98\x93\x22\xF0\x8C\x70\xD1\xED\x3D\xFA\x29\x4C\x02\xA9\x9F\xF3\xB4\x0E\x41\xEF\x9C\xDF\x73\xFC\x48\x17\x14\x02\x88\xC3\xDF\x04\xBA\x3E\x86\x77\xE9\x93\xC1\x04\xBA\x40\x5E\x4A\x9C\x90\x18\xFD\xA8\x68\x7F\x4F\x9A\x45\x86\xD7\xF7\xC3\x1D\x35\xA8\xE6\x59\x2E\x36\x1D\xA8\x9B\x87\x64\x95\xC9\x76\xA5\xC3\x4E\x3B\xF7\x37\xEC\x1F\x3E\x66\xF0\x7F\x81\xBF\x76\xC4\xFE\x4E\x58\x01\x70\x49\x0B\xAC\xAB\xA3\x2A\x8A\x2A\x12\x67\x0A\x34\xDE\x34\xF1\x5D\x57\x09\x8B\xE0\xEE\x34\x0C\x50\xD9\xFC\x4E\x05\x3E\x16\xA6\x41\xEE\x7A\xE1\xCE\xFB\x36\xCA\xF3\xBF\x56\xA5\x4E\x0A\xC1\xC3\x96\x4F\x88\x3F\x29\x89\xD7\x25\x38\xAF\x29\x8E\xF1\xAD\xBA\x63\xFC\x76\x77\x12\x8D\x05\x63\x30\x20\x5A\xE7\xA5\xCB\x5D\x66\x5B\xCE\x04\x06\x1F\x23\xA9\x0D\x54\x62\xB4\x35\x92\x17\x14\xB6\x4E\xAB\x19\xE0\x84\x36\x06\x6C\xF3\x37\xB4\x5C\x44\xAD\xAC\xFD\xA2\x45\x15\x3B\x7F\x31\x79\xA1\x23\xF9\xD9\xF9\x52\x6F\x6A\x91\x94\x9C\x7B\xD3\x8C\x97\xF9\x10\xDE\xB7\x9A\x79\xD8\xEB\x17\x0F\x45\x43\x92\x91\xDB\x3F\x98\x6B\x8D\xC4\xD6\x10\x19\x4A\xEB\x31\x68\x7A\xC2\x04\x00\x9D\xF7\x90\xAF\x67\x3D\x41\xD9\x03\x6A\x12\x48\x05\x0D\x56\x9A\x5B\x68\xAC\xF6\xFB\x9D\x2B\x93\x3F\x6B\x63\xB9\xF6\x6A\xD0\x96\x00\xB1\xA5\x5F\x92\x1A\xED\x7E\x01\x0A\x62\x72\x54\x10\x48\x66\x67\xF4\x60\xE8\xA3\xB9\xD9\x1A\xCE\x8A\xB9\x7B\x90\xF7\xB6\xFF\x2C\x54\x6B\x7A\xF6\x5D\xA8\xB1\x94\x0E\x4C\xE4\xD6\x07\xA8\x66\x39\x5A\x61\x32\xBD\x8D\xB9\x3E\x3E\x48\xF1\x78\x5E\x28\x62\x04\xD1\x07\xDF\xDA\x24\x70\x8E\xD1\xAC\x33\x1E\xDF\x6C\x08\xA2\xE4\x64\x0C\x4D\x20\x42\xC0\x3F\x00\x19\xD2\x15\x83\x73\x00\x4E\x2C\xE9\x71\xE3\x56\xF6\xD1\x19\xDC\xF5\xCA\xF1\xD6\x8D\x44\x0D\x27\x92\x1D\x88\x26\x43\xE7\xCD\x15\x7C\x2A\x2A\x05\x5D\x91\xDF\x0A\x45\x95\xC5\xDF\x28\xFA\x68\x59\xA7\xCD\x54\x20\x9F\x15\xF8\x96\x15\xB3\x35\x66\x38\x7F\xB3\xD3\x2C\x48\x97\xCE\xE4\x07\x9B\x44\x26\x6B\x40\xFC\x31\x56\xF9\xBA\x22\xDC\xEE\x2C\x37\x2C\xD9\x98\x61\xCE\x54\xA9\x55\x25\x5D\xBB\xAE\xEB\x0F\x14\x41\x2F\x80\x1B\xAC\xAC\xE8\x65\x32\x89\xC5\x20\xAC\xD2\xD9\x75\x74\x0B\xA0\xEF\x7F\xDD\x21\x4A\x52\x3B\x99\x6C\x06\xD6\x00\x4F\xB0\x1E\x39\x8C\xF7\xA7\x53\x84\xEF\xB1\xD8\x23\xCA\xDC\x00\xE6\xA6\x1B\xAA\x4F\x06\x8F\x7A\xCA\x40\x78\xD4\xF8\xBF\xCF\x28\xF3\x90\x04\x6F\x8F\xC4\x28\x0B\xE1\xBD\x9D\x29\x11\x51\xA4\x36\x40\x8A\x46\x67\xD8\x0A\xB1\x21\x8F\x85\xA1\x35\xD3\x8F\xD8\x12\x7D\x25\x6A\xDA\xB8\xA5\x7F\xD7\x0D\x42\x90\x25\xCB\x71\x4F\x44\xEE\x2C\xA2\xD2\x6B\xFC\x19\xF8\xC3\xDE\xFB\xFB\x5E\xC0\x6F\x55\x37\x68\x9E\x1F\xC2\x21\x71\xF6\x9D\x7D\x00\x7A\x14\x34\x57\x1E\x53\x60\xEE\x80\x32\xB9\x10\xF6\x84\x98\xB4\xDE\xC9\x51\xDB\xF7\x93\xF5\xC0\x47\x91\x4C\x1F\xE2\xA1\xC8\x99\x2F\x8B\x32\x26\x41\x7D\xA7\xC1\x61\x5F\x44\x9D\x4D\xD3\xD1\xC4\x57\x5E\x35\x0A\x79\x65\x6B\x22\x5E\x96\xC4\x18\xD4\x28\x30\x0F\xCC\xFD\x1D\xAC\x09\xE6\xEA\x20\xAE\x83\xF8\x04\x0B\x8B\x7E\x62\x8E\x38\x13\x5E\x09\xB7\xCE\xCA\xE7\x28\x94\x50\xA6\xFF\xFD\x24\xB9\x9E\xAF\x9C\xEB\x49\x84\xFD\x4B\x17\xA8\x7D\xB9\x40\x2F\xC3\xFE\xD0\x26\x17\x84\x91\x84\xCD\xD8\x8F\x9D\xB0\x0F\x75\x5A\xE6\x76\x4C\xDF\xA6\xD2\xEF\x6F\x79\x32\xFA\xBC\xFA\x7B\x44\xCA\x1E\xC3\x25\x6E\x6D\x88\x93\x45\xCB\xBC\xDD\xCB\x0A\x29\x3B\x48\x2B\x4F\xCB\x95\x0C\x0A\x37\xF4\xDE\xF6\x0F\xC4\xDD\xD2\xB1\x07\xC7\xF6\x37\xF0\x2F\x2E\x54\xD2\x03\x15\x2E\xB0\x1F\x03\x10\x93\x11\x57\xF4\x89\xF6\xEB\xE8\xAB\x9A\x1B\x64\x0C\x4B\x05\x91\x89\x5A\x84\x5C\x4C\x19\x69\x30\xDA\x30\x3D\x90\x03\xD1\x4F\xEE\xD6\x16\x03\xB5\xAB\x77\x48\x09\x00\x19\x5E\xAE\x9D\x23\x5C\x57\xED\x98\xBF\xF9\x97\x6B\x33\x0E\x7E\x8D\x84\x08\xFA\x1A\x26\xDF\x2B\x55\x6E\xA7\x28\xA3\x5A\x5B\x73\x1D\xBC\x5D\x42\x2E\xF4\x7C\x2D\xB4\xC4\xCD\x6C\x6A\xC2\x25\xD9\x47\x72\x5C\x64\x95\xC4\x4C\x44\x09\xFD\x23\xA8\x0D\x9D\x86\xC9\x68\xD2\xDD\x40\xC8\x6B\xDF\x90\xC2\xA7\x52\x48\x88\x51\x3B\x11\x80\x0D\x7D\xB1\xD4\x8D\xD6\x0F\xE4\xFC\xC6\xC0\x50\xD0\xC2\x13\xFA\xE2\x58\x44\xB9\x51\xC1\x05\x2C\xE6\x7A\x9A\x8F\x9F\xE1\x79\x2E\xFC\x44\x0C\x40\xDF\x88\xA0\xD6\x7A\x96\xED\x53\x74\x36\xCE\x54\xAE\x3B\x3C\x04\x40\xE9\xDB\x09\x81\x71\xD4\x5F\xB0\x1C\x60\x8C\x8F\x8B\x31\x69\x43\x86\x8D\xFE\xCA\xAE\xB4\x08\x3E\x98\x35\xA0\xE5\x81\xD2\xC6\xA4\xDA\x2B\x7F\x49\xFF\x88\xE3\x1D\x26\x36\x7B\x31\x30\xE7\x0E\xD5\x11\x5D\x67\xA1\x68\x24\xFC\xBF\x91\x30\x36\x8B\xF2\x99\xC9\xD2\xC1\x20\x1D\x35\x8B\xD8\x05\x5B\x67\x2A\xA0\xF0\xB8\xC9\x93\xE5\x6E\xBB\xC2\xDF\xCF\xD9\xAC\x25\xF8\x57\x1B\x73\xEA\x04\x33\xCB\x0B\xEC\xEE\x84\xAE\xEC\xCE\x8A\xF1\x92\x81\x34\x1A\x3B\x60\x8A\x6C\x68\xA8\x9D\x3D\x71\x71\x65\x84\x84\x90\x03\x6A\xF2\x6A\x12\xDE\x09\x1A\x9C\xA0\x35\x66\x3F\x46\x6A\xFD\x1D\x85\x47\xE2\x07\xDD\xF9\x9D\xF5\x85\x06\x1A\xD2\x81\x56\x0E\x91\xA8\x31\xA8\x3B\xC5\x2A\x73\xA2\xCF\xB7\x76\xB2\xBA\x84\xBF\x60\xEC\xC8\x5C\x45\x8D\x48\xF5\x79\x00\x90\xB4\x84\x3B\xD6\x1A\x13\x66\xA7\xC8\x69\x53\x12\x9B\x25\x17\xA6\xBC\x91\x22\x15\xEA\x7F\x09\x5D\x00\xEC\x04\xB1\x0A\xF8\x6C\xC4\x12\xA0\x7D\xFD\xBB\x8D\xA0\x6A\xBB\x07\xEC\xB8\xB5\x94\x6B\x85\x25\xD4\x53\x76\x51\x2F\xEF\xF9\xC2\x3A\x6C\x37\x41\x4D\xBE\x0B\xE8\xE0\xD0\x6C\xB1\xED\xBA\x60\x6D\xBF\x73\xDF\xC8\xAC\xEC\xE6\x2D\xE8\x1A\x35\xF1\x22\x8A\xD1\xA7\xC6\xBE\x8D\xB6\x4E\x95\xFF\x0C\x2F\x9D\x9F\xB1\x5E\xD3\x32\x60\x8A\xFF\x26\xAB\x6A\x2B\xCA\xB9\xF0\x3E\x5F\x06\xEF\xC6\x4A\x8D\x55\xBA\xE6\x68\xBC\x91\x11\x48\xE5\x5C\x3C\xAC\xC1\x9D\x7E\xDF\x0B\x75\x7F\x31\xCE\x91\xBF\x8C\x6D\x6F\x18\x75\x85\x41\x03\x21\x73\xDE\x9C\x2E\xA3\xA3\x65\xF6\x4A\xC1\x36\xD1\x02\x37\x79\xE1\xA8\xDB\x0A\xDE\xEC\x62\x91\xCD\x52\x89\x11\x1D\xB2\x48\xEB\x45\x4E\x10\xA9\x75\x59\xC9\x18\x68\xE0\xF1\x11\xB5\x0C\xD9\xEF\x0F\x31\x83\xB2\x7D\x2D\xF9\xFF\x98\xFA\x45\x20\xD1\x27\xE1\x50\x16\x10\x8F\xFA\x5F\x7E\x50\xE9\xDF\x2C\x79\x32\xCE\x80\x39\xBF\x2B\x11\xC8\x59\xDD\x67\xEA\x56\xF7\x27\x80\x55\x8A\x1E\xDE\x3D\xAE\xA6\x25\xE2\x74\xE5\x14\x02\x93\x1F\xA3\x9A\x2E\x3B\x1F\xDC\x7E\x55\xB6\x79\xA4\x60\x4B\x07\x35\x3A\x9F\x6A\x40\x62\x2D\x10\x80\xC2\x43\x30\x35\x26\x79\x56\xE5\xF6\xD4\xC2\xD7\x83\x2B\xDC\x0D\x50\xC4\x47\xDA\x72\x30\x83\x81\x21\xD2\x6D\xDB\x32\x89\xE6\x07\xD1\x47\x6C\xF4\xBD\x86\x5C\xA7\xBB\xD5\x45\x63\xFA\x3F\x6B\xCD\x3A\x77\x9B\xDB\x31\x75\x3B\x36\x6B\x26\xC2\x01\x31\x10\x58\x31\x1E\x84\x7E\x40\x87\x58\xCF\xDB\xB4\xA4\x16\x8F\x98\xEE\xFB\x60\x0D\xA4\x27\xDD\x8D\x9E\xDA\x7A\xC6\x40\xCE\x7A\x0A\x85\x3C\xC8\xC4\xDF\x83\x3C\x8F\x78\xF7\xF1\x17\x08\x93\xC0\xD2\x48\x55\x18\x8D\x28\x3D\xA6\x61\x5D\x31\xCC\x7A\xBE\xC8\xE3\x65\xE1\xEF\x43\xCC\x89\x96\x3A\x26\x7D\xA7\xC9\x67\x09\x0F\x31\x1C\x0E\xCA\x85\xF6\x9C\xD1\x53\x7E\x83\x1D\xE3\xAD\x90\x71\x5E\x92\x7B\x4F\xD3\xC7\xF7\x2E\x21\x8E\x23\x24\xA3\xEC\x7B\x73\x52\x4C\x53\xB7\x3A\x2B\x06\x02\xD0\x32\x3A\x58\x57\x4F\x00\xB7\x53\x7B\xB4\xAD\x88\x27\xDD\x82\xBD\xCC\x10\x37\xD7\x50\xB3\x76\xB7\x37\xB2\x47\x36\xB7\x8F\x7E\x81\x7C\xCB\x5A\x0E\x84\xE2\x73\x9B\x29\xB6\xA2\xCE\x74\x46\x78\xA3\xD3\xB5\x01\x97\xCC\xBF\x0A\x44\x51\x85\x12\xCB\x6C\x95\x2A\x13\x6B\xAB\x85\xF2\xBC\xDD\xE5\xF9\xC1\x06\x03\x19\x8C\x10\x84\xB1\x39\x87\x18\x1C\x0A\x1F\x54\x35\x8F\x4F\x96\xDA\x9E\x5D\x94\xFE\x04\xE6\x6F\x1D\xF9\x5D\xE0\x7C\x6C\x33\xC8\x16\xDE\x39\xE8\x83\xAE\xB4\x0C\x1A\x2F\xBC\x96\x88\x3F\xC9\x66\xB7\x53\x5D\x0E\x8F\x7F\x52\x0C\x88\xA7\x55\x03\x46\x26\x53\x41\x28\xDB\x13\xFE\xEF\x18\xF0\xC1\xA2\x39\xBB\xC0\xB8\x16\xB8\x76\xE3\xDB\xC2\x92\x2A\x46\x62\x1C\x3E\x94\xAE\x38\xE7\xF6\x9A\xC0\xE0\x9A\xBD\xDE\x32\x9B\x50\x92\x97\x07\x0E\x56\xFD\xA7\xEF\xA1\x6E\x50\x96\x6D\xE5\x7A\x4A\x0F\x55\x06\x61\x35\x82\x23\x71\x9B\xC9\x2D\x5A\x41\x47\x70\xEC\xBD\xFA\x86\x42\xC5\x21\x54\xEC\x39\x1F\x46\x29\xBB\x0F\xE4\x0A\x21\xDA\x32\x7E\x99\x77\xE1\xDA\x02\x09\x04\x36\x06\x3C\x96\xF8\xC4\xC8\xA1\xB7\x9A\x72\x2F\x46\xE4\xD3\x96\x1E\x38\x7A\x7B\x4B\x52\x8E\x6E\x0D\xB2\xD1\x39\x75\xF9\xB3\x35\xAE\x34\x1C\xFE\xDA\x28\xBD\xB9\xBC\xAA\xF2\xF2\x0A\x48\xE6\x5D\x4D\x6E\x98\xC4\x60\x78\xA8\xB1\x65\x69\x44\x5A\x4C\x15\xCC\x58\x16\x0C\x06\x93\x37\xD0\xBF\x4A\xEF\x69\x85\xA5\x08\x3B\x86\xAF\x20\x0A\x36\x55\xE6\xA5\xDF\x0A\x31\xB1\xF1\x6E\x53\x35\x3B\x5A\x1C\xBE\xA4\x72\x88\xE5\xE4\xFB\x55\x80\x28\xC9\xB7\x2F\x1B\x7D\x67\xA8\x0F\xF6\xCC\x8C\x88\x00\x11\x9B\x7A\x89\xD0\x75\xA4\xEE\x94\x82\xCE\x09\x8F\x8D\xF9\x39\x78\x08\xA9\x01\xFA\x4C\xF4\x08\x23\xBE\x7B\x25\x62\x01\x35\xBD\x1B\x64\xBF\xBB\x03\xAA\xDF\x06\x6F\xAB\x4B\xDE\x9B\x3D\x4E\x72\x71\x98\xD0\x6F\x54\xBA\xEC\xD2\xF2\x7C\xC2\xFB\x9D\x51\x27\x4A\x67\x2C\x84\x0D\xEB\x18\x1F\xB1\x8E\x7F\xA7\x2A\xE8\xFC\xAD\x90\xDE\x1D\x50\xB7\xE4\x7E\x4D\x40\x98\x24\xAD\xC9\xBB\x34\xD3\x50\x78\xC1\x26\x04\x7A\xF8\x52\x11\x2B\x35\x27\x44\xC5\xD8\x77\xAE\xFF\x71\xFC\x97\xC2\xC7\x82\x1E\x69\xB4\x47\x06\x58\x4D\x51\x95\xA5\xA1\xEE\xF1\xCD\x88\x66\x0F\xC9\x31\x60\xAC\xFC\x91\x63\x18\x79\xCB\xE4\xD5\x26\xE2\x09\x24\x3E\x7A\x5C\xA8\x4A\x87\xFE\x39\xA7\xFE\x6A\x63\xB7\xC0\xE1\xD2\x63\x03\xE6\x59\xF7\x8A\xE3\x2A\xCE\xD3\x5A\xC1\xD0\xDE\x44\xB3\x22\xB7\x05\x03\x42\xAC\x4A\xEA\xDE\x85\x4C\x62\x3A\xB7\xF4\x98\x50\x89\xED\xB6\xF3\x6A\xF4\xE0\x41\x77\x95\xB9\x5A\x71\x19\x34\x9F\xBB\xB8\x90\x7D\x62\xB7\x7A\x01\x14\x09\x18\x1E\xF7\xD0\xCB\x3B\xDC\x93\x25\x61\xEE\x28\x91\x5F\xC1\x44\xDD\xE7\xE8\xCC\xD0\xC5\xA2\xB4\x22\x20\x3C\xB6\xBF\x31\x14\x70\x93\xA6\x9B\xAD\x3D\x71\x04\x04\x6D\x9C\x63\x99\x4D\xB5\x58\xF5\x53\xFF\xC3\x89\x94\xF7\xFA\x94\x23\x0B\x14\x31\xC3\x26\xA5\x9F\x93\x86\xFB\x82\x5C\x7C\xF4\x3A\x19\x47\x58\x26\x39\x71\xFD\x34\x62\xF6\xF8\xF6\x4E\x3F\xA1\x1E\x8B\x4D\x2F\x99\xE4\x49\x94\x37\x16\xB9\xBE\xD0\x83\x96\x14\x45\x36\x3A\x69\xBE\xA2\xFB\xE0\xB6\x85\x47\x8E\x63\x48\xAD\x97\x88\x42\x9D\xD1\x77\xA7\x1F\x45\xFC\xB9\x3E\xEA\x88\xB0\x14\xF7\xF6\x59\x64\xFB\x82\x75\xD0\x57\xC5\x16\x40\x66\x9F\xD2\x63\x48\xFD\xB4\xF6\xE9\xD1\xA7\x32\x1B\xA0\x11\x87\x26\xFA\x7D\xE3\x86\x1E\x53\x0F\xEE\x66\x08\xF0\x18\x9C\x3B\xC2\x6A\x92\xBD\x24\x09\x16\xB7\x8A\x98\x1B\xC9\xF4\x2F\x21\x10\x5F\x0D\xF6\x36\x55\x1F\x4D\x5F\xFC\x3D\x50\x04\xE1\x72\xD8\xE7\x5B\xA2\x0C\x30\xAA\x48\x14\xA6\x7B\xE0\x31\x7A\xF8\x42\xBA\x03\xF2\xDB\xFB\xA0\x53\x35\x1B\x83\x4F\x7A\x1A\xE8\xE8\x3E\xDE\x7D\x6B\x2F\x00\x50\x98\x27\x8C\xE4\x1A\x9B\xF0\x47\xB5\xE8\xB2\x8B\x21\x9D\xA3\x0A\xFF\x88\xB1\x39\xF9\x19\xB6\xCB\xD6\x0C\xC4\x89\xB9\xB7\xD8\x6D\xE8\xB8\xC7\xDB\x0F\xE5\x0C\x9D\xB7\x78\xFA\xFC\xC9\xE8\x4B\x76\xBD\x9C\x19\x58\xCF\x98\x87\x7D\x87\xB1\xC3\x35\xD5\x32\x49\x20\x69\x93\x38\x5E\x94\xF2\xC4\xD1\x1B\xC0\xF0\xEB\x99\x24\xDB\x4E\x38\xCA\x6C\x8A\x68\x53\xAE\x4A\x0E\x05\x04\xAC\x47\x43\x9C\x6E\x69\x3F\xC5\x16\x1C\x96\x73\x60\x24\x67\xA6\xA5\x8D\x38\xB8\x77\xB0\xF5\x9C\x28\xCC\x54\x0F\xAA\x93\x06\x56\x3B\x35\xF2\x25\xC1\x79\xFE\xF2\x31\xEF\x31\xF1\xC3\x82\x9B\xE2\x5C\x77\x52\x11\x56\x05\x77\x81\x6E\x26\x35\x23\x48\x26\xCC\xD0\x16\x56\x6D\x0F\x6E\x87\x91\xA5\x9A\x32\x5C\xD2\x22\x81\x73\x5E\x91\xBA\xD8\x6B\x66\x32\x69\xCF\x1C\x49\x7A\x1E\x7B\x32\xF6\xFD\x0D\x6E\x95\x51\xDA\x84\x5A\x2F\xEE\xCB\xB8\x63\xC3\x14\xDC\x64\x97\x8F\x58\x3E\x02\x2E\x74\x74\x70\xC7\x09\x3C\x85\x0B\x6B\x97\xC1\x37\x4A\xE2\xBE\x87\x43\x61\x96\x05\x30\x3A\xC7\x8D\x04\xF6\xFB\xBB\xB9\x36\x1C\xBF\x7B\x5A\x62\x06\x6D\x2A\xF3\x66\x56\x59\x73\xEC\xCC\xF2\x95\x8B\x8F\xE8\x03\x66\x0D\x3C\x39\x3F\x74\x7B\x88\xCB\x86\x8F\x94\x79\xE8\x80\xDC\xD5\x7F\x86\xB4\x77\x9E\xD8\x8C\x72\xF9\x2F\x60\x7A\xFA\x3B\x38\xFA\x15\x24\x0D\x59\x39\x9B\x71\xFA\x1A\x14\xFE\x34\xF8\x37\x12\x84\xBC\xC4\x00\xBB\xC4\xCA\x3D\xC5\x33\x62\x38\x2D\xD3\x0D\x21\xC5\xE8\x4A\x85\x85\xC5\x4A\x5C\x01\x35\xD3\xDA\xD6\x41\xB9\x47\xB6\xDE\xE0\x04\x8C\x75\xD4\xA4\x66\x5A\xE0\x65\x2B\x23\xFC\xCC\xFA\x75\x06\x80\x0F\xCE\xB6\x08\x6A\x2F\x90\xBD\xD5\xC5\xAF\x5D\x8D\x89\x6B\x3B\x19\x42\xEB\x70\x0A\xC8\x2C\x3B\xF1\xFF\x73\xC5\x16\xB8\x35\x7F\xE3\xC4\xC6\x98\xBA\xAE\x7B\xEA\x3D\xDC\x6B\xB7\x83\x22\x84\xEA\x59\xAB\x26\xF6\xC7\x83\xA6\xBC\x49\x6D\x62\x89\x4B\x11\x20\x34\x10\x8E\xE9\x08\x3E\x62\x6D\xDA\x2F\xB3\x38\x81\xD2\xFA\x18\xD0\x65\x85\xDD\x69\xD0\xEA\x08\x54\xBB\xFC\x90\x0F\x1E\xC9\xFE\xB3\x62\x30\xB3\xB0\x9F\xB7\x50\x12\xF2\xE8\x2B\xBE\xA4\x2D\x17\x0A\xD8\x24\x38\xC8\x87\x8B\x98\x1A\xD1\xE7\x54\xFB\xBE\x41\x7B\xDB\xED\xAB\xB4\xA8\x17\x8C\x37\xE6\x66\x71\xA2\x0B\x8C\xA3\xB6\x4D\xF0\x03\xC5\x4D\x03\x50\x2B\x2A\x09\x48\xE0\xAA\xC5\x24\x36\x68\xFB\xA4\x85\x9D\xA1\xCB\x7B\x1A\xF6\x4D\x12\x97\x1D\x28\xA9\xEB\xF2\x8C\xD3\xF0\x6D\x5C\x94\x64\x48\xE1\x5B\x93\xD1\x7A\xFC\xBA\x59\x2B\xE6\x08\x57\xE2\x56\xC9\xD2\x2A\xED\xCD\xE3\x82\xE7\x54\x15\x37\x99\xA6\xE7\x3C\x85\xE7\xFC\x89\x6C\x95\x10\xFE\x80\x4C\xD2\x2E\xED\x60\x47\x33\xA4\xE7\x92\x12\xCE\xFF\x70\x2C\x58\x74\xB3\x9D\xB7\xBA\x7E\xE7\xDE\x50\xF0\x05\xCB\xFB\x67\xA0\x6F\x6D\x07\x85\x6A\xEE\x10\xF8\x19\x03\xFB\x8B\x62\x17\x0E\x2A\xF4\xF5\xA8\xC0\xD3\x1D\xA0\x47\x56\xA9\xBA\x31\xFC\x6E\x66\x0C\xAE\xF1\xB1\xF7\x95\xF5\xC0\xC3\xA9\x3C\xD6\x50\xB5\x49\xCD\xAE\xF8\x61\x6A\xB3\x27\x18\x4A\xA0\xC1\xB9\xCC\x9C\x7F\xA0\x42\x80\xA2\x75\x07\x51\x58\xF2\xAE\xCB\x27\xC4\x69\xC8\x38\x10\xFC\x83\xC4\x30\xC1\x79\x4B\x63\xFD\x52\xD6\x9A\x1F\x2B\xE6\x7C\x85\x92\xED\x97\x37\xFD\xBC\xF1\x8A\xAC\xF0\x8F\x01\x89\x33\x40\xAB\xC6\x56\x39\xA2\x4A\xF8\xEA\x51\x29\xF8\x2D\x81\x3B\xBF\x0E\x01\x87\x16\xB5\xE9\x66\xDB\x78\x53\x87\x47\xAC\x7F\x5C\x44\x8F\xA7\xB0\x18\xA5\x44\xE2\x67\x54\x04\xB1\x48\xBC\xB0\x42\xF3\xE5\x0C\x7A\x13\x18\x29\x53\x20\x3B\x7A\xC0\xC9\x0B\x7B\x6F\x5F\xD2\x90\x4A\xA8\xD2\xB3\x12\x63\xB3\x51\x4B\xF9\x16\x86\xD8\x1A\x1B\x28\x5F\x4E\x42\xCF\xDA\x38\xE5\x0D\xDC\xBA\x31\xBB\x77\x5A\xD9\xB4\xF4\x2E\xD1\xB3\x56\x07\x57\x59\x7D\xF1\x54\x0F\xC7\x18\xE6\xA8\xBA\x56\x01\xAA\x00\x29\x07\x05\x77\x2B\xE5\xEF\x1E\x80\xF4\xBE\x23\x7A\x80\x6F\xD2\x83\xB4\xE3\x3B\xC9\xB1\x77\x32\xD9\x12\x03\xFC\x9F\x64\x58\xBB\xDA\x82\xD4\x7A\x65\xA8\x1A\x52\x5D\x18\x84\xA8\x2A\x42\x79\xF8\x57\x21\x72\x4E\xF1\x01\x00\x8F\x1F\x28\x13\x09\xC8\x4E\x1B\x6D\x46\x5A\x7F\x75\x9D\xFC\x9E\x10\xA1\x2A\x09\x9B\x45\x0C\xBC\x61\xBA\x93\x99\xB0\xEC\xD0\x40\x97\xCD\xD9\xBE\xE6\xB6\x29\x0B\x10\xF9\x96\xA2\xC8\xEE\x8D\x54\x5F\xB5\x99\x45\xD8\x16\xE8\x0C\xB6\xAE\xBC\x31\xEE\xF2\x82\x35\x8B\xFA\x95\x85\xB1\xEB\x8E\xE5\x41\xCC\x6D\x44\xFA\x39\xA2\x21\x1F\xCE\x3E\x4A\xA7\xCA\xDF\x75\x61\x4A\x7E\xF6\xEC\xD8\x57\x2D\xCE\x1B\x83\xC5\xF6\x6F\xB0\x80\x54\x03\x3A\xE8\x7F\x1A\x8A\xC7\xD0\xD5\x09\xF1\x2B\xF6\xAD\x4B\xBA\x2F\x62\x50\x71\xA4\xB0\x10\x0F\x78\xA6\x58\x6A\x24\xCD\x13\x01\x3B\xE9\x46\x55\x4B\x8B\xCE\x9C\x7A\x59\x41\xE6\x78\x59\xF8\x06\xC9\xF7\x6B\xA1\x15\x50\xA6\x52\x34\x37\xBB\x03\xD0\xAD\x77\x8D\x92\xA5\xC9\x6C\x69\xCF\xA1\xB2\xA0\x3D\xDA\x98\xF6\xAB\x0B\x23\x4A\x99\xC9\x13\x31\x0D\x22\x81\xE2\x5A\x58\xE3\x1E\x55\x56\xE2\xE3\x71\xDF\xDF\x53\x3F\x71\xE9\xC5\xCE\x7B\xD8\xC8\x08\xB5\xB3\x99\x78\xD2\xF0\x54\xB2\xBB\xBE\x21\x06\x60\x9B\xB8\x41\x41\x29\x8A\x69\x6F\x73\x59\x2F\xF0\xA1\xDD\x0B\x65\xEA\xA0\x0E\xD9\xB7\x5F\x9B\x92\x32\x5D\xC1\x76\x1D\x04\x48\x96\x8D\x50\x64\x3D\xAB\xDA\x0F\xA3\x39\x44\x79\xEA\x2A\x28\xA7\x8D\x77\x0E\x46\xCD\xE9\x39\x66\xAB\xE9\x7F\xB9\xF9\xDD\x0A\x39\x91\xB2\x72\x4E\x57\xBC\x19\xA7\x34\x20\x46\x50\xD4\xC8\xDB\xC9\xB4\xCD\xCB\x03\xD6\x37\xEA\x5A\x8C\xDC\xBB\x91\xCC\x4F\x47\x87\xCC\x54\xDB\x14\xF5\x10\x47\x3F\x39\x24\x2D\xD3\xE7\xFB\xB7\x0A\x54\x08\xBC\xDC\x6A\x54\xAC\xF7\x90\xBE\x3B\xC7\x7B\x72\xCA\x38\x20\xCF\x22\x43\xED\x57\xA7\xF7\xC2\x91\x3E\x6D\x01\xB5\xFF\x81\xAB\xF8\xB3\x41\xB4\xB9\xA9\x8E\xC1\xC3\x9C\x6E\x50\xA4\x27\x33\x3C\x56\x7B\x50\xB4\x3B\x4D\x49\xCE\x3A\xBA\xC1\x37\xB8\x66\x5B\x18\x50\x55\xD8\x27\xF6\xF1\xBD\x94\x80\xC5\x74\x48\x37\x7D\xEE\x0A\xA3\x32\xBF\x76\xF4\x1B\xF6\x4D\xF8\x3A\xBF\x46\x74\x03\xD6\xF1\x1A\x10\x11\x91\x25\x2A\x74\x71\x1A\x3B\xD7\x95\xE6\x55\x4B\x11\x22\x22\x73\x4D\x09\xEE\x2D\xEE\x99\xE3\x43\xD0\x22\x81\x8F\x15\x52\xF2\x0C\x96\x0F\x00\x48\x71\x9E\xC7\x24\x2A\xF2\x6A\xD3\x4E\xD9\x45\x4B\x64\x7F\x19\xDB\x19\xC5\xB9\x1D\xE5\x9A\x65\x7C\x28\xCA\x50\xCF\x86\x5D\xA9\x60\x07\x18\xD5\x86\xA7\x01\xB4\xA4\x69\x67\xBD\xF6\x3D\xCC\xD4\x24\x44\x96\x3B\xC2\x9B\xF6\xEB\xD1\x0C\xC3\xA4\x40\xA1\xE0\x3A\x23\xDA\x62\x60\xC6\x42\xFA\xEA\x8B\xAA\x65\xCA\x6D\xE7\xB0\xEC\xAC\xDD\x36\xDA\xFF\x34\x60\x03\x1C\x17\xA4\xB8\x2C\x2D\x75\xFC\xE8\x0C\x23\x11\xA9\xB4\xC9\xC3\x6E\x52\x4D\x45\x0F\xC9\xCC\x72\x12\xEA\x81\xBB\xFA\x18\x5E\x63\x56\x47\xEA\x56\x8B\x83\x24\x39\x0B\x0E\x0A\xD0\x03\x7F\xAB\xEB\x9A\xC8\xD4\xD1\xC5\x2D\x7E\x7B\x4D\x33\x14\xCB\xBE\x96\xB1\x24\x2E\x66\x31\xB6\xAC\x28\x4F\x9E\xE1\x6F\xD6\xC3\xAB\x05\x04\x40\x23\xC8\x3B\x66\x43\x58\x84\x7D\xE4\x7F\xF2\xDA\xD1\xCD\x84\x1A\xBE\xAB\x09\x7A\xF9\x52\x84\x20\x5F\xE0\x00\xC3\x8E\xFC\x45\xDD\x6C\x87\x25\x13\x3D\x08\xC6\x9F\x39\x3E\xAB\x11\x57\x21\x65\xD1\xA3\x79\xE5\xFD\x52\xAA\x29\xEE\xA8\x6C\x2B\xFF\x28\xA1\x05\xD5\x7B\x2D\x48\x3C\xAF\x81\x8E\x0D\x1E\x15\x3A\x0D\xA5\x7A\x3E\x31\x6A\x25\xB1\x64\x65\xC2\xAF\x31\x08\x9F\xE8\xE5\xC6\x3C\x6A\x3B\xCE\xA7\x57\x99\xE5\x56\xD5\x94\xA1\x8B\x78\xB3\xD7\x17\x36\xB5\x25\xBC\xF6\xDA\x82\x06\x3D\x4A\x0B\xEF\x3E\xC6\xC5\xE4\xED\xB6\xA4\x9A\x1B\xA0\xC6\x01\x79\xA0\x3A\xC4\xD7\x6C\x1F\xC7\xA2\xF1\x7E\xF9\xF2\x4A\x94\x9D\xEA\x99\x62\x6B\xF9\x75\x24\xD2\xAA\xD1\x19\x3F\xEA\x7D\x35\xF9\x55\x08\x86\xEF\x7A\x6B\x46\xBF\xD5\x1C\xF1\x7F\xB7\xF0\xB4\x40\x82\xB3\xC3\xFD\x46\x26\x68\xDB\x3B\xAC\xAD\x47\x13\x32\x76\xDA\x9C\x8E\x77\x98\x2F\x95\x8B\xEA\x4F\xE3\x53\xB8\xEF\x32\xAF\xEC\xEA\x86\xFA\x05\xB7\xDB\x37\xD7\x82\xA4\x46\xE3\x46\x91\x41\x21\xE3\xD2\x4E\xC3\xE0\x33\x43\x32\x9B\x92\x64\x7C\x4A\xC3\x4A\x32\xF0\x51\xC3\xB9\x4C\x15\x7A\x38\xE3\x2B\x9E\xC5\xDC\xB4\x75\xC7\x1C\xBF\x5A\xAB\x67\x51\xB3\x2F\xBC\x63\x3C\x05\x43\x87\xC9\x9F\xEB\xC9\xEA\x22\x11\xDC\x7E\x0D\x36\xDC\x5A\x53\x86\xAA\xC4\xB1\xCF\x70\xC7\x0F\xE4\xA4\xEA\x3D\xAB\xA9\xD1\xD5\x48\xCC\xA9\x6C\xE8\x58\x1A\x8D\xF4\x26\xDC\xA3\x91\x33\x47\x50\x5E\xCF\xB8\xE1\xDF\xC2\x8A\xED\x0B\x6E\xD3\xAA\xD2\x35\xFB\x57\xCE\x3D\xC3\xC1\x37\x7E\xB2\x8F\x04\x53\x4A\xAC\x23\x38\x20\x2E\x5E\x1B\x16\x34\x16\x5F\x49\x8E\x67\x74\x3B\xEE\x2C\x53\x30\x47\x79\xC8\x0B\x1A\x8F\xBF\x7E\x32\x54\x5A\x7F\x1F\x4B\x08\xA3\xF1\x2B\xF5\x1A\xB8\x7E\x0F\x67\x09\x5A\x0B\xCA\x57\x0D\x41\xD0\x9F\xB6\xE0\xC5\xFA\x4E\xE2\x0D\xF8\x79\x1C\x50\x47\xF5\x58\xEA\x13\x1B\x5D\x70\xC8\xC8\xE9\x26\x27\xF6\xC2\x39\xCD\x1A\x96\x05\x3B\x21\x6E\x00\x29\xD6\x5C\xFE\x20\xFB\x84\x66\x84\xF8\x30\xF9\x15\x32\x7F\xEB\x4E\x27\xD2\xB2\x88\xDB\x94\x9E\x84\x56\xF0\x6E\x18\x73\xE2\xD9\x4B\x8C\x14\x93\x74\x7A\xF4\x5B\xA8\xF7\xC3\x2A\x9B\x14\xFF\xF9\x48\x30\x24\x04\x00\x2E\x74\x50\x57\xFC\x2F\x34\x57\x6F\xB1\xB0\xC8\x51\x14\x13\xCE\x49\x57\x23\x31\x70\x30\xF1\xDF\x84\xD0\x34\x7C\x4C\xF6\x34\xE4\x12\x77\xAD\x18\xA8\x84\x4D\xB9\xAF\x84\x3E\xEE\xE0\x6B\xB2\xC8\x3B\x55\x7A\xA4\x53\x20\x3C\x3C\x54\x09\x1B\xD5\xD2\x2E\xD7\xC6\xD8\x93\xBB\xD5\xC2\x36\xD8\x36\x81\xD3\x90\xF4\xA2\x6F\xCD\x4C\x72\xB7\x2B\x4F\xC2\x43\x82\xDF\x4B\x80\x8C\x58\x37\xB3\x33\x5B\xC3\xB3\xA8\x37\x59\x25\x14\xE2\x48\x24\x55\x2B\x83\x03\x34\xC8\x35\xCA\x01\x54\x77\x23\x45\xE6\x55\xEF\x1F\xE0\x50\xA9\x0B\xD9\xDB\xEA\xF7\x53\x5F\xB1\x5A\x5D\x0E\x3E\x9E\x8D\xCF\x80\x4D\x92\x7D\xB9\x57\x37\xC6\xE8\x2C\x21\x99\x71\xAB\xA2\x15\x5C\x0A\x18\xFC\x99\x4D\xDD\xC5\xFB\x65\x54\xD7\x86\x69\xDD\xED\xD5\xA8\x91\x41\x67\x2E\xDB\xB9\xE5\x3F\xFE\x44\x06\x39\x0A\xCD\x22\x5F\x78\xE3\xB0\x54\xFD\x88\x3A\x25\x1C\xB8\xE6\x35\xD7\x43\x29\x7C\x57\x88\xE7\xEC\xC1\x20\x72\x81\xD6\xF3\x03\x1D\x75\x6A\x9C\x9E\x96\x9B\x33\x2E\x59\x84\xA0\x8F\x8B\xBA\x98\x96\xCC\x3B\x9C\x23\xD1\xAA\xD9\xEC\xE1\x73\x00\x5C\xAB\x58\x48\x6C\xAD\xE3\x2F\x24\xF2\x65\x11\x8D\x32\x62\x63\x1E\xD0\xB8\x85\x99\x68\x89\x05\xE6\x62\x82\x83\xE6\x1F\xF9\xAA\x2C\x33\x04\x72\x9A\x76\x07\x88\x38\x51\xC7\x0D\x99\xFB\xEC\x35\x88\x95\xCA\x18\xF0\x8E\xAB\x7C\xA7\xB7\xBA\xD2\x3F\x4A\x86\x67\xCA\x33\x2E\x00\x4C\x44\xD1\xA7\x23\x48\x30\xF6\x0A\x44\xA6\x70\xF3\x4D\x7E\x6B\xDA\xF0\xF5\x32\x06\x40\x49\x00\x08\xDD\x60\x0B\x43\x59\x2E\xA2\x61\x14\x32\xF3\x2D\x8A\x51\xDE\x00\x3E\x85\x22\xA8\xB1\x30\xF7\xB8\x5D\x39\xB7\x53\x2B\xEC\x19\x07\xEC\x53\x3E\x3E\xDB\x60\x75\xEB\xF8\xF6\x39\x7E\xE8\x36\xFE\xBD\x30\xDC\xE6\x9D\xE7\x9C\x7E\xD6\x2D\x19\x20\xEB\xA0\xA0\x7E\x85\x57\x34\x4C\xCC\xC6\x02\x89\xE0\x4D\x6A\x92\x8A\xAD\x7E\xFA\x1A\x3E\xE9\x80\x93\x13\xBE\x8B\xC5\x93\x38\x38\xE0\x8B\x4D\x8A\x2E\x2D\x42\x3B\xF7\xBE\xEA\x6B\xEB\x11\x81\xF7\xFB\x89\x0D\xA1\x5F\x2C\xE4\xDA\x4A\x7A\x9D\xE1\x66\x23\x1E\xA3\x89\x6C\xEA\x0C\xAB\x90\x5E\x90\x85\x52\xEF\x17\x2D\xB1\xBC\x6E\xE3\x88\x4B\x07\x61\x2C\x5A\x95\x1F\x57\x47\x2C\x9A\xA1\x3D\x66\x1E\x6B\xAC\xE1\x4F\xFE\x45\xE7\x67\x0B\x69\x56\x67\x5C\x0F\x4C\xA9\x9D\xDC\x96\x57\xBE\xA4\xA9\xB3\xE7\x97\x40\x33\x82\xA8\xD1\x34\x32\x0B\xEE\x66\xB4\xC4\xAE\x2F\x59\x23\xD8\xA8\xEE\x38\x6E\xB2\xA0\xD1\x4E\x21\x57\x9A\x62\x54\xBB\x5D\xFB\x8C\x9C\x97\x82\x71\xE6\xA8\x3D\x22\x68\xF9\x5B\x6B\xDF\x24\x3D\x06\xD6\x8A\x0E\xC5\x56\x39\x8B\xCA\xC2\xE6\xBE\x58\xD2\x6F\xE3\xC2\x4E\x47\x2C\xCB\x4D\xCE\x49\x33\x39\x28\xDA\xD0\xCD\x17\xE1\x7E\xFA\xC5\x64\x52\x4D\xB2\x33\x66\x29\x3F\xD2\xDF\x07\xC0\x04\xC0\x38\xDB\x22\xEB\xBF\x41\xC3\x6E\x8A\x60\xDA\xE8\xDB\x65\x5D\xFB\xAF\xB1\xD8\xCD\x29\x47\x2C\x05\x0B\x11\xCA\x8D\x7F\x00\x83\x96\x3F\x04\x2D\x5E\x6E\xA2\x46\x17\xE4\x48\x5F\x9F\x80\x8D\x0C\x17\xC0\xD2\xAE\x26\x0F\x1D\x55\x0A\xB3\xD8\x4F\x11\x78\x7E\x47\x30\xCF\xBC\x1A\xDF\x64\x0F\x4B\x65\x87\x8A\xB7\x9B\x5A\x6B\xC7\xAC\x67\xE6\x1B\xDD\xAB\xFA\x20\x12\x28\x9F\x77\xBE\xDD\xFA\xA2\x51\x9A\xCA\xE3\x08\x3A\xEE\xB6\x60\x20\x56\x71\xE6\x60\x91\x03\x1E\xC4\x48\x4B\x2D\x52\x51\x15\xF0\x39\x31\xBD\xDE\xDD\x16\xC1\x2C\x3B\x4A\x8F\xE3\x00\x1B\x89\x56\xB3\x3A\x63\x07\x56\x40\xA2\xF3\x40\x36\x10\xB3\x37\x6B\x6A\xE6\xC8\x4C\x58\xB0\xEE\xDB\xD6\xAF\x4B\xEB\xCF\x05\xA7\xA9\x12\xEE\x7B\x9E\xF6\x1E\x34\x24\xA9\x27\xA6\xDF\x47\x5E\x5A\xC4\xF1\x54\x82\x8B\xE1\x30\x5B\x05\x3D\x27\x2A\x06\x9F\xEB\x85\xCA\xB9\xF2\xBA\xA9\x97\x32\xD3\xE3\xAE\xF9\x3A\xC2\xE6\x1A\x3C\xF7\xDF\x99\xFE\x78\x5F\x0D\xFA\xE3\x47\x23\x15\x17\xA1\xD5\xE9\xB9\xDE\xCE\x11\x8E\x00\xB1\x64\x3A\x55\x9A\x1F\xF9\xA1\x11\x37\xEF\x3A\xF3\x6F\x4C\xF8\xB0\x39\x0E\xF9\xBD\x74\xE8\x10\x68\x67\x4C\x62\x35\x72\x57\x42\xE4\x06\x56\xBF\xA9\x28\x9D\xE4\x02\x66\xD1\x0D\x86\x9F\xC4\xA3\xB9\xA3\x21\xCB\x68\x60\x23\x38\xF8\x79\xA3\x88\xCB\xC1\x78\x1E\x92\x61\xF8\x53\x17\x86\x7D\x6A\x76\xDC\x51\xC1\x93\x9D\x2B\x16\x39\xF1\xF2\xB0\x06\x99\x34\x9F\x03\x69\xD7\xA2\x76\x73\x92\x27\xDB\xA0\xFF\x31\xE1\x2E\x57\xF3\x63\x4C\x23\x74\x34\x8E\xEC\x49\x63\xF4\xF6\xD1\x08\xB4\xA2\x5D\x2F\x89\x0B\x1A\x65\x70\x2A\xFC\x3F\xB5\x10\x49\x32\xD6\x54\xE0\x78\xA4\x91\x2E\xA1\x5A\x9D\xDB\x99\xFC\xAD\xAD\x20\xE3\xBB\x26\xFB\x1D\xD4\xD1\x73\x83\xC8\x9E\xA8\x34\xC3\xF5\x70\x1C\x36\x75\x79\xD3\xED\xFB\x14\xE6\x7C\x1D\x5F\x0A\x93\xEF\x28\x84\x8A\x80\xB1\x1E\xF0\x62\xCE\x99\xA2\x69\x09\xD7\xAB\xC6\x1A\xFB\x13\x0A\x6E\x59\x39\xF0\x7C\xB5\x6C\xC8\xB8\x46\x86\x01\x01\x50\x48\x0F\xC5\x38\x0F\x73\xEB\x27\x9C\xED\x38\x3D\x54\xEB\xDD\x0B\x10\x16\xFA\x80\x87\x63\xEF\x0D\x7F\x59\x60\xC1\x79\x1B\x20\x22\x2A\xEE\xBA\x0C\xAA\x93\x5C\xB4\x3D\x5B\xF3\x2D\xD4\xC3\x08\x07\xCE\xAC\xE1\x00\xD7\x4C\x3D\x46\x40\x9A\x73\xDB\x95\x23\x03\xA8\x6D\x9B\xD2\x05\x08\x4F\x82\x7C\xE7\x92\xB2\x68\x60\xEE\x73\x61\xFD\x67\x96\xE0\x64\x37\x02\x74\xA3\x5B\x63\xDB\x84\x61\xD2\xAF\x94\x83\xEF\x7F\xBD\xFA\x6F\x56\x46\x01\x1D\xAC\xCF\x07\x76\x3B\x36\xAF\x31\xBF\xE7\xDE\x8A\xC4\xC8\xA9\xAD\xAA\x6E\x07\xF2\xF9\x87\xAA\x42\x66\x6B\x28\x1F\xF8\x49\xF9\xE9\x20\x83\x15\x64\x43\x64\x78\x68\x83\xE0\xB4\xE0\x26\x29\xC3\xA8\xCE\x57\x1D\x86\x98\x95\xDF\xDF\x43\x65\xB4\x4D\x2C\x43\xEA\x57\xD9\x5E\xB1\x89\xAA\x34\x78\xC1\x2D\x5C\x72\xFA\x06\x9B\x73\x4E\x1F\xB6\xE1\xF2\xEE\xEB\x99\xD7\xE9\x80\x1B\x1D\x48\x7F\xE8\x29\x90\x03\x3A\xDE\x83\x74\x31\x05\x4B\xEB\x66\x90\x31\x53\xDE\x36\x82\x12\x8E\x7E\x1E\x94\xAB\x02\x9F\x2F\x1E\x21\x12\xAE\xD8\x5C\x11\xE9\x2C\x6E\xE7\xF6\x47\xFA\xE0\xB3\xEC\x88\x46\xAE\x0E\x61\xD0\x1A\x71\xF1\xC9\xD0\xB9\x13\xE5\x66\x43\x63\xA8\xFB\x31\x97\x28\x54\xF7\x0C\x73\xD0\x3E\xFA\x73\x01\xB9\x14\xF7\xFC\x9B\x86\x42\x36\xF4\xC3\xEA\x90\xC9\x27\x8E\xE4\x47\x4B\x52\x00\x3D\x2C\xDB\x31\xCE\xE2\xCA\x49\x1E\x43\x23\xB6\xE0\xAE\x9B\xDB\x40\x04\xA2\xF8\x5D\x7F\xC8\x4A\xF9\xE0\x7E\xE6\x1C\x4E\xEB\xCE\x1C\x19\x88\xDC\x0F\xE4\x4F\x98\x6A\x58\x53\x7D\x93\x77\xA3\xE3\xBA\xC9\x57\xA2\x43\x4D\xB3\x92\x19\x32\x20\x45\xF3\x8D\xE0\x21\x92\xC0\x32\x6D\x20\x0A\x55\x14\xF7\x2B\xC1\x63\x53\x76\xE5\x61\x1A\x37\x35\x88\x89\xB0\xAA\x83\x57\x6E\xBD\x01\x49\x3F\x1A\x13\x96\x56\x8C\x62\x8D\x57\x2A\xEF\x82\xFE\xA9\xC9\x52\x9C\xCE\x0C\xE5\x6A\x8D\xAA\x3D\x35\x5C\x13\x53\x4A\xEE\x8E\xB8\x73\x36\x38\xC0\x2E\x19\x8F\xD6\xAB\x4A\xAA\x84\x91\x4A\xA4\xC4\x74\xE3\x16\xA4\x4D\x75\x59\x88\x5D\x7B\x43\x82\x38\x50\x7E\x38\xFC\x34\x8D\xB6\x4B\xE2\x8E\xBC\xA4\x4F\xAD\x66\x2F\xF5\x7F\x46\xD6\x87\x94\x52\xE7\x16\x42\xBD\xAE\x27\x6A\x7F\x1E\x81\x79\xFE\xAC\xD5\x50\x25\x53\x8F\x3F\x02\x37\xFE\x13\xB2\x19\x7A\xC0\x0F\x3D\xD5\x41\xD2\xF3\x42\xF4\xE0\x9D\x82\x9C\x11\x58\x22\x7B\xE1\x55\x1B\x78\xFF\xCB\xAC\x70\xC6\xEE\xDD\x9D\x40\x31\x85\x94\xB1\xBD\xA8\xFF\x72\x8C\x5B\x10\x80\x62\xE6\x14\x5F\x17\xE1\x62\xA1\x20\xBC\x86\xE5\x0D\x7B\x05\x34\x13\x2B\x21\x07\x61\x69\x08\xA7\xA2\xD1\xE7\x8E\x0B\x60\x88\x95\xC2\x1D\x11\x7C\x35\x32\xB6\x47\x1C\x72\x8E\x4F\xC5\x94\x1E\x18\xA7\x96\xC7\x3B\x46\x4B\x51\xB1\x11\x77\x38\x03\x47\x43\xB6\x53\x18\x36\xC4\x73\x45\xF5\xE6\x61\x25\x96\x54\x07\xEE\xC3\x9B\x83\xE5\x7B\x12\xC6\x3F\x3B\xBF\x3E\xD6\x5A\xBF\xED\x8D\x66\x03\xE6\xDD\xD3\x4A\x20\x0E\x51\xA7\xB1\xBD\xD4\xA1\xB5\xCC\xD7\x84\x5A\xAF\x45\x63\x8F\x94\x21\x38\x57\xD6\x2D\x27\x33\x21\x42\x15\xA0\xF8\x4D\xC0\x7C\x26\xC3\x3A\x98\xA6\xAA\xAC\x0A\x6F\xCA\xD6\x1F\x85\x45\xDC\x39\x5A\x22\x0E\x69\xAA\xF4\x48\xAA\x48\x66\x5F\x8B\x26\xED\xB1\x2A\x31\xAC\xCF\x60\x86\x9E\x7F\x04\xC6\x41\x0B\x85\xFF\x1E\x47\xEF\xAE\x44\x9C\xD0\x5F\x70\xC1\xA5\xA9\xFC\x13\x6C\xE5\xCB\x56\x9C\x7D\xBA\x2F\x57\xB9\xCF\x34\x85\x65\xED\x0B\x88\x72\xF4\x34\x50\x74\xFD\x1F\x8A\x1D\xBD\x21\x3A\x82\xBC\xB4\x9B\x3D\xDC\x74\xA4\x8D\x60\x7E\x58\x85\xB8\x88\xDC\x43\x1D\x15\x3E\x1A\x8D\x70\x89\x3D\x64\x43\xF2\xE6\x9D\x8D\x1C\x8F\x96\x41\xAF\x86\xCC\x3F\x2C\x42\x7C\x8B\xDF\x3C\x62\x89\x0D\x15\x8A\x6A\xD9\x83\x7D\xED\x52\x6B\xC0\x8D\xB2\x8C\x0D\x07\x4F\x1A\x38\xFB\x26\x9C\xC3\xAB\xE4\x12\xA1\x84\xAD\xE8\xDF\xC7\x00\xC4\x61\x2A\x69\x21\xC5\x08\x54\xC8\xAA\xBE\x2D\xD6\x2A\xBE\x4A\x7D\x2D\x70\x51\x16\x8E\xE7\x85\x54\x2E\xDF\x1B\xE0\x0C\x5A\x20\x34\x80\x18\x4D\x14\xDF\xD3\xA2\xF7\x62\x57\x00\x43\x80\xA8\x05\xE3\xAE\x77\xEC\x53\x4F\xE1\x63\xB1\x96\xC6\xCF\x90\x53\xDA\xC7\xDA\x74\x2C\x63\x3B\x9A\xF4\xA6\x1A\xB6\xFB\xCE\xAB\xD8\x4B\x75\xB3\x3E\x50\xF9\x59\x1E\xD0\xA5\x5B\x4A\xC4\x5B\xCE\x5C\x71\xA2\x93\x46\x4F\x1B\xEE\xF4\x05\x98\xDE\xB6\xC3\x3C\x0C\x05\x72\xEF\x12\x1E\xCF\x52\x2C\x32\x9B\x1E\x7D\xCF\x53\x1D\xEF\x16\xFA\x1E\x8C\x0E\xE9\xEB\x88\x3B\x39\xA0\x29\xED\x99\x2E\x1F\x5C\x52\x56\x80\xAD\x13\xB2\x12\xF7\xCA\x56\xA7\xD3\x90\x2A\xBF\x87\x44\x18\x69\x69\xBB\xF3\xDD\x99\x5A\x4C\x73\xDA\xBA\xBE\x58\xA0\xCA\xF5\xA3\xFE\x33\x9D\xB2\x8C\x69\x2F\x84\xE9\x9B\xD4\x52\x40\x8F\xAF\x17\x5A\xE3\x42\xCA\xCD\xAB\x89\x05\x00\x09\x75\xC1\x9F\x99\x87\x40\x58\x9D\x5F\x8B\x51\x47\x36\x3B\x93\x16\x01\x26\x78\x4C\x6C\x75\x06\xED\x53\xB0\x1B\x80\x3E\x93\xB9\xE4\xBB\xE8\x67\xD1\xE1\x1B\xF3\x5E\x65\x9E\x8C\x2E\x92\x16\x6D\x77\x20\x63\x7D\x99\xAE\xBE\x85\xDF\x48\xDF\x37\x6C\x0C\xBC\x3B\xD9\xA9\x20\xFA\x47\x06\x09\xCE\x3C\xFD\x85\x29\x2B\x15\x32\x3F\x8E\x0C\x24\x3E\xF5\x90\xA4\xD4\x39\x92\x02\x15\xA2\x2E\x24\x0A\xC1\xB6\x69\x2C\x08\xF4\x24\x47\x15\x2C\xAC\xB1\xC1\x87\xF0\x5B\x75\x16\x09\x7B\x5C\x89\x13\xB8\xDD\x49\x6D\xAF\x2E\x8F\x34\x32\x7E\xBC\xBC\xED\xB5\x54\xB9\x0A\xF4\x84\x73\x1F\xA1\xAB\xB6\xBF\xB3\xEF\x14\x6E\xCD\x40\x9D\xF6\xCE\x59\xA0\x1D\x59\x2C\xB7\x12\x41\xE1\xCB\xC9\xA2\x31\x2B\x80\x0B\xCC\xD8\x5C\x76\x85\xB6\x34\x0D\xF8\xE7\xF7\x9C\x30\x0F\x96\x3F\xC1\x57\xCE\xE5\x34\xAA\x32\xE6\x2A\xF1\x77\x7D\xFB\x60\x6A\xD8\x3D\xEC\x15\xC7\xFC\xDC\x78\xA7\x7F\xE8\x55\xC6\x56\xEE\x52\x99\x58\x35\xD2\x5A\xF2\x05\x6B\xC4\x37\xEC\xA2\x75\x19\x8A\x08\x41\x53\x75\x2B\x10\x52\x08\xBF\x6A\x62\xC1\xE9\x8A\xDF\xCC\x1F\x34\xBC\xC3\xFE\xD0\xAD\x1D\x7E\xBA\xCF\xDD\x41\x82\xF1\x36\x18\xCD\xAE\x2D\x17\xEC\x91\xC6\x42\xBE\xB4\x6D\xFE\xCA\xF5\x4B\x12\x3C\x0B\x38\xD3\xB8\xD5\xFD\xCE\x9E\x75\x4F\x25\xD7\xAD\x40\x76\x22\xBD\xE7\x00\x4F\x9E\xF1\x94\x69\xA6\x70\x05\x24\xFC\xD3\x66\x8C\x49\x16\x2A\x22\x83\x81\x33\x84\x1C\x9B\xD6\xAB\xB9\xB5\x18\x65\x01\xFB\xA0\xB2\x98\x47\x8E\xD3\x12\x23\x3C\x8A\x09\xAE\x3D\xC2\x9D\xF1\x72\x4F\xA8\x09\xD5\x6C\x74\x7D\x1F\x94\xD7\xAB\xA2\x00\x99\x62\x3E\xFB\x44\xCE\x3B\x32\x1D\x52\x20\xE6\xAA\x99\xF6\xB6\x1E\x2D\x57\x76\x99\x4C\x48\x70\xFE\xC5\xE6\x87\xDD\x92\x34\x09\x4D\x22\x07\x20\xD1\x14\xFB\x33\x44\xF0\xB6\x25\x89\xF9\xD4\xC8\x5F\x79\x6C\x5C\xDD\x6A\x2C\xFB\x10\xFB\xB2\xD2\xC1\x31\x6A\x48\xA9\xC8\xD7\x1D\xD3\x82\xAA\x98\x80\x15\x4C\x03\x93\xB5\x04\x17\x2F\x4A\x72\x20\x1D\x72\x73\x0B\xFD\x80\x00\xC7\x0F\xCB\x3C\xA7\x35\x60\x32\x6D\x1B\xA9\x03\xF3\x87\x0D\xD9\xF6\x09\x88\xF0\xB8\x24\x9F\x19\x8E\xF2\xBA\x77\xB1\x62\x28\xA9\x0A\xB7\xE5\x1E\x81\x5B\x2E\xBC\x22\x2F\x1D\xF3\x9B\x00\x22\xB1\xE5\x3B\xAA\xA4\x5C\x62\xEE\x26\x1F\x56\xEB\x2D\x04\x74\x7C\x65\xE1\x47\x2E\xAB\x09\x86\xD4\x8E\x18\xA1\xFA\xA5\x03\x46\xAB\xF5\xEB\x85\x8D\x94\xC3\x38\x5A\xEE\x92\x49\xED\x35\xF6\x29\xDF\xC8\x1B\xB3\xE8\xF9\x71\xC7\x53\xE9\x89\xEA\x06\xFE\xBE\xD3\x45\x83\x4C\x92\x02\x67\x45\xCD\xC3\xC1\x11\x0A\xCE\xB1\x49\x26\xBA\x7B\x75\x92\x32\x7B\x66\xD1\x2B\x9A\xB4\x88\x4A\x89\x55\xBA\xCB\xDD\x61\x31\x74\x92\x88\x44\x0E\x71\x8D\xB0\x2F\x5B\x81\x66\xAE\xAA\xDF\x8F\x76\x71\x23\x80\xD2\xE9\x2A\xD7\xCC\xA1\x09\x92\xCC\x32\xD4\xEB\xDE\x08\x79\x59\x7B\xF2\xFC\xDE\x48\xA7\xDC\x35\xC6\xFD\x43\x5A\x3F\x2D\x58\xEA\x24\x5C\xB9\x1F\x40\x1E\x00\x6F\x2E\x78\x7A\x44\xD6\x60\x69\x47\xA3\xF4\x60\x92\x33\x31\xD6\xB8\xA2\xD8\xBE\x66\x67\x7B\xFC\xB3\x88\xA6\x51\xD0\x46\xDC\x99\x26\xEE\xF3\x7F\x1C\xA9\xB7\x7C\x8F\x96\x22\xC6\x60\x4B\x8C\xB7\x6D\x64\x26\x6D\x64\xD4\x21\x2D\x17\x85\xA6\x08\x36\xB2\xD8\x21\x2E\x72\xF1\x32\x48\x9F\x96\x23\x98\x24\x84\xE8\xA5\x3F\x20\x67\x20\xAB\x26\x62\xFB\x57\x9E\x7E\x28\x69\x09\x0E\x52\xFC\xDF\xB2\x2C\x8A\x09\x6E\xAE\x8E\x37\x17\x17\x4D\x19\x85\xC5\xD6\xCF\xDE\xA0\x7A\x00\xC9\xE8\x6F\x42\x65\xED\x15\x15\x03\xA7\xE1\xBC\x46\x8A\xE4\xE8\x01\x62\x52\xF5\x2E\x15\xEA\xCA\x80\xC9\x47\xE7\x6B\xAF\x7B\xBF\x43\x62\xC0\xFD\x0F\x99\x55\x9B\x6E\x78\xE7\x95\x19\xD6\xB7\x63\x04\x8A\xA3\x50\xEF\x73\x91\x8D\x3B\xAC\x21\x5C\xB7\x43\x36\x8A\x26\x38\x19\xBF\x3E\x0C\x6B\x49\x11\xA2\x11\x5D\xF0\x17\xC6\x61\x99\xB0\xF1\xA0\x31\x46\x29\x89\x52\x23\x2B\x8B\x67\x2F\xB7\xAF\x96\x5D\x71\x5A\xCB\xE3\xC7\xE2\xDC\x89\x9F\x14\x14\x30\xA8\x9E\xFC\x11\x63\x76\xD9\x80\x79\xCC\x59\xA7\x71\x08\x16\xEA\x30\xB7\x86\x25\x45\xBE\xB0\xBE\x33\xD8\x76\x13\x02\xE6\x6E\xC5\x17\x31\x83\xA8\xB1\x26\xAF\x11\xDB\xF5\x1A\x3A\xF7\x80\xCC\x27\x1E\xAA\xAA\x9C\x66\xB3\x9D\x2B\x29\xA5\x58\xA4\xCD\xF3\x09\x58\x2A\xEE\xDF\xB6\x7E\x3E\x9A\x12\x46\xD2\xDE\x8C\x80\x81\xE6\x56\xF4\x7C\x42\xFA\xD6\xD0\xDF\x13\x2D\xDA\xE4\xF0\xF1\x71\xEC\x9E\xF5\xA8\xB6\x6F\xE4\xF8\x91\xFE\xBF\x1C\x7E\x9C\xE1\xEB\x68\x11\xF4\x02\x56\xC9\xFE\xA6\x6F\xD7\x5C\x4A\xD0\xA6\xD5\x5C\x4A\x75\x83\xFE\xDF\x9F\x75\xBE\x79\x7C\xE6\x54\x45\x6E\x0C\x46\xDB\x4F\x56\x4A\x7D\xD3\x6E\xDD\x88\x14\x68\x1E\xD2\xC3\x4E\x73\x2D\xB2\x63\xD1\x42\x76\x23\xA1\x04\x64\xC1\x17\xB3\x16\x75\x71\x9E\x48\xC0\xCD\x27\xF0\xFC\xB5\x42\x74\x2D\x77\x91\x03\xA1\x9A\xF5\xB5\x97\x5C\x2B\x2B\x69\x4F\x64\x92\x8D\xEF\x32\x5A\x8D\x70\xBE\xA9\x57\xEE\x57\x16\x8D\x00\x3F\x16\xEC\x53\x12\xB0\xF8\x34\x92\x81\xB4\x2A\xF0\xCB\x57\x3A\x50\xED\x9A\xEA\x0F\x2A\x94\xF3\xE8\x9D\x99\x01\x39\x2C\xC6\x2E\xBA\xBE\x54\x02\xE6\x74\xDF\xD1\x24\x85\x1F\xEE\xA9\x5C\x1E\x03\x55\x7D\x95\xED\x60\x20\x9F\x0D\x8E\x28\x5B\x5A\x58\x1E\x70\x53\x08\x14\xE6\x00\xCE\xA3\x75\x39\xC8\x62\x08\xE4\xCF\x73\xB8\xF5\x40\xF7\xB9\x79\xE4\x02\x72\xAA\xDD\x8E\x45\x99\xED\x75\x45\xD6\x01\xB9\x9B\x62\xFC\x05\x96\x17\x70\x1B\xA4\xD9\x66\x91\x24\x20\xC4\x71\x2C\x1B\x6E\x21\xF8\x3A\xCA\xE3\x9D\x1D\x1E\xE6\x98\x7D\x51\xC5\xAE\x50\x08\x27\xCB\x6A\x98\xEC\x8C\xC2\xE7\x60\x48\x4A\x57\x82\xFC\xCA\x9F\x18\x60\xFA\xEB\x8C\x51\xB0\xF2\x17\x95\x0C\xC7\x9E\xC5\x16\x19\x13\x25\xE1\xB6\x12\xF9\xC7\x6B\x7A\x56\x38\xA5\x6E\xC1\x45\x79\xF5\xFC\xE0\xA7\x71\x8A\x36\x37\x19\xDB\x42\xFE\x7E\x04\xE9\x52\x27\x7A\x57\xD4\x8F\xD3\x0C\xA3\x9C\xBF\xD7\xFE\x65\x78\x12\x40\xF5\xF2\x15\x21\xEB\xA9\x1B\x61\x98\x5B\xAD\x8E\x5E\xF2\x0F\x4C\x0A\x74\x5B\x42\x47\xEC\x16\xCC\x00\x46\xFE\x64\x9C\x64\x97\x92\x1F\x97\xF5\x47\xEA\x8F\xCD\x17\xDD\xAA\x84\xDC\x5F\x6F\x77\x8A\xE4\x3C\x2D\xFB\xCF\x23\x8C\x74\x0F\xFB\xB7\xAD\x5D\xEA\x56\x2C\x99\x06\x4D\xEC\x11\x91\x28\x85\x33\xD6\x20\x73\x4A\x08\xBD\x28\x40\x8D\x62\x9D\xE8\x2E\xBA\xAD\x6D\xBC\x35\x5A\xFB\xF7\x22\x62\x6A\x57\x93\x75\x02\x0F\x15\xEE\x34\x6F\xF6\x21\xA8\xB4\xE2\xC8\xDD\xDA\xA9\x81\xBC\x47\x80\xB9\x4C\x6E\xB8\xBF\xBB\x1C\x3F\x96\x7F\x82\x76\x2A\x1C\x32\x69\xF4\xE0\x2C\x99\x31\x5D\x89\x35\x15\x4C\x11\x90\xB5\x6C\x7D\xBD\x4E\x61\x5F\xCE\x7A\x98\x29\xA7\x14\x3D\xF2\x84\x6A\x2B\x91\xD7\xBC\x07\x04\xD4\xAE\x08\x14\x4E\x2C\x86\xBC\xA8\x20\x43\x82\x52\x02\x01\x90\xB7\xEB\x69\x7C\x16\xB2\x69\xE6\xD0\xE0\x77\x8E\xCD\xB4\x76\x97\x64\xA8\xDF\x8B\xED\xD7\x40\x9D\x85\x5C\xF5\xBD\x43\xF7\x3B\x2C\xEE\xEF\xBC\x6E\x9A\x97\xCE\xD8\x78\x62\x92\x0A\x47\xAF\xF3\x48\x81\x3C\x98\x0C\x19\xD9\x7C\x65\x12\x96\x35\x6A\x3F\x40\x38\xC2\xE4\x78\xA8\xEF\xA1\x4C\x00\x38\xF0\x1A\xE2\x0C\x42\x76\x54\x49\x8D\xDC\x0B\x88\x6C\xC1\x58\xEE\xF9\x05\x9A\x9D\x54\xCB\x07\xBB\x62\x1D\x31\x62\x2D\x02\x00\x33\xE1\x8A\xE0\xB2\x59\x97\xB4\x5E\x6A\x37\x26\x2C\xDE\xD4\xCB\xF9\xB0\x65\xA5\x05\x0E\x04\x46\x72\x6E\x94\x5E\xD2\x4E\xB7\xD3\x76\x51\x4C\x47\x4D\xE7\x15\x4A\xB8\x7A\x85\xCA\x04\x5F\x75\x94\x38\x90\xA5\x6B\xC7\x1C\x4F\xB9\x4F\x35\x1F\x88\xD6\x51\x8E\x72\x0E\xAA\xFA\x1D\x39\xFB\x64\x5A\x48\x51\x57\x02\x6F\xE5\xC7\xBA\x64\x10\xD6\x6B\x93\x22\x78\x11\x49\x4B\x43\x45\xA2\xFD\x09\x82\x27\x94\xDD\x74\xB8\x4A\xEC\x9A\xC7\x14\x60\xC5\xC0\x48\xD4\xC6\x82\x39\x31\x28\xC1\xB6\x8C\xFE\xEC\x8E\x1C\xAD\xEF\x4B\x02\x82\xED\x36\x10\x9A\x9A\x7E\x10\x74\x8F\xC1\x26\x5C\xA0\x25\xF2\x0F\x5B\x43\x4E\xFE\x6E\x16\x39\xF2\xEE\xAD\xBB\x4B\x18\x9D\x14\xF0\x20\xD4\xCC\xD9\xBD\x79\xDE\x65\xAE\xE4\x28\x77\x9A\x0E\x0E\xD2\x13\xA7\x35\x01\x76\x40\xCB\xC8\x85\x2F\xC3\x93\x61\x1B\x0A\xFB\x67\xF0\x32\x20\x72\x4C\x33\x59\x58\x8A\x15\x8E\xCA\xF5\x67\x50\xEB\xE5\x9E\x18\x40\xCD\x95\x62\xF1\x7B\xD2\x76\x37\xA4\x81\x74\xD6\xDF\x84\xBB\x72\xC1\x4D\x66\xE8\x02\xEF\x15\x60\x90\x0D\x24\xF8\x2D\xCD\xA3\x4D\xFA\xE1\x0F\x63\x29\x8A\xD7\xED\xD5\xCE\x5B\x4B\xD8\x61\x3D\xCD\x2B\x38\xA0\xB4\x94\x46\x30\xF8\xAE\x36\xF0\x67\x1E\x8E\xC3\x8E\x5C\xB8\x02\xB4\xF2\x6C\xC4\x63\xAD\xFA\xE9\x5D\x80\x85\xC6\xB8\x16\x6A\xD0\x37\x9E\x31\x09\x3F\x81\x4D\x2E\x1B\x56\x3E\xAF\xBB\x77\x51\xB1\x67\x52\x12\x04\xF4\x20\x83\xE2\x28\x2A\x0D\x1B\x5B\x1F\x67\x41\x92\x5C\x01\x9F\x6C\x5A\x03\x30\xDB\xED\x23\x77\x6D\x1E\x10\x63\x9C\x08\xE1\x1C\x50\xEE\xF9\x22\xF9\xC1\x04\x0C\x19\xDA\x96\xBF\x0A\xEF\xDB\x08\xCD\x48\xE4\xDE\x43\x66\x10\x34\xC1\x68\x23\x52\x78\x58\x99\xE3\x26\x8E\xF1\x8F\x17\xFA\x3F\x22\xB8\x73\xD8\x8F\xD7\xE0\xED\x9E\xAC\x30\xBB\x20\x23\xD2\x66\xA7\x74\x22\x35\x0C\x67\x69\xA3\xB2\xF3\x1C\xB1\x5B\x4C\xFC\xFC\x8B\x90\x6A\xA1\x8E\x75\x36\xD1\x60\xEF\x7F\x7B\x5D\x50\x9E\xB5\x9C\x85\x79\xC8\xB7\x9B\x5C\xB8\xF2\x04\x12\x31\xF4\xE7\x6A\x5E\xF9\xCA\x00\x88\x6B\x1C\x43\xCA\x5B\xBC\xA5\x22\x36\x15\xBD\xA4\xB1\x54\x2A\x97\xB4\x3B\xEE\x53\xBE\x5A\xF2\x44\x69\xA9\x48\xA5\xEE\x46\x1C\xD8\x35\x93\x94\x52\xC2\x40\x66\x14\xC3\x7E\x02\x75\xDA\x74\xB3\x87\x10\x0E\xF0\x9B\x47\xFE\x86\x34\xFE\xBF\xF5\x85\xB5\xE1\x30\xA6\x80\xCA\x1E\x6B\xB7\xEB\xB4\xCB\x26\xFF\xAB\x71\xE2\xEF\x72\x69\x97\x6D\x56\x93\x5A\xF7\x31\xD8\x92\xFA\xFD\x3E\xA6\x6B\x8B\x2C\xF9\x34\xAD\x1D\x4A\xD7\xD6\x10\x23\xC4\xFF\xBF\x0B\xD3\x3B\xED\x7A\xF9\x21\x0D\x07\x2D\xD3\xF3\x52\x4F\x85\x3D\xCA\xF2\x9A\x3F\x84\x86\x51\x92\xF7\xDC\x64\x04\xB1\x26\x46\xE4\x02\x8D\xBA\xFB\x66\x9A\xD5\x30\x44\x19\xFD\x91\x17\x80\xD6\x59\xE8\xD4\xC7\xBE\xCF\x8E\x17\x82\xF4\xA1\xA0\x4A\xFB\x2B\xEB\xA3\x2B\x37\xA4\xF0\xED\x9E\xE1\x8B\x4A\x95\xA5\x99\xCE\xF0\x8C\xE9\x89\x50\x69\x7A\x45\x08\x03\x47\x07\x91\x90\x09\x82\x2E\xF1\x7C\x29\xDA\xF2\xC1\xD3\x2B\x0B\x18\xDC\x2A\x46\x84\x32\x5A\xEB\x49\xB6\x02\x8C\xCC\xE7\xCD\x23\xBA\x6F\x82\x4C\x65\xD1\x9E\x25\x43\x98\x72\xF3\x3B\xDC\x42\xDD\x3F\xE5\x5E\x96\xD3\xD2\x69\xE6\x41\x8E\xF4\x83\xCF\x33\x7C\x50\xA4\x93\x59\x8B\x1E\x61\xA8\x6B\xB4\x7A\x4B\x44\xDC\xDF\xCB\x40\x21\xCA\xE5\xF9\x1E\x63\x29\x40\x1E\xFE\x3F\xF6\x40\x2E\xA0\xC9\xF0\x57\x15\x3D\x06\x49\xE9\xA5\x78\x99\xF7\x43\x3F\x84\x91\x75\x58\x42\xC6\xA9\xF9\xD3\xCE\x7A\x74\x77\xB0\x3F\x0B\x24\x46\x65\x06\xDF\xFA\x4E\xD7\xE6\xA1\xAF\x6A\x66\x19\xDA\xD4\xD9\x60\x8B\x95\x91\xF5\x53\xC9\x74\x7A\xB3\x52\xBC\xF8\x1D\x6C\xB6\x72\x04\x04\x2E\x6D\xEE\x5B\xE1\x01\xE0\x28\x3E\x04\x00\x38\x50\x33\xA3\xFA\xFC\x0D\xEF\x0E\xC6\x50\x04\x57\x22\x4A\x25\x9B\xBE\x0F\x34\x1C\x97\x93\x8F\xA2\xC5\x46\xD4\x2D\x2E\xEB\x76\x5C\x42\xE4\x90\x90\xC7\x6B\x1B\xBF\xC9\x24\x52\x59\xD0\x5C\x1A\xCA\x73\x91\xC7\xB0\x36\x40\x85\xC1\x5A\xCF\xA7\x54\x85\xE0\x19\xA8\x5C\x6A\xD8\x1D\xAE\x99\x5B\x1F\x6F\x79\x6E\x15\xFF\xC0\xC5\xED\xA7\xB5\x33\x9E\xED\x30\x02\x21\xBB\x73\xD4\xB5\xB4\xC1\x19\xFC\x4E\x7F\x90\xE7\x28\x1C\x22\x2B\x08\xB2\x87\x09\x0B\xAE\xAB\x1B\x57\x6C\x07\xA0\xA8\x62\x4E\x1B\x97\xD9\x55\xE1\x11\x54\xE5\x35\x37\x2D\x44\xD2\xE9\x6F\x8B\xC6\xFE\xCD\x33\xD9\xC9\xD5\xE0\xF4\x13\x75\x97\x75\x4F\x45\xC6\x8A\x30\x05\x84\xC4\x13\xA3\xED\x08\xCF\xD8\x1B\xA0\xC1\x50\xA3\xC1\xA9\xFC\xC9\x40\x39\x40\x99\xE3\xF3\x47\x33\x21\x0C\x52\x00\x6E\x42\x8B\x78\xCA\x1F\x82\xC1\xFE\xB5\x7A\x21\x3C\x53\x1F\x10\xE1\xB9\x15\xAF\x91\x04\xE8\x04\x7C\xD1\xC3\x0A\x91\x3A\xDA\x23\xFB\x1E\xCD\x30\xFC\x99\x43\x93\x0C\xE4\xDE\x6A\x4D\x20\x1A\x6B\x2F\x2A\x2B\x61\x87\xE2\x86\xD5\xD1\x74\x30\x0F\xC9\x4B\xC4\x2D\xA0\x91\x40\x79\xB1\xC8\x28\xF9\xEA\x11\x3A\xE3\x45\xB0\x8C\x7C\x90\x21\xD0\x1C\x94\x10\xA2\x74\x83\x2E\xC3\x26\xEC\xE6\x6A\x16\x6D\x37\xA2\x51\x6E\xAB\xB8\x91\x56\x48\x39\xD1\xFE\x7A\x43\x9D\xD9\x52\xB0\xB8\xDB\xC8\x39\xEB\x3E\x94\x73\xC6\xA6\xC7\xF2\x9E\x30\xDA\xC2\x4E\x62\xF4\xA6\xE6\xEC\x0D\x65\x02\x13\x68\x22\x8D\xED\x14\xD0\xB5\x8F\xB9\x68\x60\x7B\x31\x79\xFE\xCA\xAD\x57\xE5\x62\xCD\xA8\xB5\x60\x67\xC7\xC3\xDD\xB5\x2E\x31\x90\x64\x28\x7A\x9A\x75\xD5\x9E\x5C\x50\x36\xC3\x67\xDE\x7A\x5C\x8B\x61\x4B\x3E\x72\xF0\xD2\x4C\x08\x5B\x73\x31\xE6\x2C\xB7\x53\x69\x0D\x8F\x92\xE7\x4B\x86\x20\x03\x23\xCF\xC6\x76\x14\x0F\x37\x59\xBC\xEA\x7C\xF2\x84\xC7\xC9\xDD\x43\x83\x3D\x82\xBF\xF1\x39\x46\xCC\xBF\x4A\x7B\xDE\x54\xF0\xAE\xCC\xA9\xB6\x51\x38\x51\x4F\x68\x65\xEE\x99\xBB\x61\x64\x7F\x36\xEF\x40\xBD\xCA\xE4\x56\xFB\x9E\x7E\xC8\x3F\x84\x66\x9F\x69\xE8\xE2\x87\x56\xFF\xB2\xE3\x9F\xF6\x83\xEB\xEB\xFB\xE1\xEE\x09\xE9\x0F\x3A\xE7\x63\xB3\xD2\x38\x5D\x51\x02\xE3\x83\x12\xA1\xA7\xC4\x68\x9A\x02\xA7\xD9\x95\xD6\x9F\x49\x21\xEA\x29\x04\x86\xB1\x35\x7C\x7E\x47\xB8\x6C\xF3\x13\x0D\x66\xC9\xF9\xA3\xE8\x5D\xC0\x65\x39\x76\x3E\x80\x20\x04\x04\xFA\x42\x64\xB6\x41\xCC\x9E\xCF\xCA\x52\x93\x16\x8B\x6A\x8F\x05\x99\x04\x50\x2A\x24\x79\x78\xBE\x03\x5F\x11\xEF\xC5\x88\x39\xE6\x18\x34\x11\x85\x40\xA0\x9D\x1D\x75\x55\x8B\xC3\x84\xE1\x77\xB4\x9A\x14\xD3\xE6\xF2\x1C\xA5\x7E\x50\xE2\xE7\xB0\x53\x28\x65\x7F\xCC\x18\x6A\x37\x1E\xCF\x98\xA8\xCB\xDC\x0E\x9E\x98\x7C\xD1\xE0\x9F\x6A\x57\x74\x9F\xBB\x4F\x16\x0D\xDA\x36\x2D\x84\x8E\xC6\xDC\x6B\xDF\x08\x6D\x6E\xFD\x63\xCC\x7C\xAA\x03\x33\x97\x31\x82\x2F\x8B\xF4\x3F\x6D\x60\xD1\xBE\xD7\xD0\x9F\x3C\x0E\x1F\x79\xC6\x9D\x7D\xEB\x03\xEF\x71\xE5\x72\x1D\xCB\xE7\xC8\xA7\xD8\xEB\xFE\x6F\x90\x78\xAE\xB0\x17\xB1\x92\x92\x90\x68\xF7\xC2\x0F\xCE\xFA\x3B\x32\x4B\x8B\x17\x10\xAE\xD9\x44\x11\x1A\x95\x72\x23\x4E\xF7\x3D\x96\xEC\xE8\xEB\x3A\x6E\x26\xC3\x22\x4A\xFE\xB6\x00\x0B\xC6\x50\x76\x5B\xE4\xD0\x23\xC8\x72\xC1\x1F\x7B\x2C\x39\x54\x32\x69\xDC\xA6\xE1\x5D\xAE\xED\x9F\x38\x65\x3B\x18\x0E\x12\x10\x68\x46\x72\xDA\xC4\x0E\x1C\x47\xAB\x47\xFF\xA9\x31\x44\x68\xC8\x09\x64\xAE\x9F\x60\x31\xDF\xF4\x55\x87\xBA\xC6\x46\x86\x42\x07\x52\x7A\x66\xEF\x2B\xE6\x81\x2A\x9B\x11\x2E\x7B\x21\xFC\x70\x92\x0A\x3F\xBC\xED\xCB\x0A\x7A\xC9\x2E\xD3\x91\x3B\x87\x46\xED\xDA\xCB\xF8\x6A\x69\x38\xA7\x99\x53\x5E\x42\x2F\xF3\x05\x4E\x04\x2D\x6F\x3D\xAB\x6C\x26\xDC\x27\xEE\xC9\xDB\xDF\xFC\x99\xBC\xB8\xE0\xC2\xB7\xE0\x35\x95\x1A\xE3\x5D\x91\x20\x16\x2D\x1B\x9F\x97\xA8\xBB\x62\x27\x51\x4B\xC0\xB8\xA4\x17\xC0\x0D\x84\xDA\xBC\x9A\xEC\x34\xB2\x4F\xC5\x62\xB4\xEC\xC2\xF3\x74\x94\x1A\x19\x17\x08\xFB\x8E\x1E\x55\xED\x87\x39\x16\x18\xDF\xCE\x08\xF5\x72\xF8\xC7\x55\x52\x4B\x84\x36\xDF\x69\xAD\xB9\xD5\x16\xE9\x53\xC2\xAB\xEB\x12\x05\x9B\x50\xF6\xE8\x04\x9B\x23\xBD\x7F\x94\x46\xAF\xE8\xEB\x9F\x12\x37\x93\x1F\xA9\x2A\xC1\x1C\xA2\x64\x8E\xD3\x4C\xC0\xB9\xB7\xF0\x6D\x82\x6B\x4D\x4A\xA3\xDF\x89\xE7\x2A\xDF\x2F\x77\xF4\x36\xFF\xC7\x86\xAB\xA9\x7B\xF9\x45\x59\x7A\xC4\xD4\x99\xA7\xA9\x48\x4C\x24\xB5\x7F\x95\x4B\x0F\x64\x1B\x59\xFC\x1C\xDD\x12\x07\x3C\x75\xE4\x4C\x4D\x79\x86\x10\x15\x6F\x7C\x7F\x6E\x79\xC6\xDF\x7C\xC3\x6B\xA6\x80\x3E\xB5\xE8\x9D\x2A\xE0\xA7\xC7\x28\x8C\xB7\x0B\x37\xC2\x96\x55\x01\x71\x66\x75\x93\x1C\x33\x0A\xEB\x63\x51\x9B\x26\x00\xFC\xBE\xF6\xDC\x8D\x09\x98\x8C\x60\x79\x39\x84\xB1\x83\x23\x76\x09\x75\x62\xB0\x68\xC1\xAB\xD3\x3D\x3C\x44\xD3\x01\x86\xD7\xA4\xDB\x14\x05\x5D\x05\x8F\xEE\x3A\xA9\xE6\x8B\x78\xA6\xB8\x19\xB1\x02\x31\xC2\x41\x4C\x56\x88\x5C\xAD\x36\xEB\x54\xE2\x6D\x27\x64\x32\x3E\x86\xA0\x64\x2C\x37\x4E\x8C\x08\xF9\x93\x3A\x5B\xB8\x98\x08\x36\x4F\x94\xE7\x36\xB2\x4A\xF3\xA0\x7B\x02\x43\x01\xD4\x2B\x5E\x47\x0D\xD6\xB2\x0F\x2B\x99\x0E\x29\x2B\x08\xB0\xC5\x15\x16\xFB\x9C\x22\xB5\x5B\x7F\x53\xBC\x5E\xC9\x68\x3E\x95\x21\xB4\x12\x31\x97\x28\x12\x1C\x85\x12\x80\x22\x4C\x80\xFB\x94\x9E\xF3\x59\x49\xEA\x66\x5F\x10\x04\x4D\xF1\xF0\x37\xAB\x67\x1F\x17\x88\x0E\xFD\xC0\x55\x2E\x3A\x0D\x41\xD3\x8F\xC8\xE2\x26\xE7\x21\x4D\xF8\x2F\xD6\x58\xB7\x3A\xD3\xBC\x86\x7E\x6A\xCE\x3F\xDE\x6D\x4B\x10\xAD\x33\x0A\xDC\x84\xE0\x93\x70\x40\x82\x5B\x12\x14\xA1\x73\xAF\x83\xEE\x9C\x72\x35\xFE\x94\xD3\x7C\xBD\x30\x07\x27\x6A\xDB\x31\xD3\x7F\xDE\x80\xCD\xEA\x92\x39\xB6\xFB\x24\x60\x37\xA3\xE6\xA3\x43\x52\x75\x83\x60\x88\xFE\xEC\x77\x4F\x1B\xBC\xEF\xB1\x90\xAD\x12\xAF\x10\x1D\xA2\x6F\xF3\x24\xF5\xB2\x6B\x88\x61\x7A\x04\x9E\x2E\xC9\x32\xB4\x6F\xAD\xF7\xED\xC9\xEA\xAA\x9B\x11\xF3\xAB\x31\x66\xF8\x93\xB1\x2F\x02\x84\x63\x66\x70\x4E\xC0\x9B\xA5\x1E\x06\xBC\x30\x37\x70\x16\x92\xFD\xDC\x36\xB7\x9B\x8E\x73\x4F\x26\x63\xAC\xFC\x0E\x6F\x62\x59\x46\x57\x13\x81\xED\xAC\xC5\xE5\xA9\x07\x06\xA0\x73\xCF\x70\x54\x86\x9E\x2F\xFE\x06\x45\x8C\x3C\x07\x18\x47\x1D\xBD\x7B\x53\xCD\xEA\x25\xB9\x0C\xBE\x14\x2F\x13\x67\x8A\xFA\xE9\xCF\x96\x52\x87\xF5\x37\x11\x55\x95\x8B\x8B\x49\x8B\xD4\x6E\x9D\xCF\x3C\x00\x48\xB4\x63\xC7\x56\xF4\x6E\x89\xDE\xB3\xA5\xF9\x98\xC9\x35\x9D\xA4\xEF\x37\x4E\xF2\xF7\x57\x12\x93\x36\xF3\xD6\x6B\x2E\xA5\xF3\xFA\xF8\x35\x73\xE4\x1D\x49\xE3\x6D\xE1\x21\x4C\x76\x8A\xBC\x41\xFD\x03\x22\x8B\x4D\x84\x9C\x53\x22\x5A\xB0\xC8\x65\x16\x7A\x79\x05\xC4\xEF\xEE\x7F\x9A\xCE\x56\x55\x20\x84\xE2\xB9\x2E\xF5\x1C\xE5\x61\x5A\xCD\x02\x4B\x5D\xB6\x91\xAC\x42\x75\x62\xFB\x29\x12\x7A\x00\x3B\x4D\xE9\x03\xAB\x18\xF9\xEA\xAD\xD4\x19\x99\x5F\xAF\x7E\x90\xC1\x1C\xA4\xC5\x19\x69\x95\xD4\x94\x39\xA9\xB1\x4C\x3D\x4F\xE8\xCE\x37\xBB\xF4\x46\x19\x51\xA0\x04\x2D\x99\xB3\x26\x93\xD6\xAA\xB4\xF2\xB2\xF1\x47\x97\xD8\x18\x03\x74\xF5\x8C\x43\x27\x5B\xA9\x8B\xD9\x33\x2B\xAC\x03\xC0\xF3\xA3\x78\x37\x8D\x76\x5F\x27\x5F\xC6\x85\xFC\x41\xD7\x18\xA5\xA2\xF0\xEF\xD0\x6E\x0A\x23\xF5\xFC\x49\xB9\x20\x56\x43\x63\x99\xF6\xF4\xFA\x07\x19\x33\x65\xAF\xE6\xF4\x79\x2F\x64\xA0\xCE\x4C\x43\x36\x3F\x82\xB3\xA9\x63\x7D\x77\xC7\x9E\xFC\x1F\xE3\x32\x09\x3F\x3D\xAA\xBD\x2F\xD8\x00\xD7\x8B\xE2\xF6\xFF\x78\x22\x0C\x85\xAA\xB0\xDA\xF1\x49\xBE\x84\x7A\x34\x0C\x59\x46\x7E\xD7\xEA\x72\xD0\xE8\xBC\x58\x25\xFE\x77\xC0\x5B\xA4\x45\x30\xEA\xED\x88\xC5\x26\x46\xBE\xE5\x9D\x14\x7C\x08\x36\x49\x2C\xE9\xEF\x2E\x53\x1B\x12\xE8\xD6\xAD\x77\xEB\x79\x3C\x23\x0F\xC3\xE9\x06\xA7\xE1\xB5\x26\x2F\x09\x6B\xAE\x1C\xC6\xE8\x50\x93\xBB\x1E\x77\x50\xD9\x10\x6C\xCC\xC7\x12\x52\x84\x29\x15\xD6\xB5\xD6\xAA\x26\xB9\xF4\x15\x1E\xEC\xE6\x5E\x5E\x26\x3D\x32\x79\xFC\x78\x78\x35\x4F\xB9\x9C\xFE\x9E\x69\xBC\x2D\x03\x24\x32\xA8\x92\x32\x6C\x0F\x4F\x33\x06\x03\x60\x82\xD0\x45\x90\x8A\xA1\x1D\xC8\x6F\x6F\x88\x1A\xB0\x01\x01\x75\xA1\x68\xEC\x56\x86\x1C\xCB\xDF\x51\xF0\xF7\x6D\x42\xD3\x86\x20\xE8\x4C\x53\xF7\x36\x8C\x0D\x75\xBE\x73\x41\x0D\x00\xCB\x61\x11\xDB\xC5\xB7\x6A\x62\x15\xD3\xB6\x1E\xC7\x80\x6E\x9D\x05\x7D\x91\x20\xBB\xC2\xDF\x26\x5E\x6C\x1D\x6F\x7B\x2E\xB5\xD5\x5D\xB3\xA5\xA6\xD7\xB4\x89\x26\x7D\x53\x2D\x7B\xE7\x6C\x60\x56\x85\x99\x05\x2E\x6A\x5A\x18\xE4\x1A\x1C\x9B\xA8\xCD\x5B\x3F\x7F\x83\xF6\x70\xEC\xC8\x3C\xCA\x64\x1D\x9F\x62\x68\x48\x2F\xC2\xB8\xC8\x90\xA4\x1F\xCE\x18\xE9\x17\x59\xC4\x3C\xF0\x04\xDF\xD8\x73\x3E\xB1\x80\x6F\xF9\x19\x0E\x59\x92\x81\xD9\x41\xEE\x33\xD8\x9D\xD1\x4E\x19\x51\x52\x1B\x2B\x79\x2A\x89\x9F\x72\xD3\xE7\x21\x95\x69\x73\x31\x64\x73\xFD\xC0\x30\x58\x29\xAC\xAB\x6B\xB7\x80\x19\x57\x9B\x12\x3E\x32\x5B\x31\x9A\x96\xBA\xCB\xFA\x1D\x75\xAB\x17\xBC\x5F\x25\xA6\x46\xF3\x37\x6B\xC2\x58\x42\x7C\x0E\x80\x85\xB0\x19\x2D\x57\x5A\x36\xAE\x20\x6D\xF6\xD7\x3C\xA8\xC1\x8B\x1C\x27\xA7\x95\x18\x8B\xDD\x61\xF7\xDC\xE8\x3C\x63\x1C\xCE\xA1\x60\x17\x6C\x57\x8D\x8C\xCB\xD8\xB5\x63\x14\x9B\x0E\xBE\x32\xF9\xB5\xD4\xBC\xE1\x77\x3D\xF3\xD6\x40\xB2\x19\x6E\xBA\x13\x94\x9E\x06\x84\xAA\x1F\xE8\x33\x5C\x5C\x88\xAA\x39\x9E\x53\xC2\xF7\xA3\x9A\x3C\x7B\x1F\xC6\xFF\x91\x6D\x23\x6C\x58\x5B\x25\x7D\x5B\xD2\x2C\xDB\x8C\xDF\x80\xEA\xE9\xCA\x02\x35\xCD\x28\x5B\xB1\x7E\x30\xBB\x0A\xD0\x22\x15\xB5\x4E\x6F\x2A\x1C\x61\x36\xA8\x34\xDE\x2D\x58\xB3\x16\x9B\xE0\xF9\x45\x63\xD2\x6F\xCE\xE3\x8C\x14\x4A\xAA\xBE\x29\x15\x57\x58\x19\x02\xF6\x56\xDE\xE5\xBB\x59\x36\x77\x3B\x36\xBD\x63\x29\xE6\x4A\x4C\x5A\x93\x7A\xD6\xC9\x86\x75\x17\x3E\x9F\xC2\x30\x42\x82\x96\x71\xFD\x43\x53\xF1\x9C\xAC\x50\xE6\x99\x60\xDB\x04\xB4\x1E\xF3\x9C\xA4\x3F\xFD\x0A\xB7\x49\x0F\x35\x7A\x0D\xF9\x5C\x04\xD3\x32\x5B\x14\xF1\xF8\x0A\xCB\x6E\x34\x4B\xDD\x0D\xDD\xA8\xD1\xB5\x4A\x0D\x26\x08\x46\x68\xFA\x6B\x45\xE2\xF2\xBB\x15\x28\x47\x43\x2F\x94\xFE\xF2\xCA\x93\xAA\x9E\x47\xE3\xE1\xE2\x50\x66\xF7\xF6\x11\x04\xAE\x08\x35\x57\x3D\x49\x99\x29\x77\xA4\x72\x67\x12\x7C\xA9\x39\xED\xC8\x95\xCE\x35\x0E\x84\xFE\xF5\xCF\x5D\xBF\x80\xC1\xB5\x06\x01\xC7\xDD\x33\x0C\x58\x75\xFA\xA3\xB4\x18\x24\xB2\x47\x72\x88\xBA\x99\xD1\xF1\x31\x62\x7A\x5C\xFC\xCE\x48\x5D\xD7\x1C\xD6\x33\x5A\x62\x01\x88\x61\x17\xAD\x7A\xB3\x67\xA7\xD7\xDD\x44\x1F\x3C\x8E\xF8\xCC\x84\x1C\xFA\x56\x8A\xB2\x67\x85\xEC\xCD\xAC\xF0\x27\x43\x73\xDD\xD5\xF1\x5D\x64\xFB\x5B\x0C\x4D\xF5\xA4\x68\x0A\x1F\xBE\xE7\xA7\xD5\x06\x4B\x43\x23\x88\xAB\xCA\xFC\xAA\xBB\x0C\x49\xF3\x8A\xFF\xFF\x70\xDF\xC6\x46\xC2\xD7\x48\x2C\x8A\x2B\x54\x5D\x18\x9F\x95\xD2\xFF\x90\x04\x1D\x87\xD6\x86\x7E\x43\xD1\xC2\x72\x49\x02\x54\xAF\x45\x93\xF2\x27\x4A\xA8\x1C\x87\x6C\xEA\xAF\x10\xE8\x8F\xF8\x25\x80\x48\xC2\xB9\xA5\xA6\xF5\xE9\xEC\x55\xFB\x4C\x60\x65\x4E\x86\x78\x79\xBD\xA5\xA8\xB6\x0C\x14\x5E\xF3\x70\x05\x84\xDB\x8D\x8A\x91\x59\xA7\x63\xD6\x09\x6C\x6E\xF5\x7F\x4F\x98\x64\xF2\xF2\xAA\x3D\x31\x4A\xDE\xF0\x63\x35\x93\x23\xFE\x9C\xB8\xEB\x76\xD0\xEB\x20\x21\xD2\x37\x13\xA3\x9D\x2B\x70\x95\xAE\xE3\xD2\xF2\xAC\xF0\x6E\x21\x7D\x37\x44\xEA\x90\x9F\xE0\x11\xBC\xFA\x4D\xCB\xDC\x4C\xF4\x46\x21\x15\x6E\x93\xFE\x9E\xEC\xB5\x00\xA5\x1E\xA5\x97\xE2\x5A\x86\x71\x4F\xD9\xB6\x7E\xE4\xC4\x8A\xFE\x16\x09\xCF\xDF\x75\xA8\x05\x21\x15\x19\x27\xD5\x39\x26\x4B\x5C\xD5\xE8\x89\x55\x96\x2E\xF7\x91\x3B\xB4\x16\xB9\xCB\xCE\x79\x4C\xC9\x87\x5C\xBD\x97\x73\xB7\xC4\xE3\x66\xE5\x70\x76\x3E\x33\xE1\xAA\x08\xEA\x38\xE5\x68\xCD\xDF\x27\xAC\xD5\x30\x49\x4B\x9F\xB3\x1D\x68\x2C\xFB\x49\xE2\xC4\x8A\x21\x27\x39\x98\x26\xE3\x86\x31\x81\x82\xBE\x26\xD2\x10\x74\x9E\x9D\x7E\x35\x0B\xA5\xAD\x22\x47\xB1\x9B\x38\xEF\xDF\xCF\x3E\x3B\xDC\x6C\xEB\xA6\x3A\x34\xC6\x9B\x36\x55\x4B\xB1\x29\x70\x49\x80\xD4\x91\x09\x47\xBE\x18\x89\x47\xE8\xCA\x02\xDE\xAC\x9C\x68\xF4\xA2\x07\xA3\xCC\x09\xCD\x03\x1B\xA4\x95\x78\xE7\x79\x2D\xC1\x43\xB5\x24\xA4\x54\x46\x53\x4B\xEE\x47\x08\xE1\xD4\x51\x44\x3E\xBE\x45\x3F\x3C\xC2\x3D\xDE\x56\x7A\x2F\xDB\xD3\x94\x91\xCB\x08\x7D\x42\x63\x3E\xDC\x02\x9C\xCA\x06\xE8\x2B\x39\x62\x91\xEA\xE5\x72\x7F\x6C\x59\x61\x3F\xC9\xA6\xE6\x93\xB0\x16\x0F\xC5\x91\xE8\x30\x99\x12\xB5\x4F\x0A\x0F\x3A\xB8\x04\xD2\x02\x9A\xE2\xAB\xD9\xA2\xB9\x2E\x5A\x25\x1E\x25\x01\x84\x97\x7C\x7E\xA1\x4B\xD3\xEE\x6F\x76\xC9\x7C\xC4\xC4\xCA\x7D\x4B\x31\xAA\x71\xDA\xD4\xA8\x01\x78\x61\x5A\xA9\xD1\x4A\x70\xA8\x55\x1F\x96\x0A\xAC\xEE\xCD\x26\x4E\x44\x3D\x05\xA1\xF9\x07\x84\x72\xBE\xF4\xB5\x5D\x56\x8A\x0A\xE2\xF5\xFD\xE2\x54\xC1\x01\x61\x57\xFC\xBD\x1F\xEC\x0F\x4E\x44\x50\x9D\xCE\x5C\xC9\x1C\xBE\xD2\xA1\x0A\xD6\xC4\xDF\x9E\x69\x90\xFD\x95\xDB\x4F\xB8\xEB\x8D\xBD\xC4\x67\x18\xE3\x81\xE0\x90\xBD\x70\x11\x71\xB9\x50\xE3\x66\x09\x2D\x69\x17\xD9\x92\x5C\xA4\x12\xB8\x5B\xF5\xE1\x7C\x5A\x87\x16\x6F\x07\x38\x76\xAE\xBC\xE3\xEB\x80\xE6\x3B\x28\xAC\x1F\x17\x88\xD2\xD6\x9B\xB4\xB1\x9F\x63\xFA\xC4\xF3\x5A\x48\x2D\x79\x85\x73\x0C\x6D\x52\xB5\x08\xCB\xC8\x48\xA4\x30\x81\xF1\x34\x91\xD2\xAE\xC2\x9D\x63\xC1\x37\x88\xDE\xFB\x56\x3B\x08\x32\x72\x7B\x4B\xA0\x49\x72\x89\xB5\xBA\xCF\xB4\x0D\x29\x52\x5E\x1D\x48\xAD\x17\x39\x78\xC9\xD7\xF8\x12\xFD\xE7\x1A\x6F\x78\xD0\x44\x42\x51\xED\x14\x9E\x20\xF4\x2A\xC3\xF0\xF5\x71\xD5\xEC\x6A\xD4\x01\x16\x3C\x4C\x9C\xA1\x47\x3B\x92\x96\x02\xA0\x97\x26\x36\x75\x1B\xF5\x8A\x9A\xE9\xAE\xF6\x50\xB8\x78\x29\x6F\x0E\xC7\xAD\x5A\x21\x73\x2C\x01\x5B\xD2\x40\x35\xA0\x53\x2C\x92\x6A\x2D\x25\x56\x18\x5D\xD8\x25\xC5\xB5\x0D\x56\x3D\x50\x93\xDA\x3E\x8A\x2B\xC5\x0D\x3E\x79\x20\xE3\x60\x58\x6A\xAD\x91\xAD\x3A\xFD\x28\x08\xA9\x6B\x6A\xC4\x09\x4F\xFA\x70\xA7\xDD\x0B\x4C\x9A\xEC\x78\xC5\x37\xF2\x73\x8E\xD3\x8E\xB2\xB5\x90\x5A\xF3\x35\x2D\x3B\x59\x1A\x7A\x62\x25\x2F\xF4\xE4\x96\xFF\xD5\x65\x41\x51\x21\x62\x80\x93\x21\x06\x1A\xCC\xC2\x30\x6A\xF8\x2C\xA9\xEB\x36\xED\xA5\x5E\xDE\x6B\x99\xFB\xBF\xA1\xFE\x6A\xC4\xBC\x45\xED\xAC\xB8\xA8\x16\x3F\x69\xBB\x9B\x51\xB9\x32\x33\xC3\xD0\x94\xCE\x96\xD5\x57\x5F\xA6\x47\xD8\x0B\x57\xB6\xE2\x26\x58\xF3\x1E\x33\x6D\x06\x80\x96\xA4\x6C\x10\x05\x0E\x20\x4F\x61\x0F\x90\x10\xC6\x2D\x50\x17\xEC\x2A\x92\x14\x90\xA3\x48\x5D\x63\x60\xE3\x75\x42\x5C\x4D\x73\x8D\x3E\xFE\x86\xBA\x92\xA9\xB0\xAC\x74\x8C\x7C\x1E\x5D\x79\x56\x4C\xB9\x4C\x15\x74\x9F\x66\x43\x89\x01\x32\x05\xD6\x75\x04\xE9\x9F\xC2\xB4\x78\xDC\x30\x15\x78\x10\x0D\xEB\xA6\x96\xC8\xE4\x4B\xE2\x0B\x60\xE0\xD2\x16\x7C\x20\xB0\xAE\xBD\x45\x22\x67\xDD\x0B\xC4\xDA\xC7\x6D\x55\xF9\xB0\x58\x79\xA5\x68\x8E\x2B\xD9\xD2\x0D\x0D\x6D\x1C\x13\xCD\xA5\x30\xD5\xAF\xBA\xCA\xC3\x08\x73\xBC\xAC\xA3\x14\xEC\x6A\x17\x0A\xF7\x55\x99\x67\xC0\xFF\xF4\x88\x36\xC0\x71\xBF\x17\x98\xA0\x0E\xBD\xF9\x73\x3E\xB7\x48\x7C\x26\x00\x12\xE1\xDB\x77\xF3\xF7\xF7\x33\xF5\x4F\x58\x34\xBB\x58\xA7\x29\xEF\x47\x6B\x05\xCD\x07\x31\xC1\x7A\xCA\x73\x2D\x2D\x85\xA5\xD6\xA1\x31\x49\xBF\xED\x7E\xE0\x26\x30\x38\xA3\xE1\xE2\xB1\xD3\xE2\xB1\xC5\xC8\x4C\xAC\x1C\x13\x57\x9B\xB0\x84\xFC\x52\xDB\xFA\x2B\x08\x58\xFB\xCD\xE1\x36\x1A\xAE\x9E\x2E\x1B\x34\xB1\xDF\x09\x80\x3B\x56\x28\x95\xE4\x91\x84\x9D\xD4\xA2\x4D\x77\xB1\xD0\x4E\xA3\xDA\x74\x1F\x1C\xE7\xAC\xCB\xF9\x13\x88\xDC\x5F\xAB\xEE\xFB\x7C\xC4\x01\x39\x4E\x28\x8F\x92\x5A\x57\x85\xD4\x13\xD4\x38\xCF\x0B\x4B\x71\x74\x88\x95\x52\x56\x90\x89\xEF\x72\x11\x1C\x38\x3B\x72\x6C\xB1\x7A\x9B\xE3\xBB\x70\x7C\xFD\x6E\x8F\x4B\x26\x3B\x35\x94\x2B\x06\x1A\xC2\x52\x0E\x3E\xD3\xC9\xB5\x27\x29\xE3\x66\xE0\xEA\x14\xCE\x8A\xC9\x8B\x19\xCC\x58\x5E\x07\x95\x13\x8B\x00\x46\xCA\x55\x96\x95\xC0\x43\xC7\x6E\x6A\x41\xF4\xC8\x7F\x4C\xC5\x21\x25\x7A\xA1\x81\x65\x55\x56\xFC\x77\x29\x6D\x75\x99\xCE\xC0\x2E\xEB\x31\x31\x63\xFF\xFC\x6A\x78\xDD\x3A\x78\xB9\xF7\x2C\x60\x68\x87\xF7\x3C\x95\x24\x7F\x78\x13\xCD\x75\xF1\x7F\xEE\x94\xB7\x07\x19\x8C\xAB\xE8\xA0\xB7\x58\x64\xB1\x35\x59\xA5\xA4\xAE\x28\x82\xEE\x46\x84\xCC\x65\x60\x4E\x48\x5F\xFE\x97\x3E\x9C\xB1\x05\x04\x7B\xF7\xA9\xFF\xF8\xD7\xBD\xD6\x0F\x6E\xB7\xC2\xA2\xA8\x56\x5A\x89\xF8\xF7\x7D\x6D\xBF\xBC\xCC\x56\xAC\x1F\xC5\x42\x89\x47\x56\xC6\xA4\x9F\xF5\x9C\xC0\x0B\xA2\x9A\xEC\x43\x17\x59\xF5\xFF\xC1\xD0\x50\xD3\x70\x78\x4E\x6A\x5C\x95\x55\xEB\x0F\xE0\x1A\x2C\x4D\x94\x74\xD2\xB8\x7D\x3D\x56\x1B\x22\xCD\xA1\x20\x91\x01\x90\x84\x59\xE7\x05\xE5\x0D\xAB\x87\xBE\xF0\xA8\xCD\xF7\x8E\x3E\xC2\x05\x9F\x04\x39\x43\xD0\x7A\xA6\xD5\x3A\xF4\x99\xA8\x80\xFF\x39\xDE\x54\x89\xC6\x18\xD4\x98\xA2\xE3\xDF\x56\x3E\x87\xEB\xAD\x02\xF1\x48\x62\x0E\x48\x6F\xA1\xB1\x1C\x3E\x52\x98\x90\x69\xF4\x15\xB0\xF9\x31\xAA\x54\xE6\x82\xA7\x22\xFA\xB0\x0D\xB9\x7F\xFF\x06\xC7\xAB\x20\x11\x2E\x2F\x4B\x14\x27\xE4\xF3\xE9\x48\x35\x21\x9D\x6C\x70\xD4\xD4\x61\x8E\x11\x8D\x76\xA1\x71\xFB\x93\xDA\x65\x95\x4A\xB3\xD6\x66\x71\x7B\xD6\xB2\x4E\x0B\x63\x74\x24\x63\x5B\xF1\x17\xD4\xE9\xA7\xD4\xDE\x5D\xCE\x93\xAB\x2D\xAA\xA4\xEC\x62\xC6\xE7\xA8\x58\x3B\xD8\x9E\x96\xBC\xAE\x0C\x90\x73\x08\x88\xED\x3A\x41\x10\xD9\x53\x3D\xB9\xE7\x4A\xC1\xC4\xD4\x46\x18\xA2\xD7\xF8\xF2\x5B\x52\xE0\x9E\xAF\x28\x14\xA4\x75\x79\x75\x77\x6B\xFE\xFE\x6E\xAF\x79\xD2\x2D\xCB\x34\xC5\x12\xBF\xF7\xB3\x04\x32\x43\xFC\xEF\x35\x3E\x3F\xC8\xD2\x19\x3B\x04\x62\xCB\xAA\xCE\x86\x72\xF7\x3C\x93\xC0\xB1\x15\xD4\x76\x87\x64\xC9\x04\x19\x45\xC6\x4A\x0C\xA5\xFD\xEB\x86\x12\xD9\x75\xA2\x24\x78\xCD\x00\x44\xF6\xCC\xB8\xBB\x9B\xB3\x37\x4C\x3C\x67\x85\x1D\xB7\xD8\xF9\x82\x5E\xD1\xF5\xED\xBC\xA4\x6D\x01\xBA\xCE\xB4\xBB\xD5\xE1\xF9\xF2\xC1\x63\xE3\xF0\x31\x39\x31\xB0\xD6\x13\x27\x66\x9D\xBE\xC9\x4C\x82\x05\x9B\x85\x2E\x4B\x7C\xDE\xD5\x9A\x4A\x6C\xE7\x0C\x99\x0E\xAE\x40\x10\x8A\xC6\xF0\xED\xF4\xFA\x85\x80\x8D\xC4\xD1\xBE\x5E\x09\x7B\x37\x3D\x36\x2A\xB3\x37\xD0\x2A\x5E\xF9\x73\x46\x73\x95\xAC\xA7\x1E\x5A\x31\x58\x4D\x60\x60\xF0\x74\x4E\x34\x6F\x17\x17\x99\x59\xF7\xBA\x16\xBC\x04\xFC\xE5\x3B\x66\x87\xC1\x72\x79\x4E\x49\xF8\xFB\x30\x91\x16\x6E\x2C\xF4\x11\xFE\x12\xDB\x4C\xFC\x57\x73\x77\x1E\x13\x20\xB0\xF6\x24\xAF\xC7\xCD\xCC\x33\x97\x69\x67\x9D\x40\xBA\xA9\xAD\xB9\x20\xC8\xDC\xEE\x02\x83\xFF\xC0\x0F\xD6\x5E\x68\x1C\x05\x8A\x98\x5F\x02\x48\xC2\xB3\x77\x5A\x9D\x30\x3D\x47\xC6\xD8\x44\x7B\x33\x87\xD0\xA7\x1B\x3D\x02\xBD\x4A\xC2\x45\x98\x64\x58\xBC\x51\x2E\xDA\x49\x54\xC3\xC4\x82\x70\xB1\x41\xA9\x22\x63\x0C\x8E\x7F\x08\xA0\xBF\x29\x7B\x20\xEA\xE5\xE9\x10\x53\x13\x3A\xBC\x44\x4E\x85\xE4\x43\x70\x93\x02\x1F\xDF\xC7\xC6\x52\xB6\x6B\xE2\xC4\x05\x2A\x11\xBA\xF4\x9D\xFE\x4F\x8C\x61\xE6\x00\x92\xBC\x7E\x62\xD3\x2B\x9E\xA1\x77\x74\xC4\x41\xB5\xBF\x0E\x69\xD5\x7B\x1B\x30\x38\xFC\xCD\xDF\x3A\xEC\xFA\xB2\x64\xFF\x07\x5C\x83\x35\xDF\xDC\x75\xFA\xA1\x24\xDD\xB9\x1F\x09\x8C\xB6\x60\x7B\x45\xE1\x70\xED\x95\x12\x02\x33\x03\x3C\xB1\x46\x60\xA4\xCB\xE6\x62\x2F\x2D\xDA\x1C\xF8\xC2\x4F\xFC\x94\xEB\x37\xA5\xCF\xE9\x00\x52\xDD\x25\xD8\x55\x71\x5E\x74\xB9\xAD\xDF\x9A\xA0\x2E\x73\x44\x9C\xA0\xD9\xCD\xE7\xFC\xB6\x73\x02\xEB\x86\x48\xF4\xAF\x24\x7A\xE1\x80\x19\xB5\x97\x0F\xF2\x0A\x0A\x9D\x30\xC8\xF4\x03\xAA\x7A\x4F\xBF\x37\x8B\x59\xB1\x84\x91\xB8\x62\xB5\xA7\xD8\x05\x0C\xDD\x9E\x8B\x5B\x24\xF1\xF7\x44\x79\x0D\xD8\xE4\x90\xE1\xFF\xA8\x5E\x4A\xE3\x27\x57\x25\xE0\xB2\x19\xDC\x40\xB7\x86\x60\x52\xFF\xF5\x53\x3A\x26\xAB\x03\xCD\xFC\x76\xE2\xCF\x62\x98\xBB\xF2\xEA\x95\x43\x58\xF5\x3A\x2C\xB4\x4F\xFF\x93\xE0\xF4\xD2\xED\x0C\xE0\xFE\x7B\xD8\x7A\xF6\x8A\x83\x3E\xF2\x53\xF4\xB8\x08\xF0\xEB\xA1\xB9\x87\x2F\x48\x96\x8C\x29\xC7\xB1\x73\x38\x58\x3E\xE2\x91\x04\x35\x37\x2C\x68\x0A\x90\x7E\x1F\x67\x3A\x54\x20\x38\xDC\x81\xC9\x2F\xAF\x4D\xB3\x7C\xF0\xA4\xE7\x04\x35\x34\xFB\x1E\x7D\xAA\x4A\x4D\xB4\x08\x7D\x4B\xCB\x56\xCD\xA2\xD9\xC3\xE3\x9C\x6F\xF4\x13\xCD\x94\x2E\x32\xE8\x37\x7B\x2C\xB4\xC6\x5B\x30\x1B\x22\xF9\xEA\xF1\xD9\x9E\x93\x3F\x5D\x5B\x24\xF8\x68\xDC\x15\xFF\x1D\xBA\xF1\x5B\xDE\xFD\x55\x90\x10\xA6\x01\x10\x91\x7C\x59\x2A\xCE\x97\x8B\xAC\xA0\x7D\x56\x37\xCC\x64\xA5\x3E\xD0\xB1\x3C\xA9\xAC\xB2\xF5\xCF\x68\x93\x6A\x92\xDF\x17\x20\x8D\x8C\xFB\x8E\x7D\xB8\xD8\x9C\xA4\xC7\x49\x6A\x01\x46\xBF\xE1\xC4\xD9\x1D\x45\x7C\xB1\x5E\xDC\x74\xA1\x99\x7D\x35\x7F\x2B\x8E\x34\x13\xCB\xDB\x4E\x0A\x2D\x21\x97\x7B\xC6\x80\x96\xA9\x23\x75\x98\x09\xFA\x05\x57\x2E\x61\x83\x19\x68\x41\x3B\xD2\xB2\xB5\x9E\x1C\x15\x8D\xEE\x40\xA0\x0B\xB8\x74\x7D\x14\x26\xD2\x61\x8E\x16\x33\xEA\x19\x71\x0F\xC4\x90\x96\x09\x68\x6D\xA7\x6A\x6C\x3C\x33\x31\x54\xE8\x7C\xDB\x50\x83\xEB\x32\xF1\xE0\xE4\xE4\xE4\x86\x65\x98\x46\x00\x18\xD0\x8B\xEF\x67\xEE\xCD\xB4\x09\xE8\x3A\x9F\xCD\x5C\x4F\x07\x09\x5F\xDA\xA9\x29\x46\xD8\x2F\x85\x2B\x4E\x46\x59\x7E\x2C\xC4\xB5\x50\x9A\x2F\xC3\x19\xFC\x52\xFB\x41\x85\x10\x6B\x48\x9A\x5F\xC8\x7D\x60\x5B\x56\x5E\xA3\xB6\xA3\x37\xC2\x50\x06\x3A\x16\x80\xE7\x8D\xA8\x46\xF8\x54\x85\x37\x30\xD2\x01\x6A\x51\xEF\x89\xBD\xA3\x99\x39\x51\x8D\x36\x0A\xC1\x34\xDB\x2C\xA4\xA5\xA0\xC7\x26\xF4\x3F\xD6\xDC\xD8\x38\x03\x24\x65\xB8\xDB\xD8\xC8\x0F\x25\xFD\x50\x02\x68\xBC\x00\x56\x35\x99\xF4\x08\x31\xD9\x7F\x76\x49\x3D\xB8\xBB\x19\xA0\x74\x00\x86\xA0\x7F\xDD\xCF\x32\x48\x21\x92\xF3\x0B\xEB\x8B\x0B\xC1\x65\xB8\x3A\xA5\x35\xD5\xB4\x6C\x8F\x1D\xFF\xEB\x54\x40\x59\x2F\xFE\x21\x30\x9D\xA2\x55\xB2\x96\x67\x2D\x01\x75\x31\x43\x1E\xFD\x6A\x60\xEA\xE7\x7C\x0F\xDC\x25\xE4\xCD\x07\xFD\xDE\x32\x14\xB1\xBB\x05\x90\x98\xF0\x90\xA0\x02\xAF\x16\xC9\xA6\x84\xB0\xC9\x96\xB3\x19\xB3\xC8\x53\x65\xD6\x21\x43\xB2\xDC\x8E\xDD\x18\xEC\xD9\x45\x65\xF3\x84\x20\x63\xE7\x33\x72\xC7\x6C\xD0\xEC\x29\x08\x5C\x23\x4B\x8C\x83\x37\xA7\x70\x0C\xDE\x56\xD3\x5D\xE7\x43\xB6\x36\x58\xCA\x81\x50\x56\x21\x26\xB9\x36\xC8\xCF\x30\x60\x29\xB5\x4A\x8D\xE1\xDC\x44\xB2\x8B\xA8\x2F\x1A\xF3\xD3\xD4\xD4\x83\x86\x7C\x67\x01\x83\xD1\xD2\x94\x03\xF9\x96\xE6\x8B\x62\x2A\x1E\xE4\x4C\x8E\x98\x9F\x39\xD5\x9F\xC8\xDB\x71\x38\xBD\x93\x05\xC0\x9D\xFF\xB4\x5A\x9A\xA6\xBA\xB4\xB6\xA7\x2F\xCA\xFE\x8C\xCC\xDB\xE7\x03\xAD\x39\x83\x98\x0D\xAF\x5E\xFD\x9C\x11\xA6\x09\xC0\xDF\x8B\xF1\xE0\xA7\xA2\x6E\x17\x64\x29\xE7\xE2\x6C\x94\x9B\x7E\xC5\x92\x11\x98\x64\x62\x68\xA8\x73\x25\xF7\x9D\xDD\xBE\xAC\x1C\xE4\x4D\x4A\x35\x37\x13\x49\xC1\xE0\x76\x5C\x02\x06\xC9\x48\x70\x09\x84\x0D\x45\xF2\x40\x1A\xB0\x40\x65\xD5\xB5\x4A\x29\xC4\x4C\x3D\x51\xE3\xC1\xA0\x05\xEC\x88\x34\xA3\x78\x76\x8C\x35\xD5\x72\x27\x00\xE0\x28\x8F\xB6\x7C\x06\x5F\xB5\x27\xBC\x35\x6D\x05\x8B\x5B\x91\x9E\x8A\x8F\xA5\x1F\xAF\x70\x69\xEA\x02\x29\x68\xDA\x5C\xC3\xE0\x07\xE0\x61\x89\x88\x4C\x17\x4D\x25\xFC\xBC\x17\x4C\xC8\x45\x38\x1A\xB5\x51\x79\xDC\xC8\xA2\x56\x4D\x2F\xE8\xA3\xF9\x48\x28\xD6\x71\x0F\x30\xE7\xBD\x33\xBA\x28\xC5\xE3\x11\x5C\xB9\x13\xE1\xDE\xBC\xEB\x2B\x1B\xC2\xA4\xE0\x5F\x49\x8D\xE9\x61\xC0\xC1\x13\x72\x38\x91\xB8\xF4\x68\x6D\x40\xE2\x97\x6F\xE0\xCD\x5F\xF0\x59\x51\x98\x7C\xDE\xD8\x4C\xBE\x62\xF8\xEA\x9C\xB7\x32\x6E\xB8\x1D\x88\x62\xF5\xDF\x91\xFC\x0A\xC2\xC0\x8A\x2D\xBF\x54\xA5\x17\xDD\x8E\xF8\xBF\xBE\x4A\x76\x1A\x98\xEA\xEB\xBC\xC9\x51\x5C\xE4\x66\xDA\x15\xB4\xB2\x14\x35\x44\xF1\xF9\xF3\x07\x0B\xF5\x15\xC2\x4D\xCB\x02\xEF\xD4\x01\x4A\x70\x9C\xD7\xF3\xDB\x13\x9D\x60\x83\x39\x19\xCD\x61\xE5\x57\x1A\x81\x6B\xB0\xBC\x15\x66\x77\xBC\x51\x8E\xEA\xA7\x42\x1E\x73\x70\x4E\xBC\xF2\xB0\x05\x0B\x60\xA4\xAF\x94\xFD\xEB\xCE\xD2\xAD\x1D\x3B\x53\xF5\xF8\x16\xFA\x03\x8E\x84\xDC\x0B\x96\x88\xF6\x3F\x05\xD1\x0D\xA0\x59\x9F\x41\xE4\x47\x3B\xA2\x03\x1E\xD4\x42\xD3\x06\xF5\x8C\x90\xF9\x94\x28\x9F\xA5\x21\x89\xA6\x2F\x5F\x22\xE9\xD1\xC0\x30\x43\x4A\x92\xC4\x15\xD0\x19\x79\x38\x6F\x5B\x04\x3B\xDE\x95\xA9\xE2\xE9\x0B\xEC\x4A\x02\xB6\x21\xBE\x8E\x3D\x9A\xE8\xD4\x3E\x1B\x53\x12\x0D\x1D\x26\xAC\xE4\xE1\x2E\xFB\x8D\x43\x3D\x1E\x2F\x36\x1E\x77\xD7\xB3\x4C\x1E\x94\x94\xE9\x6D\x90\x98\xD4\x67\xF0\x35\x03\x10\x88\xB4\x4C\x80\x25\x09\x24\x39\xD2\xBE\x49\xA1\xF4\x2F\xAD\x2D\x44\x6B\xD3\xF2\x89\x42\x36\x44\xA0\xAF\xF9\x45\x48\x65\xD4\xAC\x77\x7F\x44\x2A\xC7\x0B\xBE\x93\xCD\x6A\xBF\x37\x62\x3A\xB9\x28\x99\xDB\x24\x9E\x2D\xAE\x91\x8F\x62\xB3\x30\xB3\xF9\x05\x24\xA4\x68\x6A\x3F\x44\xF3\xA3\x9F\x51\x8D\x4A\xA3\xDF\xCD\xF2\xBB\x91\x7A\x70\xE2\xEA\x15\x2E\x08\x67\x15\xD6\x5F\x15\xAF\xD5\x4B\x36\x54\xD7\xFA\x3D\x43\xE5\xE8\x9D\xBF\x25\xF2\x3A\xA7\x12\x09\x28\x9D\xB8\xBB\xFA\xB3\x1C\x48\x44\x52\xB5\x9D\x26\xDF\x43\x1D\x6E\x35\x24\x1A\xA9\x50\x02\x90\x7B\x10\x9D\xE3\xD6\x3A\x27\xED\x49\x39\x59\x36\x0B\xC0\x8D\xDE\xA4\x95\x60\x6B\xC6\xF2\xC0\x39\x5A\x2F\x1F\x6C\x0E\x08\xD6\x8E\xB8\x44\xBE\x3F\x86\x66\x82\x84\x5E\xD3\xF7\x14\x0E\xC5\xB9\xB4\x86\xF0\x70\xBE\x61\x14\xE8\x74\x62\xAA\xA2\x6D\x0C\x4F\x00\x2A\xE4\xAB\x09\x8D\x52\xED\xB7\xA0\x42\x08\xBC\x2B\x2A\x0B\x86\xA4\x0A\x7A\x6B\x14\x07\x97\x0D\x0C\x83\x55\x80\xCD\x9C\x13\x1E\x18\x8A\x78\x84\x94\x5C\x4B\x52\xC4\x7C\xB7\x97\xBF\x11\x84\x78\x7A\xDB\x5D\xB9\x43\xA1\x92\xCA\xBC\x11\x14\xD3\x8F\x3C\x18\x77\xB9\x9B\x2C\x6B\xAD\xB6\x47\x9A\xC1\x3A\x5C\x05\xB3\x82\xD0\x5E\xE7\x62\x1D\x14\x61\xAB\x57\xCD\xAE\xF6\x5C\x6D\xC9\x42\x5D\x3B\xA4\xE3\x8F\x18\x5F\x61\x43\x12\xB3\x1C\x7B\x1D\x05\x5A\x1D\xD8\x1A\xCC\x22\x58\xE6\xC7\x66\x6F\x00\x5D\x54\x1D\x4F\x0A\x31\x19\x7D\x87\xFE\x1F\x79\x7D\xE4\x7C\x38\xE5\x1E\x55\xC2\x53\x06\xF7\x28\xD6\xAE\x9B\xC0\x77\x10\x65\x70\xF5\x9E\x29\x92\x20\x14\x1F\x17\x48\xEA\x4F\xA6\xDA\x81\xF6\xF1\xF0\xE1\xB7\x57\xB5\x60\xB2\xD0\x58\x87\x15\x2A\x86\xD0\xBA\xB4\x28\xC1\xB1\x29\x68\x11\xDF\xC2\x1B\x65\xDC\x45\xBF\x0B\x4F\xCC\xC2\x22\xE4\xF0\x6E\xC5\x2F\xB6\x5D\xB2\xD6\x97\x3A\xCB\x77\x48\x99\x12\x0E\x4C\x64\x86\x9B\xC4\x8D\xEA\x63\xD2\x04\x3E\xB4\x80\x2C\x19\xB0\x9C\xEC\xEC\x58\x26\x4A\xDE\x07\xDE\x37\x88\xE1\x16\x31\x9A\xF7\x3F\x19\x80\x2E\x7B\x5A\x72\x53\x71\xDB\x82\x9C\x65\x7E\x58\x69\x95\x56\xD3\xFB\x91\xCD\x72\x5F\xF0\x52\xC7\x23\x31\x5E\x6B\xB0\xFD\x5A\x9D\xF8\x34\xB1\xA6\x9A\xFF\x6B\x9B\x93\x99\x08\xA4\x90\x9C\x3C\x1A\x16\xD2\x07\x75\x49\xAA\xCF\xC1\x99\x06\x1F\xC6\x87\x8A\x6C\x52\x83\x2B\xC6\x79\x3E\x8A\xA7\x91\xAB\xCC\x9A\x2B\x72\x2F\x15\xFC\xBE\x87\xA3\x75\xD7\x3C\xF1\x19\x6E\x47\xF3\xDE\x8F\x09\xE9\x35\x65\xE6\x40\xB9\x75\xD5\xF1\x37\xA2\x4C\x39\x7B\x6E\x1A\x79\x86\xC8\x54\xC7\x55\x70\x58\x3E\xD0\x9B\x0E\xA0\x99\xBA\xF2\x7F\x07\xA4\x1A\xF8\xD6\xAD\xA0\x76\x19\x7D\x45\xDD\x87\x1A\xF7\x72\x89\x68\x7B\x38\xF5\x81\x3A\x3F\xED\x65\x63\x11\x0E\x2B\x4E\xDC\xF3\x79\x3B\xB1\xE1\x9D\x6D\x10\x6B\x3F\xAD\xFC\x69\x36\x42\x62\x0A\x82\x6C\x2D\xC5\xE7\x3C\x39\x64\xFB\x3D\xF7\xD8\xF8\xC2\x6D\x33\xA4\x17\xF1\xB5\xB7\xB6\x04\x06\xA6\x12\x20\x4C\x06\x63\xA3\x7E\xDD\xC9\x63\xEC\xA6\xDE\xEA\xFD\xCA\xEF\x3D\xD7\xED\xC9\xF3\xBC\x93\x3A\xE6\x0C\x0A\x75\x78\x8F\xB1\x80\x2B\x79\x36\x1D\x87\x6A\x90\x1E\x5B\x2C\xBB\x47\x30\xCB\x5A\x99\x53\xD4\x7F\x69\x65\x66\x4D\x7D\x31\x7A\xDF\x5F\xDA\x68\x14\xA1\xFF\x8C\x87\xF7\xB8\xD2\x81\xD7\x2B\xDE\xFC\x2F\xCC\xAC\x08\xC5\x4A\xD9\x71\xF8\xD5\x5C\x28\x2E\x60\xF6\xEF\xC6\x3E\x6D\x74\x79\x91\xE1\xEA\x4A\xAD\x73\xED\x00\x6C\xC9\x8A\xB8\x49\x96\xFF\xF0\x7B\x65\xAF\x95\x7C\xC8\xAE\xA1\x9D\xA0\x5F\x39\x4B\xA9\x35\x92\x46\xD9\x64\xB1\xA7\x39\x8D\x2E\xC0\xA2\xFE\x4A\x8A\xFD\xAC\xE8\x9E\xD2\x0C\x50\xA0\x2D\x4F\x07\x2A\x3A\x34\x7E\x96\xE2\xD4\x5A\x52\x9C\xCC\xDC\x19\xE2\xF7\xAF\x75\x66\x7D\xA3\x8B\xAF\x2D\xD1\x72\x5B\xDB\x24\xA4\x5E\x75\xCB\x5C\xED\x77\x70\x6D\xF9\xAD\x83\x2B\xEA\x75\x8C\x9A\x08\xDF\x76\x1C\x64\xEB\x62\x3F\x59\xF0\xFE\xA5\xDB\xC3\x35\x44\x75\xDC\xB5\x0C\x69\x4A\x24\x14\x44\xDC\xD5\x38\x8A\x56\x5A\x9E\x8A\x3A\x67\x95\x47\x36\xAB\xBE\xE5\xA7\x9F\x74\x3F\xEC\xC0\x43\x2A\xAE\xB1\x64\xAA\x9A\x64\xDC\x71\x77\xF1\x79\xE1\xFB\x9E\x3B\x8C\xE7\xBC\xAD\x20\x5A\x03\x16\x52\x5B\x88\x5A\xE1\x5F\xFA\x6E\xA8\x14\x56\xF3\x47\xFA\xFC\x03\xC8\x3A\x46\x6A\x48\x30\x6E\xD0\x4C\x5D\x43\xAA\xCE\xC6\xDA\xBF\x3E\x45\xD5\xC1\x57\x34\x62\x68\x81\x58\x46\xA2\x4C\x38\xB1\x14\xA3\xED\xC7\x90\xC4\x79\xFF\x65\x6A\x81\x19\x62\xC8\xA9\x74\x78\xC0\xF9\x44\x76\xDA\x57\x8C\xA1\x30\x4C\x71\xA1\x8F\x35\xB9\xDE\x7F\x48\x19\xA5\xDE\x98\xFD\x9C\xF7\xB4\xBC\x2B\x4F\x54\x43\xCB\xD8\xC5\x63\x73\x8E\x5B\x9A\xE5\x1C\x2F\x5C\xE8\xFC\x76\x96\xD0\x9F\x9A\x88\xD8\x99\x0B\x37\x86\xDC\x30\x38\x9D\x73\x5A\x8D\x57\x85\x2B\xBE\xAB\x52\x72\xBD\x60\x77\xCF\xF2\x54\x35\xD0\xC8\x38\x9E\x30\xA3\x7B\xF1\xFF\xBB\xE2\xE8\x52\x02\x9E\x47\x59\x05\x59\x83\xA2\x99\x3A\x4C\x97\xD5\x8B\x39\x3A\xA2\x97\x8C\xAB\x43\x78\x6B\x66\x87\xC7\xEC\xCD\xBB\x4A\xED\xF4\x16\xD5\x79\x7B\x87\x68\xCC\x82\x07\xE2\x49\xE9\x57\x59\x3A\x70\x91\x01\x8E\x2E\x10\xD0\x8C\x3C\x1C\xE8\x2E\x8E\x45\x3B\x9D\xF6\x62\xA1\xA3\x03\x04\x88\x44\x91\x2A\x3C\x87\x6B\x9A\x67\xEA\x20\x5D\xF5\x19\x75\xD4\x15\xD1\x5C\xC4\x93\xC6\x7A\xF0\x76\x50\xD2\xF5\x7C\x1A\xDD\xCA\x45\xF0\xCB\xBF\xBB\xBD\xEC\x2F\xC5\xFC\x9D\x56\x96\x11\x3D\xBD\xF0\x05\xA4\xFB\x9B\x9C\x90\xF1\xE4\x3E\xB8\xF0\x5A\xC2\xF7\x75\x16\x72\xAA\xBF\x47\xC9\x26\x4E\x37\xE7\xF3\x66\x18\x03\x56\x16\xD5\xCE\x8F\xEC\x8B\xD5\x76\xE1\xC3\xFB\x89\x2A\x54\x19\xA1\x4C\xC7\xB1\x83\x5B\xE2\xD3\xE2\x58\x4C\xEC\xF6\x84\xA9\x95\x48\x9A\x28\x66\x63\xF8\x09\x5E\xD3\x9E\x35\x52\x5B\x9D\xE3\x38\x71\x50\x4F\xDC\x19\xB5\xFD\xC8\x8A\xDD\x26\x07\xDD\xF9\xA6\x21\x96\x6B\xF0\xF7\xF3\xC0\x3B\x80\x97\xB5\x7A\x74\x04\x5A\x62\x6D\x61\xFA\x73\x39\xC8\x0A\x30\x7E\xB1\x6C\x89\x5C\x32\x1F\x15\xEC\x07\x78\x6E\xFC\x80\x60\x1C\xAE\xBD\xAF\x7F\x0B\x4E\x5D\xC4\x4A\x5E\xB0\x2C\x27\xFB\x9A\x74\xF5\xB8\x10\xB7\x47\x83\xC6\xB2\x16\x38\xF3\xA1\x74\x91\x24\xF6\x96\x23\x24\x14\x24\x78\x05\xB2\x39\x8A\x56\x6C\xC4\xB9\xB5\x76\xE1\xBF\xDF\xAF\x94\x41\xE5\x6F\xFA\xA2\x0F\xDC\x7E\xE2\x94\x23\x8E\x99\x2C\x10\x6C\x39\x2A\x1F\x93\x7A\x47\xF8\x47\x5B\xD3\xFE\x07\x33\x55\x0E\x24\x3D\xE7\x53\xF2\x3A\xCB\x91\x36\x44\x1E\x1C\x7F\xCE\xD6\xC0\x8C\xE9\x5E\xF1\xAE\xF0\xF6\xB4\xC8\x53\xEF\x29\x71\x7E\x88\x6B\x6B\xB5\xFA\xAD\xF0\x0F\x71\x3C\x45\xD8\x67\xE4\x3D\x4C\xC4\x40\x84\xC9\x00\xFD\x86\x20\x90\x4E\xD2\xB6\x02\xFF\x51\xC0\x80\xD1\xE2\xC7\x7B\xF1\x62\x36\xB9\xE1\x72\xAE\x41\x30\xBE\x92\x5F\x04\x0E\x89\xB9\xD1\xF0\xEF\xF9\x3A\x1D\x3E\x38\xDE\x92\x9B\x1D\x6B\x84\x15\x6B\x83\xB2\x6A\xFC\x0D\xA4\x8F\x5B\x40\x65\x68\xAC\x40\xB2\xCF\x7A\x8B\x07\x56\x9E\x15\x41\xA0\x6B\x23\x75\xF2\x9B\xFF\xAF\x95\x8D\x73\xE7\x23\x9E\x83\x1C\xC6\xE6\xA1\xFE\xBA\x8B\xCB\x64\x20\x34\x8E\xE3\xC3\xD9\x5E\xF4\x1B\xD4\xEE\x2B\x08\xC4\x0F\x69\x4D\x4E\xAE\xB9\xB9\x3E\x5F\x89\xC8\x77\x9D\x0A\xF7\x59\x2C\x3E\x41\x38\x85\x3C\x7C\xD2\x36\xDA\xAD\xF9\xAD\x1D\x3B\xCA\x84\x27\x9A\x5E\x4D\x8D\xB0\x16\x46\x58\xA8\x0E\x64\x11\xE4\xDF\xAE\xD8\x8C\x95\x89\x1C\xDD\xFE\xDC\xB5\x0A\x50\x6B\xF9\x3C\x79\x3B\x3C\xAC\x57\x0E\x1C\xA7\x61\x14\x83\xAF\x2F\x25\x8F\x40\xFC\xA5\xF4\x05\xC0\xA4\xCA\x96\xDF\x53\xAF\x55\xF1\xE5\xB5\x90\x53\x35\x68\x7E\x7D\xF0\xE3\x33\x21\x43\x99\x2E\x20\xCD\xF2\x15\x7C\x0B\x43\x77\x87\xD1\xDB\xB5\x9E\xCF\xB5\xD0\x92\x6F\x9C\xB8\x34\x87\xC0\x89\x57\x9E\x02\xD7\x7E\x17\xD8\x86\x30\xF8\x16\x36\x85\x0A\x30\xED\x38\xBA\xCE\xBD\x22\x30\xAE\x8F\x94\x09\x9C\xAE\xC1\x43\xAD\xE9\xA7\x0C\x82\x40\xDC\x35\xD5\x5D\x43\xE6\xA1\xA8\x38\x4E\x30\x68\x78\x45\xD7\x8B\x18\xB5\xF9\x59\x78\xE9\x67\x78\xA3\xDD\x49\xB0\xB6\x99\xA9\x76\x2E\x56\x5D\xD1\xE5\xE8\x2C\x2E\xBC\x7A\x9A\x29\xBD\xE8\xAF\x33\xD2\x40\xB3\xEE\x91\x4D\x37\x99\x20\x00\xEB\xF8\xA0\x1D\x29\xDD\xA5\xE1\xBB\xE6\x7C\x02\x16\xE8\x5E\x07\x12\xE0\x71\xC9\x84\x4D\x26\xBA\x43\x96\x44\xD1\x71\x7F\x82\xDD\x2A\x11\x47\x58\x67\xA6\x38\x30\x04\xA8\x12\x15\x67\x3A\x33\x1B\x12\x9C\x8F\x1F\x91\xB3\x94\x9D\xBD\x6D\xFA\xA3\xAC\xD9\x9E\xFF\x49\x14\x03\x40\x81\x04\x08\x05\x28\x6E\x5E\x8D\xAA\xB1\xB6\xA9\x93\x62\x81\x6B\x94\x8C\x78\x21\xA5\x7D\xBA\x31\x18\x10\x74\xA4\x08\x43\x57\xD9\x9D\xA4\xB8\xAF\x96\xD6\x56\x3F\x89\x0A\xBC\x0F\xF5\x83\x16\x6B\x4D\xB0\xAF\xDD\x50\x13\xCF\x8E\x26\x08\x5F\x26\xE5\x9E\x96\x8E\x37\xE1\xC7\xA0\x0F\xB4\xBD\x64\x4A\x05\x5C\xC6\x42\xB1\xE0\x59\x22\x41\x98\x78\xF9\x89\x3A\x48\x83\x2A\x30\x00\x76\x76\x7B\xA5\x3A\x9D\xD3\xC7\x41\x42\x98\x01\xC1\x93\x8A\x8F\xFE\xD3\x3D\x04\x6F\x06\x27\xFA\x74\x20\x68\x75\xD1\x38\x4C\x9A\x9C\x21\x44\xA0\xF5\x33\xC6\x47\x1B\xEC\x91\x6C\x9D\xAB\x01\x59\xDF\x10\x96\xC7\xBC\x80\x49\xA9\xBD\x30\xAE\xF6\x75\xAA\x37\x01\xF9\xDB\x56\x6D\x29\x88\x02\x6D\x79\x6F\x61\xFD\xDD\x2F\x38\x67\xCA\xD2\xB8\xCE\x3A\xE5\x81\x5D\xC7\xCB\xEB\x88\xD3\x42\xE7\x55\x02\x74\xEA\x09\xF9\x40\xA0\x9A\xC8\xA6\x95\x4C\x42\x8D\x63\x00\xDB\xB2\x4B\x02\xE3\x2B\xE4\xF9\xD2\x83\xFC\x05\x4D\xD4\x56\x83\xB4\x04\xCF\xE6\xAC\xCC\x70\x73\x5B\x14\x52\x3E\x28\x9D\x2A\xF5\xCF\x73\x78\x99\xA3\x94\x98\x03\x1D\x60\x58\xF2\x73\x8E\xCF\xE4\x26\x17\xE1\x57\x6A\x60\x00\x75\x68\xF0\xA9\xC9\x06\xA5\xAE\x60\x94\x5D\x9F\xE8\x2E\xCD\xAE\xBD\x0C\x12\x2E\x2C\x32\xF3\x77\x24\x6C\xF8\xBB\x35\x43\x37\x47\xE9\x7F\x96\x42\xAC\x22\x5E\x6A\x4F\x29\xCE\x03\x63\x73\xE7\xAA\x79\xF3\x42\xFA\x85\xA7\xDC\x77\x7E\x9E\xA0\xE9\x70\x6F\x83\x16\x74\x9C\x2F\x62\x66\x4E\xF4\x54\x8F\x59\xF2\x72\x31\x0E\x36\xC5\x9D\xFC\x56\x6E\xC2\xEC\x18\xB8\x51\x80\xE0\xF5\xA2\x0E\x24\x04\xB7\x85\x0D\xC2\xAC\xD1\x47\xC3\x61\x7B\x1A\x3B\x73\x03\x63\x25\x4A\x42\x8A\x55\x01\xB8\xC2\x88\xE7\xCB\x1D\x61\xA8\x16\x51\xD2\x33\x9C\xBE\xBE\xB4\x84\xD8\xB9\x3E\x19\xD5\x0D\x92\xCE\x80\x58\x1E\xEC\x2F\xB0\x3E\xC0\x9A\xBE\xF0\x6F\xB4\x7F\x56\x2A\xCA\xE0\x91\x69\xA1\x5A\x86\x38\x99\x61\x69\x69\x23\xE5\x04\xED\x2E\x5A\xDC\x05\x92\xE9\x82\x87\x0C\x32\x95\x6B\xCB\x80\xFF\xF9\x0B\x0D\xD6\xCF\x3A\x63\x22\x54\x2A\xC7\x05\xEB\x47\x66\x7C\x6C\xDA\x52\x1D\xE4\x86\x3A\x5F\xA1\x50\x3E\xC1\x3D\x51\xD2\x52\xFE\x39\xB7\x81\x3A\xD3\x40\xEF\x1C\x7D\x8B\x8D\x1B\xFB\x63\x81\x21\xC1\x97\xAC\x97\x20\xC9\x74\x26\x47\xE5\xF7\xA9\xCE\x12\x1E\xEE\xBD\x8E\x4C\xB5\x9A\x0E\x27\xCD\x9B\xE3\x59\xBE\x5D\xC5\x84\x74\xCA\x89\x23\xDF\x48\xDF\xBD\x8E\x05\x55\x61\x7F\x51\x69\xD8\xE6\x37\x10\xB0\xF4\xD4\x40\xC6\x64\x89\x41\x7E\xBF\x28\x74\xC7\x13\xB9\xBA\xEB\x1F\x72\x74\xC0\xD6\xF2\x72\x9D\xA5\x59\x01\x57\x09\xFA\xD0\xA6\x7E\x4D\x8A\x84\x5E\xED\xB2\x2E\x6F\x00\xEC\x36\x52\x73\x6F\x5D\x94\xC8\x95\x87\xD8\xFD\x14\xE3\xFC\x02\x73\x89\x3C\x89\xAA\xE0\x3E\x5E\x11\x65\x97\x48\x30\x97\xEC\x0B\x15\x20\x6D\x22\x29\x5B\x42\x6D\x0B\x3F\xD5\x30\x84\x60\x45\x11\xAE\xF1\x14\x39\x50\x4D\x2B\x3F\x83\xD4\xB4\xA3\x9F\xEA\xB5\x11\x37\xA7\xA8\xA8\xCF\x1E\x43\x88\x05\xE9\xEC\x17\x6B\x56\x84\x7E\x39\x73\x6E\x0F\x6E\xFE\xF8\x2F\x0E\xB1\xCE\x59\x75\xFF\xB8\x1D\x1F\x2C\x44\x75\xF8\x3D\xC9\xBF\x54\x96\xED\x80\x4E\xC0\xE9\x51\xBC\x6A\xEB\x38\x13\x59\xE8\x8C\x49\xBA\x12\x6D\xEB\x12\xAB\x98\xFF\x94\x40\xBE\xE9\x7E\x98\xD4\x67\xB8\xD5\x53\xAC\x40\x8D\x60\x20\x27\x49\x0D\xD0\x62\x27\x90\xF9\xF5\xF8\x25\xD8\x99\x21\x31\xA4\x0C\xF1\xF8\x1D\x01\xCC\xC6\x8B\xAE\x31\x7C\xB2\x29\xBC\x1D\x38\x41\xF8\x74\x42\xCE\x82\x70\x9A\xB4\x8C\x16\xF0\xA9\xA0\x49\x12\x71\x10\x36\x5B\xF3\xD4\x52\x28\x36\x3F\x99\x7A\xA4\xA3\xA7\xEA\xAD\x8A\x9C\xB7\xC2\xF4\xC0\x20\x1E\x59\xAB\x96\xE4\x94\x13\xCA\xFE\xBC\x3F\x99\x99\x73\x23\xDF\xF7\x41\xE8\xD9\x6E\x7C\xF5\x5B\xA9\x65\x83\x03\xD4\xAA\x4D\x09\x92\x94\xAE\x45\x8F\x1E\x87\x53\xEF\xCF\x0B\xAB\x4F\x5D\x4D\xE0\xD5\x88\x5A\x50\xFD\xDA\x3F\xB5\x2D\x67\xA7\x0B\xD3\xA0\x14\x94\x89\xB7\x8A\x08\xF6\xA1\x0F\x45\xD0\x67\xC6\xF5\xDE\xFE\xC3\x1F\xF4\xB2\xA8\x0B\xAE\x4A\x17\x27\x57\x5C\xAC\x8F\x93\xAB\xCA\xA5\xCB\x00\x2B\x58\xFE\xF2\x71\xDA\x47\x3B\x6B\xF9\x24\xF1\xFF\x30\xEE\x4E\x52\xB7\x47\xC1\x52\xF6\xCB\x3E\x8E\x65\x93\x5F\x3F\x27\xFF\x32\x7D\xE9\x02\xF9\xD5\xF7\x5A\x09\x47\x35\x70\x47\xAC\x05\xED\x72\x2A\x57\x80\x96\x82\xD3\x5A\x3E\xE5\x54\x0C\x87\x7C\x8E\x2A\x17\x5C\x9D\x4C\xE9\x7B\xE9\xC8\x0D\x48\xC3\x30\x11\xFB\x70\x8F\x6D\x4B\x84\x52\x99\x44\x6D\x25\xD9\x2B\x00\x48\x6B\x48\xAD\x0E\xB9\x7E\x51\x96\x05\x2A\x88\x13\x6D\xA9\x92\x1D\x65\x82\xEB\x71\xC8\xD0\x86\x22\x68\xF2\x3B\x95\xBB\xC4\x19\x34\xC0\x81\x50\x0A\x29\xA0\xE1\x3F\x9B\x53\x19\x8E\x1B\x03\xDD\xDE\x0D\xB9\x9C\x72\xD6\xEA\x7B\x4D\x4D\x3D\x51\xC7\xFA\x27\x06\xF4\xA5\x65\xDE\x5B\x42\x77\xE3\x6D\xBE\x1C\x0B\xA6\x55\x47\xF4\xE4\xE7\x70\x82\x23\x00\x53\xDB\x0C\xAB\x69\x89\xEF\x86\xED\x98\xF3\x2A\x5F\x7F\x3C\x66\x7E\xA9\xAD\xD8\x82\xD4\xD4\xE0\x42\xD9\xE0\x7E\xC7\x1E\xA3\x29\x02\xA6\xFB\xD5\xDB\xEA\x75\x1E\x10\x04\x4A\xF1\xA5\xB8\x71\xBF\xD5\xA6\xFD\x99\x68\x8E\x1D\xFF\x48\xFE\x61\x74\x94\x48\x36\xCF\x0F\xCA\x41\xF1\x87\xED\x13\x03\x52\x89\x88\x74\x36\x8A\x42\x91\xAA\x97\x5C\xB7\x41\x22\x00\xF1\xA4\x4E\xC7\xE6\x94\x47\x5F\x00\x66\x82\x82\x54\x5E\xF4\x9C\xED\x97\x18\xD9\xC6\xE1\xCE\xD5\xBE\xF3\x59\xD3\x50\x25\x51\x5C\x5F\x48\xE0\xE7\x4F\x9D\x1A\x6F\xEF\x20\x39\x8D\x70\xC7\x19\xD0\x7A\x5E\x77\xBA\x80\xB3\xF6\x60\xF8\x64\xA7\x87\xF0\xDE\x28\x8A\xF4\xDD\x70\xC1\x80\x53\x52\xCC\x4D\xF9\x2E\x89\x52\xD1\x4E\x30\xD3\x69\x1C\x6A\xBB\x60\x7B\xE6\x73\x30\xA4\xC2\xAA\xF3\xF3\x38\x40\x3E\x78\x11\x5D\x1B\xD4\xB0\x6D\xD0\x92\x42\x69\x67\x06\xDB\x63\xBD\x8D\x0F\x22\x30\x65\x6E\x8E\x83\x4C\xCD\x62\xDA\xC8\xE5\x4C\x01\x06\xD5\x71\x8A\xC3\xC4\x0A\xA9\x49\x41\x10\x58\xE4\x9A\x29\x34\x1C\xCA\x53\xC5\x3D\xB9\xC4\xDC\x91\xEA\x14\xF0\xD0\xE4\xA5\x6E\x6B\xB6\xA5\x91\x94\x02\x76\xA2\x16\xAE\x96\x70\xE9\x63\x68\x2C\x7F\xAA\xB8\x1A\x4F\xDE\x0C\xC9\x1C\xDE\xF5\xDC\x42\x2E\x1D\x04\x5D\x74\x26\x17\x78\x2F\x05\x3F\x03\x17\x86\x28\x7F\x98\xE3\xAE\xEE\x88\x95\xB6\x2E\x11\xD3\x03\x1E\x94\x41\xCA\xD2\x77\x4F\x94\x9F\xE4\xF2\xE3\xDF\x14\x2F\xDE\x62\x5B\x7B\x33\x02\x62\xA6\xF6\xAA\xAC\x8A\x0A\x3A\xD4\x35\xC5\x1F\x20\x9F\xA0\x3B\xE4\x18\x5F\xF7\x1D\xBD\x6B\x52\xF4\x29\xE2\x30\x1D\x1B\xB5\xA3\xDF\x4E\x1A\x6D\x7E\x48\x82\x71\x79\xF2\xE5\x95\xCE\x27\x9D\x41\x69\xEF\xB8\x28\x8F\x4C\xCB\xB7\xD6\x87\xB7\x9D\x51\xF1\x71\x0E\x13\x39\x89\x07\x09\x67\x41\xD1\x33\xA8\x6A\x33\x60\x48\x6F\x2C\x93\xD5\x4F\xA7\xB5\xF2\x7E\x5F\xCA\x91\x16\xD1\x43\x44\x49\x5C\xBB\x16\xF1\xC9\x16\x49\xBE\x58\x4A\x8C\x13\x0C\x00\x12\x88\x85\x60\x3B\xAD\xD6\xB1\xCF\x16\xE7\xAA\x57\xF4\x4B\x19\x03\x19\x99\x61\xFC\x7F\x03\xD8\x3D\x2C\xCE\x9A\xD4\x3E\x10\x9D\xD4\x5A\x54\x83\x50\xE4\x2F\x20\xDE\xFE\x4D\x1D\xC2\xC7\x29\xA9\xE3\xB5\x33\x75\x7F\xB9\x52\x57\xDE\xF3\xD1\x00\xD4\x1B\x4E\x88\xC7\x25\x84\x3E\xF0\xC3\x6B\x07\xB8\x2A\xF8\x3B\x5F\xE7\xE5\xD4\x02\x13\xFD\x89\xAB\x99\xCC\xDA\xFF\x63\xF9\xBD\xAA\xE5\x32\x5F\x3A\x9D\xAC\x27\xC8\x6D\xD3\x62\xDA\xCA\xDA\x7E\x81\x4F\x89\xEF\xD4\xF7\x77\x8E\xB0\xD9\xD0\x5E\xB4\xFD\x7D\xE5\xF4\xDF\x9E\x81\x27\x1D\x87\x7E\x22\x61\x35\x5A\x36\xA4\xEF\x00\xC0\x19\x94\xF2\x5E\x5F\x63\x5A\x65\x47\x2D\xDD\xF7\x52\xE3\x6E\x23\x04\x29\xFF\xC4\xAE\x30\x93\xD5\x0B\x2B\x81\x85\xCD\xD9\x34\x75\x95\xF7\xEB\xFD\xEE\xEA\x7D\x65\xF4\x82\xD5\xA7\x93\xD4\xED\xFD\xFF\x75\x2A\x0A\x89\xE1\xFB\xDB\x2E\xBF\xCD\x3D\xBA\x8D\xAE\x47\x86\xAE\x2F\x42\xBF\xF4\x13\x2C\xE6\x6B\x0D\x54\x66\xB9\xD1\x81\x6A\xDB\x53\xA7\x95\x88\x92\x8F\xF2\x8A\x33\x49\xF3\xC9\x3C\xA6\x98\x14\x0E\xBF\x76\xCA\xE9\x9F\xED\x5C\x69\x25\xF5\x02\xA2\x9D\x73\xB6\x70\x42\x70\x96\x94\x91\xA9\x7E\x29\x39\x59\xC3\xC0\x06\x12\xA2\xCF\xC3\x36\xDC\x71\xEF\xF6\x69\x3A\x93\xBB\x9B\x63\xBF\x95\xEA\x07\x53\x1A\x6D\x40\x1D\x4E\x7E\x27\x93\xFB\xEF\x3E\x02\xDB\x3F\x84\x03\x80\xF3\x4F\x7B\x65\xE8\x36\x37\x60\x6A\x51\xF1\x09\x74\xBE\x2E\x7F\x8F\x15\x41\xD2\x48\x2A\xC7\xA8\x9F\x2D\x99\x09\x17\xB9\xD8\xE3\x1A\x3A\x27\xB6\x63\x7D\xD8\x01\xB5\x69\x64\xD9\x9B\x6B\x60\xD7\x65\xB3\x83\xE3\x25\x53\x87\xE3\xE1\x4B\xF0\x68\xB8\xAA\x5F\x13\xB7\x42\x28\xDC\xBE\x32\x82\x05\xBB\xE7\x7F\x3B\x88\x63\xED\x0C\x81\x08\xD0\x75\x41\x94\xF7\x4E\xC4\x9A\x9A\xD6\xD0\x7C\x36\xE8\xC5\x72\x8E\x49\xC4\x93\x35\xDD\x91\xBA\xCF\x73\x5B\x7E\x15\x37\xED\x57\x43\x31\xDC\xF1\x19\xF1\x7F\xE0\x6A\x3F\x0D\x9B\x12\xF3\xE7\x76\x14\x14\x74\x90\x05\xB0\x45\x52\xE5\x67\xD0\xC3\x78\x83\xFA\x08\x36\x0F\xB6\xCF\x9F\x1E\x6B\x59\x3B\xD6\xCF\x14\xAA\xEF\x86\xBF\xD9\x3F\xEE\x31\xC1\xA1\xD2\x77\x00\x43\xC7\xED\xE7\x9D\xB9\xCD\x79\x7E\x54\x88\xFF\xAD\x7B\xBE\x88\x70\x51\xAB\x7F\xF3\x21\x2E\x0D\xF7\x2C\x47\x6F\x40\xA3\x53\x6F\xC9\xB0\xE8\xD6\x5A\x19\xDE\x61\x99\xA9\x4B\xD6\x2D\xB2\x2F\x71\x6C\xAB\xE5\xBF\x67\x91\x15\x8F\x3D\xEA\xBC\x70\xD4\x60\xE8\x90\xC2\x2D\x39\x89\x64\x2F\x18\xCB\x25\x17\x66\x8B\x45\x7B\x2D\x0C\x88\xFE\xDA\x72\xB1\x82\x50\x98\x74\x45\x0A\x06\xE4\xF0\x75\xC3\xCB\x59\xAE\x38\x45\x47\xA3\x8F\xE7\x92\x7B\xFB\xBB\xD4\x81\xB9\x53\x98\x99\xDF\xE8\xAB\x04\xE0\xE9\x37\x3D\xE3\x96\x83\xB9\x7D\xDD\xC7\xD4\x7F\x22\x5F\x52\x0B\x17\x2B\x46\xDF\x88\x74\x5B\x7C\x0E\x4A\x44\xA2\xE0\x0D\xDF\xBD\x66\xAC\x80\xF1\x94\x82\x88\x71\x00\x8F\xB6\x55\x63\x35\xAD\x00\x57\x6B\x8B\x20\xF3\x43\x2E\x2C\x27\xF3\xF2\x60\x61\x53\x6E\x58\x02\x06\x1C\x10\xBC\x57\x52\x91\x77\x07\x5E\xB0\xF9\xEF\x13\x3C\x7C\xC4\xDA\x81\xC2\x63\x93\x19\xAB\xFB\x62\xB9\x90\xF3\xF0\x7A\x85\x9C\x48\xAE\xD6\x7C\xE1\x9D\x82\xED\xEA\x5C\x74\x68\xD1\x01\x3F\x2E\xCD\x85\x2F\x57\x32\x50\x55\x13\x9B\x82\xC9\xF4\x3F\xD5\x1B\xE1\x33\x01\x74\x0A\x3D\x7B\xCE\x27\xC0\xEE\x58\x7A\x38\x97\x80\xF2\x87\x56\x37\xF7\xEF\x27\x64\x4B\xCB\x2E\x5F\x2E\xF6\x45\x63\x0E\xD8\xDD\xE9\xBB\x39\x90\x2D\x01\xC7\xA0\xB3\x87\x03\x9B\x57\x28\xB8\x99\xC8\x3B\x5F\x04\x27\xF4\xC5\x54\x24\xBB\x8A\xB4\x7E\x20\x20\x01\xC7\x77\xB7\xD1\x97\xB2\xFA\x12\xC4\x77\xC1\x25\x67\x31\xEF\x7E\x48\xF6\xEF\xB9\x31\xEF\x01\x97\xC7\x38\xD3\xAC\xFE\xA3\x53\x5D\x74\x61\x24\x0A\xEA\xF8\x62\x55\xD9\x94\x63\x34\xB8\xBE\xC0\x45\x27\x21\x27\x55\x84\x54\x35\xE0\xEB\x13\xA9\xAC\xD8\x31\xDD\xD6\xF5\x84\xF7\xC3\x7C\x6F\x26\xB7\x29\x78\x71\xB8\xBF\xB8\x4C\x92\x5B\x3E\xB8\xE4\xC5\x79\xFD\x5B\x36\x22\x58\x7A\x41\x33\x8A\xC7\x3C\x5B\x04\x73\xE7\x83\xF4\x71\xF0\xDF\x19\x42\xC6\x0C\x3D\xF9\x89\x0B\xD3\x53\xD1\x04\x51\x30\xDD\xC1\x10\x51\xBD\xEE\x61\x0C\xCF\x88\xC2\xC5\x88\xEA\xE1\x72\x46\x6B\x5D\x1D\xB9\x3E\x18\x66\x30\x7F\x62\x8E\xD2\x3A\xA2\xA4\xD6\xA6\xD7\x9B\x7F\xC8\x04\x56\xDD\x37\xAB\x70\x78\x00\xE7\x86\x15\xA7\x1C\x51\x93\x02\x1E\xD0\x82\xF6\xA9\x82\x2A\x67\xD1\xFE\x9E\xF0\x29\x04\x63\xC4\x3C\xCB\x58\xFF\x9B\x05\x43\x3E\x4A\xCC\x9F\x3E\x4B\x89\xC0\xCF\x0C\xCD\x0B\x1C\xC3\x87\x36\x60\xDA\xDA\x82\xC4\x48\xDF\xA7\xB2\x6C\xE7\xFF\x48\x63\xE5\x76\xCA\xDC\xBE\x1C\x61\x2D\x5D\x0A\x38\xC2\xAD\x99\x4F\xCF\xDA\x4D\x9A\x06\x1E\x47\xD8\x3C\xE1\x9E\xCC\x34\x3A\x08\x7B\x1D\x9F\xFD\xC5\xC1\x8B\xF9\xB8\x55\xA2\xB2\x4F\x52\xC7\xF9\x36\xA6\xB8\x39\x72\xD2\xF2\x76\x26\x3E\xA8\x36\xE3\x3E\x6D\x77\x12\x03\xDB\xA7\x43\x5D\x6C\x6F\x29\x73\x63\xC9\xC8\x86\x85\x42\xAA\xC7\x38\x56\x97\x59\x12\x3E\x05\xAE\xB3\x0D\x12\x16\x25\x09\x36\x86\x59\xDC\x94\xA5\x6A\xCB\xE3\xF8\x6C\x9F\xD8\xE2\x67\x2A\x18\x6D\x49\x49\x3D\xED\x13\xFD\x60\x07\x37\x74\x79\xD9\x98\xAA\xE8\x17\x69\xDB\xF1\xFF\x70\x85\x2D\x84\x92\x05\x87\x18\x11\x94\xB6\xBC\xBB\xD3\x60\x74\xF6\x74\xB2\xEB\xD0\xD7\xB7\xDE\xBE\xAE\x33\x7C\x08\x39\x10\x22\xB4\xCD\x4F\x34\x7D\x4D\xCF\xD7\xF9\xD5\x45\x4A\xF3\xF8\xF1\x8E\x73\x26\x18\x8C\x2A\x0A\xCB\xE1\xA4\xAF\x7D\x62\x2B\xA4\x07\x65\x72\x1D\xEB\xB8\x2A\x1E\x13\x05\x70\x68\x2C\x92\x36\x6C\x2D\x99\x80\xE1\xD1\x36\x80\xFC\x89\xBE\x40\xAC\x0C\x76\x5A\xCF\x5A\xE9\x91\x0D\x54\x40\x83\xDE\xB5\x09\x69\x54\xFD\x85\xD4\x86\xF7\x9A\x87\xF0\x9F\x48\xA9\x3D\x9A\xC3\xA6\xA7\x1B\xE9\x2F\x1B\x6D\x6C\x24\x84\xC8\x17\xD6\xC2\x56\xE1\xE8\x08\x50\x93\x5C\x46\xD2\xC2\x73\x44\x55\x9E\x3F\x9F\x96\xD4\xC4\xDB\x2C\x60\xAC\x6D\xF9\xC0\x27\xC4\x11\x77\x6F\x31\x57\xF1\x74\xD4\xF8\xB7\x09\xB0\xBD\x77\x1F\x03\x4B\xA6\x4F\x60\x5E\x3F\x61\x6D\x41\x33\xBE\xB1\x0E\x88\x16\xFA\x58\x34\x86\xA4\xE7\x6F\x32\x53\x2D\x3D\x53\x72\x38\x4A\x6B\x29\xF3\x4F\x80\x00\x32\xA5\x22\x16\xDB\x68\x11\xEE\xA0\xAA\x70\x9F\x33\x82\xF6\x11\xDF\x45\x1F\x94\xF0\xBA\x86\xC0\xC0\x1B\x54\xF0\x81\x9B\x1F\x62\xB6\xF1\xDE\x3D\x4D\xFF\x4F\xE7\x35\x25\x71\xE3\x6B\x25\x59\x4D\x6A\xDF\x69\x02\x77\x8D\x5B\x89\xCD\x96\xB3\x18\x52\x56\x11\x12\xA6\x95\x84\x6D\x78\x30\x2B\x4F\x95\x1E\x32\x31\x8F\xA5\x7E\x28\xD8\xEE\xEA\x6A\x2B\xC6\x21\x2B\xEA\xD1\x28\xD9\x82\x90\xD6\x56\x6E\x4F\x5F\x60\xDF\x4A\xB9\xE5\x8A\xED\x26\xCD\x0F\xA0\x15\x7B\xB0\x19\xBF\x10\x76\xCD\xE1\x60\x56\xD6\xBE\x60\xA6\x94\x0A\x79\xF4\xC1\x42\xD0\xDD\xE1\x4F\x14\x3E\x8A\xCD\xDD\xDF\xB1\xB4\x0F\xAC\xE9\x70\xCF\xEE\x11\x75\x11\x57\xB8\xB4\xFB\xDC\x07\xDC\x8C\x1B\x6B\x91\x49\x9B\xA0\x99\x63\xFB\xEC\xA6\x46\x45\x37\x2B\x3F\xE5\x3A\x63\x56\x6D\xFA\xDF\xF3\x85\x03\xD3\xEE\xAF\xEA\x3E\x8D\xE5\x7A\xEF\x55\xBC\x87\x81\xFE\xE4\x5D\x97\x9C\x30\xC8\x5A\x0E\x80\x4E\x13\xCC\x61\x95\x4F\xDE\xFB\xC8\xAB\x3D\xE8\xAB\xAF\x12\x1C\x8E\x05\xEA\xFF\xA7\x4A\x7C\x01\x25\xA0\x3C\x27\xA2\x03\x16\xE4\x6A\x22\x78\x1F\xB3\x8B\x34\xD8\x75\x0C\x89\x65\x3F\x0A\x37\x3A\x54\xC0\xD3\x4A\x65\x53\xA9\x50\xCB\x80\x0D\xE2\xC7\xDD\x85\xDC\x05\x1D\xEB\x2E\x7B\x2A\x7E\x0C\x76\xD9\xB5\xA9\x0F\x04\xC4\x2B\x4A\x48\x7A\x8A\x27\x27\x27\x52\x2D\x8A\xAA\xB1\x60\xDB\xC3\x16\x4E\xB8\x6A\xDC\xA7\xFE\x37\xD8\x95\x6B\xF5\x73\xBB\xBE\x32\x1A\x24\x4F\x00\xDE\x35\x11\xB5\x7D\xA9\xF3\x3A\xE8\xD2\xE9\xDF\x4B\x6F\x26\xC5\x88\x8A\xBE\xF0\x0F\x65\x73\x03\x71\xF1\x17\x46\xB0\xBE\x99\x7A\x97\x9D\xB5\xDF\x66\xA1\x2B\xAE\x9F\x7F\x36\xE0\xC7\x83\xAD\x78\x49\x52\x3A\x08\x2D\x11\xC5\x0A\x3A\xD8\x39\x0E\xE5\xBF\x28\x6C\x6B\x01\xD7\xE0\x34\xAC\x65\x85\x1B\xAC\xD0\xC8\x19\x71\xCA\x88\x56\x19\x19\xB6\xDE\x81\x58\x85\xD9\x76\x54\x68\xC5\x62\xCC\xFC\x5C\xDA\x96\x1F\xA8\x04\x11\xC6\x6D\x82\xA5\x3C\xB8\x88\x31\x4D\xDD\xAA\xD7\x7B\xAC\x9D\xB4\xC4\xE6\xA8\xB0\x60\x01\xE6\xD2\x59\x51\xB6\xA5\x07\x22\x6F\xED\x9A\x2C\xED\xF6\x13\x21\x14\xB9\x60\x1D\xA8\x4E\x0B\x58\x84\x2A\x9A\x21\x55\x5F\xBD\x69\xC3\x4B\x94\x69\x81\x67\xD5\xB7\x63\x44\x71\x97\xDD\xD0\xA9\x85\xA3\x60\x3E\xB1\x78\x88\xA3\xEA\x21\x7A\x5B\x76\x44\x7F\xF0\x42\xED\x8F\x31\xD2\x6C\xCD\xD8\x14\xE2\xCF\xEE\x95\xF3\x39\x1C\xE2\xAE\x66\xF5\x1C\x80\x51\x67\xD5\x5D\x26\x71\x5B\xBD\xF3\x17\x8C\x67\x85\xB1\xB0\x1F\xAB\xDD\x1D\x7C\xD0\x2A\x5D\x53\xF2\x4F\xE9\xF9\x9A\x04\x93\x3D\xE0\x8F\x09\x62\x90\x62\xEF\x15\xF3\x96\x3B\x48\xD2\x01\x99\x74\xF1\x45\x46\x06\xF7\x9F\xD7\xAB\x84\x93\xFE\x9D\x6E\x67\x91\x39\xD5\xBA\xD7\xF7\x68\xD9\x4B\x10\x22\x29\x5A\xE5\x7F\x26\x74\xA7\x84\x49\x1C\x3D\x15\x7B\x2C\x9D\x8F\x19\xAC\x42\xBC\x59\xFA\x98\x2F\xDB\x95\xD2\xB1\x56\xC8\xBB\x16\x99\xC5\x6A\x80\xB5\xE9\xA9\x51\x07\xD1\x0E\x98\xB4\x39\xE1\x33\xC2\x7A\x2F\xAE\x6C\x5B\x57\xB7\xED\x13\x31\x77\xEF\xEF\xA8\xE6\xD5\x70\xAF\x57\xD2\x33\x5F\x95\x06\x12\xE7\xAA\x4E\x39\xDC\x80\x8B\x38\x7E\x89\xA1\x40\x83\x31\x8E\x9D\xF8\xCE\xDD\x13\x22\x10\x11\x5C\x8F\xE5\xD3\x09\xA4\x23\x98\x58\x16\xB0\x6D\xE9\xA7\x01\x06\xB3\x21\xED\xF2\x6B\x27\x93\xEF\xC3\x8C\x5C\x80\x28\x4B\x53\x40\x43\xCD\x07\xE0\x02\x7C\x2C\xF0\x53\x8D\x42\x07\x44\xB8\xE1\xB9\x2D\x1F\x2C\x9C\xD7\x06\x40\xF8\x67\x1E\x40\x9C\x51\xAD\x24\x2D\x8E\x29\x18\x2D\x3A\x25\x5D\x75\x1B\xCE\x08\x8D\x2E\xEB\x2B\x4F\x12\x8E\x68\xBF\x29\xD8\x86\xAC\x86\xCE\x33\x90\x54\x9B\xB1\x70\x9C\xCA\xFE\x6F\x94\x61\x61\xFB\xED\xF6\x89\xB4\x69\x7C\xB5\xC8\x51\xA8\xD1\x54\xEA\xD6\x6D\x4C\x1C\xF6\xCA\xBA\xE0\x81\x8D\x81\x28\x29\xCE\x90\xCD\x5E\x5D\xE9\xCA\xF2\xE9\xCB\x39\x00\x70\x45\xCA\x1A\x00\xE2\x63\x3F\x57\x0C\xA2\x96\x77\xF3\xE7\xBB\xE5\x64\xFD\x91\x59\xB4\x4F\x70\xD3\xFD\xA0\x2A\x8D\x2A\x36\x79\xF1\xA0\x0B\x2E\x84\x28\xA9\x54\x27\x1F\xDE\xC5\x5D\x85\xBD\x54\xC7\xDA\xC9\x94\xDF\x8E\x23\xF5\xD3\x19\x8B\x46\x97\x83\x1D\x92\xA7\xFB\x35\xEE\x62\x1C\x06\x0D\x38\x4B\x01\xCB\x93\x91\x28\x27\x56\xA6\x1F\xDC\xCC\x5B\xBD\x61\x7E\x3A\xA4\x16\xD1\x94\x7F\xC1\x6C\xD1\xA9\x22\xFA\x91\x97\x81\xEC\x46\x51\xE0\x44\xED\x09\x6B\x14\xEA\xE9\xF7\xBD\x59\x37\xD4\x00\xD9\xA0\x93\x09\xCF\xE2\x8F\xA9\x49\xAA\xE9\xFC\x1B\x64\xE8\x70\xAB\x87\x7E\xF7\x68\x15\xEA\x2B\xCA\x60\x5A\x36\xD0\x32\x08\xF2\xB0\x88\xB8\x24\x10\x6D\xFE\x89\x6A\x53\x9F\x0D\x50\x21\x17\xB2\x95\x5F\xE4\x9D\x96\x1F\x3B\x77\x5B\xFC\x50\xCF\x28\x50\x61\x03\xD5\x75\x4B\xFE\x6B\x87\xAB\x93\x6C\x3B\x81\x01\x31\x62\xBC\x0E\x41\x40\x5B\xF5\xE7\x05\x38\x9F\xAE\x98\xDE\x9D\x0B\x30\x8C\xBB\xC6\xE5\x8F\xD6\x11\x79\xA8\x85\x59\xD3\x9C\xCF\xD4\xA2\xEA\xB0\x21\xEE\x85\xB2\xBB\x33\xA1\x8F\x63\x44\x84\xD0\x17\x38\x81\xB7\xE6\x53\x45\x24\xB3\x2F\xCA\x67\x1A\x36\xF9\xB3\xD5\x5E\xCB\x78\x1F\x3E\x33\x51\x15\xB9\x7C\xFE\x24\x51\x95\x2A\x5C\x27\x2C\xBA\x6D\x96\xBE\xC0\xC0\x3F\xC6\x8C\x6D\x30\x6F\x4B\x8A\x3B\x02\x26\x42\xB4\x2E\x51\xEB\x6F\xE3\xBA\x9F\x21\x19\xBC\x6F\x5B\xD8\x79\xEB\x0D\x9B\xFB\x32\x83\x3F\xEA\x54\xE1\x1E\x56\x6A\xA3\xC1\x2D\x2A\xDF\xD8\xB9\x08\x0F\xB2\xF9\xD4\xAC\x0E\x21\x12\x44\xB7\x8D\x8F\xD9\xD1\xA4\x89\x31\x97\xF0\x26\x34\xED\x6C\x14\xEF\xB1\x19\xCD\x4E\x62\x68\x45\xCF\xE1\x05\x01\xBB\xF0\xE4\xE4\x3B\x1B\xB7\x92\xBB\x8E\x0D\xB5\x7A\x19\xDF\x81\x2E\x75\x28\xED\x8D\x37\x10\x72\xB6\x31\x99\x43\xD6\xDB\x71\xBB\xA0\x43\x11\x74\xFA\x22\xFD\x18\xBF\xC7\xA5\xC2\x5A\x43\x2A\x32\xB2\x17\x63\xE3\x22\x4D\xCD\xC4\x0A\x7F\xE6\x30\x4C\x96\xBF\x15\x3B\x3B\xC7\x7E\xA2\xB2\xD7\x87\x48\x29\x90\xBA\xBE\x97\xBE\x4F\xD8\x20\x25\x98\x7C\x82\x84\x92\xED\x91\x62\x2B\xD1\xEB\xF3\xCC\xDA\xC3\xB0\x4A\xE5\xBF\x88\x85\xD9\xA3\xB9\xF7\x13\x69\x50\x32\xAE\x7C\x6A\x7E\x69\xF2\xCD\xC8\xBA\x68\xF6\x19\x4B\x9A\x30\x63\xCE\x48\x22\xA4\xB3\x67\xC6\x24\x4C\xBF\xC5\x05\xC5\x18\xDA\x4A\xE1\xE7\xD7\xEC\x67\x28\x61\x46\x72\xEC\x2C\xBF\xEC\x26\x7F\x3D\xE0\x9E\x71\x7D\xB4\xD5\xDE\xB8\x82\x08\x01\x91\xEA\x1C\xE1\x92\x78\x5B\x41\x98\xCB\x78\x12\x65\xCE\x7A\x2D\x0F\x11\x19\xDD\xD2\xD5\x7C\x76\x4C\x48\x9D\x32\xAE\x32\xBB\x1E\x33\x45\xFC\xB3\xBC\x79\xAA\x4A\xBE\x36\x2C\x73\xDA\xF4\x10\x74\x8C\xAE\x09\x7A\xF5\x93\xEF\x42\x34\x9C\xC5\xD9\x1C\x11\xC3\x8F\xDA\x8E\x77\xE0\x34\x05\x4F\x3C\x6C\xBC\x4D\xB0\x1F\x5A\x8D\x9C\x43\x97\x7B\xB8\xA4\x59\x25\x9D\xBE\x44\x03\x32\xE4\xD3\xFE\x22\x48\xE5\x4C\x0E\x15\xFA\x00\x58\xE1\xD1\x42\x5D\x17\xD4\x9E\xDC\x31\x78\xF7\x8A\x47\x20\x6C\x08\xB9\x62\x3F\x21\x81\xA0\x0C\x65\xED\x77\x62\x84\xB7\xBB\x79\xD0\x98\x5A\xCA\xB9\xB4\x68\xAE\x09\xA4\xCA\x37\xA1\xCD\x6B\xF2\x08\x8C\xD4\x80\xE7\x51\xC3\x14\x0C\x5F\xFE\xF9\xAA\x9F\x97\xDC\x8B\xDC\x6F\xC1\x11\x15\x23\x77\xE8\x29\x08\x48\xC2\xBF\xD1\x50\xEF\x91\x81\x21\x88\x45\x55\xA3\xD8\x50\x8F\x48\x9E\x36\x45\x0B\x0E\xE2\x7D\xBC\x48\x31\xF8\xF0\x46\x85\x17\x9C\x71\x46\xB2\xA4\xB1\x5F\x52\xE6\x87\x62\x8C\x45\x03\x7E\x76\x57\x94\x68\x7C\xCA\x84\xC7\x98\xA9\xDC\x1F\x4D\x40\xB6\xC3\x15\x9A\xA6\xD4\x03\x7A\x35\x4C\x4E\x77\x51\x85\x69\xF4\x30\xC3\x29\x10\x55\x9F\xA6\x2D\x95\x16\xCF\xD3\xA2\x22\x81\x80\x85\x05\xDB\x14\x89\x24\x09\xFE\xEF\xCA\xE4\xAA\x41\xCE\x05\x5E\xCC\x52\x2E\x5C\x0B\xF2\x99\xE7\x50\x52\x39\xE3\x91\xD2\x75\x96\x5A\x93\x5B\x8A\x36\xC9\x45\x59\x33\x2D\xBD\xCE\x24\xAA\x50\xE3\xA0\x76\xE9\x2F\x4F\xF9\x98\x5C\xB0\xE8\xDB\xAD\x72\x94\x55\xB9\x55\xFC\x6E\x88\x6F\x3F\x93\xBE\xEE\xC1\x42\x8F\x3F\xBC\x48\x01\xBB\x3A\x88\xAB\x60\xBD\x76\xBF\xC2\x4C\x6A\x44\xBF\x64\x7D\x0A\x6C\x29\x6C\x80\x99\x41\x28\xDA\x98\x10\x2F\x99\x40\x33\x5D\x71\xE4\x39\x89\x04\x1C\xC3\x8B\x2C\xFC\x1E\xC0\x03\xE3\xA1\xD6\x34\xF3\x96\xC7\xD1\x8D\x4A\x62\x47\x0B\x3B\x54\xB7\xE4\x5D\xC0\x96\x8B\x49\x06\xD6\x5B\x0B\x3C\x45\x73\x7F\xCC\xC3\xAF\x49\x13\xE4\x1A\x18\x26\x51\x59\x08\x6B\xF1\x1E\xD8\x4F\xDF\x0C\x5A\xC8\x6B\x48\x16\x3A\x03\x49\xD1\xB9\x23\xAA\x3D\x1C\x4B\xFF\x06\x70\xE6\x92\x31\x43\x5B\x38\x0A\x97\x9F\xEE\x43\x88\xBF\x70\xB9\x73\xF8\x9F\x21\x86\x81\x61\x09\x94\xDA\x53\x00\x82\xBC\xB1\x6A\xF4\xAE\x46\xD4\x67\xC8\x87\x9F\x53\x61\x89\x06\x29\x2E\xB7\xCB\x59\x1E\xC2\x56\x93\x6C\xD6\xDA\x0B\xC2\x9B\xC2\x6E\x28\x64\x79\xB9\x6E\x22\xAD\x47\x0C\x22\x2E\x44\xFF\x5F\x9A\x5C\x3B\x1B\x4A\xA5\x9C\xBE\x99\x5C\x1C\x8C\x46\xB1\xEB\x52\x5B\x34\xF2\x53\xE5\xEB\xA6\xE1\x32\x8F\xFF\xB4\x66\x8B\x0C\x14\x0B\xC2\xE4\x58\x58\x1B\x04\xC1\x78\xF1\x4E\x85\xCD\xE8\x93\x3A\xBE\xCF\xAF\x77\x15\x83\xD2\x9E\x03\xC3\x13\x25\x1E\x47\x2D\x8A\xA9\x3B\x94\xC7\x1B\xDE\xF6\xAD\xAF\x5D\x63\xCE\xB4\x0A\xF6\x4B\xA1\xE5\x20\x57\xAE\x35\xD6\x48\x5A\xB8\xD4\x7D\x0F\x13\xC4\xB4\x4B\xC8\x82\xED\xA3\x3E\xE0\xEA\xB6\xDF\x98\xBC\xFF\xF9\xC3\x0E\x4E\x01\xD8\x92\xE8\xE2\x62\xF0\x70\xCA\x05\xB5\x33\x3A\xEE\x51\x8F\xF7\xC0\xC8\xDD\xD8\x97\x9D\x4F\xF4\xEA\xDC\x70\x52\x4C\x27\xD1\x28\xD9\x30\xFE\xD3\x56\x7C\xBD\x2F\x42\x1E\x41\x18\x47\x39\x58\xF3\x25\x5D\xC7\xC7\xF0\xBC\xEA\x2A\x82\x1D\xA4\x31\x73\xE5\x6F\xAF\x0B\xC1\xD5\x50\x2A\x37\x82\xC0\x91\xF8\xAE\x4C\x55\x1E\x14\x6C\xB4\x4E\x1E\x9A\x2C\x1B\x52\x8A\xBF\x81\x44\x0B\x48\x04\xE4\xAB\xBC\x7D\xF4\xDA\x81\x02\x80\xF5\x27\xE3\x77\x8E\x82\xD3\xA3\x7F\xC5\xB2\x95\x8A\xD0\x12\x1B\x2A\x8D\xAD\xD1\x14\xC0\x24\x2B\x75\x60\x7A\x38\x9F\x62\x0B\xDB\x97\x94\x5C\xD0\x3E\x24\xC5\xF7\x01\x0C\x6C\x18\x65\x00\x2A\x30\xC8\x41\x69\xFC\x11\xD1\x73\xAB\x9D\xFA\xBB\xEE\xC0\x9A\xB6\x27\xEA\x6B\xDA\xC0\xFF\x54\xF4\xBA\xD1\x0B\x01\xD2\x44\x23\xB4\x75\x7E\x93\x08\x2B\xB9\x40\xC3\x13\xD6\xDA\x2B\x99\x60\xE2\x8D\x87\x9E\x5A\x03\x2F\x7E\x8F\x59\x62\x4A\x6C\x50\xF8\x24\xFC\x3C\x35\x49\x24\x81\x6F\xE7\x28\xDC\xEF\x5E\x6A\xE3\x26\xDF\x3D\x38\xAE\x01\x8A\x6F\xBA\x02\xBA\x26\xDF\x90\x9C\xD6\x17\x87\xA1\xB7\xB6\xA6\xAD\x1A\xA3\xDD\x91\x08\x95\xBC\x64\x80\x61\xF5\xAD\x00\xD8\x62\x27\x34\x8C\x2F\xDF\x73\x86\xA8\xA7\x0A\x33\x92\xE7\xF9\x6A\x44\x05\x98\x84\x70\xDF\x6A\xF5\xC2\x2E\x4A\x1D\xC5\x81\x94\x44\x49\x35\xA9\x1A\x56\x6A\x00\x88\x0F\x4B\x04\x8A\x32\x3A\xD1\x32\x5F\xF3\xDB\x40\x62\xC6\x4A\x3C\x6F\x4E\x1B\x38\x64\x38\x0E\x84\x5D\xD2\x96\x0B\xB8\x79\x06\x29\xE1\x25\xEC\x41\x09\x85\x3F\xF6\xD9\x99\xFB\x01\x5D\xCC\x6D\x9B\x97\xC5\x76\x2A\x70\xAF\x44\x0A\x6D\x6A\x77\x0B\x5E\x57\x44\xE4\xC2\x24\x29\x81\x6F\x4A\xD7\x60\x1D\x5C\xC3\xB2\x5D\xAA\x01\xB1\xBE\xF5\x79\xAF\xC2\x87\x4D\xDB\xD9\xEC\x52\xA1\xAC\x18\x8C\xBA\x84\x2E\x9E\x46\x98\x9F\x57\xC3\x0F\x93\x35\x57\xA6\xE6\xC8\x61\x55\xCB\x8F\x50\xB3\x5C\x36\x80\x00\x11\x9D\x5C\x09\xEC\xF5\x2D\x44\x05\xF8\x1E\x2C\x97\x9B\xAA\x27\x31\x24\xFB\x27\xCB\xF2\xA7\x5F\xAA\x46\x7C\xF2\x67\x33\x85\xBC\xB3\x18\x99\xE5\x27\x97\xB8\x80\x4B\xA5\x4C\xEA\xA2\x25\x69\x03\x48\x0E\x10\x7C\xAE\x6E\x96\xD8\x82\x31\x25\x85\x65\xC4\x67\xCB\x93\x54\xB4\x8B\x8C\x56\x21\x24\x94\xEC\x3D\xD0\xA6\xC4\xE8\xBD\xC3\x5A\x40\xBF\x4C\x42\xD2\x0D\x7C\x25\x3E\xF2\xC5\x75\x13\xEE\x85\xDB\x73\x82\x31\xEC\x9F\xF0\x65\x4E\x77\x93\xFD\xE0\x54\x1F\x6C\x56\x94\xDC\x02\xFD\x3C\xA2\xCD\x61\xBE\x21\xE8\xA2\x1E\xB2\xD6\xB1\x28\xF1\x75\x68\xCB\xE6\xAB\x24\x40\xE0\xD2\xC5\x4E\x9F\x90\x77\x17\x87\x48\xD8\x68\xF8\xF9\xA5\xDC\x38\xD5\x74\x1B\xAC\xBC\x72\xC9\xC5\xB1\xFA\x09\x26\xC5\xB0\x82\xB4\xAB\xD8\xA9\x52\x1D\xB8\x29\xC0\x1E\xD1\xFE\x13\x6D\x9B\xCE\x1A\x3B\x55\x3E\x24\xEC\x7C\x2C\xE3\xBE\x65\xCF\x23\xE9\xD9\x68\x0F\x8D\xE5\x3A\x56\xA4\xB0\xF0\xC5\x79\x2A\xAE\xE0\xD3\x11\x7E\x60\xE8\xA7\xD1\x14\x32\x79\xB2\x98\x51\x39\xA4\xD7\x94\x20\x29\xF2\x0C\xAA\xA7\x7D\x6A\x4E\x52\x54\x73\x9D\xFF\x93\x60\x48\xFC\xE2\x4E\xB8\x4C\x0A\x3E\xFA\xA8\x11\xBB\x5B\x25\x6F\xAF\xFA\x7C\x42\x83\x8B\xA1\xA3\x47\x7E\xCA\x19\xD5\x78\x41\xEF\xA3\xC0\xE5\xAA\x3C\x97\x87\x6B\x2C\xD7\xC4\x4F\xEF\x5D\x81\x10\x60\x73\xF8\xDD\x99\x1C\x73\x8D\x99\xBF\x67\xA3\x97\xD0\xB3\xA6\x10\xF5\x13\x3E\x31\x13\x7B\x4D\xD4\xC4\x5B\x4C\xC5\x63\xD4\xDE\xE4\xE1\xFD\x37\x60\xF6\xDE\x12\x66\x8D\x5C\x51\xA7\x4E\x4C\xA4\x7F\xD5\xDA\x71\xBF\x3B\x8C\x78\x89\x6B\x15\xA8\x27\xDE\x19\xE0\xF7\xB4\xCB\x40\xD4\xFA\xB1\x22\x21\x78\xA7\x01\xF5\xB0\x9E\xDF\xE1\xF0\xDA\x21\x02\x09\x27\x10\x97\xCE\xF9\xA5\x50\xDF\xD8\xC3\x55\xDD\x26\xD3\x97\x9D\xA1\x77\xBB\xB8\x1C\x6D\x36\xB9\x7D\xC2\x47\x1A\x3B\x19\xEA\x23\xDE\x59\x24\x2C\x1B\x4D\x8A\x9D\xAC\x64\x6D\x1C\x72\xF3\x0B\x3A\x1B\x27\x0F\xD0\x20\x0F\xF6\x5D\xE8\x40\x27\x8E\xCA\xAA\x17\x79\xE5\xCF\x3C\xF0\x29\x01\x13\x25\x9D\xF2\x1B\xB4\x2A\xCD\x4E\xAA\x78\x0F\x2B\x3D\x7F\x5C\x74\xC2\x5C\xD3\xCF\x78\x48\x85\x0D\x06\xEB\xB8\xE5\x78\xD1\x2F\xFF\xFA\x38\x63\xF3\xDD\x30\x74\x45\xDE\x7F\xEE\x98\x5B\x31\xC0\x4B\x1E\x22\xE3\xDF\x9F\xC4\x3F\x36\xA2\xDE\x93\xAB\x91\x5A\x9B\x4B\xEA\x03\x4B\xED\xA8\xC7\xA9\x8F\x60\xE5\x5C\xA9\xC7\x8D\xD2\x03\x30\x6F\xD4\x15\xE2\xD7\x12\x86\x8C\xD6\x44\x18\xCD\x49\x36\x67\x00\x7D\x66\xEA\xEB\x3B\x83\xE9\xBD\xA9\x43\x40\x00\x94\xD0\x49\xF9\x1A\x24\x5E\xE1\xA7\x62\xBD\xD5\x44\xF5\x87\x94\xD8\x2A\xAE\xB6\x01\x7F\x2E\x07\xCE\x05\xF3\xDB\x01\x40\x6D\x2B\xA7\x1D\xBC\x21\x32\xBE\xB5\xD5\x9B\x40\x20\x45\x94\x0F\x02\xC7\x27\x45\xC9\xCE\xC3\xEE\xA8\x44\x9E\x17\xB7\x55\x9E\x66\x48\x39\xD3\x72\x5E\x9B\x70\x03\x5C\x01\x08\x3B\x21\x98\x5D\xAA\xDD\x68\xB1\x98\xAC\xB4\x0B\xF9\xE8\xDD\xB5\x37\x13\xE3\x6E\x79\x56\xE5\xDF\xCC\x45\x89\xED\x95\x47\x19\xCE\xEE\xF9\xCF\x02\x13\xE7\x11\x71\x1B\x30\xB8\x4B\xFC\x30\x4B\xE1\x3E\x8D\x9E\x45\x9F\xD6\xF6\xD7\xD1\x01\xAA\x4A\x98\x91\x2F\xD8\x05\x49\xDE\x49\xBA\x5C\x76\x31\x24\xDA\x35\x93\x9C\x80\x77\x16\x12\xCB\x51\xEA\xF8\xA4\xCF\xF5\xFC\xB1\xBC\x0C\x5F\x81\xEC\x4A\x24\x08\xA2\xD8\x88\x5C\x10\x1A\x3F\x0E\x45\xDA\xBE\x9A\x68\x32\x52\x24\xD3\xDF\xEC\x46\xAB\xAB\x13\x77\xBE\x27\x74\x9C\xE4\x15\x03\x3D\xE0\xFD\x19\x5E\x04\x0E\xB8\x99\xCB\x07\x8A\x9B\xA6\x7E\x94\xC6\x4E\x77\xD7\x21\xFF\x9B\xEE\x1D\xD0\x5F\xE3\x87\x1C\x23\x8C\x60\x99\x47\xD9\x08\x76\xE6\xFF\xAB\x1E\xB6\xC0\x13\x40\x31\x1D\xC1\x34\x9F\xD1\x57\x7D\xFD\x5F\xC8\x65\xD8\x44\xA4\x06\x0E\x46\xE3\x38\x18\x01\xD4\x6B\x7B\x69\x7B\xC7\xB3\xEC\xA7\xD1\x0A\x30\x81\xEB\x71\xDD\x4A\x20\x96\x70\x49\xB6\xBA\x24\x45\xED\x72\xBB\x1B\xA3\xCA\xCD\x0C\x1B\x9D\x8D\xDC\x8C\x59\x72\x7C\xDA\x2C\xB1\x64\x31\x5F\x27\x01\x92\x6F\x27\x37\x48\x6D\xEE\xD4\x32\x92\x8B\x42\x7E\xAA\x32\x14\xE6\x35\x12\xEB\x39\xCB\x7F\xE8\x57\x3A\x80\x6C\xC3\x4B\x0F\x29\x1A\x40\xEE\x0F\x50\x82\x52\xD4\x7D\x41\xC0\x16\xE4\x4F\x3A\x48\x31\xF5\x52\xCA\xEE\x79\xF7\x03\xFA\x46\x5A\xD7\x66\xB1\x63\xF9\xEF\x3B\xA7\x8E\x84\xE3\x79\x1D\x77\x05\x14\x11\x17\x64\x5E\xF6\x08\xF5\xB4\xB2\xEB\x3C\xC3\xB6\x61\x04\xDE\x18\x84\x01\x4E\xD0\x12\xAA\xA3\xBD\x56\xF8\x77\xB2\x49\x5B\xC7\x83\x1A\xCA\xF3\xDB\xE6\x14\x0F\x13\xB0\x6C\xB0\x04\x44\x5C\x90\x96\x88\xDB\x48\x20\xC3\x4E\x89\xF7\x27\x73\x12\xA8\xCC\x6C\x33\x84\xB1\x3E\x3C\xB5\x02\x55\xF5\xE6\x05\x40\xDA\xCD\x33\xF6\xB0\x37\xAE\xDC\xF2\x35\x24\x35\xC1\x7A\xD7\xCC\x9A\xD8\xA1\x3B\x86\x07\x41\xF6\xAD\xFC\x47\x21\xB7\xCC\xCE\x79\x3F\x0E\x31\x6D\xF5\xDF\x99\x8F\x88\xCB\xDA\xB2\x13\x85\x7A\x86\xA2\x43\x8C\x0B\x6D\x03\x82\xFB\xBF\x2E\x2C\xF2\x8C\x6F\x57\xA3\xE9\xE7\x52\x4C\x2E\x53\x2F\xDC\xDB\x12\x2D\xAF\xED\x37\xE3\xC4\x79\x8C\xD9\x90\x06\x66\x73\xE4\xBA\x38\x22\xA5\xC9\x7A\x48\xE4\xFE\x93\x95\x60\xD7\x3E\x04\xF5\x6F\xBE\x17\xCF\xFC\x23\xB7\x50\xFE\x52\x91\xA8\x52\x83\x61\x20\x83\x86\x1F\x5F\x3C\xF6\xE4\x06\xAA\xB6\x23\x2A\xDC\x42\xDB\x7D\x26\x7F\xA5\x27\x7C\x77\x4F\xCD\xAD\x17\xC8\x97\x15\x26\xAB\x2A\x6F\x09\xC1\xE4\x90\xFB\xE4\xD5\x2C\x79\x68\xEC\x2E\x5D\x45\x42\x4C\xF2\xE5\x74\xA8\xDA\xA9\x16\x02\x10\x37\xA8\x75\x04\x40\xC9\xCD\x75\xC6\xCC\x08\xF5\xDA\x13\x83\xF6\xFD\x59\x5E\x42\xDA\x7B\x5D\x5F\x15\xE0\xE6\xB8\x41\xD8\x4A\x54\x0A\x54\x2A\xFE\xC7\xCB\x7E\xEB\xDF\x3B\x19\x53\x8C\x31\x50\xAD\x5B\x49\x34\x90\xB2\xEA\xD9\x88\xD1\x50\x98\x54\xEF\x84\x6D\x80\xB7\x4B\x4F\x6D\x5B\x97\x3F\x01\x88\x08\x36\xD3\x9D\x58\x8E\xED\x23\x63\xF3\x52\x9B\xA7\x26\x3E\x6A\x41\xD2\x8E\x4F\x47\xD9\x68\xF1\x02\x9E\x1C\xD8\x50\x19\x4F\x71\xBC\x63\xE2\xE0\x18\x9A\x56\x46\x10\xE9\x7B\x00\xAD\x00\x46\xF1\x9B\xB2\x19\xE1\xB2\x80\x55\xC4\x9D\xF3\xE9\x27\xE9\x5F\x7E\x41\x89\x25\xBE\x52\xC8\x59\x7B\x5C\x3E\xA0\xDF\x3B\x42\x09\xF0\x4A\x29\x8C\xB2\xA1\x35\x19\x51\x0A\x1A\x51\x7D\x6C\x85\xAC\xD6\x49\x16\x4F\x03\x24\x92\x7D\x1A\xF2\xB4\x95\xB4\x91\x39\xA7\xF5\xC5\x69\xAF\xEE\xE3\x2B\x65\xA2\x98\x3C\x7D\x22\xE8\x7D\x9E\x8B\xAA\x82\xB9\x3B\x21\x5F\x90\x75\x6F\xFF\x7B\xC3\xF5\xC2\xC8\xF9\x95\x0B\x44\x10\x11\x52\x5A\x66\x3A\x54\xD5\x75\xB5\xE7\xDA\xDE\xAF\x8D\x53\xCC\x58\x4F\xC4\x7F\x7D\x0B\x11\x61\x49\x1E\xB7\xE2\x89\x91\x1C\x89\x7A\x45\xBB\xD7\xA8\x08\x02\x64\x46\xCF\x24\xC4\x9D\x43\x68\x3E\x9C\x88\x39\xB2\xEC\xA1\x42\x01\x09\x94\x54\xD8\xFC\x7A\xF2\x64\xC9\x64\x7D\x27\x96\xC3\x75\xA5\x0A\xCD\x8D\x05\xED\x64\xF6\x7C\xCE\xD1\xB1\xC2\xC7\x59\xE2\x8C\x8F\xBF\x74\xAB\xE7\xE5\xB4\xDC\x1B\x03\x1D\x92\xD9\xC3\xB3\xA4\x9B\xAA\xAB\xA6\xF6\xD7\xE9\x1A\x97\x58\x1A\xF9\x04\xF7\xCC\xEA\x95\x2E\x8E\x85\xA8\x12\x85\x60\x48\x94\xE7\x0B\x8A\x3F\x0F\xAD\x57\x67\xA5\xB2\xEE\x99\x90\x74\xC2\xE2\xC4\x21\xF9\xAF\xDF\x80\x83\xA4\xCD\xA0\xAE\x91\xCE\x1D\x5E\xF8\x62\xE4\x8F\x59\x19\xF2\xE3\x14\xEF\x0B\x8E\x31\xEB\xDD\x3B\x20\xB7\x6F\x42\x54\x25\xD9\xD7\xEB\x8C\xCB\x49\xDE\xE4\xBB\x64\x0F\x1E\xC6\xEA\x4E\x02\x51\x3D\x4C\x86\x3E\xB3\x6D\x6F\x3B\x51\x3D\xAD\xC0\xC4\x70\x4C\x9B\xD0\x90\xE8\x2F\x8D\x3E\xC6\xA2\xD0\x0A\x1C\x5B\x71\xC4\x91\xE0\x66\xCE\x10\x55\x89\x14\xFD\x4D\x61\x6B\xD6\xA9\xF7\xFA\x41\x84\xBC\x3F\xD9\xCE\xA6\x76\xF5\x64\x51\x10\xEF\x2C\x13\x56\x04\x9C\x45\x02\x60\x61\xD1\xED\x83\x14\x78\x74\x22\x03\x75\xC3\x1D\x65\xFC\xD3\x10\x08\xDB\xAA\xAE\x86\xB7\x1B\xB9\xA3\x03\x0B\x07\xF6\x56\xDA\x33\xE4\xCE\xA0\xC1\x00\x5E\xFA\xFE\x86\x4B\xE9\x50\x34\x16\x62\xD0\x07\x2D\xFE\xFF\xB5\xC5\x5D\x0D\x14\xEE\x11\xB7\x56\x32\x83\x9B\x2B\xB3\xA4\xFE\xF0\xD4\x2F\xE5\x2D\xDD\xC5\x22\x99\x79\x07\xE3\x89\x9B\xFB\x8D\xAD\xD7\xB4\x1D\x7A\xD8\xD4\x31\x4E\x83\x78\xEB\xD9\x0F\x7E\xE1\x2D\x07\x13\x6C\x7F\xF1\xC2\x24\x3D\xD6\x27\x20\xF9\x3B\x8C\x97\x7B\x18\xC5\x5C\x7F\x9E\xE6\x1D\xDD\x52\xA8\xB9\x76\xA0\x6F\x45\x2C\x26\xAD\x10\xB1\xF3\x56\x97\x3F\xB6\xFE\xFC\xC2\x65\x06\xCD\x12\xCC\x2B\x7D\xBC\x59\x78\xC5\x38\x24\x47\xE2\x77\xAC\x8A\xB2\xB8\x09\xBE\xC2\xE1\xF3\x16\xDE\xCC\x91\x15\x22\x95\x4F\x3A\xC2\x07\x16\xD5\xE5\x66\xAF\x4C\xBF\x2E\x93\x89\x2C\x84\xF5\x36\x31\xE0\x52\x45\xFF\xEC\x5B\xFE\xF6\xAA\x1A\x05\x1E\xE4\x68\x35\x7E\x78\x5B\xA8\xD2\x5C\xB6\x10\x51\x20\x3D\x46\x2B\xB2\x3B\x02\xA0\xEE\x73\xBF\x52\xA3\x8F\xCE\xA1\xAE\xE2\x1F\x7E\x53\xBD\x29\x98\x36\xFF\x3E\x82\xAD\x00\x9E\xB3\x65\xC9\xDF\x11\xD1\xD9\x38\xD0\xC9\x04\x68\xC7\x12\xF9\x4C\x37\xD7\x29\xC4\xE3\x73\xE4\x01\x94\xB1\x28\x74\x15\x88\x5B\x1D\x6D\xF5\xC9\xF6\x80\xF4\x09\xDF\xA9\xEA\xFF\x15\xA3\x48\xF1\x5E\x98\x11\x09\x7E\xB6\x0D\x65\x06\x75\x28\xD7\x8E\x06\x24\xEA\x75\x46\x33\xAB\xD0\x49\x84\x9F\xFF\x23\xBD\x6B\xD1\x2F\xA8\xBD\x81\x51\xFC\x4D\x8F\x7D\x11\x9C\x1F\xAB\x57\xD3\x3C\xC9\x1E\xCA\x0A\xDB\x10\x0C\xDE\xF8\x0A\xD8\x93\x66\xCE\x43\xD3\x00\x03\xBE\x7A\x22\x60\x60\xD8\x82\x70\x0A\xD5\x66\x80\xAC\xA9\xFB\x18\xD8\xF8\x4B\x89\x07\x71\x4C\xBB\x61\xBD\x6A\x36\xDB\xF9\xD0\xD0\x5A\xCF\x8E\xFC\xCF\x13\xE6\x8D\x26\x53\xF6\x29\x12\x24\xE9\x78\x37\x5C\x96\x32\xD1\xD6\x20\x1E\x02\x79\xBC\x06\x09\x48\x56\x96\xB0\x4F\xE7\x80\x48\x63\x61\x3C\xD8\xB1\xB4\x63\x91\xCE\xF1\x17\x41\xED\x49\x27\xA5\x42\x68\x3E\x10\x0F\x23\xE1\x3F\x50\x29\x86\x84\xC7\xFD\x90\xB9\x14\xD1\x4B\x82\xAE\xC8\xAB\x4C\x05\x94\xAC\x61\x99\xC8\xFC\x34\x5A\x23\x30\x15\x56\x18\x12\xFB\xE3\xB0\x88\x90\x35\xEE\x79\x4A\x00\xF9\x95\x4A\x44\xC4\xDA\x3B\xAB\xBD\xBF\xB8\xB9\xB1\xDD\xB7\x24\xB9\xE4\x42\x44\xD0\x90\x5D\x69\xAB\x52\xFF\xD3\xDD\x22\x19\xDD\xEF\xD2\x53\xE2\x5C\xBC\x62\x38\xEF\x6B\xC4\xB5\x93\x5E\x99\x00\xC0\x5A\x76\x32\xA7\xB9\xF4\x7D\x25\x4F\x75\xAA\x47\x21\x3A\xA9\xF1\x60\xAC\xC4\x1B\xA0\x09\x23\x1B\x3C\xDF\x75\x2E\xAA\xFC\x0B\xF3\x18\xD3\xAD\x93\x87\xA1\x68\x2B\xBB\x6C\x0C\xEB\xD5\x72\x45\x55\x4F\xE8\xE2\x76\xB3\x8A\xAD\x91\x0F\x37\x41\x97\x08\xA0\xB2\xC3\xD6\x6C\x33\x8B\xD3\x05\x0B\x62\x96\xD0\x9C\x22\xF9\x51\xE1\xF8\xA3\xD3\x8B\xAC\x12\x8C\x44\xE0\xBA\x50\xFD\x31\x41\x75\x52\xAA\x38\x40\xCA\x3D\x57\x39\xBF\x19\x41\xAE\x72\x9D\x76\xC8\x64\x0C\x7E\xCA\xDB\x0E\x7D\x98\x46\x32\x42\x51\x64\xA0\xED\x52\x7C\x97\xD9\x77\x4C\x79\xA8\x6E\xAF\x71\x02\x96\xBC\x90\x4D\x84\xDD\xF3\x5A\x6C\x2A\x94\x73\x84\xE7\x6F\x4F\xB7\xFF\x16\x38\x1B\xE7\x99\x51\x8D\x8D\x39\x14\x23\x32\x9B\xDB\x01\xC8\x64\x4D\x6A\x82\x74\x5C\x38\xD4\xFC\x7D\xFB\x9C\xF4\x98\x7F\x6A\x7B\xBC\xA9\xDA\x24\xBD\xF2\xE5\x34\x05\x59\x9D\xAD\xFF\xE8\x70\x15\xA0\x37\x22\x74\x8B\xC8\xEF\xD3\x81\xE4\xFB\x73\xA4\x11\x94\xF7\x20\x10\x66\x7E\x3B\x65\x47\xB2\x12\x1E\xD4\x88\x91\x34\x93\x75\xB2\xE8\x56\x88\x7A\xE0\x62\x46\x35\x59\xAB\x0E\xE0\xDD\xFC\xCE\x8D\xA8\x06\x2A\x9E\x22\xB6\x77\x05\xAE\x00\xEE\x1B\x01\x31\x1E\x1D\x1B\xF2\xFD\x05\xB8\xE7\xA8\x27\x69\xED\xD4\x66\x7A\x95\xAB\xD1\xCD\xBF\x3B\x39\xA9\xBB\x48\x95\xF5\xDB\x22\x09\xAF\x8C\xF4\xFF\x5D\x7E\xF8\x47\x6B\xB9\xCC\xAE\x10\x88\xDD\xDB\xF4\x03\x80\x3B\x01\xB3\x2D\xD3\x9D\x74\x85\xC0\x65\x63\xA0\x8D\xB9\x99\x54\xC4\x39\x07\x6C\x3A\x12\xF3\x08\x63\xCE\x8D\x7B\x7C\x4F\x48\xA9\xCD\xA3\x8A\xC8\x74\x83\x39\x22\xE0\x0C\x17\x35\xD7\x7B\x8B\x08\xBC\x81\x73\x84\x4F\x2A\xF5\x3A\x22\x17\x46\xA4\x2B\xFC\xD7\x0E\x3D\xF8\xA4\xB3\x9A\x43\x67\x65\x66\xA2\xC0\x57\x83\xC4\xC5\xE5\x02\x7B\x98\xB8\x5B\x27\x27\xE8\x0F\x17\xE7\x26\xE8\x19\xD3\x19\x50\xD0\x84\xDF\x1C\x44\x1F\x22\x12\x6E\x16\x58\x05\x5E\x9F\x5D\x4B\x04\x71\x5E\x8B\x48\x49\xCB\x5A\x5C\xE7\xBC\xEF\xC4\xE2\x85\x19\xBF\xF8\xA4\x51\x6B\x8E\xD5\xD4\x16\x3A\x3B\x48\xAA\x71\x2C\xBC\x21\x8F\x6D\x71\x52\xE6\xC1\xC5\xFD\x26\xCB\xB8\x62\xE2\xD4\x96\x5E\x8F\x28\x40\x43\x3B\xC6\xD7\x32\xBE\x32\x76\xC4\xCF\x21\xD3\xD6\x63\x51\xBF\x17\x3B\x12\xE9\xD9\x24\x64\xEA\x6B\xE4\xE8\xDF\xFA\x12\x39\x4B\x23\xCE\xAB\xE1\x0C\xFF\x73\x09\x08\x10\x3F\x49\x1D\x8D\xE8\xD3\x13\xC1\xA3\xCC\x13\xD9\x03\xAB\xF3\xDC\x35\x9B\x67\x5F\xE2\x1A\x48\x5C\xF8\x1A\x57\x35\x2E\xB3\x44\xE4\xC3\xCB\x2B\x4F\xF4\xF0\x89\x96\x9B\x45\x1B\x6F\xD1\x0D\x90\xB0\x8F\x9A\xF4\xA9\x86\xB4\x00\xCA\x16\xF8\xFA\x7B\xD9\x39\x1E\x37\xE8\x6B\xE9\xC4\xB5\xE9\xF1\x06\x81\xC1\x22\x8E\x36\xF2\x31\x88\x2A\x56\xA4\x32\xAA\x79\x67\x19\x9D\xD3\x1A\x97\xC3\xCD\x4C\x07\xE9\xAF\x4D\x22\xA4\x97\xC7\xFF\xF7\xFB\xF2\x2C\xCA\xD7\x31\xFD\x34\xD0\x57\xE7\xA3\x02\xE8\xED\x5C\x6E\x43\x7C\x60\x94\x8B\xEE\xB6\xFB\xA5\x16\x13\x11\x9C\x6E\x8C\xBE\x19\x43\x59\x7D\xA0\x06\x92\x3F\x3A\x1F\x47\xBD\xFA\xA0\x04\x1D\x15\xDE\x52\x4D\x21\xB4\xCA\x66\x52\x19\xCC\x8B\x98\xEF\x38\x85\x4B\x47\x51\xD3\xED\xA9\x22\xB9\xD9\xD7\x07\x81\x3F\xA0\x8C\xF7\xC3\xEF\x15\x53\x32\xD1\xB1\xB9\x71\xC4\xE1\x49\x95\xB0\xD4\x7E\x77\xFA\x22\x4A\xAC\x0A\x34\x42\x53\x6B\x47\x56\x0B\xEB\x0E\xD9\xD1\x9B\xC0\x4D\x6C\x66\x7A\x98\xA2\x2B\x19\xCE\x61\x7A\x9F\x30\xFA\x5A\xD7\x8A\x77\xE1\x8E\xED\x3C\xDC\xAE\x51\x6B\x4C\x6E\xE6\x4E\xD0\x2B\x0E\xD5\x51\xAB\xA8\xBB\x54\x40\x44\x12\xE1\xDB\x3F\x7D\x79\xD4\x26\x26\x99\x74\x20\x51\x3B\x22\x67\xBD\x53\x9B\xAB\xD3\x5A\xF7\xA8\xE6\x65\x4F\xD3\x54\x1B\x37\xDE\x9C\x4C\x3A\xF7\x68\xFA\x7D\x78\x03\x66\xC3\xBC\x7E\x6F\xF1\xA8\xD6\x1C\x17\xD4\x81\x4F\x19\x4D\x7A\x34\x6B\x71\xB5\x84\x13\x1C\x2E\x54\x43\x43\xCF\x71\x94\xCB\x7E\x48\x57\x03\xBD\x7C\xD0\x52\x99\x64\xBE\xB9\x68\x3A\x72\x82\x62\x97\x3B\xF9\xFD\x94\x02\x13\x0A\x4B\xA2\xF8\x53\x75\x27\x05\xD2\xA5\x92\xBE\x15\x5A\x51\x28\xAE\x69\x33\x0B\x3A\x46\x45\x0B\x36\x41\x83\x61\xB0\x9A\x32\xDE\x10\x9C\xD1\xAB\xD3\x36\x87\xD4\xD4\xFC\x3B\x0F\x4D\x94\xB4\x08\x1F\xA8\x4A\xC4\x33\xEB\xD9\xEA\xC7\xD5\x21\xEA\x5F\xCE\x75\xB1\x56\xF0\xA8\xBB\xF0\x3D\xE9\x5D\x67\x5D\x5D\x43\x85\xE4\x85\xD6\x07\x15\xC2\x9F\x1E\x93\xD7\xCC\x60\x83\x94\x4B\x2D\x22\x95\xB4\x79\x27\xFB\x69\x45\x84\x01\xCE\x68\x3C\xAB\x47\xC2\xF8\x07\x87\xBA\x2E\x9C\x77\xC3\x50\x78\xD4\x08\x39\x1D\x9F\x67\x17\xF7\xF5\x44\x01\x3B\xF8\x98\x6A\x66\x94\xCE\xE6\xD7\xFE\x9F\x98\x3F\xCD\xF9\x86\xF2\x9E\xDD\xBB\x59\x0E\x99\x2C\x0D\xE4\x16\x3C\x3E\xC2\x87\xF2\xDC\x79\xA3\x02\x74\x48\x79\x6F\x3B\x3F\x87\xA1\xF9\x6A\x1A\x82\x72\xE3\x29\xA6\x24\xEB\x7D\xAC\xB3\x35\xAF\xD0\x74\xF4\xD4\x3F\xE1\x60\x0F\x8B\xAD\x30\x19\x69\x72\xCC\x08\xB6\xD2\x5F\x8B\xC6\x42\x1C\x73\x2E\x33\x1C\xDA\x05\x9D\x6F\x48\x03\x39\x0B\xEF\xF1\xBA\x00\xE3\x31\x00\x3B\x31\xCE\x76\x5B\xD6\x28\xFC\x68\xB3\x04\x1B\xD1\x3F\xCD\x17\xA0\x37\x8B\x08\x3B\x1E\x60\xFD\xF9\x11\xF2\xD5\xFF\x35\x2E\xD4\x9E\x26\xAC\xD4\x20\x5B\x38\xFA\x96\xA6\x42\x6E\x60\x1B\x25\x35\x7C\xB1\x6C\x63\x2F\x8C\x09\xC5\x60\x34\x91\xBC\x84\x11\x68\xCD\xDA\xDD\x0C\x68\x37\xE3\xC0\x2A\xB9\x9A\x92\xDD\x93\x60\xC8\x23\x68\xDF\xBE\x27\x88\x24\xDF\xF8\x03\xA7\x85\xE7\x2D\x2D\xD6\x85\x1F\xAC\x3E\x4B\xC2\xA8\xED\xCB\x1A\xAC\xF4\x78\x33\xA2\x67\x03\x20\x3E\x87\xDA\xB3\x5D\x08\x87\xA5\x9E\x38\x89\xFB\x21\x36\x6F\x54\xC9\x36\x44\x8D\x16\x1C\x47\xA8\xD3\x47\x38\x75\xDD\xC7\xCC\xDE\x8E\x3C\xBA\x1D\xE6\xA0\x5D\xBC\x93\x2B\x15\x4E\x2F\xD7\x39\xC0\xC2\x88\x0E\xAA\xAE\x58\x8B\x88\x74\x04\x2C\xA7\xDB\x6A\x3D\x45\x97\x0E\x50\xF3\xAA\x3E\x2B\x1A\x13\xD6\xE3\xB9\xFD\x64\x63\xAF\x82\x23\x93\xE4\x56\x8D\x48\xED\xEB\x07\x60\x37\x55\x34\xF9\xAA\xB1\x55\x97\x1F\x49\x9C\xA1\xE5\x0F\x0C\x04\x71\xA3\xE1\x5C\xD0\xE5\x1D\xE7\xB9\x28\xD0\xF6\x08\x78\xCF\x7F\x98\xA2\x4C\xE3\x87\x4C\x66\xFA\xFF\x8F\x8D\x05\x87\xF4\x08\xD9\x81\x72\xC8\x9F\x93\xDB\xFF\x2D\x09\xC8\x90\x5F\x3E\x7B\x35\x30\x48\xAD\x64\x23\x89\xE6\xE5\x8D\x8E\xFB\xA3\x82\x96\xC4\x23\xAD\x34\x4A\x9C\x6E\x88\x8E\xD4\x65\x54\x52\x9F\x3B\xB4\xA3\x36\xF4\x22\x9E\xCB\x8B\x3A\x18\x59\x66\x5E\x40\xAF\x6E\xDD\x5E\x8B\xFD\x11\x45\xBF\x46\xF0\x8E\xA3\xA4\x82\x72\x28\x7D\x08\x87\x04\x43\x4F\x59\x1A\xB8\x0A\xE7\xF7\x49\x41\x8D\x45\xC6\x34\x38\x54\x53\x03\xA1\x52\x2E\x22\xCB\x23\xFC\x70\x0C\x91\xA5\x63\x5F\xCB\xDD\x7E\x4A\x72\xE7\xA9\xFD\x93\xAF\x12\x5C\x86\x8D\x00\x1F\x06\x52\xB9\x49\xEB\xCC\x52\x47\xC7\xCF\xB6\x21\x16\x50\xAF\x4B\x8D\x82\xBF\x85\x2F\xB1\x51\x2F\x4A\x0A\x87\x8F\x29\xD7\x2F\x15\xAE\xBA\x5D\x40\xCE\x15\x4D\xD4\x65\xE9\xEF\x03\x58\xD8\xA6\xA8\xE7\x35\x7A\x5B\x45\x6F\x32\xB1\x0D\xA1\x9B\x2E\xAE\xC1\x2D\x79\xC9\x59\x62\xE8\x19\x5A\xF2\x3B\x88\x6E\x8E\xD2\x21\x17\x9C\xBB\x58\x7B\x55\x0B\x53\x9A\x88\x8D\x11\xB1\x3A\x21\x2B\xDE\xB9\xCB\xCB\xB9\xAB\x9F\x16\xBB\xB8\x2A\xCF\xAA\xE5\x87\x26\x66\xAC\x54\x51\x60\x2F\x0F\xDE\x2D\x42\x33\xD0\xEF\xFF\x4D\x1B\xC6\xCB\x28\x25\x91\xBF\x8F\xB2\x31\x13\x09\x32\x6B\xE3\xFF\x39\xB4\x4A\xE6\x88\x39\x7A\x21\x70\xB7\x1C\xFC\x46\xE8\xDC\xC1\xF0\x13\xA6\x7A\xC9\x55\x69\xF6\x4D\x5A\x44\xB8\xA2\x30\x32\x9F\x5E\x84\x9B\xDA\x2E\xB5\x82\x1B\xA1\x68\xE9\xD5\xD8\xBC\xA2\x52\x72\xE9\xAD\x6D\xAF\x3E\x97\xCE\x2B\xB0\x67\xFF\x79\x21\xAE\x2D\xCC\x9F\x67\xB3\x5C\x8C\x2B\xC2\xD1\x8E\xCE\xDC\xA2\x36\x0A\x15\x2C\x76\x03\x22\xA7\x47\x94\x1F\xDF\xEA\xB0\x30\x20\x63\x6F\x1B\x48\xC0'
+
+def getResourceFolder() -> str:
+	"""Get the folder with the key files. In a PyInstaller-created executable, the resources are unpacked into a temporary folder"""
+	if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+		return os.path.join(sys._MEIPASS, 'resources')
+	return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
+
+def __getattr__(name: str) -> bytes:
+	# Called only when an attribute isn't found in this module, so each key table is only loaded once, after that it's a normal module attribute
+	if name not in _KEY_RESOURCES:
+		raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+	keyFilename, expectedKeySize = _KEY_RESOURCES[name]
+	keyFilePath = os.path.join(getResourceFolder(), keyFilename)
+	with open(keyFilePath, 'rb') as keyFile:
+		keyTable = keyFile.read()
+	if len(keyTable) != expectedKeySize:
+		raise ValueError(f"Key file '{keyFilePath}' should be {expectedKeySize:,} bytes, but it's {len(keyTable):,} bytes")
+	globals()[name] = keyTable
+	return keyTable
@@ -0,0 +1,152 @@
+"""
+A manifest lists each file inside a ggpack together with a hash of its decoded contents, so ggpacks can be checked and compared without unpacking them.
+Each manifest also stores the size and modification time of its ggpack, so a stored manifest can be reused as long as the ggpack didn't change
+"""
+import csv, json, os
+from typing import Dict, List, Optional, Tuple
+
+import Codec, Utils
+from GGPack import GGPack, getSharedGGPack
+
+MANIFEST_VERSION = 1
+# Files are hashed in batches, so there's not too much overhead for ggpacks with lots of small files, but big files still get spread over the processes
+MAX_BATCH_SIZE = 64 * 1024 * 1024
+MAX_BATCH_FILE_COUNT = 512
+
+# The hash of a file's decoded contents, and the error message if it couldn't be hashed. One of them is always None
+HashResult = Tuple[Optional[str], Optional[str]]
+
+
+def _hashFileEntries(ggpack: GGPack, fileEntries: List[Dict]) -> List[HashResult]:
+	"""Decode the provided files from the provided ggpack in memory, and hash their contents"""
+	hashResults: List[HashResult] = []
+	for fileEntry in fileEntries:
+		try:
+			decodedChunks = Codec.iterCodedChunks(ggpack.getEncodedFileEntry(fileEntry), GGPack.isEncoded(fileEntry['filename']))
+			hashResults.append((Utils.calculateMd5HashOfChunks(decodedChunks), None))
+		except Exception as e:
+			hashResults.append((None, str(e)))
+	return hashResults
+
+def hashFileEntries(gameFilePath: str, fileEntries: List[Dict]) -> List[HashResult]:
+	"""Hash the provided files from the provided ggpack in a worker process. The worker keeps the ggpack open for its next batches, see getSharedGGPack"""
+	return _hashFileEntries(getSharedGGPack(gameFilePath), fileEntries)
+
+def hashGGPackEntries(fileEntriesByGameFilePath: Dict[str, List[Dict]], jobCount: int = 1) -> Dict[str, List[HashResult]]:
+	"""
+	Hash the decoded contents of the provided files from one or more ggpacks
+	:param fileEntriesByGameFilePath: For each ggpack path, the file index entries to hash
+	:param jobCount: How many processes to use. All the files of all the ggpacks are spread over these processes
+	:return: For each ggpack path, the hash results, in the same order as the provided file entries
+	"""
+	if jobCount <= 1:
+		hashResultsByGameFilePath: Dict[str, List[HashResult]] = {}
+		for gameFilePath, fileEntries in fileEntriesByGameFilePath.items():
+			with GGPack(gameFilePath) as ggpack:
+				hashResultsByGameFilePath[gameFilePath] = _hashFileEntries(ggpack, fileEntries)
+		return hashResultsByGameFilePath
+	batches: List[Tuple[str, int, List[Dict]]] = []
+	for gameFilePath, fileEntries in fileEntriesByGameFilePath.items():
+		batchStart = 0
+		batchSize = 0
+		for fileIndex, fileEntry in enumerate(fileEntries):
+			batchSize += fileEntry['size']
+			if batchSize >= MAX_BATCH_SIZE or fileIndex + 1 - batchStart >= MAX_BATCH_FILE_COUNT or fileIndex + 1 == len(fileEntries):
+				batches.append((gameFilePath, batchStart, fileEntries[batchStart:fileIndex + 1]))
+				batchStart = fileIndex + 1
+				batchSize = 0
+	hashResultsByGameFilePath = {gameFilePath: [None] * len(fileEntries) for gameFilePath, fileEntries in fileEntriesByGameFilePath.items()}
+	from concurrent.futures import ProcessPoolExecutor
+	with ProcessPoolExecutor(max_workers=jobCount) as executor:
+		batchResults = list(executor.map(hashFileEntries, [batch[0] for batch in batches], [batch[2] for batch in batches]))
+	for (gameFilePath, batchStart, fileEntries), hashResults in zip(batches, batchResults):
+		hashResultsByGameFilePath[gameFilePath][batchStart:batchStart + len(hashResults)] = hashResults
+	return hashResultsByGameFilePath
+
+def hashFile(filePath: str) -> str:
+	"""Hash the contents of a normal file, one chunk at a time"""
+	with open(filePath, 'rb') as fileToHash:
+		return Utils.calculateMd5HashOfChunks(iter(lambda: fileToHash.read(Codec.DEFAULT_CHUNK_SIZE), b''))
+
+def hashFiles(filePaths: List[str], jobCount: int = 1) -> List[str]:
+	"""Hash the contents of the provided normal files, in the same order. Hashing big chunks releases the GIL, so threads are enough to hash multiple files at once"""
+	if jobCount <= 1:
+		return [hashFile(filePath) for filePath in filePaths]
+	from concurrent.futures import ThreadPoolExecutor
+	with ThreadPoolExecutor(max_workers=jobCount) as executor:
+		return list(executor.map(hashFile, filePaths))
+
+def getGameFileKey(gameFilePath: str) -> Dict:
+	"""Get the info that identifies this version of a ggpack. If any of it changes, a stored manifest for it can't be used anymore"""
+	fileStats = os.stat(gameFilePath)
+	return {"path": os.path.abspath(gameFilePath), "fileSize": fileStats.st_size, "modifiedTime": fileStats.st_mtime_ns}
+
+def createManifest(gameFilePath: str, fileEntries: List[Dict], hashResults: List[Optional[HashResult]], problems: Optional[List[str]] = None) -> Dict:
+	"""Create a manifest for the provided ggpack. 'hashResults' should be in the same order as 'fileEntries', use None for files that weren't hashed. Leave 'problems' empty if the ggpack wasn't verified"""
+	manifest = {"manifestVersion": MANIFEST_VERSION}
+	manifest.update(getGameFileKey(gameFilePath))
+	manifest["files"] = [{"filename": fileEntry['filename'], "offset": fileEntry['offset'], "size": fileEntry['size'], "md5": hashResult[0] if hashResult else None}
+						 for fileEntry, hashResult in zip(fileEntries, hashResults)]
+	if problems is not None:
+		manifest["problems"] = problems
+	return manifest
+
+def getDefaultManifestPath(folder: str, gameFilePath: str) -> str:
+	"""Get where the manifest for the provided ggpack is stored by default. ggpacks in different folders often have the same name, so the name includes a hash of the full path"""
+	pathHash = Utils.calculateMd5Hash(os.path.abspath(gameFilePath).encode('utf-8'))[:12]
+	return os.path.join(folder, f"{os.path.basename(gameFilePath)}.{pathHash}.manifest.json")
+
+def writeManifests(manifests: List[Dict], outputFilePath: str):
+	"""Write the provided manifests to a file. If the filename ends with '.csv' it's written as CSV with one row per file, otherwise as JSON"""
+	if outputFilePath.lower().endswith('.csv'):
+		with open(outputFilePath, 'w', newline='', encoding='utf-8') as outputFile:
+			csvWriter = csv.writer(outputFile)
+			csvWriter.writerow(('archive', 'filename', 'offset', 'size', 'md5'))
+			for manifest in manifests:
+				for fileEntry in manifest['files']:
+					csvWriter.writerow((manifest['path'], fileEntry['filename'], fileEntry['offset'], fileEntry['size'], fileEntry['md5'] or ''))
+	else:
+		with open(outputFilePath, 'w', encoding='utf-8') as outputFile:
+			json.dump({"archives": manifests}, outputFile, indent=1)
+
+def _loadManifests(manifestFilePath: str) -> List[Dict]:
+	if not os.path.isfile(manifestFilePath):
+		return []
+	try:
+		with open(manifestFilePath, 'r', encoding='utf-8') as manifestFile:
+			manifests = json.load(manifestFile)['archives']
+	except (ValueError, KeyError, TypeError):
+		return []
+	return manifests if isinstance(manifests, list) else []
+
+def storeManifest(manifest: Dict, manifestFilePath: str):
+	"""Store the provided manifest in a JSON manifest file, replacing any older manifest for the same ggpack in that file, but keeping the manifests for other ggpacks"""
+	manifests = [storedManifest for storedManifest in _loadManifests(manifestFilePath) if isinstance(storedManifest, dict) and storedManifest.get('path') != manifest['path']]
+	manifests.append(manifest)
+	writeManifests(manifests, manifestFilePath)
+
+def storeHashes(manifestFilePath: str, gameFilePath: str, fileEntries: List[Dict], hashResults: List[Optional[HashResult]]):
+	"""
+	Add the provided hashes to the stored manifest for the provided ggpack. If there's a stored manifest for the same version of the ggpack,
+	the hashes and problems already in it are kept, and only the new hashes get added. Otherwise a new manifest with just the provided hashes gets stored
+	"""
+	manifest = loadStoredManifest(manifestFilePath, gameFilePath)
+	if not manifest:
+		storeManifest(createManifest(gameFilePath, fileEntries, hashResults), manifestFilePath)
+		return
+	storedFileEntriesByKey = {(fileEntry['filename'], fileEntry['offset'], fileEntry['size']): fileEntry for fileEntry in manifest['files']}
+	for newFileEntry in createManifest(gameFilePath, fileEntries, hashResults)['files']:
+		fileKey = (newFileEntry['filename'], newFileEntry['offset'], newFileEntry['size'])
+		if fileKey not in storedFileEntriesByKey:
+			manifest['files'].append(newFileEntry)
+		elif newFileEntry['md5']:
+			storedFileEntriesByKey[fileKey]['md5'] = newFileEntry['md5']
+	storeManifest(manifest, manifestFilePath)
+
+def loadStoredManifest(manifestFilePath: str, gameFilePath: str) -> Optional[Dict]:
+	"""Load the manifest for the provided ggpack from a JSON manifest file, if it's there and the ggpack didn't change since. Returns None otherwise"""
+	gameFileKey = getGameFileKey(gameFilePath)
+	for manifest in _loadManifests(manifestFilePath):
+		if isinstance(manifest, dict) and manifest.get('manifestVersion') == MANIFEST_VERSION and all(manifest.get(keyName) == keyValue for keyName, keyValue in gameFileKey.items()):
+			return manifest
+	return None
@@ -0,0 +1,979 @@
+import datetime, os, sys, time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import Codec, Stats, Utils
+from CustomExceptions import DecodeError
+from GGDict import GGDict
+from GGPack import GGPack, getIndexCache, getSharedGGPack, setIndexCache
+
+# The current folder depends on whether this is run as a Python script or as a PyInstaller-created executable
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+	# Running in a PyInstaller bundle
+	CURRENT_FOLDER = os.path.abspath(os.path.dirname(sys.executable))
+else:
+	# Running in a normal Python process
+	CURRENT_FOLDER = os.path.abspath(os.path.dirname(__file__))
+
+KEYSTREAM_CACHE_FILEPATH = os.path.join(CURRENT_FOLDER, 'MonkeyPack.keystream')
+INDEX_CACHE_FILEPATH = os.path.join(CURRENT_FOLDER, 'MonkeyPack.indexcache')
+
+# How many chunks can wait between the reading, encoding, and writing steps when packing. This limits how much memory packing uses
+PIPELINE_QUEUE_SIZE = 8
+
+# Options are written with two preceding dashes. Value options take the argument after them as their value, flag options don't take a value
+VALUE_OPTIONS = ('game', 'jobs', 'manifest', 'stats', 'to-tar', 'to-zip', 'update')
+FLAG_OPTIONS = ('dedup', 'index-cache', 'keystream-cache', 'progress', 'quiet')
+
+# How the progress of handling each file gets shown: a line per file, a progress bar, or nothing at all. See setOutputMode
+OUTPUT_MODE_LINES = 'lines'
+OUTPUT_MODE_PROGRESS = 'progress'
+OUTPUT_MODE_QUIET = 'quiet'
+_outputMode = OUTPUT_MODE_LINES
+PROGRESS_BAR_WIDTH = 40
+# Redrawing the progress bar for every file would be as slow as printing a line per file, so only redraw it this often, in seconds
+PROGRESS_INTERVAL = 0.1
+_lastProgressTime = 0.0
+
+
+def decodeGameData(encodedGameData: bytes) -> bytes:
+	"""Decodes the provided encoded game data into something parseable, or turns decoded data back into encoded data"""
+	return Codec.decode(encodedGameData)
+
+
+def listFiles(packFilepath: str, filenameFilterList: List[str] = None):
+	"""List all the files inside the specified ggpack file"""
+	if not os.path.isfile(packFilepath):
+		raise FileNotFoundError(f"Asked to list files inside '{packFilepath}' but that file doesn't exist")
+	fileIndex = parseFileIndex(packFilepath)
+	# Write the found files to the screen and to a textfile too, to make it easier to look through when there's a lot of files
+	outputFilepath = os.path.join(CURRENT_FOLDER, os.path.basename(packFilepath) + '.txt')
+	matchingFileCount = 0
+	with open(outputFilepath, 'w') as outputFile:
+		printAndWrite(f"Found {len(fileIndex['files']):,} files inside '{packFilepath}':", outputFile)
+		if filenameFilterList:
+			printAndWrite(f"Filtering on: " + ", ".join(filenameFilterList), outputFile)
+		for fileCount, fileEntry in enumerate(fileIndex['files']):
+			if not filenameFilterList or doesFilenameMatchFilterList(fileEntry['filename'], filenameFilterList):
+				matchingFileCount += 1
+				printAndWrite(f"File {fileCount + 1:,} of {len(fileIndex['files']):,}: '{fileEntry['filename']}', {fileEntry['size']:,} bytes", outputFile, _outputMode == OUTPUT_MODE_LINES)
+	print(f"Listed {matchingFileCount:,} files inside {packFilepath}, this list has also been written to '{outputFilepath}'")
+
+def listGameFiles(gameFolderPath: str, filenameFilterList: List[str] = None):
+	"""List the files the game would load from all the ggpack files in the provided game folder, and which ggpack file each one would be loaded from"""
+	print(f"Opening the ggpack files in '{gameFolderPath}'")
+	from GGPackSet import GGPackSet
+	with GGPackSet(gameFolderPath) as ggpackSet:
+		outputFilepath = os.path.join(CURRENT_FOLDER, 'Weird.ggpack.txt')
+		matchingFileCount = 0
+		with open(outputFilepath, 'w') as outputFile:
+			printAndWrite(f"Found {len(ggpackSet):,} files inside the {len(ggpackSet.getGGPacks()):,} ggpack files in '{gameFolderPath}':", outputFile)
+			if filenameFilterList:
+				printAndWrite(f"Filtering on: " + ", ".join(filenameFilterList), outputFile)
+			for ggpack, fileEntry in ggpackSet.iterEntries():
+				if not filenameFilterList or doesFilenameMatchFilterList(fileEntry['filename'], filenameFilterList):
+					matchingFileCount += 1
+					printAndWrite(f"'{fileEntry['filename']}' from '{os.path.basename(ggpack.gameFilePath)}', {fileEntry['size']:,} bytes", outputFile, _outputMode == OUTPUT_MODE_LINES)
+	print(f"Listed {matchingFileCount:,} files inside {gameFolderPath}, this list has also been written to '{outputFilepath}'")
+
+def unpackGameFiles(gameFolderPath: str, filenameFilterList: List[str] = None, jobCount: int = 1):
+	"""Unpack the files the game would load from all the ggpack files in the provided game folder, so each file is unpacked from the ggpack file with the highest priority that contains it"""
+	extractFolder = os.path.join(CURRENT_FOLDER, 'Weirdggpack')
+	print(f"Opening the ggpack files in '{gameFolderPath}'")
+	from GGPackSet import GGPackSet
+	with GGPackSet(gameFolderPath) as ggpackSet:
+		fileEntriesByGGPack: Dict[GGPack, List[Dict]] = {ggpack: [] for ggpack in ggpackSet.getGGPacks()}
+		for ggpack, fileEntry in ggpackSet.iterEntries():
+			fileEntriesByGGPack[ggpack].append(fileEntry)
+		for ggpack, fileEntries in fileEntriesByGGPack.items():
+			if fileEntries:
+				_unpackFromGGPack(ggpack, extractFolder, filenameFilterList, jobCount, fileEntries)
+
+def catFiles(filenames: List[str], outputStream, packFilePath: str = None, gameFolderPath: str = None):
+	"""
+	Write the decoded contents of the provided files to the provided binary stream, like the standard output, one after the other, without writing anything to disk
+	:param filenames: The names of the files to write
+	:param outputStream: The binary stream to write the decoded files to
+	:param packFilePath: The ggpack file to read the files from
+	:param gameFolderPath: If provided instead of a ggpack file, the files are read from the ggpack file in this game folder that the game would load them from
+	"""
+	from GGPackSet import GGPackSet
+	with (GGPackSet(gameFolderPath) if gameFolderPath else GGPack(packFilePath)) as archive:
+		for filename in filenames:
+			for chunk in archive.read(filename, stream=True):
+				outputStream.write(chunk)
+	outputStream.flush()
+
+def unpack(unpackFilePath: str, filenameFilterList: List[str] = None, jobCount: int = 1, extractFolder: str = None):
+	"""
+	Unpacks the provided ggpack file into a folder named after the provided ggpack file
+	:param unpackFilePath: The ggpack file to unpack
+	:param filenameFilterList: If provided, only files matching one of these filters get unpacked
+	:param jobCount: How many processes to use for unpacking. Each file is unpacked independently, so with more than one process, multiple files get unpacked at the same time
+	:param extractFolder: If provided, the files get unpacked into this folder instead
+	"""
+	if not os.path.isfile(unpackFilePath):
+		raise FileNotFoundError(f"Asked to unpack file '{unpackFilePath}', but that file doesn't exist")
+	if not extractFolder:
+		# Dump the files inside a folder named after the pack file. That folder will be created where this script is
+		extractFolder = os.path.join(CURRENT_FOLDER, os.path.basename(unpackFilePath).replace('.', ''))
+	print(f"Opening game file '{unpackFilePath}'")
+	with GGPack(unpackFilePath) as ggpack:
+		_unpackFromGGPack(ggpack, extractFolder, filenameFilterList, jobCount)
+
+def _unpackFromGGPack(ggpack: GGPack, extractFolder: str, filenameFilterList: List[str], jobCount: int, fileEntries: List[Dict] = None):
+	"""Unpack the files from the provided ggpack into the extract folder. If 'fileEntries' is provided, only those file entries get unpacked, otherwise all of the ggpack's file entries are"""
+	unpackFilePath = ggpack.gameFilePath
+	fileIndex = ggpack.getFileIndex()
+	if fileEntries is None:
+		fileEntries = fileIndex['files']
+	os.makedirs(extractFolder, exist_ok=True)
+	totalFileCount = len(fileEntries)
+	print(f"Unpacking {unpackFilePath}")
+	if filenameFilterList:
+		print(f"Filtering on " + ", ".join(filenameFilterList))
+	entriesToUnpack: List[Tuple[int, Dict]] = []
+	for fileCount, fileEntry in enumerate(fileEntries):
+		if len(fileEntry) < 3:
+			print(f"Skipping unpacking '{fileEntry}' from '{fileIndex}', not enough info stored")
+			continue
+		if 'filename' not in fileEntry or 'offset' not in fileEntry or 'size' not in fileEntry:
+			print(f"Invalid file entry '{fileEntry}', missing key 'filename', 'offset', or 'size', skipping")
+			continue
+		if filenameFilterList and not doesFilenameMatchFilterList(fileEntry['filename'], filenameFilterList):
+			# The current file doesn't match the provided filter list, so skip it
+			continue
+		entriesToUnpack.append((fileCount, fileEntry))
+	# Collect the errors per file, so one broken file doesn't stop the rest from being unpacked
+	failedFiles: Dict[str, str] = {}
+	if jobCount <= 1:
+		for unpackCount, (fileCount, fileEntry) in enumerate(entriesToUnpack):
+			printFileProgress(unpackCount + 1, len(entriesToUnpack), f"Unpacking file {fileCount + 1:,} of {totalFileCount:,}: '{fileEntry['filename']}', {fileEntry['size']:,} bytes")
+			try:
+				unpackFileEntry(ggpack, fileEntry, extractFolder)
+			except Exception as e:
+				print(f"ERROR: Unpacking '{fileEntry['filename']}' failed: {e}")
+				failedFiles[fileEntry['filename']] = str(e)
+	else:
+		print(f"Unpacking {len(entriesToUnpack):,} files using {jobCount} processes")
+		from concurrent.futures import ProcessPoolExecutor, as_completed
+		with ProcessPoolExecutor(max_workers=jobCount) as executor:
+			# Start with the biggest files, so a big file near the end doesn't keep one process busy while the others are idle
+			entriesToUnpack.sort(key=lambda countAndEntry: countAndEntry[1]['size'], reverse=True)
+			recordStats = Stats.getStats() is not None
+			futureToEntry = {executor.submit(_unpackFileEntryInWorker, unpackFilePath, fileEntry, extractFolder, recordStats): fileEntry for fileCount, fileEntry in entriesToUnpack}
+			for finishedCount, future in enumerate(as_completed(futureToEntry)):
+				fileEntry = futureToEntry[future]
+				try:
+					writtenByteCount, workerStats = future.result()
+					if workerStats:
+						Stats.getStats().merge(workerStats)
+					printFileProgress(finishedCount + 1, len(entriesToUnpack), f"Unpacked file {finishedCount + 1:,} of {len(entriesToUnpack):,}: '{fileEntry['filename']}', {fileEntry['size']:,} bytes")
+				except Exception as e:
+					print(f"ERROR: Unpacking '{fileEntry['filename']}' failed: {e}")
+					failedFiles[fileEntry['filename']] = str(e)
+	print(f"Successfully unpacked {len(entriesToUnpack) - len(failedFiles):,} files from '{unpackFilePath}' into '{extractFolder}")
+	if failedFiles:
+		print(f"Failed to unpack {len(failedFiles):,} files:")
+		for failedFilename, error in failedFiles.items():
+			print(f"  '{failedFilename}': {error}")
+
+def unpackFileEntry(ggpack: GGPack, fileEntry: Dict, extractFolder: str) -> int:
+	"""Unpack a single file from the provided ggpack into the extract folder. Returns the number of bytes written"""
+	filePath = getExtractFilePath(extractFolder, fileEntry['filename'])
+	# Decode in chunks straight from the memory-mapped ggpack, so large files don't have to be fully in memory. Reading from the map happens while decoding, so that's included in the decoding time.
+	# Like when packing, the time spent decoding and writing is added up per file, and recorded once the whole file is written
+	decodeTime = 0.0
+	writeTime = 0.0
+	with open(filePath, 'wb') as f:
+		decodeStartTime = time.perf_counter()
+		for chunk in Codec.iterCodedChunks(ggpack.getEncodedFileEntry(fileEntry), GGPack.isEncoded(fileEntry['filename'])):
+			writeStartTime = time.perf_counter()
+			decodeTime += writeStartTime - decodeStartTime
+			f.write(chunk)
+			decodeStartTime = time.perf_counter()
+			writeTime += decodeStartTime - writeStartTime
+	archiveName = os.path.basename(ggpack.gameFilePath)
+	Stats.record(Stats.ENTRY_DECODE, decodeTime, fileEntry['size'], archiveName)
+	Stats.record(Stats.ENTRY_WRITE, writeTime, fileEntry['size'], archiveName)
+	return fileEntry['size']
+
+def getExtractFilePath(extractFolder: str, filename: str) -> str:
+	"""Get where to unpack the file with the provided name inside a ggpack to. Files packed from a subfolder have '/' in their name, so those get unpacked into the same subfolder, which gets created if needed"""
+	if '/' not in filename and '\\' not in filename and not filename.startswith('.'):
+		return os.path.join(extractFolder, filename)
+	filePath = os.path.normpath(os.path.join(extractFolder, *filename.split('/')))
+	# Make sure a name like '../file.txt' can't make us write outside the extract folder
+	if os.path.commonpath([os.path.abspath(extractFolder), os.path.abspath(filePath)]) != os.path.abspath(extractFolder) or os.path.abspath(filePath) == os.path.abspath(extractFolder):
+		raise DecodeError(f"File name '{filename}' would be unpacked outside of '{extractFolder}'")
+	os.makedirs(os.path.dirname(filePath), exist_ok=True)
+	return filePath
+
+def unpackToArchive(fileEntries: Iterable[Tuple[GGPack, Dict]], archivePath: str, archiveType: str, outputStream=None, filenameFilterList: List[str] = None) -> int:
+	"""
+	Unpack the provided files into a single tar or zip file, instead of into a separate file each. Each file is decoded while it's written into the archive, so nothing else gets written to disk.
+	Files get the modification time of the ggpack they're in. Zip files are stored uncompressed, so that's as fast as tar files
+	:param fileEntries: For each file to unpack, the ggpack it's in and its file entry, like GGPackSet.iterEntries returns
+	:param archivePath: The tar or zip file to write, or '-' to write to the provided output stream
+	:param archiveType: Either 'tar' or 'zip'
+	:param outputStream: When 'archivePath' is '-', the binary stream to write the archive to, like the standard output. It doesn't need to be seekable
+	:param filenameFilterList: If provided, only files matching one of these filters get unpacked
+	:return: The number of unpacked files
+	"""
+	if archiveType not in ('tar', 'zip'):
+		raise ValueError(f"Unknown archive type '{archiveType}', should be 'tar' or 'zip'")
+	if filenameFilterList:
+		print(f"Filtering on " + ", ".join(filenameFilterList))
+	fileEntries = [(ggpack, fileEntry) for ggpack, fileEntry in fileEntries if not filenameFilterList or doesFilenameMatchFilterList(fileEntry['filename'], filenameFilterList)]
+	archiveFile = outputStream if archivePath == '-' else open(archivePath, 'wb')
+	try:
+		if archiveType == 'tar':
+			import tarfile
+			# Stream mode, so the output doesn't need to be seekable. Copying in bigger blocks than the default makes decoding while copying faster
+			with tarfile.open(fileobj=archiveFile, mode='w|', copybufsize=Codec.DEFAULT_CHUNK_SIZE) as tarFile:
+				for fileCount, (ggpack, fileEntry) in enumerate(fileEntries):
+					printFileProgress(fileCount + 1, len(fileEntries), f"Adding file {fileCount + 1:,} of {len(fileEntries):,} to '{archivePath}': '{fileEntry['filename']}', {fileEntry['size']:,} bytes")
+					tarInfo = tarfile.TarInfo(fileEntry['filename'])
+					tarInfo.size = fileEntry['size']
+					tarInfo.mtime = int(os.path.getmtime(ggpack.gameFilePath))
+					tarFile.addfile(tarInfo, Codec.CodedReader(ggpack.getEncodedFileEntry(fileEntry), GGPack.isEncoded(fileEntry['filename'])))
+		else:
+			import zipfile
+			with zipfile.ZipFile(archiveFile, 'w', zipfile.ZIP_STORED) as zipFile:
+				for fileCount, (ggpack, fileEntry) in enumerate(fileEntries):
+					printFileProgress(fileCount + 1, len(fileEntries), f"Adding file {fileCount + 1:,} of {len(fileEntries):,} to '{archivePath}': '{fileEntry['filename']}', {fileEntry['size']:,} bytes")
+					zipInfo = zipfile.ZipInfo(fileEntry['filename'], time.localtime(os.path.getmtime(ggpack.gameFilePath))[:6])
+					zipInfo.file_size = fileEntry['size']
+					# Files of 2 GB or more need the zip64 extension, and that needs to be known before writing them
+					with zipFile.open(zipInfo, 'w', force_zip64=fileEntry['size'] >= zipfile.ZIP64_LIMIT) as zippedFile:
+						for chunk in Codec.iterCodedChunks(ggpack.getEncodedFileEntry(fileEntry), GGPack.isEncoded(fileEntry['filename'])):
+							zippedFile.write(chunk)
+	finally:
+		if archiveFile is not outputStream:
+			archiveFile.close()
+		else:
+			archiveFile.flush()
+	print(f"Successfully unpacked {len(fileEntries):,} files into '{archivePath}'")
+	return len(fileEntries)
+
+def _unpackFileEntryInWorker(unpackFilePath: str, fileEntry: Dict, extractFolder: str, recordStats: bool = False) -> Tuple[int, Optional[Dict]]:
+	"""Unpack a file in a worker process. If 'recordStats' is True, the stats for this file get recorded and returned, so they can be merged into the stats of the main process"""
+	if not recordStats:
+		return unpackFileEntry(getSharedGGPack(unpackFilePath), fileEntry, extractFolder), None
+	Stats.setStats(Stats.Stats())
+	try:
+		return unpackFileEntry(getSharedGGPack(unpackFilePath), fileEntry, extractFolder), Stats.getStats().getPhases()
+	finally:
+		Stats.setStats(None)
+
+def verify(packFilePaths: List[str], jobCount: int = 1, manifestFilePath: str = None) -> bool:
+	"""
+	Check the provided ggpack files without unpacking them: whether the location of each packed file makes sense, and whether each file can be decoded.
+	A manifest with the hash of each decoded file gets written, either to 'manifestFilePath' for all ggpacks together, or next to this program for each ggpack separately
+	:param packFilePaths: The ggpack files to verify
+	:param jobCount: How many processes to use for decoding and hashing. The files of all the provided ggpacks are spread over these processes
+	:param manifestFilePath: Where to write the manifest to. If this ends with '.csv' it's written as CSV, otherwise as JSON
+	:return: True if no problems were found, False otherwise
+	"""
+	import Manifest
+	problemsByPath: Dict[str, List[str]] = {}
+	fileEntriesByPath: Dict[str, List[Dict]] = {}
+	fileEntriesToHashByPath: Dict[str, List[Dict]] = {}
+	hashedFileEntryIdsByPath: Dict[str, Set[int]] = {}
+	for packFilePath in packFilePaths:
+		if not os.path.isfile(packFilePath):
+			raise FileNotFoundError(f"Asked to verify file '{packFilePath}', but that file doesn't exist")
+		print(f"Checking file locations in '{packFilePath}'")
+		with GGPack(packFilePath) as ggpack:
+			problemsByPath[packFilePath] = ggpack.findExtentProblems()
+			fileEntriesByPath[packFilePath] = list(ggpack.iterEntries())
+			# Files outside of the ggpack can't be decoded, those are already listed as a problem
+			fileEntriesToHashByPath[packFilePath] = [fileEntry for fileEntry in fileEntriesByPath[packFilePath] if fileEntry['offset'] >= 8 and 0 <= fileEntry['size'] and fileEntry['offset'] + fileEntry['size'] <= ggpack.fileSize]
+			hashedFileEntryIdsByPath[packFilePath] = {id(fileEntry) for fileEntry in fileEntriesToHashByPath[packFilePath]}
+	print(f"Decoding and hashing {sum(len(fileEntries) for fileEntries in fileEntriesToHashByPath.values()):,} files using {jobCount} process{'es' if jobCount != 1 else ''}")
+	hashResultsByPath = Manifest.hashGGPackEntries(fileEntriesToHashByPath, jobCount)
+	manifests: List[Dict] = []
+	for packFilePath in packFilePaths:
+		problems = problemsByPath[packFilePath]
+		hashResultIterator = iter(hashResultsByPath[packFilePath])
+		hashResults: List[Optional[Manifest.HashResult]] = []
+		for fileEntry in fileEntriesByPath[packFilePath]:
+			if id(fileEntry) not in hashedFileEntryIdsByPath[packFilePath]:
+				hashResults.append(None)
+				continue
+			hashResults.append(next(hashResultIterator))
+			if hashResults[-1][1]:
+				problems.append(f"Unable to decode file '{fileEntry['filename']}': {hashResults[-1][1]}")
+		manifest = Manifest.createManifest(packFilePath, fileEntriesByPath[packFilePath], hashResults, problems)
+		manifests.append(manifest)
+		if problems:
+			print(f"Found {len(problems):,} problems in '{packFilePath}':")
+			for problem in problems:
+				print(f"  {problem}")
+		else:
+			print(f"Verified all {len(fileEntriesByPath[packFilePath]):,} files in '{packFilePath}', no problems found")
+	if manifestFilePath:
+		Manifest.writeManifests(manifests, manifestFilePath)
+		print(f"Wrote the manifest to '{manifestFilePath}'")
+	else:
+		for manifest, packFilePath in zip(manifests, packFilePaths):
+			Manifest.storeManifest(manifest, Manifest.getDefaultManifestPath(CURRENT_FOLDER, packFilePath))
+		print(f"Wrote a manifest for each ggpack file to '{CURRENT_FOLDER}'")
+	return not any(problemsByPath.values())
+
+def diff(packFilePath: str, otherPath: str, filenameFilterList: List[str] = None, jobCount: int = 1, manifestFilePath: str = None) -> bool:
+	"""
+	Show which files were added, removed, or changed between a ggpack file and either another ggpack file or a folder, without unpacking anything.
+	Files are compared by size first, only files with the same size get decoded and hashed. Hashes stored in manifests (see 'verify') are reused if the ggpack didn't change,
+	and newly calculated hashes are stored in those manifests, so comparing the same ggpack again is a lot faster
+	:param packFilePath: The ggpack file to compare
+	:param otherPath: The ggpack file or folder to compare it to
+	:param filenameFilterList: If provided, only files matching one of these filters get compared
+	:param jobCount: How many files to decode and hash at the same time
+	:param manifestFilePath: A JSON manifest file to look for stored hashes in, besides the manifests stored next to this program
+	:return: True if there are no differences, False otherwise
+	"""
+	print(f"Comparing '{packFilePath}' to '{otherPath}'")
+	oldFiles = _getFilesToDiff(packFilePath, filenameFilterList, manifestFilePath)
+	newFiles = _getFilesToDiff(otherPath, filenameFilterList, manifestFilePath)
+	addedFilenames = [filename for filename in newFiles if filename not in oldFiles]
+	removedFilenames = [filename for filename in oldFiles if filename not in newFiles]
+	modifiedFilenames = [filename for filename in oldFiles if filename in newFiles and oldFiles[filename]['size'] != newFiles[filename]['size']]
+	sameSizeFilenames = [filename for filename in oldFiles if filename in newFiles and oldFiles[filename]['size'] == newFiles[filename]['size']]
+	# Only files with the same size can be the same, so only those need to be hashed
+	_hashFilesToDiff(packFilePath, oldFiles, sameSizeFilenames, jobCount)
+	_hashFilesToDiff(otherPath, newFiles, sameSizeFilenames, jobCount)
+	changedSameSizeFilenames = [filename for filename in sameSizeFilenames if oldFiles[filename]['md5'] != newFiles[filename]['md5']]
+	modifiedFilenames.extend(changedSameSizeFilenames)
+	for description, filenames in (('Added', addedFilenames), ('Removed', removedFilenames), ('Modified', modifiedFilenames)):
+		if filenames:
+			print(f"{description} ({len(filenames):,}):")
+			for filename in sorted(filenames):
+				print(f"  {filename}")
+	print(f"{len(addedFilenames):,} added, {len(removedFilenames):,} removed, {len(modifiedFilenames):,} modified, {len(sameSizeFilenames) - len(changedSameSizeFilenames):,} unchanged")
+	return not addedFilenames and not removedFilenames and not modifiedFilenames
+
+def _getFilesToDiff(path: str, filenameFilterList: List[str], manifestFilePath: str = None) -> Dict[str, Dict]:
+	"""Get the name, size, and if a manifest is stored also the hash, of each file in the provided ggpack file or folder. Each file dict also stores the file index entry or the file path"""
+	import FileScanner, Manifest
+	filesToDiff: Dict[str, Dict] = {}
+	if os.path.isdir(path):
+		# Files in subfolders are compared to files packed with the same relative path, see FileScanner.scanFilesToPack
+		for fileToPack in FileScanner.scanFilesToPack([path], filenameFilterList):
+			filesToDiff[fileToPack['filename']] = {"size": fileToPack['size'], "md5": None, "path": fileToPack['path']}
+		return filesToDiff
+	if not os.path.isfile(path):
+		raise FileNotFoundError(f"Asked to compare '{path}', but that file or folder doesn't exist")
+	storedManifest = None
+	if manifestFilePath:
+		storedManifest = Manifest.loadStoredManifest(manifestFilePath, path)
+	if not storedManifest:
+		storedManifest = Manifest.loadStoredManifest(Manifest.getDefaultManifestPath(CURRENT_FOLDER, path), path)
+	storedHashes = {(fileEntry['filename'], fileEntry['offset'], fileEntry['size']): fileEntry['md5'] for fileEntry in storedManifest['files']} if storedManifest else {}
+	with GGPack(path) as ggpack:
+		for fileEntry in ggpack.iterEntries():
+			if not filenameFilterList or doesFilenameMatchFilterList(fileEntry['filename'], filenameFilterList):
+				filesToDiff[fileEntry['filename']] = {"size": fileEntry['size'], "md5": storedHashes.get((fileEntry['filename'], fileEntry['offset'], fileEntry['size'])), "entry": fileEntry}
+	return filesToDiff
+
+def _hashFilesToDiff(path: str, filesToDiff: Dict[str, Dict], filenamesToHash: List[str], jobCount: int):
+	"""Hash the provided files from a ggpack file or folder, unless their hash is already known. For ggpack files, the new hashes get stored in the manifest for that ggpack"""
+	filenamesToHash = [filename for filename in filenamesToHash if filesToDiff[filename]['md5'] is None]
+	if not filenamesToHash:
+		return
+	import Manifest
+	print(f"Hashing {len(filenamesToHash):,} files from '{path}'")
+	if os.path.isdir(path):
+		fileHashes = Manifest.hashFiles([filesToDiff[filename]['path'] for filename in filenamesToHash], jobCount)
+		for filename, fileHash in zip(filenamesToHash, fileHashes):
+			filesToDiff[filename]['md5'] = fileHash
+		return
+	hashResults = Manifest.hashGGPackEntries({path: [filesToDiff[filename]['entry'] for filename in filenamesToHash]}, jobCount)[path]
+	for filename, (fileHash, error) in zip(filenamesToHash, hashResults):
+		if error:
+			raise DecodeError(f"Unable to decode '{filename}' from '{path}': {error}")
+		filesToDiff[filename]['md5'] = fileHash
+	# Add the new hashes to the stored manifest, so the next comparison with this ggpack doesn't need to hash them again
+	fileEntries = [filesToDiff[filename]['entry'] for filename in filenamesToHash]
+	Manifest.storeHashes(Manifest.getDefaultManifestPath(CURRENT_FOLDER, path), path, fileEntries, hashResults)
+
+def parseFileIndex(gameFilePath: str) -> Dict:
+	print(f"Opening game file '{gameFilePath}'")
+	with GGPack(gameFilePath) as ggpack:
+		return ggpack.getFileIndex()
+
+def getEncodedFileIndex(gameFilePath: str) -> bytes:
+	print(f"Opening game file '{gameFilePath}'")
+	with GGPack(gameFilePath) as ggpack:
+		return bytes(ggpack.getEncodedFileIndex())
+
+def getEncodedPackFile(gameFilePath: str, startOffset: int, size: int = None):
+	with GGPack(gameFilePath) as ggpack:
+		return bytes(ggpack.getEncodedData(startOffset, size))
+
+def packFiles(filenamesToPack: List[str], filenameFilterList: List[str] = None, deduplicate: bool = False, packFilename: str = None, jobCount: int = 1) -> str:
+	"""
+	Pack the files from the provided filenames into a ggpack that the game can recognise. If 'deduplicate' is True, files with identical contents are only stored once.
+	If 'packFilename' isn't provided, the first ggpack filename the game recognises that isn't used yet is used. 'jobCount' is how many folders to scan at the same time. Returns the path of the created ggpack
+	"""
+	# First determine which ggpack filename we can use.
+	if not packFilename:
+		packFilename = getAvailableFilename()
+	if not packFilename:
+		raise FileExistsError(f"There are already too many Weird.ggpack files in this folder, valid ggpacks end with 1-9 and optionally the letters a to f")
+	filesToPack = collectFilesToPack(filenamesToPack, filenameFilterList, jobCount)
+	fileOffsetsDict = {"files": [], "guid": "b554baf88ff004c50cc0214575794b8c"}  # All the RtMI ggpack files use the same guid, use it for our packfile too
+	with open(packFilename, 'wb') as packFile:
+		# First write two dummy integers, these will get overwritten later with the file index start offset and the file index size, once we know those
+		packFile.write(Utils.toWritableInt(0))
+		packFile.write(Utils.toWritableInt(0))
+		# Write the files to the pack file
+		fileOffsetsDict['files'].extend(writePackEntries(packFile, filesToPack, deduplicate=deduplicate))
+		# Then add the file index
+		print(f"Writing file index '{packFilename}'")
+		writeFileIndex(packFile, fileOffsetsDict)
+	print(f"Successfully packed {len(filesToPack):,} files into '{packFilename}'")
+	return packFilename
+
+def collectFilesToPack(filenamesToPack: List[str], filenameFilterList: List[str] = None, jobCount: int = 1) -> List[Dict]:
+	"""Turn the provided list of files and folders to pack into a list of just files, with their name inside the ggpack, their path, and their size. See FileScanner.scanFilesToPack"""
+	print("Finding the files to pack")
+	import FileScanner
+	filesToPack = FileScanner.scanFilesToPack(filenamesToPack, filenameFilterList, jobCount)
+	print(f"Found {len(filesToPack):,} files to pack, {sum(fileToPack['size'] for fileToPack in filesToPack):,} bytes in total")
+	return filesToPack
+
+def preallocateFile(fileToPreallocate, size: int):
+	"""Reserve the disk space for the provided file up to the provided size before writing it, so the file system can keep the file in one piece. Does nothing on systems that don't support this"""
+	startOffset = fileToPreallocate.tell()
+	if not hasattr(os, 'posix_fallocate') or size <= startOffset:
+		return
+	try:
+		os.posix_fallocate(fileToPreallocate.fileno(), startOffset, size - startOffset)
+	except OSError:
+		# Not all file systems support this, but the file can still be written without it
+		pass
+
+def writePackEntries(packFile, filesToPack: List[Dict], progressPrefix: str = 'Packing file', deduplicate: bool = False) -> List[Dict]:
+	"""
+	Encode the provided files and write them into the pack file, starting at the current position. Returns the file index entries for the written files.
+	Reading, encoding, and writing happen at the same time: a reader thread and a writer thread pass chunks to and from the encoding in this thread through bounded queues,
+	so the disk doesn't sit idle while encoding, and at most a few chunks are in memory at once. The output is the same as when doing each step after the other.
+	If 'deduplicate' is True, files with identical contents are only written once, and all their file index entries point to that one copy.
+	'filesToPack' is a list of dictionaries with the 'filename' inside the ggpack, the 'path', and the 'size' of each file, like collectFilesToPack returns
+	"""
+	filenamesToPack = [fileToPack['path'] for fileToPack in filesToPack]
+	duplicateOf = findDuplicateFiles(filesToPack) if deduplicate else {}
+	# The sizes are known up front, so the offsets can be assigned in order before anything is written
+	fileEntries: List[Dict] = []
+	nextOffset = packFile.tell()
+	for fileIndex, fileToPack in enumerate(filesToPack):
+		if fileIndex in duplicateOf:
+			fileOffset = fileEntries[duplicateOf[fileIndex]]['offset']
+		else:
+			fileOffset = nextOffset
+			nextOffset += fileToPack['size']
+		fileEntries.append({"filename": fileToPack['filename'], "offset": fileOffset, "size": fileToPack['size']})
+	preallocateFile(packFile, nextOffset)
+
+	import queue, threading
+	archiveName = os.path.basename(getattr(packFile, 'name', ''))
+	stopEvent = threading.Event()
+	readQueue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+	writeQueue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+	pipelineErrors: List[Exception] = []
+
+	def putInQueue(queueToPutIn: queue.Queue, item) -> bool:
+		# Keep trying until there's room in the queue, unless the pipeline got stopped because of an error. Returns False in that case
+		while not stopEvent.is_set():
+			try:
+				queueToPutIn.put(item, timeout=0.1)
+				return True
+			except queue.Full:
+				pass
+		return False
+
+	def readFiles():
+		try:
+			for fileIndex, filenameToPack in enumerate(filenamesToPack):
+				if fileIndex in duplicateOf:
+					# This file's data has already been written
+					continue
+				bytesLeft = fileEntries[fileIndex]['size']
+				readTime = 0.0
+				with open(filenameToPack, 'rb') as fileToPack:
+					while bytesLeft > 0:
+						readStartTime = time.perf_counter()
+						chunk = fileToPack.read(min(Codec.DEFAULT_CHUNK_SIZE, bytesLeft))
+						readTime += time.perf_counter() - readStartTime
+						if not chunk:
+							raise DecodeError(f"Expected {fileEntries[fileIndex]['size']:,} bytes from '{filenameToPack}', but it ended after {fileEntries[fileIndex]['size'] - bytesLeft:,} bytes. Did it change while packing?")
+						bytesLeft -= len(chunk)
+						if not putInQueue(readQueue, (fileIndex, chunk)):
+							return
+				Stats.record(Stats.ENTRY_READ, readTime, fileEntries[fileIndex]['size'], archiveName)
+		except Exception as e:
+			pipelineErrors.append(e)
+			stopEvent.set()
+		putInQueue(readQueue, None)
+
+	def writeChunks():
+		try:
+			# The time spent writing is recorded per file, once the first chunk of the next file arrives
+			currentWriteFileIndex = None
+			writeTime = 0.0
+			while True:
+				try:
+					writeItem = writeQueue.get(timeout=0.1)
+				except queue.Empty:
+					if stopEvent.is_set():
+						break
+					continue
+				if writeItem is None:
+					break
+				fileIndex, chunk = writeItem
+				if fileIndex != currentWriteFileIndex:
+					if currentWriteFileIndex is not None:
+						Stats.record(Stats.ENTRY_WRITE, writeTime, fileEntries[currentWriteFileIndex]['size'], archiveName)
+					currentWriteFileIndex = fileIndex
+					writeTime = 0.0
+				writeStartTime = time.perf_counter()
+				packFile.write(chunk)
+				writeTime += time.perf_counter() - writeStartTime
+			if currentWriteFileIndex is not None:
+				Stats.record(Stats.ENTRY_WRITE, writeTime, fileEntries[currentWriteFileIndex]['size'], archiveName)
+		except Exception as e:
+			pipelineErrors.append(e)
+			stopEvent.set()
+
+	readerThread = threading.Thread(target=readFiles, name='PackReader', daemon=True)
+	writerThread = threading.Thread(target=writeChunks, name='PackWriter', daemon=True)
+	readerThread.start()
+	writerThread.start()
+	try:
+		currentFileIndex = -1
+		streamCodec: Optional[Codec.StreamCodec] = None
+		encodeTime = 0.0
+		while not stopEvent.is_set():
+			try:
+				readItem = readQueue.get(timeout=0.1)
+			except queue.Empty:
+				continue
+			if readItem is None:
+				break
+			fileIndex, chunk = readItem
+			if fileIndex != currentFileIndex:
+				if currentFileIndex >= 0:
+					Stats.record(Stats.ENTRY_ENCODE, encodeTime, fileEntries[currentFileIndex]['size'], archiveName)
+				currentFileIndex = fileIndex
+				encodeTime = 0.0
+				printFileProgress(fileIndex + 1, len(filenamesToPack), f"{progressPrefix} {fileIndex + 1:,} of {len(filenamesToPack):,}: '{filenamesToPack[fileIndex]}'")
+				# .bank files contain music and sounds, and are stored unencoded
+				streamCodec = Codec.StreamCodec(fileEntries[fileIndex]['size']) if GGPack.isEncoded(fileEntries[fileIndex]['filename']) else None
+			encodeStartTime = time.perf_counter()
+			if streamCodec:
+				chunk = streamCodec.process(chunk)
+			encodeTime += time.perf_counter() - encodeStartTime
+			if not putInQueue(writeQueue, (fileIndex, chunk)):
+				break
+		if currentFileIndex >= 0:
+			Stats.record(Stats.ENTRY_ENCODE, encodeTime, fileEntries[currentFileIndex]['size'], archiveName)
+	except Exception as e:
+		pipelineErrors.append(e)
+		stopEvent.set()
+	finally:
+		# Let the writer finish writing what it got, then wait for both threads to stop
+		putInQueue(writeQueue, None)
+		stopEvent.set()
+		writerThread.join()
+		readerThread.join()
+	if pipelineErrors:
+		raise pipelineErrors[0]
+	if deduplicate:
+		print(f"Stored {len(duplicateOf):,} duplicate files only once, saving {sum(filesToPack[fileIndex]['size'] for fileIndex in duplicateOf):,} bytes")
+	return fileEntries
+
+def findDuplicateFiles(filesToPack: List[Dict]) -> Dict[int, int]:
+	"""
+	Find which of the provided files have the same contents as an earlier file in the list.
+	Only files with the same size can be the same, so only those get hashed. The keystream only depends on the size of the data, so files with the same contents also encode to the same data,
+	as long as both are encoded or both aren't ('.bank' files aren't encoded)
+	:param filesToPack: The files to check, with the 'filename', 'path', and 'size' of each file, like collectFilesToPack returns
+	:return: A dictionary with the list index of each duplicate file as the key, and the list index of the first file with the same contents as the value
+	"""
+	import Manifest
+	filesBySizeAndEncoding: Dict[Tuple[int, bool], List[int]] = {}
+	for fileIndex, fileToPack in enumerate(filesToPack):
+		filesBySizeAndEncoding.setdefault((fileToPack['size'], GGPack.isEncoded(fileToPack['filename'])), []).append(fileIndex)
+	duplicateOf: Dict[int, int] = {}
+	for fileIndexes in filesBySizeAndEncoding.values():
+		if len(fileIndexes) < 2:
+			continue
+		firstFileIndexByHash: Dict[str, int] = {}
+		for fileIndex in fileIndexes:
+			fileHash = Manifest.hashFile(filesToPack[fileIndex]['path'])
+			if fileHash in firstFileIndexByHash:
+				duplicateOf[fileIndex] = firstFileIndexByHash[fileHash]
+			else:
+				firstFileIndexByHash[fileHash] = fileIndex
+	return duplicateOf
+
+def writeFileIndex(packFile, fileOffsetsDict: Dict):
+	"""Write the provided file index at the current position in the pack file, and update the header to point to it"""
+	archiveName = os.path.basename(getattr(packFile, 'name', ''))
+	fileIndexStartOffset = packFile.tell()
+	with Stats.measure(Stats.INDEX_SERIALIZE, archiveName=archiveName):
+		fileIndex = GGDict.toGgDict(fileOffsetsDict, True)
+	with Stats.measure(Stats.INDEX_ENCODE, len(fileIndex), archiveName):
+		encodedFileIndex = decodeGameData(fileIndex)
+	with Stats.measure(Stats.INDEX_WRITE, len(fileIndex), archiveName):
+		packFile.write(encodedFileIndex)
+		# Anything after the file index is left over from an earlier version of this pack file, so remove that
+		packFile.truncate()
+	# Now we can overwrite the initial two ints, the file index start offset and size
+	packFile.seek(0)
+	packFile.write(Utils.toWritableInt(fileIndexStartOffset))
+	packFile.write(Utils.toWritableInt(len(fileIndex)))
+
+def updatePack(packFilePath: str, filenamesToPack: List[str], filenameFilterList: List[str] = None, deduplicate: bool = False, jobCount: int = 1):
+	"""
+	Update an existing ggpack file with the provided files, without rewriting the whole ggpack.
+	Files that are already in the ggpack with the same size and contents are skipped. Changed and new files get added to the end, and a new file index is written after them.
+	The old versions of changed files and the old file index stay in the ggpack as unused space, use 'compactPack' to remove that.
+	If 'deduplicate' is True, changed files with identical contents are only stored once. 'jobCount' is how many folders to scan at the same time
+	"""
+	if not os.path.isfile(packFilePath):
+		raise FileNotFoundError(f"Asked to update ggpack file '{packFilePath}', but that file doesn't exist")
+	filesToPack = collectFilesToPack(filenamesToPack, filenameFilterList, jobCount)
+	print(f"Updating '{packFilePath}'")
+	import Manifest
+	changedFiles: List[Dict] = []
+	with GGPack(packFilePath) as ggpack:
+		fileOffsetsDict = ggpack.getFileIndex()
+		for fileCount, fileToPack in enumerate(filesToPack):
+			filename = fileToPack['filename']
+			if filename in ggpack and ggpack.getFileEntry(filename)['size'] == fileToPack['size']:
+				# Same size, so check whether the contents are the same too
+				if Manifest.hashFile(fileToPack['path']) == Utils.calculateMd5HashOfChunks(ggpack.read(filename, stream=True)):
+					printFileProgress(fileCount + 1, len(filesToPack), f"File {fileCount + 1:,} of {len(filesToPack):,} is unchanged, skipping: '{fileToPack['path']}'")
+					continue
+			changedFiles.append(fileToPack)
+		fileEntriesByName = {fileEntry['filename']: fileEntry for fileEntry in ggpack.iterEntries()}
+	if not changedFiles:
+		print(f"All {len(filesToPack):,} files are unchanged, so '{packFilePath}' doesn't need to be updated")
+		return
+	with open(packFilePath, 'r+b') as packFile:
+		# Append after everything that's already there, so if this gets interrupted, the old file index is still intact
+		packFile.seek(0, os.SEEK_END)
+		for newFileEntry in writePackEntries(packFile, changedFiles, 'Packing changed file', deduplicate):
+			if newFileEntry['filename'] in fileEntriesByName:
+				# Update the existing entry, so the file keeps its place in the file index
+				fileEntriesByName[newFileEntry['filename']].update(newFileEntry)
+			else:
+				fileOffsetsDict['files'].append(newFileEntry)
+				fileEntriesByName[newFileEntry['filename']] = newFileEntry
+		print(f"Writing file index '{packFilePath}'")
+		writeFileIndex(packFile, fileOffsetsDict)
+	unusedByteCount = getUnusedByteCount(packFilePath, fileOffsetsDict)
+	print(f"Successfully updated {len(changedFiles):,} of {len(filesToPack):,} files in '{packFilePath}', it now contains {unusedByteCount:,} bytes of unused space")
+
+def getUnusedByteCount(packFilePath: str, fileOffsetsDict: Dict) -> int:
+	"""Get how many bytes in the provided ggpack file aren't used by the header, the file index, or any of the files in that file index"""
+	with GGPack(packFilePath) as ggpack:
+		# Multiple entries can point to the same data, so count each location only once
+		usedExtents = {(fileEntry['offset'], fileEntry['size']) for fileEntry in fileOffsetsDict['files']}
+		return ggpack.fileSize - 8 - ggpack.fileIndexSize - sum(size for offset, size in usedExtents)
+
+def compactPack(packFilePath: str):
+	"""Rewrite the provided ggpack file without any unused space, for instance left over from updatePack. The packed data is copied as-is, so nothing needs to be decoded or encoded again"""
+	if not os.path.isfile(packFilePath):
+		raise FileNotFoundError(f"Asked to compact ggpack file '{packFilePath}', but that file doesn't exist")
+	print(f"Compacting '{packFilePath}'")
+	compactedFilePath = packFilePath + '.compacting'
+	with GGPack(packFilePath) as ggpack, open(compactedFilePath, 'wb') as compactedFile:
+		originalFileSize = ggpack.fileSize
+		fileOffsetsDict = ggpack.getFileIndex()
+		compactedFile.write(Utils.toWritableInt(0))
+		compactedFile.write(Utils.toWritableInt(0))
+		# Multiple entries can point to the same data, make sure that stays that way
+		newOffsets: Dict[Tuple[int, int], int] = {}
+		for fileEntry in sorted(ggpack.iterEntries(), key=lambda entry: entry['offset']):
+			extent = (fileEntry['offset'], fileEntry['size'])
+			if extent not in newOffsets:
+				newOffsets[extent] = compactedFile.tell()
+				compactedFile.write(ggpack.getEncodedFileEntry(fileEntry))
+			fileEntry['offset'] = newOffsets[extent]
+		writeFileIndex(compactedFile, fileOffsetsDict)
+	os.replace(compactedFilePath, packFilePath)
+	print(f"Successfully compacted '{packFilePath}' from {originalFileSize:,} to {os.path.getsize(packFilePath):,} bytes")
+
+def getAvailableFilename():
+	# Valid extensions after the 'ggpack' part are 1 to 9, optionally followed by the letter a to f
+	for i in range(6, 10):
+		letterlessFilename = os.path.join(CURRENT_FOLDER, f'Weird.ggpack{i}')
+		if not os.path.isfile(letterlessFilename):
+			return letterlessFilename
+		for letter in 'abcdef':
+			letteredFilename = letterlessFilename + letter
+			if not os.path.isfile(letteredFilename):
+				return letteredFilename
+	return None
+
+def printAndWrite(stringToWrite: str, fileToWriteTo, shouldPrint: bool = True):
+	if shouldPrint:
+		print(stringToWrite)
+	fileToWriteTo.write(stringToWrite + '\n')
+
+def setOutputMode(outputMode: str):
+	"""Set how the progress of handling each file gets shown, see printFileProgress"""
+	global _outputMode
+	if outputMode not in (OUTPUT_MODE_LINES, OUTPUT_MODE_PROGRESS, OUTPUT_MODE_QUIET):
+		raise ValueError(f"Unknown output mode '{outputMode}'")
+	_outputMode = outputMode
+
+def printFileProgress(fileNumber: int, fileCount: int, message: str):
+	"""
+	Show that a file is being handled. Depending on the output mode, the message gets printed, a progress bar gets updated, or nothing is shown.
+	Printing a line for each file takes a lot of time when there's thousands of files, so the other modes are faster
+	"""
+	global _lastProgressTime
+	if _outputMode == OUTPUT_MODE_LINES:
+		print(message)
+	elif _outputMode == OUTPUT_MODE_PROGRESS:
+		currentTime = time.perf_counter()
+		if fileNumber < fileCount and currentTime - _lastProgressTime < PROGRESS_INTERVAL:
+			return
+		_lastProgressTime = currentTime
+		filledWidth = PROGRESS_BAR_WIDTH * fileNumber // fileCount if fileCount else PROGRESS_BAR_WIDTH
+		sys.stdout.write(f"\r[{'#' * filledWidth}{'.' * (PROGRESS_BAR_WIDTH - filledWidth)}] {fileNumber:,} of {fileCount:,} files")
+		if fileNumber >= fileCount:
+			sys.stdout.write('\n')
+		sys.stdout.flush()
+
+def doesFilenameMatchFilterList(filename: str, filenameFilterList: List[str]) -> bool:
+	import FileScanner
+	return FileScanner.doesFilenameMatchFilters(filename, filenameFilterList)
+
+def parseFileArguments(argumentList: List[str]) -> Tuple[List[str], List[str], List[str]]:
+	"""
+	Split the provided filename arguments into three separate filename lists
+	:param argumentList: The list of filenames to parse
+	:return: A tuple with three lists: One with ggpack filenames, one with filename filters, one with normal filenames
+	"""
+	packList: List[str] = []
+	filterList: List[str] = []
+	filenameList: List[str] = []
+	for fn in argumentList:
+		if '.ggpack' in fn:
+			packList.append(fn)
+		elif '*' in fn or '?' in fn:
+			filterList.append(fn)
+		else:
+			filenameList.append(fn)
+	return packList, filterList, filenameList
+
+def parseOptions(argumentList: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+	"""
+	Take the options out of the provided argument list
+	:param argumentList: The list of arguments to parse
+	:return: A tuple with a dictionary of the found options and their values ('True' for flag options), and a list of the remaining arguments
+	"""
+	options: Dict[str, Any] = {}
+	remainingArguments: List[str] = []
+	argumentIterator = iter(argumentList)
+	for argument in argumentIterator:
+		if not argument.startswith('--'):
+			remainingArguments.append(argument)
+			continue
+		optionName = argument[2:].lower()
+		if optionName in FLAG_OPTIONS:
+			options[optionName] = True
+		elif optionName in VALUE_OPTIONS:
+			optionValue = next(argumentIterator, None)
+			if optionValue is None:
+				raise ValueError(f"Option '{argument}' needs a value")
+			options[optionName] = optionValue
+		else:
+			raise ValueError(f"Unknown option '{argument}'")
+	return options, remainingArguments
+
+def parseJobCount(options: Dict[str, Any], defaultJobCount: int = 1) -> int:
+	"""Get the number of jobs from the '--jobs' option, or the provided default if it wasn't provided"""
+	if 'jobs' not in options:
+		return defaultJobCount
+	try:
+		jobCount = int(options['jobs'], 10)
+	except ValueError:
+		raise ValueError(f"The '--jobs' option should be a number, not '{options['jobs']}'")
+	if jobCount < 1:
+		raise ValueError(f"The '--jobs' option should be at least 1, not {jobCount}")
+	return jobCount
+
+def printHelp():
+	print("MonkeyPack is a simple tool to unpack and pack files from the game Return To Monkey Island")
+	print("You can drag your file(s) on top of this program. If they're ggpack files, they'll be unpacked. Otherwise, a new ggpack file will be created with those files inside it.")
+	print("You can also provide the filename(s) on the command line, that works the same way as dragging them onto the program.")
+	print("Packed and unpacked files are always written in the folder where this program is, so make sure you have write permission.")
+	print("There are also command line options if you want more control, that should be typed after the program name, without preceding dashes:")
+	print("  help: Print this help")
+	print("  list [list of ggpack files]: List which files are inside the provided ggpack files, and also writes that info to textfiles named after the ggpack files.")
+	print("  unpack [list of ggpack files]: Unpacks the provided ggpack files in the current directory, each inside a folder named after that ggpack file.")
+	print("  pack [list of files/folders to pack]: Packs the provided files (separated by spaces) into a single ggpack file, that will be placed in the current directory. If a folder name is provided, all the files inside that folder and its subfolders will be packed, keeping their path inside that folder in their name.")
+	print("  cat [ggpack file] [list of filenames]: Write the decoded contents of the provided files inside the ggpack file to the standard output, for instance to pipe them into another program. All other output goes to the standard error output.")
+	print("  compact [list of ggpack files]: Remove the unused space from the provided ggpack files, for instance left over from 'pack --update'.")
+	print("  diff [ggpack file] [ggpack file or folder]: Show which files were added, removed, or changed between the provided ggpack file and another ggpack file or a folder, without unpacking them.")
+	print("  verify [list of ggpack files]: Check that the provided ggpack files are valid without unpacking them, and write a manifest with a hash of each file inside them.")
+	print("You can provide filename filters to limit the output of these commands. Use '?' for single character matches and '*' for multi-character matches")
+	print("Options are written with two preceding dashes, and can be placed anywhere after the command:")
+	print("  --jobs [number]: For 'unpack', 'verify', and 'diff', how many files to handle at the same time, using that many processes. Defaults to 1 for 'unpack' and the number of processors for the others. For 'pack', how many folders to scan at the same time, which helps on network drives")
+	print("  --manifest [file]: For 'verify', write one manifest for all ggpack files to this file. If it ends with '.csv' it's written as CSV, otherwise as JSON. For 'diff', reuse the hashes stored in this JSON manifest")
+	print("  --game [folder]: For 'list', 'unpack', and 'cat', use all the ggpack files in this game folder instead of a single ggpack file. If a file is in multiple ggpack files, the one the game would load is used")
+	print("  --to-tar [file]: For 'unpack', unpack all the files into this single tar file instead of into a folder. Use '-' to write the tar file to the standard output")
+	print("  --to-zip [file]: For 'unpack', unpack all the files into this single uncompressed zip file instead of into a folder. Use '-' to write the zip file to the standard output")
+	print("  --quiet: Don't show a line for each file that gets listed, unpacked, or packed, which is a lot faster when there's thousands of files")
+	print("  --progress: Show a progress bar instead of a line for each file that gets unpacked or packed")
+	print("  --stats [file]: Write how much time and how many bytes each step took, in total and per ggpack file, to this file as JSON")
+	print("  --dedup: For 'pack', only store files with identical contents once, with all their names pointing to that one copy")
+	print("  --index-cache: Store the file index of each ggpack in a file next to this program, so later runs on an unchanged ggpack don't need to decode it again")
+	print("  --update [ggpack file]: For 'pack', update the provided existing ggpack file instead of creating a new one. Only new and changed files get added")
+	print("  --keystream-cache: Store the generated decoding keys in a file next to this program, so later runs don't need to generate them again")
+	print("See the included readme or https://github.com/didero/monkeypack for a more elaborate usage guide")
+
+def main():
+	startTime = time.perf_counter()
+	try:
+		if len(sys.argv) < 2:
+			printHelp()
+			return
+		command = sys.argv[1].lower().lstrip('-')
+		argumentList = sys.argv[2:]
+		if command == 'help':
+			printHelp()
+			return
+
+		if command not in ('cat', 'compact', 'diff', 'list', 'pack', 'unpack', 'verify'):
+			# Try to guess what to do with the provided argument(s)
+			print("WARNING: No explicit command provided, guessing what to do. Call this script with 'help' to see the availble commands")
+			if not os.path.exists(sys.argv[1]):
+				print(f"ERROR: Unknown command '{sys.argv[1]}'")
+				printHelp()
+				return
+			if '.ggpack' in sys.argv[1]:
+				command = 'unpack'
+			else:
+				command = 'pack'
+			# The first argument was apparently a file, add it back into the argument list
+			argumentList.insert(0, sys.argv[1])
+
+		options, argumentList = parseOptions(argumentList)
+		archiveType = 'tar' if 'to-tar' in options else 'zip' if 'to-zip' in options else None
+		if command == 'cat' or (archiveType and options['to-' + archiveType] == '-'):
+			# The decoded files get written to the standard output, so all the other output should go to the standard error output, to keep it out of the decoded data
+			standardOutputStream = sys.stdout.buffer
+			sys.stdout = sys.stderr
+		else:
+			standardOutputStream = None
+		if options.get('quiet'):
+			setOutputMode(OUTPUT_MODE_QUIET)
+		elif options.get('progress'):
+			setOutputMode(OUTPUT_MODE_PROGRESS)
+		if 'stats' in options:
+			Stats.setStats(Stats.Stats())
+		if options.get('keystream-cache'):
+			Codec.setKeystreamCache(Codec.KeystreamCache(diskCachePath=KEYSTREAM_CACHE_FILEPATH))
+		if options.get('index-cache'):
+			from IndexCache import IndexCache
+			setIndexCache(IndexCache(INDEX_CACHE_FILEPATH))
+		packFilenameList, filenameFilterList, filenameList = parseFileArguments(argumentList)
+		if len(packFilenameList) == 0 and len(filenameList) == 0 and 'game' not in options:
+			print("ERROR: No filenames provided")
+			printHelp()
+			return
+
+		if command == 'compact':
+			if len(packFilenameList) == 0:
+				print("ERROR: Please provide one or more ggpack files to compact")
+			else:
+				for packFilename in packFilenameList:
+					compactPack(packFilename)
+		elif command == 'diff':
+			if len(packFilenameList) == 2 and len(filenameList) == 0:
+				otherPath = packFilenameList[1]
+			elif len(packFilenameList) == 1 and len(filenameList) == 1:
+				otherPath = filenameList[0]
+			else:
+				print("ERROR: Please provide a ggpack file and either another ggpack file or a folder to compare it to")
+				return
+			if not diff(packFilenameList[0], otherPath, filenameFilterList, parseJobCount(options, os.cpu_count() or 1), options.get('manifest')):
+				return 1
+		elif command == 'verify':
+			if len(packFilenameList) == 0:
+				print("ERROR: Please provide one or more ggpack files to verify")
+			elif not verify(packFilenameList, parseJobCount(options, os.cpu_count() or 1), options.get('manifest')):
+				return 1
+		elif command == 'cat':
+			if len(filenameList) == 0 or len(packFilenameList) + (1 if 'game' in options else 0) != 1:
+				print("ERROR: Please provide either a ggpack file or a game folder with '--game', and the names of one or more files inside it")
+				return
+			catFiles(filenameList, standardOutputStream, packFilenameList[0] if packFilenameList else None, options.get('game'))
+		elif command == 'unpack' and archiveType:
+			if 'to-tar' in options and 'to-zip' in options:
+				print("ERROR: Please provide either '--to-tar' or '--to-zip', not both")
+				return
+			if len(packFilenameList) + (1 if 'game' in options else 0) != 1:
+				print(f"ERROR: Please provide either a single ggpack file or a game folder with '--game' to unpack into a {archiveType} file")
+				return
+			filenameFilterList.extend(filenameList)
+			from GGPackSet import GGPackSet
+			with (GGPackSet(options['game']) if 'game' in options else GGPack(packFilenameList[0])) as archive:
+				fileEntries = archive.iterEntries() if 'game' in options else ((archive, fileEntry) for fileEntry in archive.iterEntries())
+				unpackToArchive(fileEntries, options['to-' + archiveType], archiveType, standardOutputStream, filenameFilterList)
+		elif (command == 'list' or command == 'unpack') and 'game' in options:
+			# Use all the ggpack files in the game folder together, the way the game loads them
+			filenameFilterList.extend(filenameList)
+			if command == 'list':
+				listGameFiles(options['game'], filenameFilterList)
+			else:
+				unpackGameFiles(options['game'], filenameFilterList, parseJobCount(options))
+		elif command == 'list' or command == 'unpack':
+			if len(packFilenameList) == 0:
+				print("ERROR: Please provide one or more ggpack files")
+			else:
+				# For listing or unpacking the files, there is no need for a distinction between straight filenames and filename filters, so combine them into one filter list
+				filenameFilterList.extend(filenameList)
+				if command == 'list':
+					for packFilename in packFilenameList:
+						listFiles(packFilename, filenameFilterList)
+				elif command == 'unpack':
+					jobCount = parseJobCount(options)
+					for packFilename in packFilenameList:
+						unpack(packFilename, filenameFilterList, jobCount)
+		elif command == 'pack':
+			if len(filenameList) == 0:
+				print("ERROR: Please add one or more files to pack into a ggpack file")
+			else:
+				if len(packFilenameList) > 0:
+					print("WARNING: Some of the provided files are ggpack files, they can't be packed so they will be ignored")
+				if 'update' in options:
+					updatePack(options['update'], filenameList, filenameFilterList, options.get('dedup', False), parseJobCount(options))
+				else:
+					packFiles(filenameList, filenameFilterList, options.get('dedup', False), jobCount=parseJobCount(options))
+		else:
+			print(f"ERROR: Unknown command '{command}'")
+			printHelp()
+	except Exception as e:
+		print(f"ERROR: {e}")
+		with open('error.log', 'a') as errorFile:
+			errorFile.write(f"[{datetime.datetime.now()}] {e}")
+			errorFile.write('\n')
+		return 1
+	finally:
+		Codec.getKeystreamCache().close()
+		if getIndexCache():
+			getIndexCache().close()
+		executionTime = time.perf_counter() - startTime
+		if Stats.getStats():
+			Stats.record(Stats.TOTAL, executionTime)
+			Stats.getStats().write(options['stats'])
+			print(f"Wrote the stats to '{options['stats']}'")
+		print(f"Execution finished in {executionTime:.6f} seconds")
+
@@ -0,0 +1,137 @@
+"""
+Records how much time and how many bytes each phase of reading and writing ggpacks takes, like decoding the file index or writing a packed file, both in total and per ggpack.
+Recording is off unless a Stats object is set with setStats, so the measuring costs next to nothing in normal runs
+"""
+import contextlib, time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Phase names, so the same phase is always recorded under the same name
+INDEX_READ = 'index read'
+INDEX_DECODE = 'index decode'
+INDEX_PARSE = 'index parse'
+INDEX_CACHE_LOAD = 'index cache load'
+INDEX_SERIALIZE = 'index serialize'
+INDEX_ENCODE = 'index encode'
+INDEX_WRITE = 'index write'
+ENTRY_READ = 'entry read'
+ENTRY_DECODE = 'entry decode'
+ENTRY_ENCODE = 'entry encode'
+ENTRY_WRITE = 'entry write'
+TOTAL = 'total'
+
+
+class PhaseStats:
+	"""The totals for one phase, and a histogram of how long each recorded step took. Each histogram bucket is twice as long as the one before it, starting at 1 microsecond"""
+	__slots__ = ('count', 'seconds', 'byteCount', 'maxSeconds', 'histogram')
+
+	def __init__(self):
+		self.count = 0
+		self.seconds = 0.0
+		self.byteCount = 0
+		self.maxSeconds = 0.0
+		self.histogram: List[int] = []
+
+	def add(self, seconds: float, byteCount: int):
+		self.count += 1
+		self.seconds += seconds
+		self.byteCount += byteCount
+		if seconds > self.maxSeconds:
+			self.maxSeconds = seconds
+		bucketIndex = int(seconds * 1_000_000).bit_length()
+		if bucketIndex >= len(self.histogram):
+			self.histogram.extend([0] * (bucketIndex + 1 - len(self.histogram)))
+		self.histogram[bucketIndex] += 1
+
+	def merge(self, otherPhaseStats: 'PhaseStats'):
+		self.count += otherPhaseStats.count
+		self.seconds += otherPhaseStats.seconds
+		self.byteCount += otherPhaseStats.byteCount
+		self.maxSeconds = max(self.maxSeconds, otherPhaseStats.maxSeconds)
+		if len(otherPhaseStats.histogram) > len(self.histogram):
+			self.histogram.extend([0] * (len(otherPhaseStats.histogram) - len(self.histogram)))
+		for bucketIndex, bucketCount in enumerate(otherPhaseStats.histogram):
+			self.histogram[bucketIndex] += bucketCount
+
+	def toDict(self) -> Dict:
+		phaseDict = {"count": self.count, "seconds": self.seconds, "bytes": self.byteCount, "maxSeconds": self.maxSeconds,
+					 "megabytesPerSecond": self.byteCount / (1024 * 1024) / self.seconds if self.seconds > 0 else None}
+		# Only store the buckets that have something in them, each with the longest time that fits in that bucket
+		phaseDict["histogram"] = [{"upToMicroseconds": 2 ** bucketIndex, "count": bucketCount} for bucketIndex, bucketCount in enumerate(self.histogram) if bucketCount > 0]
+		return phaseDict
+
+
+class Stats:
+	"""Collects the PhaseStats for each ggpack and phase. Recording is thread-safe, so the threads that pack files can all record to the same Stats"""
+
+	def __init__(self):
+		# Only imported once stats get recorded, so commands without '--stats' don't need to load it
+		import threading
+		self._phases: Dict[Tuple[str, str], PhaseStats] = {}
+		self._lock = threading.Lock()
+
+	def record(self, phaseName: str, seconds: float, byteCount: int = 0, archiveName: str = ''):
+		"""Record one step of the provided phase, for instance decoding one file. 'archiveName' is the name of the ggpack the step was for, if any"""
+		with self._lock:
+			phaseStats = self._phases.get((archiveName, phaseName))
+			if phaseStats is None:
+				phaseStats = self._phases[(archiveName, phaseName)] = PhaseStats()
+			phaseStats.add(seconds, byteCount)
+
+	@contextlib.contextmanager
+	def measure(self, phaseName: str, byteCount: int = 0, archiveName: str = '') -> Iterator[None]:
+		startTime = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.record(phaseName, time.perf_counter() - startTime, byteCount, archiveName)
+
+	def getPhases(self) -> Dict[Tuple[str, str], PhaseStats]:
+		"""Get the recorded stats per ggpack name and phase name. The result can be passed to 'merge' of another Stats object, also in another process"""
+		with self._lock:
+			return dict(self._phases)
+
+	def merge(self, phases: Dict[Tuple[str, str], PhaseStats]):
+		"""Add the provided stats, as returned by getPhases, to these stats, for instance the stats recorded in a worker process"""
+		with self._lock:
+			for phaseKey, otherPhaseStats in phases.items():
+				if phaseKey not in self._phases:
+					self._phases[phaseKey] = PhaseStats()
+				self._phases[phaseKey].merge(otherPhaseStats)
+
+	def toDict(self) -> Dict:
+		"""Get the totals per phase over all ggpacks, and the stats per phase for each ggpack"""
+		totals: Dict[str, PhaseStats] = {}
+		archives: Dict[str, Dict[str, Dict]] = {}
+		for (archiveName, phaseName), phaseStats in sorted(self.getPhases().items()):
+			totals.setdefault(phaseName, PhaseStats()).merge(phaseStats)
+			if archiveName:
+				archives.setdefault(archiveName, {})[phaseName] = phaseStats.toDict()
+		return {"totals": {phaseName: phaseStats.toDict() for phaseName, phaseStats in totals.items()}, "archives": archives}
+
+	def write(self, outputFilePath: str):
+		import json
+		with open(outputFilePath, 'w', encoding='utf-8') as outputFile:
+			json.dump(self.toDict(), outputFile, indent=1)
+
+
+# The stats that get recorded to, or None if nothing should be recorded, see setStats
+_stats: Optional[Stats] = None
+
+def getStats() -> Optional[Stats]:
+	return _stats
+
+def setStats(stats: Optional[Stats]):
+	"""Set the Stats object to record to. Set to None to stop recording"""
+	global _stats
+	_stats = stats
+
+def record(phaseName: str, seconds: float, byteCount: int = 0, archiveName: str = ''):
+	"""Record one step of the provided phase to the current Stats object, if recording is on"""
+	if _stats is not None:
+		_stats.record(phaseName, seconds, byteCount, archiveName)
+
+def measure(phaseName: str, byteCount: int = 0, archiveName: str = ''):
+	"""Time the code inside this context manager as one step of the provided phase, if recording is on"""
+	if _stats is None:
+		return contextlib.nullcontext()
+	return _stats.measure(phaseName, byteCount, archiveName)
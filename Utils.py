@@ -1,4 +1,5 @@
 import hashlib, struct
+from typing import Iterable
 
 def _parseFromFormatString(dataToParse: bytes, formatString: str):
 	return struct.unpack(formatString, dataToParse)[0]
@@ -40,3 +41,10 @@ def getPrintableBytes(b: bytes) -> str:
 
 def calculateMd5Hash(b: bytes) -> str:
 	return hashlib.md5(b).hexdigest()
+
+def calculateMd5HashOfChunks(chunks: Iterable[bytes]) -> str:
+	"""Calculate the MD5 hash of data that's provided in chunks, so it doesn't have to be fully in memory"""
+	md5Hash = hashlib.md5()
+	for chunk in chunks:
+		md5Hash.update(chunk)
+	return md5Hash.hexdigest()
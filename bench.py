@@ -0,0 +1,246 @@
+"""
+Benchmarks for the parts of MonkeyPack where speed matters: the codec, the file index parser and serializer, and packing and unpacking whole ggpacks.
+All the test data is generated from a fixed seed, so results of different runs and different versions can be compared.
+Before the codec gets timed, every codec backend is checked against the reference decoder, and the benchmarks stop if one of them decodes differently.
+Usage: python bench.py [--output results.json] [--baseline baseline.json] [--tolerance 0.1]
+The results are written to the output file as JSON. If a baseline results file is provided, each result is compared to it, and if any result is more than 'tolerance' worse,
+the regressions are listed and the exit code is 1
+"""
+import argparse, contextlib, json, os, platform, random, sys, tempfile, time
+from typing import Any, Callable, Dict, List
+
+import Codec
+from GGDict import GGDict
+import MonkeyPack
+
+RANDOM_SEED = 1991
+BENCHMARK_RESULTS_VERSION = 1
+DEFAULT_TOLERANCE = 0.1
+
+# The sizes of the generated test data. These are big enough to give stable results, but small enough to run the whole suite in a minute or so
+CODEC_DATA_SIZE = 32 * 1024 * 1024
+INDEX_ENTRY_COUNT = 100_000
+DEEP_GGDICT_DEPTH = 100
+DEEP_GGDICT_TREE_COUNT = 100
+TINY_FILE_COUNT = 5000
+TINY_FILE_MAX_SIZE = 1024
+HUGE_FILE_COUNT = 3
+HUGE_FILE_SIZE = 32 * 1024 * 1024
+# The data lengths and chunk sizes the codec backends get checked with before they're timed. The lengths include data shorter than, as long as, and longer than the keystream loop,
+# and the odd chunk sizes make chunks start and end at different places in that loop
+CODEC_CHECK_DATA_LENGTHS = (0, 1, 2, 7, 255, 1286, 1287, 4099, 65_537, 200_003)
+CODEC_CHECK_CHUNK_SIZES = (1, 7, 1000, 4099, 65_537)
+
+
+def createSyntheticFileIndex(entryCount: int) -> Dict:
+	"""Create a file index like the ones in the game's ggpack files, with the provided number of file entries. The result is always the same for the same entry count"""
+	fileEntries = []
+	offset = 8
+	for entryIndex in range(entryCount):
+		size = 1000 + (entryIndex * 7919) % 100_000
+		fileEntries.append({"filename": f"SyntheticFile_{entryIndex:07}.txt", "offset": offset, "size": size})
+		offset += size
+	return {"files": fileEntries, "guid": "b554baf88ff004c50cc0214575794b8c"}
+
+def createDeepGGDict(depth: int, treeCount: int) -> Dict:
+	"""Create a GGDict with a number of deeply nested trees of dictionaries and arrays, like the game's more complicated data files. The result is always the same for the same arguments"""
+	randomGenerator = random.Random(RANDOM_SEED)
+	trees = []
+	for treeIndex in range(treeCount):
+		tree = {"name": f"Leaf_{treeIndex}", "value": randomGenerator.randrange(1_000_000)}
+		for level in range(depth):
+			tree = {"name": f"Node_{treeIndex}_{level}", "level": level, "values": [randomGenerator.randrange(1_000_000), f"Value_{randomGenerator.randrange(1000)}", [level, treeIndex]], "child": tree}
+		trees.append(tree)
+	return {"trees": trees}
+
+def countGGDictValues(value: Any) -> int:
+	"""Count how many values are in the provided GGDict value, including the value itself and all the values inside it"""
+	if isinstance(value, dict):
+		return 1 + sum(countGGDictValues(childValue) for childValue in value.values())
+	if isinstance(value, list):
+		return 1 + sum(countGGDictValues(childValue) for childValue in value)
+	return 1
+
+def createRandomBytes(randomGenerator: random.Random, size: int) -> bytes:
+	return randomGenerator.getrandbits(size * 8).to_bytes(size, 'little') if size > 0 else b''
+
+def createSyntheticFiles(folder: str, fileCount: int, minimumSize: int, maximumSize: int) -> int:
+	"""Create files with random contents in the provided folder, always the same for the same arguments. Returns the total size of the created files"""
+	randomGenerator = random.Random(RANDOM_SEED + fileCount)
+	os.makedirs(folder, exist_ok=True)
+	totalSize = 0
+	for fileIndex in range(fileCount):
+		fileSize = randomGenerator.randint(minimumSize, maximumSize)
+		with open(os.path.join(folder, f"SyntheticFile_{fileIndex:05}.txt"), 'wb') as syntheticFile:
+			syntheticFile.write(createRandomBytes(randomGenerator, fileSize))
+		totalSize += fileSize
+	return totalSize
+
+def timeFunction(functionToTime: Callable, repeatCount: int = 3) -> float:
+	"""Run the provided function a few times, and return the fastest time in seconds"""
+	fastestTime = None
+	for repeatIndex in range(repeatCount):
+		startTime = time.perf_counter()
+		functionToTime()
+		elapsedTime = time.perf_counter() - startTime
+		if fastestTime is None or elapsedTime < fastestTime:
+			fastestTime = elapsedTime
+	return fastestTime
+
+def createResult(amount: float, seconds: float, unit: str) -> Dict[str, Any]:
+	"""All results are a rate, so higher is always better"""
+	return {"value": amount / seconds, "unit": unit}
+
+
+def checkCodecBackends() -> List[str]:
+	"""
+	Check that every codec backend decodes exactly the same as Codec.decodeReference, both all at once and in chunks with a StreamCodec
+	:return: A description of each difference, empty if there aren't any
+	"""
+	randomGenerator = random.Random(RANDOM_SEED)
+	mismatches: List[str] = []
+	originalBackend = Codec.getBackend()
+	try:
+		for dataLength in CODEC_CHECK_DATA_LENGTHS:
+			data = createRandomBytes(randomGenerator, dataLength)
+			expectedData = Codec.decodeReference(data)
+			for backendName in Codec.getAvailableBackends():
+				Codec.setBackend(backendName)
+				if Codec.decode(data) != expectedData:
+					mismatches.append(f"Backend '{backendName}' decodes {dataLength:,} bytes differently than the reference decoder")
+				# Chunk size 1 makes a call per byte, which is too slow for the longer data
+				for chunkSize in CODEC_CHECK_CHUNK_SIZES if dataLength <= 4099 else CODEC_CHECK_CHUNK_SIZES[1:]:
+					streamCodec = Codec.StreamCodec(dataLength)
+					if b''.join(streamCodec.process(data[chunkStart:chunkStart + chunkSize]) for chunkStart in range(0, dataLength, chunkSize)) != expectedData:
+						mismatches.append(f"Backend '{backendName}' decodes {dataLength:,} bytes in chunks of {chunkSize:,} bytes differently than the reference decoder")
+	finally:
+		Codec.setBackend(originalBackend)
+	return mismatches
+
+def benchmarkCodec(dataSize: int = CODEC_DATA_SIZE) -> Dict[str, Dict[str, Any]]:
+	"""
+	Time decoding a big buffer at once with each fast codec backend, and decoding it in chunks with the default backend, in MB/s.
+	Each backend first gets checked with checkCodecBackends, since timing a backend that decodes wrong is pointless. A ValueError is raised if any of them decodes wrong
+	"""
+	mismatches = checkCodecBackends()
+	if mismatches:
+		raise ValueError("The codec backends don't all decode the same as the reference decoder:\n" + "\n".join(mismatches))
+	data = createRandomBytes(random.Random(RANDOM_SEED), dataSize)
+	megabyteCount = dataSize / (1024 * 1024)
+	results: Dict[str, Dict[str, Any]] = {}
+	originalBackend = Codec.getBackend()
+	try:
+		for backendName in Codec.getAvailableBackends():
+			# The reference backend is way too slow for data this big
+			if backendName == Codec.REFERENCE_BACKEND:
+				continue
+			Codec.setBackend(backendName)
+			results[f"codec_decode_{backendName}"] = createResult(megabyteCount, timeFunction(lambda: Codec.decode(data)), 'MB/s')
+	finally:
+		Codec.setBackend(originalBackend)
+	results["codec_decode_stream"] = createResult(megabyteCount, timeFunction(lambda: sum(len(chunk) for chunk in Codec.iterCodedChunks(memoryview(data)))), 'MB/s')
+	return results
+
+def benchmarkGgDictParse(entryCount: int = INDEX_ENTRY_COUNT) -> float:
+	"""Time how long it takes to parse a big file index. Returns the number of file entries parsed per second"""
+	# A file index this big has too many strings for the short string indexes the game uses, so use long ones
+	ggdictData = GGDict.toGgDict(createSyntheticFileIndex(entryCount), False)
+	parseTime = timeFunction(lambda: GGDict.fromGgDict(ggdictData, False))
+	return entryCount / parseTime
+
+def benchmarkGgDictSerialize(entryCount: int = INDEX_ENTRY_COUNT) -> float:
+	"""Time how long it takes to turn a big file index into a GGDict. Returns the number of file entries serialized per second"""
+	fileIndex = createSyntheticFileIndex(entryCount)
+	serializeTime = timeFunction(lambda: GGDict.toGgDict(fileIndex, False))
+	return entryCount / serializeTime
+
+def benchmarkDeepGgDict(depth: int = DEEP_GGDICT_DEPTH, treeCount: int = DEEP_GGDICT_TREE_COUNT) -> Dict[str, Dict[str, Any]]:
+	"""Time parsing and serializing a deeply nested GGDict, in values per second"""
+	deepGgDict = createDeepGGDict(depth, treeCount)
+	valueCount = countGGDictValues(deepGgDict)
+	ggdictData = GGDict.toGgDict(deepGgDict, True)
+	return {
+		"ggdict_deep_parse": createResult(valueCount, timeFunction(lambda: GGDict.fromGgDict(ggdictData, True)), 'values/s'),
+		"ggdict_deep_serialize": createResult(valueCount, timeFunction(lambda: GGDict.toGgDict(deepGgDict, True)), 'values/s')
+	}
+
+def benchmarkPackAndUnpack(name: str, fileCount: int, minimumSize: int, maximumSize: int) -> Dict[str, Dict[str, Any]]:
+	"""Time packing the provided number of synthetic files into a ggpack, and unpacking that ggpack again, in files/s and MB/s"""
+	results: Dict[str, Dict[str, Any]] = {}
+	with tempfile.TemporaryDirectory(prefix='MonkeyPackBench') as benchmarkFolder:
+		sourceFolder = os.path.join(benchmarkFolder, 'source')
+		extractFolder = os.path.join(benchmarkFolder, 'unpacked')
+		packFilePath = os.path.join(benchmarkFolder, 'Weird.ggpack1')
+		totalSize = createSyntheticFiles(sourceFolder, fileCount, minimumSize, maximumSize)
+		megabyteCount = totalSize / (1024 * 1024)
+		def packSourceFolder():
+			MonkeyPack.packFiles([sourceFolder], packFilename=packFilePath)
+		def unpackPackFile():
+			MonkeyPack.unpack(packFilePath, extractFolder=extractFolder)
+		# Packing and unpacking print a line per file, which would mostly time how fast the console is
+		with open(os.devnull, 'w') as nullOutput, contextlib.redirect_stdout(nullOutput):
+			packTime = timeFunction(packSourceFolder)
+			unpackTime = timeFunction(unpackPackFile)
+	results[f"pack_{name}_files"] = createResult(fileCount, packTime, 'files/s')
+	results[f"pack_{name}_throughput"] = createResult(megabyteCount, packTime, 'MB/s')
+	results[f"unpack_{name}_files"] = createResult(fileCount, unpackTime, 'files/s')
+	results[f"unpack_{name}_throughput"] = createResult(megabyteCount, unpackTime, 'MB/s')
+	return results
+
+def runBenchmarks() -> Dict[str, Dict[str, Any]]:
+	"""Run all the benchmarks, and return the result of each benchmark by name"""
+	results: Dict[str, Dict[str, Any]] = {}
+	results.update(benchmarkCodec())
+	results["ggdict_index_parse"] = {"value": benchmarkGgDictParse(), "unit": 'entries/s'}
+	results["ggdict_index_serialize"] = {"value": benchmarkGgDictSerialize(), "unit": 'entries/s'}
+	results.update(benchmarkDeepGgDict())
+	results.update(benchmarkPackAndUnpack('tiny', TINY_FILE_COUNT, 1, TINY_FILE_MAX_SIZE))
+	results.update(benchmarkPackAndUnpack('huge', HUGE_FILE_COUNT, HUGE_FILE_SIZE, HUGE_FILE_SIZE))
+	return results
+
+def findRegressions(results: Dict[str, Dict[str, Any]], baselineResults: Dict[str, Dict[str, Any]], tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+	"""
+	Compare the provided results to the baseline results
+	:param results: The new benchmark results, as returned by runBenchmarks
+	:param baselineResults: The benchmark results to compare to
+	:param tolerance: How much worse a result can be than the baseline before it's a regression, as a fraction. For instance 0.1 allows results to be up to 10% worse
+	:return: A description of each regression, empty if there aren't any. Benchmarks that aren't in both results are skipped
+	"""
+	regressions: List[str] = []
+	for benchmarkName, result in results.items():
+		if benchmarkName not in baselineResults:
+			continue
+		baselineValue = baselineResults[benchmarkName]['value']
+		if result['value'] < baselineValue * (1 - tolerance):
+			regressions.append(f"{benchmarkName}: {result['value']:,.1f} {result['unit']}, baseline is {baselineValue:,.1f} {result['unit']} ({result['value'] / baselineValue - 1:+.1%})")
+	return regressions
+
+def runFromCommandLine() -> int:
+	argumentParser = argparse.ArgumentParser(description="Run the MonkeyPack benchmarks")
+	argumentParser.add_argument('--output', default='benchmark_results.json', help="The file to write the results to as JSON")
+	argumentParser.add_argument('--baseline', help="A results file from an earlier run to compare the results to")
+	argumentParser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help=f"How much worse a result can be than the baseline before it counts as a regression, as a fraction. Defaults to {DEFAULT_TOLERANCE}")
+	arguments = argumentParser.parse_args()
+
+	results = runBenchmarks()
+	for benchmarkName, result in results.items():
+		print(f"{benchmarkName}: {result['value']:,.1f} {result['unit']}")
+	with open(arguments.output, 'w', encoding='utf-8') as outputFile:
+		json.dump({"resultsVersion": BENCHMARK_RESULTS_VERSION, "python": platform.python_version(), "codecBackend": Codec.getBackend(), "benchmarks": results}, outputFile, indent=1)
+	print(f"Wrote the results to '{arguments.output}'")
+
+	if arguments.baseline:
+		with open(arguments.baseline, 'r', encoding='utf-8') as baselineFile:
+			baselineResults = json.load(baselineFile)['benchmarks']
+		regressions = findRegressions(results, baselineResults, arguments.tolerance)
+		if regressions:
+			print(f"Found {len(regressions):,} results more than {arguments.tolerance:.0%} worse than the baseline in '{arguments.baseline}':")
+			for regression in regressions:
+				print(f"  {regression}")
+			return 1
+		print(f"No results more than {arguments.tolerance:.0%} worse than the baseline in '{arguments.baseline}'")
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(runFromCommandLine())
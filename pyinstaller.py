@@ -12,6 +12,7 @@ if __name__ == '__main__':
 		'--onefile',
 		'--clean',  # Always start with a new cache
 		'--noconfirm',  # Clean the 'dist' folder
+		f'--add-data=resources{os.pathsep}resources',  # The key files, see Keys.py
 	]
 	PyInstaller.__main__.run(pyInstallerArguments)
 	print(f"Build took {time.perf_counter() - startTime} seconds")